@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import copy
 import datetime
 import logging
+import threading
+from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    Iterator,
     Literal,
     Optional,
     Sequence,
@@ -37,6 +43,10 @@ from great_expectations.core.batch import (
     batch_request_contains_batch_data,
     get_batch_request_as_dict,
 )
+from great_expectations.core.batch_spec import (
+    RuntimeQueryBatchSpec,
+    SqlAlchemyDatasourceBatchSpec,
+)
 from great_expectations.core.config_peer import ConfigOutputModes, ConfigPeer
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
 from great_expectations.data_context.types.base import (
@@ -45,6 +55,7 @@ from great_expectations.data_context.types.base import (
 )
 from great_expectations.data_context.types.resource_identifiers import GXCloudIdentifier
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 from great_expectations.util import (
     deep_filter_properties_iterable,
     filter_properties_dict,
@@ -54,6 +65,7 @@ from great_expectations.validation_operators import ActionListValidationOperator
 
 if TYPE_CHECKING:
     from great_expectations.checkpoint.configurator import ActionDict
+    from great_expectations.core.batch import AnyBatch, BatchDataUnion
     from great_expectations.core.config_provider import _ConfigurationProvider
     from great_expectations.data_context import AbstractDataContext
     from great_expectations.datasource.fluent.interfaces import (
@@ -80,6 +92,50 @@ def _does_validation_contain_expectation_suite_name(
     return any(val.expectation_suite_name is not None for val in validations)
 
 
+def _get_validation_datasource_name(
+    substituted_runtime_config: dict, validation_dict: CheckpointValidationConfig
+) -> str | None:
+    batch_request: dict = get_batch_request_as_dict(
+        batch_request=validation_dict.batch_request
+        or substituted_runtime_config.get("batch_request")
+    )
+    return batch_request.get("datasource_name") if batch_request else None
+
+
+def _copy_execution_engine_for_concurrent_validation(
+    batch_list: list[AnyBatch],
+) -> SqlAlchemyExecutionEngine | None:
+    """Returns own ExecutionEngine for validating Batches concurrently with other Batches of their Datasource.
+
+    Only SQL Batches qualify (their data is re-materialized from BatchSpec by returned SqlAlchemyExecutionEngine); for
+    other Batches, None is returned, and they must be validated by ExecutionEngine of their Datasource.
+    """
+    if not batch_list:
+        return None
+
+    execution_engine = batch_list[-1].data.execution_engine  # type: ignore[union-attr]
+    if not isinstance(execution_engine, SqlAlchemyExecutionEngine):
+        return None
+
+    batch: AnyBatch
+    if not all(
+        isinstance(
+            batch.batch_spec, (SqlAlchemyDatasourceBatchSpec, RuntimeQueryBatchSpec)
+        )
+        for batch in batch_list
+    ):
+        return None
+
+    return execution_engine.copy_for_concurrent_use()
+
+
+def _get_batch_with_data(batch: AnyBatch, batch_data: BatchDataUnion) -> AnyBatch:
+    """Returns shallow copy of Batch, which references specified BatchData."""
+    batch_with_data: AnyBatch = copy.copy(batch)
+    batch_with_data._data = batch_data  # type: ignore[assignment]
+    return batch_with_data
+
+
 class BaseCheckpoint(ConfigPeer):
     """
     BaseCheckpoint class is initialized from CheckpointConfig typed object and contains all functionality
@@ -117,6 +173,7 @@ class BaseCheckpoint(ConfigPeer):
         run_time: datetime.datetime | None = None,
         result_format: str | dict | None = None,
         expectation_suite_id: str | None = None,
+        max_workers: int | None = None,
     ) -> CheckpointResult:
         """Validate against current Checkpoint.
 
@@ -136,10 +193,15 @@ class BaseCheckpoint(ConfigPeer):
             run_time: The date/time of the run.
             result_format: One of several supported formatting directives for expectation validation results
             expectation_suite_id: Great Expectations Cloud id for the expectation suite
+            max_workers: Maximum number of validations to run concurrently (in separate threads); if None, the value
+                configured for Checkpoint is used, and if that is None (or 1), validations are run one at a time.
+                Results are reported in the order of validations, and actions of each validation are run in order,
+                after that validation completes.
 
         Raises:
             InvalidCheckpointConfigError: If `run_id` is provided with `run_name` or `run_time`.
             InvalidCheckpointConfigError: If `result_format` is not an expected type.
+            InvalidCheckpointConfigError: If `max_workers` is not a positive integer.
             CheckpointError: If Checkpoint does not contain a `batch_request` or validations.
 
         Returns:
@@ -203,6 +265,16 @@ class BaseCheckpoint(ConfigPeer):
                 f"result_format should be of type - {' '.join(str(t) for t in _result_format_types)}"
             )
 
+        if max_workers is None:
+            max_workers = self.config.max_workers
+
+        if max_workers is not None and (
+            not isinstance(max_workers, int) or max_workers < 1
+        ):
+            raise gx_exceptions.InvalidCheckpointConfigError(
+                f'max_workers should be a positive integer; "{max_workers}" was provided.'
+            )
+
         batch_request = get_batch_request_as_dict(batch_request=batch_request)
         validations = get_validations_with_batch_request_as_dict(
             validations=validations
@@ -242,16 +314,14 @@ class BaseCheckpoint(ConfigPeer):
 
         validation_operator_results: list[ValidationOperatorResult] = []
         if len(validations) > 0:
-            for idx, validation_dict in enumerate(validations):
-                result = self._run_validation(
-                    substituted_runtime_config=substituted_runtime_config,
-                    result_format=result_format,
-                    run_id=run_id,
-                    idx=idx,
-                    validation_dict=validation_dict,
-                    context=context,
-                )
-                validation_operator_results.append(result)
+            validation_operator_results = self._run_validations(
+                validations=validations,
+                substituted_runtime_config=substituted_runtime_config,
+                result_format=result_format,
+                run_id=run_id,
+                context=context,
+                max_workers=max_workers,
+            )
         else:
             result = self._run_validation(
                 substituted_runtime_config=substituted_runtime_config,
@@ -314,6 +384,154 @@ class BaseCheckpoint(ConfigPeer):
 
         return config_provider.substitute_config(substituted_config)
 
+    def _run_validations(  # noqa: PLR0913
+        self,
+        validations: list[CheckpointValidationConfig],
+        substituted_runtime_config: dict,
+        result_format: dict | str | None,
+        run_id: str | RunIdentifier | None,
+        context: AbstractDataContext,
+        max_workers: int | None = None,
+    ) -> list[ValidationOperatorResult]:
+        """Runs validations (concurrently, if "max_workers" allows) and returns their results in order of validations.
+
+        Batches of the same Datasource are retrieved one validation at a time.  SQL Batches are then validated
+        concurrently (each validation by its own SqlAlchemyExecutionEngine); other validations of Batches from the same
+        Datasource share its ExecutionEngine (and its active Batch), and hence take turns.  Validations sharing the
+        Validator, supplied to Checkpoint, are always run one at a time.  Action lists of concurrently running
+        validations also take turns, because actions may write to the same Stores and Data Docs sites.
+        """
+        max_workers = min(max_workers or 1, len(validations))
+        run_concurrently: bool = max_workers > 1 and self._validator is None
+        actions_lock: threading.Lock | None = (
+            threading.Lock() if run_concurrently else None
+        )
+
+        def _run_validation_at_index(
+            idx: int, datasource_lock: threading.Lock | None = None
+        ) -> ValidationOperatorResult:
+            return self._run_validation(
+                substituted_runtime_config=substituted_runtime_config,
+                result_format=result_format,
+                run_id=run_id,
+                idx=idx,
+                validation_dict=validations[idx],
+                context=context,
+                actions_lock=actions_lock,
+                datasource_lock=datasource_lock,
+            )
+
+        if not run_concurrently:
+            return [_run_validation_at_index(idx) for idx in range(len(validations))]
+
+        datasource_locks: dict[str | None, threading.Lock] = defaultdict(threading.Lock)
+        validation_locks: list[threading.Lock] = [
+            datasource_locks[
+                _get_validation_datasource_name(
+                    substituted_runtime_config=substituted_runtime_config,
+                    validation_dict=validation_dict,
+                )
+            ]
+            for validation_dict in validations
+        ]
+
+        def _run_validation_at_index_concurrently(
+            idx: int,
+        ) -> ValidationOperatorResult:
+            return _run_validation_at_index(
+                idx=idx, datasource_lock=validation_locks[idx]
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"gx-checkpoint-{self.name}",
+        ) as executor:
+            # "Executor.map()" yields results in order of its inputs (and re-raises first exception in that order).
+            return list(
+                executor.map(
+                    _run_validation_at_index_concurrently, range(len(validations))
+                )
+            )
+
+    @contextlib.contextmanager
+    def _get_validator(  # noqa: PLR0913
+        self,
+        context: AbstractDataContext,
+        batch_request: BatchRequest | FluentBatchRequest | RuntimeBatchRequest | None,
+        expectation_suite_name: str | None,
+        expectation_suite_id: str | None,
+        include_rendered_content: bool,
+        datasource_lock: threading.Lock | None = None,
+    ) -> Iterator[Validator]:
+        """Provides Validator for the duration of one validation.
+
+        Validations running concurrently pass lock of Datasource of their Batches ("datasource_lock"), under which
+        Batches are retrieved.  SQL Batches are then validated by Validator with its own SqlAlchemyExecutionEngine
+        (closed afterwards) without holding the lock; other Batches are validated by ExecutionEngine of their
+        Datasource, and the lock is held until validation completes.
+        """
+        if self._validator:
+            yield self._validator
+            return
+
+        if self._using_cloud_context:
+            expectation_suite_name = None
+        else:
+            expectation_suite_id = None
+
+        if datasource_lock is None:
+            yield context.get_validator(
+                batch_request=batch_request,
+                expectation_suite_name=expectation_suite_name,
+                expectation_suite_id=expectation_suite_id,
+                include_rendered_content=include_rendered_content,
+            )
+            return
+
+        with datasource_lock:
+            batch_list: list[AnyBatch] = context.get_batch_list(
+                batch_request=batch_request
+            )
+            execution_engine: SqlAlchemyExecutionEngine | None = (
+                _copy_execution_engine_for_concurrent_validation(batch_list=batch_list)
+            )
+            if execution_engine is None:
+                yield context.get_validator(
+                    batch_list=batch_list,  # type: ignore[arg-type]
+                    expectation_suite_name=expectation_suite_name,
+                    expectation_suite_id=expectation_suite_id,
+                    include_rendered_content=include_rendered_content,
+                )
+                return
+
+        # Imported here to avoid circular import (Validator depends on Checkpoint configuration types).
+        from great_expectations.validator.validator import Validator
+
+        try:
+            batch: AnyBatch
+            yield Validator(
+                execution_engine=execution_engine,
+                interactive_evaluation=True,
+                expectation_suite=context.get_expectation_suite(
+                    expectation_suite_name=expectation_suite_name,
+                    include_rendered_content=include_rendered_content,
+                    id=expectation_suite_id,
+                ),
+                data_context=context,
+                batches=[
+                    _get_batch_with_data(
+                        batch=batch,
+                        batch_data=execution_engine.get_batch_data(
+                            batch_spec=batch.batch_spec
+                        ),
+                    )
+                    for batch in batch_list
+                ],
+                include_rendered_content=include_rendered_content,
+            )
+        finally:
+            execution_engine.close()
+
     def _run_validation(  # noqa: PLR0913
         self,
         substituted_runtime_config: dict,
@@ -322,6 +540,8 @@ class BaseCheckpoint(ConfigPeer):
         context: AbstractDataContext,
         idx: int | None = 0,
         validation_dict: CheckpointValidationConfig | None = None,
+        actions_lock: threading.Lock | None = None,
+        datasource_lock: threading.Lock | None = None,
     ) -> ValidationOperatorResult:
         if validation_dict is None:
             validation_dict = CheckpointValidationConfig(
@@ -355,17 +575,6 @@ class BaseCheckpoint(ConfigPeer):
                     context._determine_if_expectation_validation_result_include_rendered_content()
                 )
 
-            validator: Validator = self._validator or context.get_validator(
-                batch_request=batch_request,
-                expectation_suite_name=expectation_suite_name
-                if not self._using_cloud_context
-                else None,
-                expectation_suite_id=(
-                    expectation_suite_id if self._using_cloud_context else None
-                ),
-                include_rendered_content=include_rendered_content,
-            )
-
             action_list: Sequence[ActionDict] | None = substituted_validation_dict.get(
                 "action_list"
             )
@@ -389,6 +598,7 @@ class BaseCheckpoint(ConfigPeer):
                     action_list=action_list,
                     result_format=result_format,
                     name=f"{self.name}-checkpoint-validation[{idx}]",
+                    actions_lock=actions_lock,
                 )
             )
             checkpoint_identifier = None
@@ -405,18 +615,26 @@ class BaseCheckpoint(ConfigPeer):
 
             validation_id: str | None = substituted_validation_dict.get("id")
 
-            return action_list_validation_operator.run(
-                assets_to_validate=[validator],
-                run_id=run_id,
-                evaluation_parameters=substituted_validation_dict.get(
-                    "evaluation_parameters"
-                ),
-                result_format=result_format,
-                checkpoint_identifier=checkpoint_identifier,
-                checkpoint_name=self.name,
-                validation_id=validation_id,
-                **operator_run_kwargs,
-            )
+            with self._get_validator(
+                context=context,
+                batch_request=batch_request,
+                expectation_suite_name=expectation_suite_name,
+                expectation_suite_id=expectation_suite_id,
+                include_rendered_content=include_rendered_content,
+                datasource_lock=datasource_lock,
+            ) as validator:
+                return action_list_validation_operator.run(
+                    assets_to_validate=[validator],
+                    run_id=run_id,
+                    evaluation_parameters=substituted_validation_dict.get(
+                        "evaluation_parameters"
+                    ),
+                    result_format=result_format,
+                    checkpoint_identifier=checkpoint_identifier,
+                    checkpoint_name=self.name,
+                    validation_id=validation_id,
+                    **operator_run_kwargs,
+                )
         except (
             gx_exceptions.CheckpointError,
             gx_exceptions.ExecutionEngineError,
@@ -501,6 +719,7 @@ class Checkpoint(BaseCheckpoint):
         id: Great Expectations Cloud id for this Checkpoint.
         expectation_suite_id: Great Expectations Cloud id associated with Expectation Suite.
         default_validation_id:  Default value used by Checkpoint if no Validations are configured.
+        max_workers: Maximum number of validations to run concurrently, if not overridden by `run()`.
 
     Raises:
         ValueError: If BatchRequest contains batch_data, since only primitive types are allowed in the constructor.
@@ -541,6 +760,7 @@ class Checkpoint(BaseCheckpoint):
         id: str | None = None,
         expectation_suite_id: str | None = None,
         default_validation_id: str | None = None,
+        max_workers: int | None = None,
     ) -> None:
         validations = convert_validations_list_to_checkpoint_validation_configs(
             validations
@@ -595,6 +815,7 @@ constructor arguments.
             id=id,
             expectation_suite_id=expectation_suite_id,
             default_validation_id=default_validation_id,
+            max_workers=max_workers,
         )
         super().__init__(
             checkpoint_config=checkpoint_config,
@@ -623,6 +844,7 @@ constructor arguments.
         expectation_suite_id: Optional[str] = None,
         default_validation_id: Optional[str] = None,
         validator: Validator | None = None,
+        max_workers: Optional[int] = None,
     ) -> Checkpoint:
         checkpoint_config: Union[CheckpointConfig, dict]
 
@@ -662,6 +884,7 @@ constructor arguments.
             "id": id,
             "expectation_suite_id": expectation_suite_id,
             "default_validation_id": default_validation_id,
+            "max_workers": max_workers,
         }
 
         default_checkpoints_module_name = "great_expectations.checkpoint"
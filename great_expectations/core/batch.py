@@ -749,6 +749,8 @@ class Batch(SerializableDictDot):
         batch_kwargs=None,
     ) -> None:
         self._data = data
+        # Set (by BatchManager) on copies of Batch, whose data is held only by bounded BatchData cache.
+        self._batch_data_loader: Callable[[], BatchDataType | None] | None = None
         if batch_request is None:
             batch_request = {}
 
@@ -783,13 +785,17 @@ class Batch(SerializableDictDot):
 
     @property
     def data(self) -> BatchDataType | None:
-        """Getter for Batch data"""
+        """Getter for Batch data (loaded again, if it was evicted from BatchData cache of ExecutionEngine)"""
+        if self._data is None and self._batch_data_loader is not None:
+            return self._batch_data_loader()
+
         return self._data
 
     @data.setter
     def data(self, value: BatchDataType) -> None:
         """Setter for Batch data"""
         self._data = value
+        self._batch_data_loader = None
 
     @property
     def batch_request(self):
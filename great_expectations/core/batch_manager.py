@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+)
 
 from great_expectations.core.batch import (
     Batch,
@@ -11,6 +23,7 @@ from great_expectations.core.batch import (
     BatchMarkers,
     _get_fluent_batch_class,
 )
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec
 
 if TYPE_CHECKING:
     from great_expectations.core.batch import AnyBatch
@@ -21,16 +34,148 @@ logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
 
 
+class _BatchDataCache(MutableMapping[str, BatchDataUnion]):
+    """LRU cache of loaded BatchData objects (with batch_id as key), optionally bounded by count and by memory.
+
+    Entries marked as "evictable" (i.e., those, whose BatchData can be re-materialized) are evicted, least recently used
+    first, whenever either budget is exceeded.  Evicted entries remain keys of this cache; accessing them calls "loader",
+    which is expected to load BatchData again (and to store it in this cache).  Other entries (e.g., in-memory DataFrame
+    objects supplied at runtime), "pinned" entry (i.e., active BatchData), and most recently used entry are never evicted.
+    Memory footprint of entry is reported by "sizer" (entries of unknown size count only against "max_count" budget).
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        loader: Callable[[str], None],
+        sizer: Callable[[BatchDataUnion], Optional[int]],
+        on_evict: Callable[[str, BatchDataUnion], None],
+        max_count: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self._loader = loader
+        self._sizer = sizer
+        self._on_evict = on_evict
+        self._max_count = max_count
+        self._max_bytes = max_bytes
+
+        # All known "batch_id" keys, in order of their first appearance (loaded or not).
+        self._batch_ids: Dict[str, None] = {}
+        # Loaded BatchData objects, in order of their use (least recently used first).
+        self._batch_data: OrderedDict[str, BatchDataUnion] = OrderedDict()
+        self._batch_data_sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+
+        self._evictable_batch_ids: Set[str] = set()
+        self._pinned_batch_id: Optional[str] = None
+
+    @property
+    def is_bounded(self) -> bool:
+        return self._max_count is not None or self._max_bytes is not None
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def is_loaded(self, batch_id: str) -> bool:
+        return batch_id in self._batch_data
+
+    def register(self, batch_id: str, evictable: bool) -> None:
+        """Adds "batch_id" key (without loading its BatchData) and sets whether or not its entry may be evicted."""
+        self._batch_ids[batch_id] = None
+        if evictable:
+            self._evictable_batch_ids.add(batch_id)
+        else:
+            self._evictable_batch_ids.discard(batch_id)
+
+        self._evict()
+
+    def pin(self, batch_id: Optional[str]) -> None:
+        self._pinned_batch_id = batch_id
+
+    def __getitem__(self, batch_id: str) -> BatchDataUnion:
+        if batch_id in self._batch_data:
+            self._batch_data.move_to_end(batch_id)
+            return self._batch_data[batch_id]
+
+        if batch_id not in self._batch_ids:
+            raise KeyError(batch_id)
+
+        self._loader(batch_id)
+        return self._batch_data[batch_id]
+
+    def __setitem__(self, batch_id: str, batch_data: BatchDataUnion) -> None:
+        if batch_id in self._batch_data:
+            self._remove(batch_id=batch_id)
+
+        self._batch_ids[batch_id] = None
+        self._batch_data[batch_id] = batch_data
+
+        size: Optional[int] = self._sizer(batch_data)
+        if size is not None:
+            self._batch_data_sizes[batch_id] = size
+            self._total_bytes += size
+
+        self._evict()
+
+    def __delitem__(self, batch_id: str) -> None:
+        del self._batch_ids[batch_id]
+        self._evictable_batch_ids.discard(batch_id)
+        if batch_id in self._batch_data:
+            self._on_evict(batch_id, self._remove(batch_id=batch_id))
+
+    def __contains__(self, batch_id: object) -> bool:
+        return batch_id in self._batch_ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._batch_ids))
+
+    def __len__(self) -> int:
+        return len(self._batch_ids)
+
+    def _is_over_budget(self) -> bool:
+        return (
+            self._max_count is not None and len(self._batch_data) > self._max_count
+        ) or (self._max_bytes is not None and self._total_bytes > self._max_bytes)
+
+    def _evict(self) -> None:
+        while self._is_over_budget():
+            # The most recently used entry is being (or is about to be) used by caller; hence, it is never evicted.
+            batch_id: Optional[str] = next(
+                (
+                    key
+                    for key in list(self._batch_data)[:-1]
+                    if key in self._evictable_batch_ids and key != self._pinned_batch_id
+                ),
+                None,
+            )
+            if batch_id is None:
+                return
+
+            logger.debug(f'Evicting BatchData for Batch ID "{batch_id}" from cache.')
+            self._on_evict(batch_id, self._remove(batch_id=batch_id))
+
+    def _remove(self, batch_id: str) -> BatchDataUnion:
+        self._total_bytes -= self._batch_data_sizes.pop(batch_id, 0)
+        return self._batch_data.pop(batch_id)
+
+
 class BatchManager:
     def __init__(
         self,
         execution_engine: ExecutionEngine,
         batch_list: Optional[List[Batch]] = None,
+        batch_data_cache_max_count: Optional[int] = None,
+        batch_data_cache_max_bytes: Optional[int] = None,
     ) -> None:
         """
         Args:
             execution_engine: The ExecutionEngine to be used to access cache of loaded Batch objects.
             batch_list: List of Batch objects available from external source (default is None).
+            batch_data_cache_max_count: Maximum number of BatchData objects held loaded at once (default is None,
+                meaning unbounded).  When either budget is set, BatchData of Batch objects, which can be re-materialized
+                from their BatchSpec, are loaded on first access and evicted (least recently used first) as needed.
+            batch_data_cache_max_bytes: Maximum memory footprint of loaded BatchData objects, as estimated by
+                ExecutionEngine (default is None, meaning unbounded).
         """
         self._execution_engine: ExecutionEngine = execution_engine
 
@@ -38,19 +183,28 @@ class BatchManager:
         self._active_batch_data_id: Optional[str] = None
 
         self._batch_cache: Dict[str, AnyBatch] = OrderedDict()
-        self._batch_data_cache: Dict[str, BatchDataUnion] = {}
+        self._batch_data_cache: _BatchDataCache = _BatchDataCache(
+            loader=self._reload_batch_data,
+            sizer=self._get_batch_data_size,
+            on_evict=self._unload_batch_data,
+            max_count=batch_data_cache_max_count,
+            max_bytes=batch_data_cache_max_bytes,
+        )
+        # BatchSpec objects, from which evicted BatchData can be re-materialized (with batch_id as key).
+        self._batch_specs: Dict[str, BatchSpec] = {}
+        self._reloading_batch_id: Optional[str] = None
 
         if batch_list:
             self.load_batch_list(batch_list=batch_list)
 
     @property
-    def batch_data_cache(self) -> Dict[str, BatchDataUnion]:
-        """Dictionary of loaded BatchData objects."""
+    def batch_data_cache(self) -> MutableMapping[str, BatchDataUnion]:
+        """Dictionary of loaded BatchData objects (evicted and not yet loaded ones are loaded upon access)."""
         return self._batch_data_cache
 
     @property
     def loaded_batch_ids(self) -> List[str]:
-        """IDs of loaded BatchData objects."""
+        """IDs of loaded BatchData objects (including those, which are loaded upon access)."""
         return list(self._batch_data_cache.keys())
 
     @property
@@ -145,7 +299,7 @@ class BatchManager:
 
     def load_batch_list(self, batch_list: Sequence[AnyBatch]) -> None:
         batch: AnyBatch
-        for batch in batch_list:
+        for idx, batch in enumerate(batch_list):
             try:
                 assert isinstance(
                     batch, (Batch, _get_fluent_batch_class())
@@ -153,11 +307,23 @@ class BatchManager:
             except AssertionError as e:
                 logger.error(str(e))
 
+            self.register_batch_spec(batch_id=batch.id, batch_spec=batch.batch_spec)
+
+            if batch.id not in self._batch_specs:
+                self._batch_cache[batch.id] = batch
+            else:
+                # BatchData, which can be re-materialized from BatchSpec, is referenced only by bounded BatchData cache
+                # (so that its eviction actually releases memory); it is loaded on first access, unless Batch is final.
+                self._batch_cache[batch.id] = self._get_batch_resolving_data_from_cache(
+                    batch=batch
+                )
+                if idx < len(batch_list) - 1:
+                    continue
+
             self._execution_engine.load_batch_data(
                 batch_id=batch.id, batch_data=batch.data  # type: ignore[arg-type]
             )
 
-            self._batch_cache[batch.id] = batch
             # We set the active_batch_id in each iteration of the loop to keep in sync with the active_batch_data_id
             # that has been loaded.  Hence, the final active_batch_id will be that of the final BatchData loaded.
             self._active_batch_id = batch.id
@@ -166,5 +332,65 @@ class BatchManager:
         """
         Updates the data for the specified Batch in the cache
         """
+        # Loading evicted (or not yet loaded) BatchData on demand does not change the active BatchData.
+        if batch_id != self._reloading_batch_id:
+            self._active_batch_data_id = batch_id
+            self._batch_data_cache.pin(batch_id)
+
         self._batch_data_cache[batch_id] = batch_data
-        self._active_batch_data_id = batch_id
+
+    def register_batch_spec(
+        self, batch_id: str, batch_spec: Optional[BatchSpec]
+    ) -> None:
+        """
+        Records BatchSpec, from which BatchData for specified Batch can be re-materialized, should it be evicted from
+        bounded cache.  BatchSpec objects, which hold in-memory data themselves (i.e., RuntimeDataBatchSpec), are ignored.
+        """
+        if not self._batch_data_cache.is_bounded:
+            return
+
+        if not batch_spec or isinstance(batch_spec, RuntimeDataBatchSpec):
+            return
+
+        self._batch_specs[batch_id] = batch_spec
+        self._batch_data_cache.register(batch_id=batch_id, evictable=True)
+
+    def _get_batch_resolving_data_from_cache(self, batch: AnyBatch) -> AnyBatch:
+        """
+        Returns shallow copy of Batch (retaining its BatchSpec and metadata), which does not reference its BatchData;
+        instead, its "data" is looked up in BatchData cache upon access (evicted BatchData is re-materialized).
+        """
+        batch_resolving_data_from_cache: AnyBatch = copy.copy(batch)
+        batch_resolving_data_from_cache._data = None  # type: ignore[assignment]
+        batch_resolving_data_from_cache._batch_data_loader = functools.partial(
+            self._batch_data_cache.get, batch.id
+        )
+        return batch_resolving_data_from_cache
+
+    def _reload_batch_data(self, batch_id: str) -> None:
+        batch_spec: Optional[BatchSpec] = self._batch_specs.get(batch_id)
+        if batch_spec is None:
+            raise KeyError(batch_id)
+
+        logger.debug(
+            f'Re-materializing BatchData for Batch ID "{batch_id}" from its BatchSpec.'
+        )
+        batch_data: BatchDataUnion = self._execution_engine.get_batch_data(
+            batch_spec=batch_spec
+        )
+
+        self._reloading_batch_id = batch_id
+        try:
+            self._execution_engine.load_batch_data(
+                batch_id=batch_id, batch_data=batch_data  # type: ignore[arg-type]
+            )
+        finally:
+            self._reloading_batch_id = None
+
+    def _get_batch_data_size(self, batch_data: BatchDataUnion) -> Optional[int]:
+        return self._execution_engine.get_batch_data_size(batch_data=batch_data)
+
+    def _unload_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
+        self._execution_engine.unload_batch_data(
+            batch_id=batch_id, batch_data=batch_data
+        )
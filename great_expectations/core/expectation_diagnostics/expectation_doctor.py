@@ -37,6 +37,8 @@ from great_expectations.expectations.expectation_configuration import (
 from great_expectations.expectations.registry import (
     _registered_metrics,
     _registered_renderers,
+    register_core_expectations,
+    register_core_metrics,
 )
 from great_expectations.render import (
     CollapseContent,
@@ -128,6 +130,10 @@ class ExpectationDoctor:
             _debug = lambda x: x  # noqa: E731
             _error = lambda x: x  # noqa: E731
 
+        # Diagnostics inspect registries directly; hence, all core Metrics and renderers must be registered beforehand.
+        register_core_metrics()
+        register_core_expectations()
+
         library_metadata: AugmentedLibraryMetadata = (
             self._get_augmented_library_metadata()
         )
@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 import json
 import logging
+import operator
 import pprint
 import uuid
 from copy import deepcopy
@@ -11,9 +12,11 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -67,6 +70,194 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _to_hashable(value: Any) -> Hashable:
+    """Converts (nested) kwargs value to hashable one, such that equal values are converted to equal hashable values.
+
+    Raises:
+        TypeError: value contains element, which is neither hashable nor container (dict, list, tuple, or set).
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _to_hashable(item)) for key, item in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(item) for item in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_to_hashable(item) for item in value)
+
+    hash(value)
+    return value
+
+
+class _ExpectationIndex:
+    """Hash index of Expectations (by position in list of ExpectationSuite) for "domain" and "success" match types.
+
+    Index keys are expectation type and (hashable form of) domain or success kwargs.  Index only narrows down candidate
+    positions (which are confirmed by "ExpectationConfiguration.isEquivalentTo()"); Expectations, whose kwargs cannot be
+    made hashable, are candidates for every lookup.  Keys are computed once per Expectation object and are recomputed
+    only for Expectation, whose domain or success kwarg has since been reassigned (as tracked by its "_kwargs_version");
+    Expectation modified in place otherwise (e.g., by mutating its kwarg value) must be passed to "discard()"
+    (ExpectationSuite does this when Expectation is saved).  Index is synchronized with list of Expectations on every
+    lookup: appended Expectations are indexed incrementally, and any other change to list (e.g., its reassignment)
+    re-creates positions from already computed keys.
+    """
+
+    MATCH_TYPES: Tuple[str, ...] = ("domain", "success")
+
+    def __init__(self) -> None:
+        # Expectation objects in positions, which index currently reflects.
+        self._expectations: List[Expectation] = []
+        # Computed keys (by match type) of indexed Expectation objects (with id() of Expectation object as key), along
+        # with "_kwargs_version" of Expectation object, for which they were computed.
+        self._keys: Dict[
+            int, Tuple[Expectation, int, Dict[str, Optional[Hashable]]]
+        ] = {}
+        self._positions: Dict[str, Dict[Hashable, List[int]]] = {
+            match_type: {} for match_type in self.MATCH_TYPES
+        }
+        self._unhashable_positions: Dict[str, List[int]] = {
+            match_type: [] for match_type in self.MATCH_TYPES
+        }
+        # Value of "Expectation._kwargs_assignment_count", for which versions of computed keys have been checked.
+        self._kwargs_assignment_count: Optional[int] = None
+
+    @staticmethod
+    def get_key(
+        expectation_configuration: ExpectationConfiguration, match_type: str
+    ) -> Optional[Hashable]:
+        """Index key of ExpectationConfiguration for given match type (None, if key cannot be computed)."""
+        try:
+            kwargs: dict = (
+                expectation_configuration.get_domain_kwargs()
+                if match_type == "domain"
+                else expectation_configuration.get_success_kwargs()
+            )
+            return expectation_configuration.expectation_type, _to_hashable(kwargs)
+        except (gx_exceptions.GreatExpectationsError, TypeError):
+            return None
+
+    def find_candidates(
+        self,
+        expectations: List[Expectation],
+        expectation_configuration: ExpectationConfiguration,
+        match_type: str,
+    ) -> Optional[List[int]]:
+        """Sorted positions of Expectations possibly matching ExpectationConfiguration (None, if index is unusable)."""
+        if match_type not in self.MATCH_TYPES:
+            return None
+
+        key: Optional[Hashable] = self.get_key(
+            expectation_configuration=expectation_configuration, match_type=match_type
+        )
+        if key is None:
+            return None
+
+        self._sync(expectations=expectations)
+
+        return sorted(
+            self._positions[match_type].get(key, [])
+            + self._unhashable_positions[match_type]
+        )
+
+    def replace(self, position: int, expectation: Expectation) -> None:
+        """Updates index for Expectation object, which replaced another one in given position of (synchronized) list."""
+        if position >= len(self._expectations):
+            return
+
+        self._unindex(position=position)
+        self._keys.pop(id(self._expectations[position]), None)
+        self._expectations[position] = expectation
+        self._index(position=position)
+
+    def discard(self, expectation: Expectation) -> None:
+        """Forgets computed keys of Expectation object (e.g., because it has been modified in place)."""
+        if self._keys.pop(id(expectation), None) is not None:
+            self._reset()
+
+    def _sync(self, expectations: List[Expectation]) -> None:
+        from great_expectations.expectations.expectation import Expectation
+
+        if not (
+            len(expectations) >= len(self._expectations)
+            and all(map(operator.is_, self._expectations, expectations))
+        ):
+            current_ids: Set[int] = {id(expectation) for expectation in expectations}
+            self._keys = {
+                key: value for key, value in self._keys.items() if key in current_ids
+            }
+            self._reset()
+        elif self._kwargs_assignment_count != Expectation._kwargs_assignment_count:
+            # Only Expectations, whose domain or success kwargs have been reassigned, are indexed anew.
+            position: int
+            expectation: Expectation
+            for position, expectation in enumerate(self._expectations):
+                if self._keys[id(expectation)][1] != expectation._kwargs_version:
+                    self._unindex(position=position)
+                    self._index(position=position)
+
+        self._kwargs_assignment_count = Expectation._kwargs_assignment_count
+
+        # Only Expectations appended since last synchronization need to be indexed.
+        num_indexed: int = len(self._expectations)
+        self._expectations.extend(expectations[num_indexed:])
+        for position in range(num_indexed, len(self._expectations)):
+            self._index(position=position)
+
+    def _reset(self) -> None:
+        self._expectations = []
+        for match_type in self.MATCH_TYPES:
+            self._positions[match_type] = {}
+            self._unhashable_positions[match_type] = []
+
+    def _get_keys(self, expectation: Expectation) -> Dict[str, Optional[Hashable]]:
+        entry: Optional[
+            Tuple[Expectation, int, Dict[str, Optional[Hashable]]]
+        ] = self._keys.get(id(expectation))
+        if entry is None or entry[1] != expectation._kwargs_version:
+            expectation_configuration: ExpectationConfiguration = (
+                expectation.configuration
+            )
+            entry = (
+                expectation,
+                expectation._kwargs_version,
+                {
+                    match_type: self.get_key(
+                        expectation_configuration=expectation_configuration,
+                        match_type=match_type,
+                    )
+                    for match_type in self.MATCH_TYPES
+                },
+            )
+            self._keys[id(expectation)] = entry
+
+        return entry[2]
+
+    def _index(self, position: int) -> None:
+        match_type: str
+        key: Optional[Hashable]
+        for match_type, key in self._get_keys(
+            expectation=self._expectations[position]
+        ).items():
+            if key is None:
+                self._unhashable_positions[match_type].append(position)
+            else:
+                self._positions[match_type].setdefault(key, []).append(position)
+
+    def _unindex(self, position: int) -> None:
+        # Positions are removed under keys, which Expectation was indexed by (even if they have since become stale).
+        match_type: str
+        key: Optional[Hashable]
+        for match_type, key in self._keys[id(self._expectations[position])][2].items():
+            positions: List[int] = (
+                self._unhashable_positions[match_type]
+                if key is None
+                else self._positions[match_type][key]
+            )
+            positions.remove(position)
+            if key is not None and not positions:
+                del self._positions[match_type][key]
+
+
 @public_api
 @deprecated_argument(argument_name="data_asset_type", version="0.14.0")
 class ExpectationSuite(SerializableDictDot):
@@ -107,6 +298,7 @@ class ExpectationSuite(SerializableDictDot):
             self.name = expectation_suite_name
         self.id = id
 
+        self._expectation_index = _ExpectationIndex()
         self.expectations = [
             self._process_expectation(exp) for exp in expectations or []
         ]
@@ -288,6 +480,8 @@ class ExpectationSuite(SerializableDictDot):
         return self._store.has_key(key=key)
 
     def _save_expectation(self, expectation) -> Expectation:
+        # Expectation may have been modified in place; hence, its index keys are computed anew upon next lookup.
+        self._expectation_index.discard(expectation=expectation)
         expectation = self._store.update_expectation(
             suite=self, expectation=expectation
         )
@@ -427,6 +621,8 @@ class ExpectationSuite(SerializableDictDot):
         for key in attributes_to_copy:
             setattr(result, key, deepcopy(getattr(self, key), memo))
 
+        result._expectation_index = _ExpectationIndex()
+
         return result
 
     @public_api
@@ -527,7 +723,6 @@ class ExpectationSuite(SerializableDictDot):
             TypeError: Must provide either expectation_configuration or id.
             ValueError: No match or multiple matches found (and remove_multiple_matches=False).
         """
-        expectation_configurations = [exp.configuration for exp in self.expectations]
         if expectation_configuration is None and id is None:
             raise TypeError("Must provide either expectation_configuration or id")
 
@@ -539,28 +734,17 @@ class ExpectationSuite(SerializableDictDot):
         if len(found_expectation_indexes) < 1:
             raise ValueError("No matching expectation was found.")
 
-        elif len(found_expectation_indexes) > 1:
-            if remove_multiple_matches:
-                removed_expectations = []
-                for index in sorted(found_expectation_indexes, reverse=True):
-                    removed_expectations.append(expectation_configurations.pop(index))
-                self.expectations = [
-                    self._build_expectation(config)
-                    for config in expectation_configurations
-                ]
-                return removed_expectations
-            else:
-                raise ValueError(
-                    "More than one matching expectation was found. Specify more precise matching criteria,"
-                    "or set remove_multiple_matches=True"
-                )
+        elif len(found_expectation_indexes) > 1 and not remove_multiple_matches:
+            raise ValueError(
+                "More than one matching expectation was found. Specify more precise matching criteria,"
+                "or set remove_multiple_matches=True"
+            )
 
-        else:
-            result = [expectation_configurations.pop(found_expectation_indexes[0])]
-            self.expectations = [
-                self._build_expectation(config) for config in expectation_configurations
-            ]
-            return result
+        # Remaining Expectation objects (and their already computed index keys) are retained.
+        return [
+            self.expectations.pop(index).configuration
+            for index in sorted(found_expectation_indexes, reverse=True)
+        ]
 
     def remove_all_expectations_of_type(
         self, expectation_types: Union[List[str], str]
@@ -592,6 +776,11 @@ class ExpectationSuite(SerializableDictDot):
         If a id is provided, match_type is ignored and only indexes of Expectations
         with matching id are returned.
 
+        Expectations of the suite are looked up (for 'domain' and 'success' match types) by their kwargs, which are
+        indexed once per Expectation. Reassigning a kwarg of an Expectation (e.g., `expectation.column = "b"`) is
+        picked up automatically; however, mutating a kwarg value in place (e.g., `expectation.value_set.append(5)`) is
+        not, and such Expectation may not be found by its new kwargs until it is saved (`expectation.save()`).
+
         Args:
             expectation_configuration: A potentially incomplete (partial) Expectation Configuration to match against to
                 find the index of any matching Expectation Configurations on the suite.
@@ -621,19 +810,32 @@ class ExpectationSuite(SerializableDictDot):
                 "Ensure that expectation configuration is valid."
             )
 
-        match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
-            if id is not None:
-                if expectation.id == id:
-                    match_indexes.append(idx)
-            else:  # noqa: PLR5501
-                if expectation.configuration.isEquivalentTo(
-                    other=expectation_configuration,  # type: ignore[arg-type]
-                    match_type=match_type,
-                ):
-                    match_indexes.append(idx)
+        if id is not None:
+            return [
+                idx
+                for idx, expectation in enumerate(self.expectations)
+                if expectation.id == id
+            ]
 
-        return match_indexes
+        # Hash index narrows down candidates for "domain" and "success" match types; otherwise, all are candidates.
+        candidate_indexes: Optional[
+            List[int]
+        ] = self._expectation_index.find_candidates(
+            expectations=self.expectations,
+            expectation_configuration=expectation_configuration,  # type: ignore[arg-type]
+            match_type=match_type,
+        )
+        if candidate_indexes is None:
+            candidate_indexes = list(range(len(self.expectations)))
+
+        return [
+            idx
+            for idx in candidate_indexes
+            if self.expectations[idx].configuration.isEquivalentTo(
+                other=expectation_configuration,  # type: ignore[arg-type]
+                match_type=match_type,
+            )
+        ]
 
     @public_api
     def find_expectations(
@@ -721,11 +923,13 @@ class ExpectationSuite(SerializableDictDot):
                 if existing_expectation_id is not None:
                     expectation_configuration.id = existing_expectation_id
 
-                self.expectations[
-                    found_expectation_indexes[0]
-                ] = self._build_expectation(
+                expectation: Expectation = self._build_expectation(
                     expectation_configuration=expectation_configuration
                 )
+                self.expectations[found_expectation_indexes[0]] = expectation
+                self._expectation_index.replace(
+                    position=found_expectation_indexes[0], expectation=expectation
+                )
             else:
                 raise gx_exceptions.DataContextError(
                     "A matching ExpectationConfiguration already exists. If you would like to overwrite this "
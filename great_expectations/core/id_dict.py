@@ -11,13 +11,33 @@ T = TypeVar("T")
 
 
 class IDDict(dict):
+    """Dictionary, identified by (and hashed on) its contents.
+
+    Since computing identifier requires serializing contents, identifier (for default "id_keys" and "id_ignore_keys")
+    is computed once and cached; cached identifier is discarded whenever IDDict itself is modified.  As with any
+    hashable object, values must not be modified in place once identifier has been obtained.
+    """
+
     _id_ignore_keys: Set[str] = set()
 
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is None and id_ignore_keys is None:
+            try:
+                return self.__dict__["_cached_id"]
+            except KeyError:
+                _id = self._compute_id(
+                    id_keys=self.keys(), id_ignore_keys=self._id_ignore_keys
+                )
+                self.__dict__["_cached_id"] = _id
+                return _id
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
+        return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+    def _compute_id(self, id_keys, id_ignore_keys):
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
             return tuple()
@@ -30,6 +50,49 @@ class IDDict(dict):
             json.dumps(_id_dict, sort_keys=True).encode("utf-8")
         ).hexdigest()
 
+    def _invalidate_cached_id(self) -> None:
+        self.__dict__.pop("_cached_id", None)
+
+    @override
+    def __setitem__(self, key, value) -> None:
+        self._invalidate_cached_id()
+        super().__setitem__(key, value)
+
+    @override
+    def __delitem__(self, key) -> None:
+        self._invalidate_cached_id()
+        super().__delitem__(key)
+
+    @override
+    def __ior__(self, other):  # type: ignore[misc,override]
+        self._invalidate_cached_id()
+        return super().__ior__(other)
+
+    @override
+    def update(self, *args, **kwargs) -> None:
+        self._invalidate_cached_id()
+        super().update(*args, **kwargs)
+
+    @override
+    def setdefault(self, key, default=None):
+        self._invalidate_cached_id()
+        return super().setdefault(key, default)
+
+    @override
+    def pop(self, key, *args):
+        self._invalidate_cached_id()
+        return super().pop(key, *args)
+
+    @override
+    def popitem(self):
+        self._invalidate_cached_id()
+        return super().popitem()
+
+    @override
+    def clear(self) -> None:
+        self._invalidate_cached_id()
+        super().clear()
+
     @override
     def __hash__(self) -> int:  # type: ignore[override]
         """Overrides the default implementation"""
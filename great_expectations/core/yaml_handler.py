@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import io
+import threading
 from pathlib import Path
 
 from ruamel.yaml import YAML
@@ -42,6 +43,8 @@ class YAMLHandler:
         # TODO: ensure this does not break all usage of ruamel in GX codebase.
         self._handler.indent(mapping=2, sequence=4, offset=2)
         self._handler.default_flow_style = False
+        # ruamel YAML objects keep parser and emitter state; hence, they must not be used by several threads at once.
+        self._lock = threading.Lock()
 
     @public_api
     def load(self, stream: io.TextIOWrapper | str) -> dict[str, JSONValues]:
@@ -64,7 +67,8 @@ class YAMLHandler:
         Returns:
             The deserialized dictionary form of the input stream.
         """
-        return self._handler.load(stream=stream)
+        with self._lock:
+            return self._handler.load(stream=stream)
 
     @public_api
     def dump(
@@ -101,10 +105,12 @@ class YAMLHandler:
 
     def _dump(self, data: dict, stream, **kwargs) -> None:
         """If an input stream has been provided, modify it in place."""
-        self._handler.dump(data=data, stream=stream, **kwargs)
+        with self._lock:
+            self._handler.dump(data=data, stream=stream, **kwargs)
 
     def _dump_and_return_value(self, data: dict, **kwargs) -> str:
         """If an input stream hasn't been provided, generate one and return the value."""
         stream = io.StringIO()
-        self._handler.dump(data=data, stream=stream, **kwargs)
+        with self._lock:
+            self._handler.dump(data=data, stream=stream, **kwargs)
         return stream.getvalue()
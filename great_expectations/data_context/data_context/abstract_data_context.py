@@ -1386,6 +1386,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         default_validation_id: str | None = ...,
         validator: Validator | None = ...,
         checkpoint: None = ...,
+        max_workers: int | None = ...,
     ) -> Checkpoint:
         """
         Individual constructor arguments are provided.
@@ -1409,6 +1410,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         default_validation_id: None = ...,
         validator: Validator | None = ...,
         checkpoint: Checkpoint = ...,
+        max_workers: None = ...,
     ) -> Checkpoint:
         """
         A `checkpoint` is provided.
@@ -1441,6 +1443,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         default_validation_id: str | None = None,
         validator: Validator | None = None,
         checkpoint: Checkpoint | None = None,
+        max_workers: int | None = None,
     ) -> Checkpoint:
         """Add a Checkpoint to the DataContext.
 
@@ -1460,6 +1463,7 @@ class AbstractDataContext(ConfigPeer, ABC):
             default_validation_id: The default validation ID to use in generating this checkpoint.
             validator: An existing validator used to generate a validations list.
             checkpoint: An existing checkpoint you wish to persist.
+            max_workers: The maximum number of validations to run concurrently when this checkpoint is run.
 
         Returns:
             The Checkpoint object created.
@@ -1479,6 +1483,7 @@ class AbstractDataContext(ConfigPeer, ABC):
             default_validation_id=default_validation_id,
             validator=validator,
             checkpoint=checkpoint,
+            max_workers=max_workers,
         )
 
         result = self.checkpoint_store.add_checkpoint(checkpoint)
@@ -1533,6 +1538,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         default_validation_id: str | None = ...,
         validator: Validator | None = ...,
         checkpoint: None = ...,
+        max_workers: int | None = ...,
     ) -> Checkpoint:
         """
         Individual constructor arguments are provided.
@@ -1555,6 +1561,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         default_validation_id: None = ...,
         validator: Validator | None = ...,
         checkpoint: Checkpoint = ...,
+        max_workers: None = ...,
     ) -> Checkpoint:
         """
         A `checkpoint` is provided.
@@ -1583,6 +1590,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         default_validation_id: str | None = None,
         validator: Validator | None = None,
         checkpoint: Checkpoint | None = None,
+        max_workers: int | None = None,
     ) -> Checkpoint:
         """Add a new Checkpoint or update an existing one on the context depending on whether it already exists or not.
 
@@ -1599,6 +1607,7 @@ class AbstractDataContext(ConfigPeer, ABC):
             default_validation_id: The default validation ID to use in generating this checkpoint.
             validator: An existing validator used to generate a validations list.
             checkpoint: An existing checkpoint you wish to persist.
+            max_workers: The maximum number of validations to run concurrently when this checkpoint is run.
 
         Returns:
             A new Checkpoint or an updated once (depending on whether or not it existed before this method call).
@@ -1618,6 +1627,7 @@ class AbstractDataContext(ConfigPeer, ABC):
             default_validation_id=default_validation_id,
             validator=validator,
             checkpoint=checkpoint,
+            max_workers=max_workers,
         )
 
         result: Checkpoint | CheckpointConfig = (
@@ -1645,6 +1655,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         default_validation_id: str | None = None,
         validator: Validator | None = None,
         checkpoint: Checkpoint | None = None,
+        max_workers: int | None = None,
     ) -> Checkpoint:
         from great_expectations.checkpoint.checkpoint import Checkpoint
 
@@ -1674,6 +1685,7 @@ class AbstractDataContext(ConfigPeer, ABC):
                 expectation_suite_id=expectation_suite_id,
                 default_validation_id=default_validation_id,
                 validator=validator,
+                max_workers=max_workers,
             )
 
         return checkpoint
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import pathlib
@@ -209,6 +210,31 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        # Compact manifest (one JSON object per line) of summaries of resources, linked from index page.
+        filepath_template = "index_manifest.jsonl"
+        index_manifest_config_defaults = {
+            "module_name": module_name,
+            "filepath_template": filepath_template,
+            "suppress_store_backend_id": True,
+        }
+        if is_gx_cloud_store:
+            index_manifest_config_defaults = {
+                "module_name": module_name,
+                "suppress_store_backend_id": True,
+            }
+
+        index_manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults=index_manifest_config_defaults,
+        )
+        if not index_manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         static_assets_config_defaults = {
             "module_name": module_name,
             "filepath_template": None,
@@ -235,6 +261,7 @@ class HtmlSiteStore:
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
+            "index_manifest": index_manifest_obj,
             "static_assets": static_assets_obj,
         }
 
@@ -373,6 +400,39 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def read_index_manifest(self) -> list[dict]:
+        """Returns entries of index manifest (empty list, if manifest has not been written or cannot be parsed)."""
+        store_backend = self.store_backends["index_manifest"]
+        if not store_backend.has_key(()):
+            return []
+
+        try:
+            return [
+                json.loads(line)
+                for line in store_backend.get(()).splitlines()
+                if line.strip()
+            ]
+        except json.JSONDecodeError as e:
+            logger.warning(f"Index manifest could not be parsed and is ignored: {e}")
+            return []
+
+    def write_index_manifest(self, entries: list[dict]) -> None:
+        """Writes entries of index manifest, one JSON object per line (entries, which are not JSON-serializable, are
+        skipped, since manifest only spares loading of resources it summarizes)."""
+        lines: list[str] = []
+        for entry in entries:
+            try:
+                lines.append(json.dumps(entry))
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Skipping index manifest entry {entry}: {e}")
+
+        self.store_backends["index_manifest"].set(
+            (),
+            "\n".join(lines),
+            content_encoding="utf-8",
+            content_type="application/jsonl; charset=utf-8",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
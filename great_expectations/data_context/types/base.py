@@ -2476,12 +2476,14 @@ class CheckpointConfigSchema(Schema):
             "site_names",
             "id",
             "expectation_suite_id",
+            "max_workers",
         )
         ordered = True
 
     # if keys have None value, remove in post_dump
     REMOVE_KEYS_IF_NONE = [
         "default_validation_id",
+        "max_workers",
     ]
 
     id = fields.UUID(required=False, allow_none=True)
@@ -2500,6 +2502,7 @@ class CheckpointConfigSchema(Schema):
         allow_none=True,
     )
     default_validation_id = fields.String(required=False, allow_none=True)
+    max_workers = fields.Integer(required=False, allow_none=True)
 
     profilers = fields.List(
         cls_or_instance=fields.Dict(), required=False, allow_none=True
@@ -2565,6 +2568,7 @@ class CheckpointConfig(BaseYamlConfig):
         commented_map: The commented map
         id: Your GE Cloud ID
         expectation_suite_id: Your expectation suite
+        max_workers: Maximum number of validations to run concurrently (None runs them one at a time)
     """
 
     def __init__(  # noqa: PLR0913
@@ -2580,6 +2584,7 @@ class CheckpointConfig(BaseYamlConfig):
         commented_map: Optional[CommentedMap] = None,
         id: Optional[str] = None,
         expectation_suite_id: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
         self._name = name
         self._expectation_suite_name = expectation_suite_name
@@ -2591,6 +2596,7 @@ class CheckpointConfig(BaseYamlConfig):
         self._validations = validations or []
         self._default_validation_id = default_validation_id
         self._id = id
+        self._max_workers = max_workers
 
         super().__init__(commented_map=commented_map)
 
@@ -2643,6 +2649,14 @@ class CheckpointConfig(BaseYamlConfig):
     def default_validation_id(self, validation_id: str) -> None:
         self._default_validation_id = validation_id
 
+    @property
+    def max_workers(self) -> Optional[int]:
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: Optional[int]) -> None:
+        self._max_workers = value
+
     @property
     def batch_request(self) -> dict:
         return self._batch_request
@@ -117,6 +117,9 @@ class DataConnector:
         batch_data, batch_markers = self._execution_engine.get_batch_data_and_markers(
             batch_spec=batch_spec
         )
+        self._execution_engine.batch_manager.register_batch_spec(
+            batch_id=batch_definition.id, batch_spec=batch_spec
+        )
         self._execution_engine.load_batch_data(batch_definition.id, batch_data)
         return (
             batch_data,
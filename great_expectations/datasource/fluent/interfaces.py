@@ -915,6 +915,8 @@ class Batch:
         self._data_asset = data_asset
         self._batch_request = batch_request
         self._data = data
+        # Set (by BatchManager) on copies of Batch, whose data is held only by bounded BatchData cache.
+        self._batch_data_loader: Callable[[], BatchData | None] | None = None
 
         # Immutable legacy attributes
         # TODO: These legacy fields are required but we should figure out how to delete them
@@ -951,6 +953,9 @@ class Batch:
 
     @property
     def data(self) -> BatchData:
+        if self._data is None and self._batch_data_loader is not None:
+            return self._batch_data_loader()  # type: ignore[return-value] # None only if Batch is no longer loaded
+
         return self._data
 
     @property
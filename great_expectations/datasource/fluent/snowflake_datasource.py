@@ -197,6 +197,10 @@ class SnowflakeDatasource(SQLDatasource):
             connection_string=connection_string,
             engine=self.get_engine(),
             create_temp_table=self.create_temp_table,
+            max_query_concurrency=self.max_query_concurrency,
+            fuse_row_condition_queries=self.fuse_row_condition_queries,
+            fuse_unexpected_values_queries=self.fuse_unexpected_values_queries,
+            temp_table_materialization_threshold=self.temp_table_materialization_threshold,
             data_context=self._data_context,
         )
         self._execution_engine = gx_exec_engine
@@ -269,6 +269,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> SQLDatasource: ...
     def update_sql(  # noqa: PLR0913
         self,
@@ -278,6 +282,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> SQLDatasource: ...
     def add_or_update_sql(  # noqa: PLR0913
         self,
@@ -287,6 +295,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> SQLDatasource: ...
     def delete_sql(
         self,
@@ -300,6 +312,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> PostgresDatasource: ...
     def update_postgres(  # noqa: PLR0913
         self,
@@ -309,6 +325,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> PostgresDatasource: ...
     def add_or_update_postgres(  # noqa: PLR0913
         self,
@@ -318,6 +338,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> PostgresDatasource: ...
     def delete_postgres(
         self,
@@ -556,6 +580,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> SqliteDatasource: ...
     def update_sqlite(  # noqa: PLR0913
         self,
@@ -565,6 +593,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> SqliteDatasource: ...
     def add_or_update_sqlite(  # noqa: PLR0913
         self,
@@ -574,6 +606,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> SqliteDatasource: ...
     def delete_sqlite(
         self,
@@ -590,6 +626,10 @@ class _SourceFactories:
             ConfigStr, SnowflakeDsn, str, SnowflakeConnectionDetails, dict[str, str]
         ] = ...,
         create_temp_table: bool = ...,
+        max_query_concurrency: int = ...,
+        fuse_row_condition_queries: bool = ...,
+        fuse_unexpected_values_queries: bool = ...,
+        temp_table_materialization_threshold: Optional[int] = ...,
         account: None = ...,
         user: None = ...,
         password: None = ...,
@@ -608,6 +648,10 @@ class _SourceFactories:
         *,
         connection_string: None = ...,
         create_temp_table: bool = ...,
+        max_query_concurrency: int = ...,
+        fuse_row_condition_queries: bool = ...,
+        fuse_unexpected_values_queries: bool = ...,
+        temp_table_materialization_threshold: Optional[int] = ...,
         account: str = ...,
         user: str = ...,
         password: Union[ConfigStr, str] = ...,
@@ -628,6 +672,10 @@ class _SourceFactories:
             ConfigStr, SnowflakeDsn, str, SnowflakeConnectionDetails, dict[str, str]
         ] = ...,
         create_temp_table: bool = ...,
+        max_query_concurrency: int = ...,
+        fuse_row_condition_queries: bool = ...,
+        fuse_unexpected_values_queries: bool = ...,
+        temp_table_materialization_threshold: Optional[int] = ...,
         account: None = ...,
         user: None = ...,
         password: None = ...,
@@ -646,6 +694,10 @@ class _SourceFactories:
         *,
         connection_string: None = ...,
         create_temp_table: bool = ...,
+        max_query_concurrency: int = ...,
+        fuse_row_condition_queries: bool = ...,
+        fuse_unexpected_values_queries: bool = ...,
+        temp_table_materialization_threshold: Optional[int] = ...,
         account: str = ...,
         user: str = ...,
         password: Union[ConfigStr, str] = ...,
@@ -666,6 +718,10 @@ class _SourceFactories:
             ConfigStr, SnowflakeDsn, str, SnowflakeConnectionDetails, dict[str, str]
         ] = ...,
         create_temp_table: bool = ...,
+        max_query_concurrency: int = ...,
+        fuse_row_condition_queries: bool = ...,
+        fuse_unexpected_values_queries: bool = ...,
+        temp_table_materialization_threshold: Optional[int] = ...,
         account: None = ...,
         user: None = ...,
         password: None = ...,
@@ -684,6 +740,10 @@ class _SourceFactories:
         *,
         connection_string: None = ...,
         create_temp_table: bool = ...,
+        max_query_concurrency: int = ...,
+        fuse_row_condition_queries: bool = ...,
+        fuse_unexpected_values_queries: bool = ...,
+        temp_table_materialization_threshold: Optional[int] = ...,
         account: str = ...,
         user: str = ...,
         password: Union[ConfigStr, str] = ...,
@@ -705,6 +765,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, DatabricksDsn, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> DatabricksSQLDatasource: ...
     def update_databricks_sql(  # noqa: PLR0913
         self,
@@ -714,6 +778,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, DatabricksDsn, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> DatabricksSQLDatasource: ...
     def add_or_update_databricks_sql(  # noqa: PLR0913
         self,
@@ -723,6 +791,10 @@ class _SourceFactories:
         *,
         connection_string: Union[ConfigStr, DatabricksDsn, str] = ...,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
     ) -> DatabricksSQLDatasource: ...
     def delete_databricks_sql(
         self,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import logging
+import time
 import warnings
 from datetime import date, datetime
 from pprint import pformat as pf
@@ -13,6 +14,7 @@ from typing import (
     Final,
     List,
     Literal,
+    NamedTuple,
     Optional,
     Protocol,
     Tuple,
@@ -153,7 +155,11 @@ class _Partitioner(Protocol):
                  This category was only 1 parameter per column.
         """
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> List[Dict]:
+    def param_defaults(
+        self,
+        sql_asset: _SQLAsset,
+        selectable: Optional[sqlalchemy.Selectable] = None,
+    ) -> List[Dict]:
         """Creates all valid batch requests options for sql_asset
 
         This can be implemented by querying the data defined in the sql_asset to generate
@@ -162,11 +168,15 @@ class _Partitioner(Protocol):
         set of distinct (year, month) pairs. We would then return a list of BatchRequest.options,
         ie dictionaries, of the form {"year": year, "month": month} that contain all these distinct
         pairs.
+
+        If selectable is provided (e.g., a subset of the rows of sql_asset), only its data is queried.
         """
 
 
 def _partitioner_and_sql_asset_to_batch_identifier_data(
-    partitioner: _Partitioner, asset: _SQLAsset
+    partitioner: _Partitioner,
+    asset: _SQLAsset,
+    selectable: Optional[sqlalchemy.Selectable] = None,
 ) -> list[dict]:
     execution_engine = asset.datasource.get_execution_engine()
     sqlalchemy_data_partitioner = SqlAlchemyDataPartitioner(
@@ -174,7 +184,7 @@ def _partitioner_and_sql_asset_to_batch_identifier_data(
     )
     return sqlalchemy_data_partitioner.get_data_for_batch_identifiers(
         execution_engine=execution_engine,
-        selectable=asset.as_selectable(),
+        selectable=asset.as_selectable() if selectable is None else selectable,
         partitioner_method_name=partitioner.method_name,
         partitioner_kwargs=partitioner.partitioner_method_kwargs(),
     )
@@ -188,9 +198,13 @@ class _PartitionerDatetime(FluentBaseModel):
     def columns(self) -> list[str]:
         return [self.column_name]
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self,
+        sql_asset: _SQLAsset,
+        selectable: Optional[sqlalchemy.Selectable] = None,
+    ) -> list[dict]:
         batch_identifier_data = _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, selectable=selectable
         )
         params: list[dict] = []
         for identifer_data in batch_identifier_data:
@@ -293,9 +307,13 @@ class _PartitionerOneColumnOneParam(FluentBaseModel):
     def columns(self) -> list[str]:
         return [self.column_name]
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self,
+        sql_asset: _SQLAsset,
+        selectable: Optional[sqlalchemy.Selectable] = None,
+    ) -> list[dict]:
         batch_identifier_data = _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, selectable=selectable
         )
         params: list[dict] = []
         for identifer_data in batch_identifier_data:
@@ -391,11 +409,15 @@ class SqlPartitionerColumnValue(_PartitionerOneColumnOneParam):
         return {self.column_name: options[self.column_name]}
 
     @override
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self,
+        sql_asset: _SQLAsset,
+        selectable: Optional[sqlalchemy.Selectable] = None,
+    ) -> list[dict]:
         # The superclass version of param_defaults is correct, but here we leverage that
         # the parameter name is the same as the column name to make this much faster.
         return _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, selectable=selectable
         )
 
 
@@ -426,9 +448,13 @@ class SqlPartitionerMultiColumnValue(FluentBaseModel):
             )
         return {col: options[col] for col in self.column_names}
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self,
+        sql_asset: _SQLAsset,
+        selectable: Optional[sqlalchemy.Selectable] = None,
+    ) -> list[dict]:
         return _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, selectable=selectable
         )
 
 
@@ -489,6 +515,15 @@ SqlPartitioner = Union[
 ]
 
 
+class _PartitionDiscoveryCacheEntry(NamedTuple):
+    """Batch request options discovered for a partitioner, and the state needed to refresh them."""
+
+    params: List[Dict]
+    # Maximum value of the partitioner column at the time of discovery (None if not tracked or no rows).
+    watermark: Any
+    discovered_at: float
+
+
 class _SQLAsset(DataAsset):
     """A _SQLAsset Mixin
 
@@ -503,6 +538,21 @@ class _SQLAsset(DataAsset):
     type: str = pydantic.Field("_sql_asset")
     partitioner: Optional[SqlPartitioner] = None
     name: str
+    partition_discovery_cache_ttl: Optional[float] = pydantic.Field(
+        default=None,
+        ge=0,
+        description="Number of seconds for which partitions, discovered by querying the asset,"
+        " are reused when listing batches; None disables caching",
+    )
+    incremental_partition_discovery: bool = pydantic.Field(
+        default=False,
+        description="Whether previously discovered partitions are refreshed by only querying rows whose"
+        " partitioner column value is above the last seen maximum (assumes rows are appended in order"
+        " of that column)",
+    )
+    _partition_discovery_cache: Dict[
+        str, _PartitionDiscoveryCacheEntry
+    ] = pydantic.PrivateAttr(default_factory=dict)
     _partitioner_implementation_map: Dict[
         Type[Partitioner], Optional[Type[SqlPartitioner]]
     ] = pydantic.PrivateAttr(
@@ -729,6 +779,112 @@ class _SQLAsset(DataAsset):
                 return False
         return True
 
+    @public_api
+    def invalidate_partition_discovery_cache(self) -> None:
+        """Forgets discovered partitions, so that the next batch listing queries the asset for all of them.
+
+        Call this after data was changed in a way that incremental partition discovery cannot detect
+        (e.g., rows were deleted or rows with older partitioner column values were inserted).
+        """
+        self._partition_discovery_cache = {}
+
+    def _get_partition_param_defaults(
+        self, sql_partitioner: SqlPartitioner
+    ) -> List[Dict]:
+        """Returns batch request options of all partitions, reusing and refreshing previous discoveries if enabled."""
+        if (
+            self.partition_discovery_cache_ttl is None
+            and not self.incremental_partition_discovery
+        ):
+            return sql_partitioner.param_defaults(self)
+
+        cache_key: str = sql_partitioner.json(exclude_unset=False)
+        cache_entry: Optional[
+            _PartitionDiscoveryCacheEntry
+        ] = self._partition_discovery_cache.get(cache_key)
+        now: float = time.monotonic()
+        if (
+            cache_entry is not None
+            and self.partition_discovery_cache_ttl is not None
+            and now - cache_entry.discovered_at < self.partition_discovery_cache_ttl
+        ):
+            return copy.deepcopy(cache_entry.params)
+
+        # Only partitions over a single column can be refreshed from that column's last seen maximum value.
+        column_name: Optional[str] = (
+            getattr(sql_partitioner, "column_name", None)
+            if self.incremental_partition_discovery
+            else None
+        )
+        if column_name is None:
+            cache_entry = _PartitionDiscoveryCacheEntry(
+                params=sql_partitioner.param_defaults(self),
+                watermark=None,
+                discovered_at=now,
+            )
+        elif cache_entry is None or cache_entry.watermark is None:
+            cache_entry = _PartitionDiscoveryCacheEntry(
+                params=sql_partitioner.param_defaults(self),
+                watermark=self._get_partitioner_column_max(column_name=column_name),
+                discovered_at=now,
+            )
+        else:
+            cache_entry = self._refresh_partition_discovery_cache_entry(
+                sql_partitioner=sql_partitioner,
+                column_name=column_name,
+                cache_entry=cache_entry,
+                discovered_at=now,
+            )
+
+        self._partition_discovery_cache[cache_key] = cache_entry
+        return copy.deepcopy(cache_entry.params)
+
+    def _refresh_partition_discovery_cache_entry(
+        self,
+        sql_partitioner: SqlPartitioner,
+        column_name: str,
+        cache_entry: _PartitionDiscoveryCacheEntry,
+        discovered_at: float,
+    ) -> _PartitionDiscoveryCacheEntry:
+        """Adds partitions of rows, whose partitioner column value is above the last seen maximum, to cache entry."""
+        new_rows: sqlalchemy.Selectable = (
+            sa.select(sa.text("*"))
+            .select_from(self.as_selectable())
+            .where(sa.column(column_name) > cache_entry.watermark)
+            .subquery()
+        )
+        watermark: Any = self._get_partitioner_column_max(
+            column_name=column_name, selectable=new_rows
+        )
+        if watermark is None:
+            # No rows were appended since the last discovery.
+            return cache_entry._replace(discovered_at=discovered_at)
+
+        params: List[Dict] = list(cache_entry.params)
+        known_params: List[str] = [str(sorted(param.items())) for param in params]
+        param: Dict
+        for param in sql_partitioner.param_defaults(self, selectable=new_rows):
+            if str(sorted(param.items())) not in known_params:
+                params.append(param)
+
+        return _PartitionDiscoveryCacheEntry(
+            params=params, watermark=watermark, discovered_at=discovered_at
+        )
+
+    def _get_partitioner_column_max(
+        self,
+        column_name: str,
+        selectable: Optional[sqlalchemy.Selectable] = None,
+    ) -> Any:
+        execution_engine: SqlAlchemyExecutionEngine = (
+            self.datasource.get_execution_engine()
+        )
+        return execution_engine.execute_query(
+            sa.select(sa.func.max(sa.column(column_name))).select_from(
+                self.as_selectable() if selectable is None else selectable
+            )
+        ).scalar()
+
     def _fully_specified_batch_requests(
         self, batch_request: BatchRequest
     ) -> List[BatchRequest]:
@@ -747,7 +903,7 @@ class _SQLAsset(DataAsset):
 
         batch_requests: List[BatchRequest] = []
         # We iterate through all possible batches as determined by the partitioner
-        for params in sql_partitioner.param_defaults(self):
+        for params in self._get_partition_param_defaults(sql_partitioner):
             # If the params from the partitioner don't match the batch request options
             # we don't create this batch.
             if not _SQLAsset._matches_request_options(params, batch_request.options):
@@ -1158,6 +1314,14 @@ class SQLDatasource(Datasource):
         connection_string: The SQLAlchemy connection string used to connect to the database.
             For example: "postgresql+psycopg2://postgres:@localhost/test_database"
         create_temp_table: Whether to leverage temporary tables during metric computation.
+        max_query_concurrency: Maximum number of per-domain metric queries to run concurrently.
+        fuse_row_condition_queries: Whether to compute aggregate metrics on domains differing only by
+            row_condition in one query.
+        fuse_unexpected_values_queries: Whether to fetch unexpected values and unexpected index lists of
+            map Expectations selecting the same columns in one query.
+        temp_table_materialization_threshold: Minimum number of queries, estimated to re-execute the SQL of
+            a domain (a query asset, or a row_condition), for which that domain is materialized into a
+            temporary table; None disables materialization.
         kwargs: Extra SQLAlchemy keyword arguments to pass to `create_engine()`. Note, only python
             primitive types will be serializable to config.
         assets: An optional dictionary whose keys are SQL DataAsset names and whose values
@@ -1172,6 +1336,20 @@ class SQLDatasource(Datasource):
     type: Literal["sql"] = "sql"
     connection_string: Union[ConfigStr, str]
     create_temp_table: bool = False
+    max_query_concurrency: int = pydantic.Field(
+        default=1,
+        ge=1,
+        description="Maximum number of per-domain metric queries executed concurrently,"
+        " using connections from the SQLAlchemy Engine connection pool",
+    )
+    fuse_row_condition_queries: bool = False
+    fuse_unexpected_values_queries: bool = False
+    temp_table_materialization_threshold: Optional[int] = pydantic.Field(
+        default=None,
+        ge=1,
+        description="Minimum estimated number of queries re-executing the SQL of a domain, for which"
+        " that domain is materialized into a temporary table",
+    )
     kwargs: Dict[str, Union[ConfigStr, Any]] = pydantic.Field(
         default={},
         description="Optional dictionary of `kwargs` will be passed to the SQLAlchemy Engine"
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
 import logging
+import os
+import pathlib
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
 from typing import (
@@ -18,11 +22,16 @@ from typing import (
 )
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations import __version__ as ge_version
 from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch_manager import BatchManager
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+)
 from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -39,12 +48,16 @@ if TYPE_CHECKING:
     from great_expectations.compatibility.pyspark import functions as F
     from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
     from great_expectations.core.batch import (
+        AnyBatch,
         BatchData,
         BatchDataType,
         BatchDataUnion,
         BatchMarkers,
         BatchSpec,
     )
+    from great_expectations.execution_engine.persistent_metric_cache import (
+        PersistentMetricCache,
+    )
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
     from great_expectations.validator.validator import Validator
 
@@ -133,6 +146,16 @@ class ExecutionEngine(ABC):
     Args:
         name: (str) name of this ExecutionEngine
         caching: (Boolean) if True (default), then resolved (computed) metrics are added to local in-memory cache.
+        persistent_metric_cache: PersistentMetricCache object (or its configuration dictionary) for storing resolved
+            metrics across runs, keyed by fingerprint of Batch data (used only if "caching" is True).
+        use_approximate_metrics: (Boolean) if True, metrics supporting approximation (e.g., "column.quantile_values")
+            are computed from mergeable sketches in single pass and bounded memory, rather than exactly (SQL engine
+            estimates them in database with dialect-native approximate functions instead).
+        batch_data_cache_max_count: maximum number of loaded Batch data objects held at once (default None: unbounded);
+            when set (or when "batch_data_cache_max_bytes" is set), least recently used Batch data, which can be
+            re-materialized from its BatchSpec, is evicted (and loaded again from its BatchSpec when needed).
+        batch_data_cache_max_bytes: maximum memory footprint of loaded Batch data objects (default None: unbounded), as
+            estimated by "get_batch_data_size()" (Batch data of unknown size counts only against count budget).
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
@@ -147,9 +170,14 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        persistent_metric_cache: Optional[Union[PersistentMetricCache, dict]] = None,
+        use_approximate_metrics: bool = False,
+        batch_data_cache_max_count: Optional[int] = None,
+        batch_data_cache_max_bytes: Optional[int] = None,
     ) -> None:
         self.name = name
         self._validator = validator
+        self._use_approximate_metrics = use_approximate_metrics
 
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
@@ -160,6 +188,20 @@ class ExecutionEngine(ABC):
         else:
             self._metric_cache = NoOpDict()
 
+        if isinstance(persistent_metric_cache, dict):
+            self._persistent_metric_cache: Optional[
+                PersistentMetricCache
+            ] = instantiate_class_from_config(
+                config=persistent_metric_cache,
+                runtime_environment={},
+                config_defaults={
+                    "module_name": "great_expectations.execution_engine.persistent_metric_cache",
+                    "class_name": "SqlitePersistentMetricCache",
+                },
+            )
+        else:
+            self._persistent_metric_cache = persistent_metric_cache
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
 
@@ -177,7 +219,21 @@ class ExecutionEngine(ABC):
             if key in self.recognized_batch_spec_defaults
         }
 
-        self._batch_manager = BatchManager(execution_engine=self)
+        if batch_data_cache_max_count is not None and batch_data_cache_max_count < 1:
+            raise gx_exceptions.InvalidConfigError(
+                f'"batch_data_cache_max_count" must be positive integer; got {batch_data_cache_max_count}.'
+            )
+
+        if batch_data_cache_max_bytes is not None and batch_data_cache_max_bytes < 0:
+            raise gx_exceptions.InvalidConfigError(
+                f'"batch_data_cache_max_bytes" must be non-negative integer; got {batch_data_cache_max_bytes}.'
+            )
+
+        self._batch_manager = BatchManager(
+            execution_engine=self,
+            batch_data_cache_max_count=batch_data_cache_max_count,
+            batch_data_cache_max_bytes=batch_data_cache_max_bytes,
+        )
 
         if batch_data_dict is None:
             batch_data_dict = {}
@@ -192,6 +248,12 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "persistent_metric_cache": persistent_metric_cache
+            if isinstance(persistent_metric_cache, dict)
+            else None,
+            "use_approximate_metrics": use_approximate_metrics,
+            "batch_data_cache_max_count": batch_data_cache_max_count,
+            "batch_data_cache_max_bytes": batch_data_cache_max_bytes,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -203,6 +265,12 @@ class ExecutionEngine(ABC):
         """Optionally configure the validator as appropriate for the execution engine."""
         pass
 
+    def plan_metric_resolution(  # noqa: B027 # empty-method-without-abstract-decorator
+        self, metrics_to_resolve: Iterable[MetricConfiguration]
+    ) -> None:
+        """Optionally prepare for resolving metrics (e.g., all metrics of "ValidationGraph"), before any is computed."""
+        pass
+
     @property
     def config(self) -> dict:
         return self._config
@@ -211,6 +279,14 @@ class ExecutionEngine(ABC):
     def dialect(self):
         return None
 
+    @property
+    def persistent_metric_cache(self) -> Optional[PersistentMetricCache]:
+        return self._persistent_metric_cache
+
+    @property
+    def use_approximate_metrics(self) -> bool:
+        return self._use_approximate_metrics
+
     @property
     def batch_manager(self) -> BatchManager:
         """Getter for batch_manager"""
@@ -230,6 +306,16 @@ class ExecutionEngine(ABC):
     def load_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def unload_batch_data(  # noqa: B027 # empty-method-without-abstract-decorator
+        self, batch_id: str, batch_data: BatchDataUnion
+    ) -> None:
+        """Optionally release backend resources held by Batch data, which has been evicted from BatchManager cache."""
+        pass
+
+    def get_batch_data_size(self, batch_data: BatchDataUnion) -> Optional[int]:
+        """Estimated memory footprint (in bytes) of loaded Batch data (None, if unknown, which is the default)."""
+        return None
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -270,6 +356,23 @@ class ExecutionEngine(ABC):
         if not metrics_to_resolve:
             return metrics or {}
 
+        # Metrics, computed by previous runs against the same data, are taken from persistent cache before building
+        # (and thus scheduling) any computations; their dependencies are still resolved by ValidationGraph, but these
+        # are themselves looked up in persistent cache when their turn comes.
+        persisted_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if self._caching and self._persistent_metric_cache is not None:
+            metrics_to_resolve = list(metrics_to_resolve)
+            persisted_metrics = self._get_persisted_metrics(
+                metric_configurations=metrics_to_resolve
+            )
+            if persisted_metrics:
+                self._metric_cache.update(persisted_metrics)
+                metrics_to_resolve = [
+                    metric_configuration
+                    for metric_configuration in metrics_to_resolve
+                    if metric_configuration.id not in persisted_metrics
+                ]
+
         metric_fn_direct_configurations: List[MetricComputationConfiguration]
         metric_fn_bundle_configurations: List[MetricComputationConfiguration]
         (
@@ -280,10 +383,14 @@ class ExecutionEngine(ABC):
             metrics=metrics,
             runtime_configuration=runtime_configuration,
         )
-        return self._process_direct_and_bundled_metric_computation_configurations(
+        resolved_metrics: Dict[
+            Tuple[str, str, str], MetricValue
+        ] = self._process_direct_and_bundled_metric_computation_configurations(
             metric_fn_direct_configurations=metric_fn_direct_configurations,
             metric_fn_bundle_configurations=metric_fn_bundle_configurations,
         )
+        resolved_metrics.update(persisted_metrics)
+        return resolved_metrics
 
     def resolve_metric_bundle(
         self, metric_fn_bundle
@@ -537,11 +644,22 @@ class ExecutionEngine(ABC):
         Returns:
             resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
         """
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        # an engine-specific way of computing several directly-computable metrics together
+        resolved_metrics: Dict[
+            Tuple[str, str, str], MetricValue
+        ] = self._resolve_fused_direct_metrics(
+            metric_fn_direct_configurations=metric_fn_direct_configurations
+        )
 
         metric_computation_configuration: MetricComputationConfiguration
 
         for metric_computation_configuration in metric_fn_direct_configurations:
+            if (
+                metric_computation_configuration.metric_configuration.id
+                in resolved_metrics
+            ):
+                continue
+
             try:
                 resolved_metrics[
                     metric_computation_configuration.metric_configuration.id
@@ -575,9 +693,217 @@ class ExecutionEngine(ABC):
 
         if self._caching:
             self._metric_cache.update(resolved_metrics)
+            if self._persistent_metric_cache is not None:
+                self._persist_metrics(
+                    metric_configurations=[
+                        metric_computation_configuration.metric_configuration
+                        for metric_computation_configuration in metric_fn_direct_configurations
+                        + metric_fn_bundle_configurations
+                    ],
+                    resolved_metrics=resolved_metrics,
+                )
 
         return resolved_metrics
 
+    def _resolve_fused_direct_metrics(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves directly-computable metrics, which engine is able to compute together, in fewer trips to backend.
+
+        Metrics, which are not returned, are computed individually by their metric functions (none are, by default).
+        """
+        return {}
+
+    def _get_persisted_metrics(
+        self, metric_configurations: List[MetricConfiguration]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        Looks up "MetricConfiguration" objects in persistent metric cache by fingerprint of Batch data they pertain to.
+
+        Args:
+            metric_configurations: "MetricConfiguration" objects to be resolved
+
+        Returns:
+            Dictionary of metric values, computed previously against the same data, keyed by "MetricConfiguration" ID
+        """
+        persisted_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        batch_fingerprint: str
+        metric_configurations_for_batch: List[MetricConfiguration]
+        for (
+            batch_fingerprint,
+            metric_configurations_for_batch,
+        ) in self._group_metric_configurations_by_batch_fingerprint(
+            metric_configurations=metric_configurations
+        ).items():
+            persisted_metrics.update(
+                self._persistent_metric_cache.get_metrics(  # type: ignore[union-attr] # checked by caller
+                    batch_fingerprint=batch_fingerprint,
+                    metric_ids=[
+                        metric_configuration.id
+                        for metric_configuration in metric_configurations_for_batch
+                    ],
+                )
+            )
+
+        return persisted_metrics
+
+    def _persist_metrics(
+        self,
+        metric_configurations: List[MetricConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> None:
+        """
+        Stores resolved metrics in persistent metric cache, keyed by fingerprint of Batch data they pertain to.
+
+        Args:
+            metric_configurations: resolved "MetricConfiguration" objects
+            resolved_metrics: metric values keyed by "MetricConfiguration" ID
+        """
+        batch_fingerprint: str
+        metric_configurations_for_batch: List[MetricConfiguration]
+        for (
+            batch_fingerprint,
+            metric_configurations_for_batch,
+        ) in self._group_metric_configurations_by_batch_fingerprint(
+            metric_configurations=metric_configurations
+        ).items():
+            self._persistent_metric_cache.set_metrics(  # type: ignore[union-attr] # checked by caller
+                batch_fingerprint=batch_fingerprint,
+                metrics={
+                    metric_configuration.id: resolved_metrics[metric_configuration.id]
+                    for metric_configuration in metric_configurations_for_batch
+                    if metric_configuration.id in resolved_metrics
+                },
+            )
+
+    def _group_metric_configurations_by_batch_fingerprint(
+        self, metric_configurations: List[MetricConfiguration]
+    ) -> Dict[str, List[MetricConfiguration]]:
+        """
+        Groups "MetricConfiguration" objects by fingerprint of Batch data they pertain to.  Metrics representing partial
+        functions (these hold backend-specific objects) and metrics on Batch data without fingerprint are omitted.
+        """
+        partial_function_suffixes: Tuple[str, ...] = tuple(
+            f".{suffix.value}" for suffix in MetricPartialFunctionTypeSuffixes
+        )
+
+        batch_fingerprints_by_batch_id: Dict[Optional[str], Optional[str]] = {}
+        metric_configurations_by_batch_fingerprint: Dict[
+            str, List[MetricConfiguration]
+        ] = {}
+
+        batch_id: Optional[str]
+        batch_fingerprint: Optional[str]
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            if metric_configuration.metric_name.endswith(partial_function_suffixes):
+                continue
+
+            batch_id = metric_configuration.metric_domain_kwargs.get("batch_id")
+            if batch_id not in batch_fingerprints_by_batch_id:
+                batch_fingerprints_by_batch_id[
+                    batch_id
+                ] = self._get_metric_cache_fingerprint(batch_id=batch_id)
+
+            batch_fingerprint = batch_fingerprints_by_batch_id[batch_id]
+            if batch_fingerprint is not None:
+                metric_configurations_by_batch_fingerprint.setdefault(
+                    batch_fingerprint, []
+                ).append(metric_configuration)
+
+        return metric_configurations_by_batch_fingerprint
+
+    def _get_metric_cache_fingerprint(self, batch_id: Optional[str]) -> Optional[str]:
+        """
+        Returns fingerprint of Batch data, qualified by ExecutionEngine class and Great Expectations version (so that
+        metric values are never shared across engines or across versions of metric implementations), or None.
+        """
+        batch_fingerprint: Optional[str] = self._get_batch_fingerprint(
+            batch_id=batch_id
+        )
+        if batch_fingerprint is None:
+            return None
+
+        return hashlib.md5(
+            json.dumps(
+                {
+                    "execution_engine": f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+                    "great_expectations_version": ge_version,
+                    "batch_fingerprint": batch_fingerprint,
+                },
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _get_batch_fingerprint(self, batch_id: Optional[str]) -> Optional[str]:
+        """
+        Returns fingerprint of data underlying Batch, or None if Batch data cannot be reliably identified.
+
+        The "pandas_data_fingerprint" Batch marker (hash of loaded data) is used if available; otherwise, for Batch data
+        read from local file, fingerprint combines file path, modification time, and size with BatchSpec, and for Batch
+        data read from remote object, it combines object path and version (e.g., ETag) with BatchSpec.
+        """
+        if batch_id is None:
+            batch_id = self._batch_manager.active_batch_data_id
+
+        batch: Optional[AnyBatch] = (
+            None if batch_id is None else self._batch_manager.batch_cache.get(batch_id)
+        )
+        if batch is None:
+            return None
+
+        batch_markers: Optional[BatchMarkers] = batch.batch_markers
+        if batch_markers and batch_markers.get("pandas_data_fingerprint"):
+            return batch_markers["pandas_data_fingerprint"]
+
+        batch_spec: Optional[BatchSpec] = batch.batch_spec
+        path: Optional[str] = batch_spec.get("path") if batch_spec else None
+        if not isinstance(path, str):
+            return None
+
+        source_version: dict
+        try:
+            if pathlib.Path(path).is_file():
+                stat_result: os.stat_result = pathlib.Path(path).stat()
+                source_version = {
+                    "mtime_ns": stat_result.st_mtime_ns,
+                    "size": stat_result.st_size,
+                }
+            else:
+                remote_object_version: Optional[str] = self._get_remote_object_version(
+                    batch_spec=batch_spec  # type: ignore[arg-type] # path implies batch_spec
+                )
+                if remote_object_version is None:
+                    return None
+
+                source_version = {"version": remote_object_version}
+
+            batch_spec_id: str = batch_spec.to_id()  # type: ignore[union-attr] # path implies batch_spec
+        except Exception as e:
+            logger.debug(f'Unable to fingerprint Batch "{batch_id}": {e}')
+            return None
+
+        return hashlib.md5(
+            json.dumps(
+                {
+                    "path": path,
+                    **source_version,
+                    "batch_spec_id": batch_spec_id,
+                },
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _get_remote_object_version(self, batch_spec: BatchSpec) -> Optional[str]:
+        """
+        Returns version identifier (e.g., ETag) of remote object (e.g., in S3), from which Batch data is read, or None.
+
+        Remote objects are not fingerprinted by default; engines able to read them override this method.
+        """
+        return None
+
     def _partition_domain_kwargs(
         self,
         domain_kwargs: Dict[str, Any],
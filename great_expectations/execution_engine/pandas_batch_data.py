@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from typing import Callable, Iterator
+
+import pandas as pd
 
 from great_expectations.core.batch import BatchData
 
-if TYPE_CHECKING:
-    import pandas as pd
+logger = logging.getLogger(__name__)
 
 
 class PandasBatchData(BatchData):
@@ -16,3 +18,47 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class ChunkedPandasBatchData(PandasBatchData):
+    """PandasBatchData, whose records are streamed in chunks, rather than held in memory as single DataFrame.
+
+    Args:
+        execution_engine: PandasExecutionEngine, which loaded this Batch data.
+        chunk_factory: callable, returning new iterator over chunks (DataFrame objects) of Batch data on each call.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_factory: Callable[[], Iterator[pd.DataFrame]],
+    ) -> None:
+        super().__init__(execution_engine=execution_engine, dataframe=None)  # type: ignore[arg-type] # materialized lazily
+        self._chunk_factory = chunk_factory
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Reads Batch data chunk by chunk; chunks are indexed by position of their rows in whole Batch data."""
+        offset: int = 0
+        chunk: pd.DataFrame
+        for chunk in self._chunk_factory():
+            if isinstance(chunk.index, pd.RangeIndex) and chunk.index.start != offset:
+                chunk.index = pd.RangeIndex(start=offset, stop=offset + len(chunk))
+
+            offset += len(chunk)
+            yield chunk
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._dataframe is not None
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """Whole Batch data as single DataFrame (concatenated from all chunks when accessed for the first time)."""
+        if self._dataframe is None:
+            logger.warning(
+                "Streamed Batch data is being materialized in memory, because requested computation does not support chunked processing."
+            )
+            chunks: list = list(self.iter_chunks())
+            self._dataframe = pd.concat(chunks) if chunks else pd.DataFrame()
+
+        return self._dataframe
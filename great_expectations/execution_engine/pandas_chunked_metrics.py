@@ -0,0 +1,254 @@
+"""Merging of metrics, computed chunk-by-chunk over streamed (chunked) Pandas Batch data.
+
+When PandasExecutionEngine streams Batch data in chunks (see "ChunkedPandasBatchData"), metrics are resolved as follows:
+
+- Partial function metrics ("map" and "condition" metrics) are not computed eagerly; instead, they are marked with the
+  "DEFERRED_CHUNKED_METRIC_VALUE" sentinel and evaluated for every chunk, when metrics depending on them are computed.
+  Map metrics, whose value for a row depends on other rows (e.g., uniqueness), are exempt from this.
+- Metrics, for which a merge function is registered below (counts, sums, minimum/maximum, and partial lists of
+  unexpected values, indices, and rows), are computed for every chunk and merged into the value for whole Batch data,
+  provided that all partial function metrics they depend on are deferred.
+- Mergeable sketches (e.g., "column.hll_sketch") are built for every chunk and merged.
+- Metrics, whose value does not depend on rows of chunk (e.g., "table.columns", or estimates derived from sketches), are
+  computed on first chunk only.
+- All other metrics require whole Batch data to be materialized in memory.
+
+Dependencies, which are not deferred, always hold values for whole Batch data; hence, metrics of the form "fraction of
+values more than three standard deviations away from the mean" merge correctly, as long as their chain of dependencies
+from the Batch data consists of deferred metrics.
+"""
+
+from __future__ import annotations
+
+import ast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, Optional, Set, Tuple
+
+import pandas as pd
+
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+    SummarizationMetricNameSuffixes,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+class _DeferredChunkedMetricValue:
+    """Marks partial function metric, which is evaluated for each chunk of Batch data on demand."""
+
+    def __repr__(self) -> str:
+        return "DEFERRED_CHUNKED_METRIC_VALUE"
+
+
+DEFERRED_CHUNKED_METRIC_VALUE: Final[
+    _DeferredChunkedMetricValue
+] = _DeferredChunkedMetricValue()
+
+ChunkedMetricMergeFn = Callable[[Any, Any, "MetricConfiguration"], Any]
+
+# Metrics, whose value is the same for every chunk of Batch data (schema, or estimates computed from merged sketches).
+CHUNK_INVARIANT_METRIC_NAMES: Final[Set[str]] = {
+    "table.columns",
+    "table.column_types",
+    "column.approx_distinct_values.count",
+    "column.approx_quantile_values",
+    "column.approx_value_counts",
+}
+
+# Map metrics, whose value for a row depends on other rows (and hence cannot be evaluated chunk by chunk).
+NON_ROW_LOCAL_MAP_METRIC_NAMES: Final[Set[str]] = {
+    "column_values.unique",
+    "column_values.increasing",
+    "column_values.decreasing",
+    "compound_columns.unique",
+}
+
+_PARTIAL_FUNCTION_METRIC_NAME_SUFFIXES: Final[Tuple[str, ...]] = tuple(
+    f".{suffix.value}" for suffix in MetricPartialFunctionTypeSuffixes
+)
+
+
+class ChunkedMetricMergeError(ValueError):
+    pass
+
+
+def is_partial_function_metric(metric_name: str) -> bool:
+    return metric_name.endswith(_PARTIAL_FUNCTION_METRIC_NAME_SUFFIXES)
+
+
+def is_deferred_chunked_metric(metric_name: str) -> bool:
+    """Returns True if metric is row-local partial function (evaluated for each chunk, as needed by dependent metrics)."""
+    return (
+        is_partial_function_metric(metric_name=metric_name)
+        and metric_name.rsplit(".", 1)[0] not in NON_ROW_LOCAL_MAP_METRIC_NAMES
+    )
+
+
+def get_chunked_metric_merge_fn(metric_name: str) -> Optional[ChunkedMetricMergeFn]:
+    """Returns function merging two chunk values of metric into one, or None if metric values cannot be merged."""
+    merge_fn: Optional[ChunkedMetricMergeFn] = _MERGE_FN_BY_METRIC_NAME.get(metric_name)
+    if merge_fn is not None:
+        return merge_fn
+
+    suffix: str
+    for suffix, merge_fn in _MERGE_FN_BY_METRIC_NAME_SUFFIX.items():
+        if metric_name.endswith(f".{suffix}"):
+            return merge_fn
+
+    return None
+
+
+def _sum(
+    accumulated_value: Any, chunk_value: Any, metric_configuration: MetricConfiguration
+) -> Any:
+    return accumulated_value + chunk_value
+
+
+def _min(
+    accumulated_value: Any, chunk_value: Any, metric_configuration: MetricConfiguration
+) -> Any:
+    if _is_missing(value=chunk_value):
+        return accumulated_value
+
+    if _is_missing(value=accumulated_value):
+        return chunk_value
+
+    return min(accumulated_value, chunk_value)
+
+
+def _max(
+    accumulated_value: Any, chunk_value: Any, metric_configuration: MetricConfiguration
+) -> Any:
+    if _is_missing(value=chunk_value):
+        return accumulated_value
+
+    if _is_missing(value=accumulated_value):
+        return chunk_value
+
+    return max(accumulated_value, chunk_value)
+
+
+def _merge_sketches(
+    accumulated_value: Any, chunk_value: Any, metric_configuration: MetricConfiguration
+) -> Any:
+    return accumulated_value.merge(chunk_value)
+
+
+def _concatenate_partial_results(
+    accumulated_value: Any, chunk_value: Any, metric_configuration: MetricConfiguration
+) -> Any:
+    partial_unexpected_count: Optional[int] = _get_partial_unexpected_count(
+        metric_configuration=metric_configuration
+    )
+
+    if isinstance(accumulated_value, list) and isinstance(chunk_value, list):
+        merged_list: list = accumulated_value + chunk_value
+        return (
+            merged_list
+            if partial_unexpected_count is None
+            else merged_list[:partial_unexpected_count]
+        )
+
+    if isinstance(accumulated_value, pd.DataFrame) and isinstance(
+        chunk_value, pd.DataFrame
+    ):
+        merged_df: pd.DataFrame = pd.concat([accumulated_value, chunk_value])
+        return (
+            merged_df
+            if partial_unexpected_count is None
+            else merged_df.iloc[:partial_unexpected_count]
+        )
+
+    raise ChunkedMetricMergeError(
+        f'Values of type {type(accumulated_value)} and {type(chunk_value)} for metric "{metric_configuration.metric_name}" cannot be merged.'
+    )
+
+
+_PANDAS_UNEXPECTED_INDEX_QUERY_PREFIX: Final[str] = "df.filter(items="
+_PANDAS_UNEXPECTED_INDEX_QUERY_SUFFIX: Final[str] = ", axis=0)"
+
+
+def _merge_unexpected_index_queries(
+    accumulated_value: Any, chunk_value: Any, metric_configuration: MetricConfiguration
+) -> Any:
+    if accumulated_value is None and chunk_value is None:
+        return None
+
+    index_list: list = _parse_unexpected_index_query(
+        query=accumulated_value, metric_configuration=metric_configuration
+    ) + _parse_unexpected_index_query(
+        query=chunk_value, metric_configuration=metric_configuration
+    )
+    return f"{_PANDAS_UNEXPECTED_INDEX_QUERY_PREFIX}{index_list}{_PANDAS_UNEXPECTED_INDEX_QUERY_SUFFIX}"
+
+
+def _parse_unexpected_index_query(
+    query: Any, metric_configuration: MetricConfiguration
+) -> list:
+    if not (
+        isinstance(query, str)
+        and query.startswith(_PANDAS_UNEXPECTED_INDEX_QUERY_PREFIX)
+        and query.endswith(_PANDAS_UNEXPECTED_INDEX_QUERY_SUFFIX)
+    ):
+        raise ChunkedMetricMergeError(
+            f'Unrecognized value "{query}" of metric "{metric_configuration.metric_name}".'
+        )
+
+    try:
+        return ast.literal_eval(
+            query[
+                len(_PANDAS_UNEXPECTED_INDEX_QUERY_PREFIX) : -len(
+                    _PANDAS_UNEXPECTED_INDEX_QUERY_SUFFIX
+                )
+            ]
+        )
+    except (ValueError, SyntaxError) as e:
+        # Index values, such as timestamps, are not representable as Python literals.
+        raise ChunkedMetricMergeError(
+            f'Unexpected index list of metric "{metric_configuration.metric_name}" cannot be merged: {e}'
+        ) from e
+
+
+def _get_partial_unexpected_count(
+    metric_configuration: MetricConfiguration,
+) -> Optional[int]:
+    result_format: Optional[dict] = metric_configuration.metric_value_kwargs.get(
+        "result_format"
+    )
+    if not isinstance(result_format, dict):
+        raise ChunkedMetricMergeError(
+            f'Metric "{metric_configuration.metric_name}" does not specify "result_format".'
+        )
+
+    if result_format.get("result_format") == "COMPLETE":
+        return None
+
+    return result_format["partial_unexpected_count"]
+
+
+def _is_missing(value: Any) -> bool:
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+_MERGE_FN_BY_METRIC_NAME: Final[Dict[str, ChunkedMetricMergeFn]] = {
+    "table.row_count": _sum,
+    "column.min": _min,
+    "column.max": _max,
+    "column.sum": _sum,
+    "column.hll_sketch": _merge_sketches,
+    "column.kll_sketch": _merge_sketches,
+    "column.count_min_sketch": _merge_sketches,
+}
+
+_MERGE_FN_BY_METRIC_NAME_SUFFIX: Final[Dict[str, ChunkedMetricMergeFn]] = {
+    SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value: _sum,
+    SummarizationMetricNameSuffixes.FILTERED_ROW_COUNT.value: _sum,
+    SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value: _concatenate_partial_results,
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value: _concatenate_partial_results,
+    SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value: _concatenate_partial_results,
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_QUERY.value: _merge_unexpected_index_queries,
+}
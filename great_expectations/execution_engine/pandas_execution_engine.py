@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import contextlib
 import datetime
 import hashlib
+import io
 import logging
+import pathlib
 import pickle
+import threading
+from collections import ChainMap, OrderedDict
 from functools import partial
 from io import BytesIO
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Iterable,
+    Iterator,
+    List,
     Optional,
     Tuple,
     Union,
@@ -24,6 +32,7 @@ import pandas as pd
 import great_expectations.exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility import aws, azure, google
+from great_expectations.compatibility.pyarrow import parquet
 from great_expectations.compatibility.sqlalchemy_and_pandas import (
     execute_pandas_reader_fn,
 )
@@ -46,9 +55,22 @@ from great_expectations.core.metric_domain_types import (
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,  # noqa: TCH001
     PartitionDomainKwargs,  # noqa: TCH001
 )
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+)
+from great_expectations.execution_engine.pandas_chunked_metrics import (
+    CHUNK_INVARIANT_METRIC_NAMES,
+    DEFERRED_CHUNKED_METRIC_VALUE,
+    ChunkedMetricMergeError,
+    ChunkedMetricMergeFn,
+    get_chunked_metric_merge_fn,
+    is_deferred_chunked_metric,
+    is_partial_function_metric,
+)
 from great_expectations.execution_engine.partition_and_sample.pandas_data_partitioner import (
     PandasDataPartitioner,
 )
@@ -59,14 +81,134 @@ from great_expectations.execution_engine.partition_and_sample.pandas_data_sample
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
+    from great_expectations.core.batch import BatchDataUnion
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
 logger = logging.getLogger(__name__)
 
 
 HASH_THRESHOLD = 1e9
 
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512 MiB
+
+# Reader methods, which can return iterator over chunks of specified number of rows ("chunksize" reader option).
+CHUNKED_TEXT_READER_METHODS = ("read_csv", "read_table", "read_fwf")
+
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
 
+class _BytesChunksReader(io.RawIOBase):
+    """Read-only binary file object over iterator of bytes chunks (e.g., of Azure blob, as it is being downloaded)."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        super().__init__()
+        self._chunks = chunks
+        self._chunk = memoryview(b"")
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def readinto(self, buffer) -> int:
+        while not self._chunk:
+            try:
+                self._chunk = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+
+        size: int = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+class _DomainRecordsCache:
+    """Bounded LRU cache of filtered domain records (e.g., results of applying "row_condition" to Batch data).
+
+    Entries may also hold columns of domain records (e.g., non-null values of column with their null mask), which are
+    shared by map metrics of the same column.  Total memory footprint of cached DataFrame and Series objects does not
+    exceed "max_bytes" (value of 0 disables caching).  Every entry retains reference to data it was derived from; if
+    that data has since been replaced (e.g., Batch data reloaded under the same "batch_id"), the entry is discarded.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[
+            tuple, Tuple[pd.DataFrame, Union[pd.DataFrame, pd.Series], int]
+        ] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, key: tuple, source_data: pd.DataFrame
+    ) -> Optional[Union[pd.DataFrame, pd.Series]]:
+        with self._lock:
+            entry: Optional[
+                Tuple[pd.DataFrame, Union[pd.DataFrame, pd.Series], int]
+            ] = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if entry[0] is not source_data:
+                self._remove(key=key)
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(
+        self,
+        key: tuple,
+        source_data: pd.DataFrame,
+        domain_records: Union[pd.DataFrame, pd.Series],
+    ) -> None:
+        if self._max_bytes <= 0:
+            return
+
+        # "Series.memory_usage()" returns scalar, whereas "DataFrame.memory_usage()" returns usage of every column.
+        memory_usage: Union[int, pd.Series] = domain_records.memory_usage(
+            index=True, deep=False
+        )
+        size: int = int(
+            memory_usage.sum() if isinstance(memory_usage, pd.Series) else memory_usage
+        )
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key=key)
+
+            self._entries[key] = (source_data, domain_records, size)
+            self._total_bytes += size
+
+            while self._total_bytes > self._max_bytes:
+                self._remove(key=next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remove(self, key: tuple) -> None:
+        size: int
+        _, _, size = self._entries.pop(key)
+        self._total_bytes -= size
+
+
 @public_api
 class PandasExecutionEngine(ExecutionEngine):
     """PandasExecutionEngine instantiates the ExecutionEngine API to support computations using Pandas.
@@ -75,7 +217,15 @@ class PandasExecutionEngine(ExecutionEngine):
 
     Args:
         *args: Positional arguments for configuring PandasExecutionEngine
-        **kwargs: Keyword arguments for configuring PandasExecutionEngine
+        **kwargs: Keyword arguments for configuring PandasExecutionEngine (in addition to those of ExecutionEngine,
+            "discard_subset_failing_expectations", "boto3_options", "azure_options", "gcs_options", and
+            "domain_records_cache_max_bytes" -- memory budget for reusing filtered domain records, such as results of
+            applying the same "row_condition", across metrics; 0 disables this reuse, and "chunk_size" -- if set, then
+            local files and S3, GCS, or Azure objects read with "read_csv", "read_table", "read_fwf", or "read_json"
+            (with "lines" option), as well as local files read with "read_parquet", are streamed in chunks of this many
+            rows, rather than loaded into memory as whole; "chunksize" reader option of text reader methods, such as that
+            of Fluent CSV asset, turns on streaming for individual Batch data; see
+            "great_expectations.execution_engine.pandas_chunked_metrics" for metrics computed chunk by chunk)
 
     For example:
     ```python
@@ -115,6 +265,19 @@ class PandasExecutionEngine(ExecutionEngine):
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
+        domain_records_cache_max_bytes: int = kwargs.pop(
+            "domain_records_cache_max_bytes", DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES
+        )
+        if domain_records_cache_max_bytes < 0:
+            raise gx_exceptions.InvalidConfigError(
+                f'"domain_records_cache_max_bytes" must be non-negative integer; got {domain_records_cache_max_bytes}.'
+            )
+
+        chunk_size: Optional[int] = kwargs.pop("chunk_size", None)
+        if chunk_size is not None and chunk_size < 1:
+            raise gx_exceptions.InvalidConfigError(
+                f'"chunk_size" must be positive integer; got {chunk_size}.'
+            )
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -130,9 +293,21 @@ class PandasExecutionEngine(ExecutionEngine):
                 "boto3_options": boto3_options,
                 "azure_options": azure_options,
                 "gcs_options": gcs_options,
+                "domain_records_cache_max_bytes": domain_records_cache_max_bytes,
+                "chunk_size": chunk_size,
             }
         )
 
+        self._chunk_size = chunk_size
+        # Whether any Batch data has been loaded as streamed (chunked) data.
+        self._has_streamed_batch_data = False
+        # Chunk of streamed Batch data, on which metrics are currently being computed (keyed by "batch_id").
+        self._streamed_records: Dict[str, pd.DataFrame] = {}
+
+        self._domain_records_cache = _DomainRecordsCache(
+            max_bytes=domain_records_cache_max_bytes
+        )
+
         self._data_partitioner = PandasDataPartitioner()
         self._data_sampler = PandasDataSampler()
 
@@ -206,6 +381,50 @@ class PandasExecutionEngine(ExecutionEngine):
 
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @override
+    def get_batch_data_size(self, batch_data: BatchDataUnion) -> Optional[int]:
+        if not isinstance(batch_data, PandasBatchData) or (
+            isinstance(batch_data, ChunkedPandasBatchData)
+            and not batch_data.is_materialized
+        ):
+            return None
+
+        return int(batch_data.dataframe.memory_usage(index=True, deep=False).sum())
+
+    @override
+    def _get_remote_object_version(self, batch_spec: BatchSpec) -> Optional[str]:
+        """Returns ETag of S3 object, GCS blob, or Azure blob, from which Batch data is read (None for other Batches)."""
+        if isinstance(batch_spec, S3BatchSpec):
+            if self._s3 is None:
+                self._instantiate_s3_client()
+            s3_url = S3Url(batch_spec.path)
+            return self._s3.head_object(Bucket=s3_url.bucket, Key=s3_url.key)["ETag"]  # type: ignore[attr-defined] # instantiated above
+
+        if isinstance(batch_spec, GCSBatchSpec):
+            if self._gcs is None:
+                self._instantiate_gcs_client()
+            if self._gcs is None:
+                return None
+            gcs_url = GCSUrl(batch_spec.path)
+            gcs_blob = self._gcs.get_bucket(gcs_url.bucket).get_blob(gcs_url.blob)
+            return None if gcs_blob is None else gcs_blob.etag
+
+        if isinstance(batch_spec, AzureBatchSpec):
+            if self._azure is None:
+                self._instantiate_azure_client()
+            if self._azure is None:
+                return None
+            azure_url = AzureUrl(batch_spec.path)
+            return (
+                self._azure.get_blob_client(
+                    container=azure_url.container, blob=azure_url.blob
+                )
+                .get_blob_properties()
+                .etag
+            )
+
+        return None
+
     @override
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
         self, batch_spec: BatchSpec | PandasBatchSpecProtocol
@@ -220,6 +439,7 @@ class PandasExecutionEngine(ExecutionEngine):
         )
 
         batch_data: Any
+        chunk_factory: Optional[Callable[[], Iterator[pd.DataFrame]]]
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
             batch_data = batch_spec.batch_data
@@ -267,6 +487,20 @@ class PandasExecutionEngine(ExecutionEngine):
             logger.debug(
                 f"Fetching s3 object. Bucket: {s3_url.bucket} Key: {s3_url.key}"
             )
+            chunk_factory = self._get_chunk_factory(
+                batch_spec=batch_spec,
+                reader_options=reader_options,
+                open_remote_file=lambda: s3_engine.get_object(
+                    Bucket=s3_url.bucket, Key=s3_url.key
+                )["Body"],
+            )
+            if chunk_factory is not None:
+                # Object is streamed anew (by its own request) on every pass over chunks.
+                s3_object["Body"].close()
+                return self._get_streamed_batch_data(
+                    chunk_factory=chunk_factory, batch_markers=batch_markers
+                )
+
             reader_fn: DataFrameFactoryFn = self._get_reader_fn(
                 reader_method, s3_url.key
             )
@@ -291,6 +525,18 @@ class PandasExecutionEngine(ExecutionEngine):
             blob_client = azure_engine.get_blob_client(
                 container=azure_url.container, blob=azure_url.blob
             )
+            chunk_factory = self._get_chunk_factory(
+                batch_spec=batch_spec,
+                reader_options=reader_options,
+                open_remote_file=lambda: io.BufferedReader(
+                    _BytesChunksReader(chunks=blob_client.download_blob().chunks())
+                ),
+            )
+            if chunk_factory is not None:
+                return self._get_streamed_batch_data(
+                    chunk_factory=chunk_factory, batch_markers=batch_markers
+                )
+
             azure_object = blob_client.download_blob()
             logger.debug(
                 f"Fetching Azure blob. Container: {azure_url.container} Blob: {azure_url.blob}"
@@ -324,6 +570,16 @@ class PandasExecutionEngine(ExecutionEngine):
                     f"""PandasExecutionEngine encountered the following error while trying to read data from GCS \
 Bucket: {error}"""
                 )
+            chunk_factory = self._get_chunk_factory(
+                batch_spec=batch_spec,
+                reader_options=reader_options,
+                open_remote_file=lambda: gcs_blob.open("rb"),
+            )
+            if chunk_factory is not None:
+                return self._get_streamed_batch_data(
+                    chunk_factory=chunk_factory, batch_markers=batch_markers
+                )
+
             reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
             buf = BytesIO(gcs_blob.download_as_bytes())
             buf.seek(0)
@@ -331,6 +587,12 @@ Bucket: {error}"""
 
         # Experimental datasources will go down this code path
         elif isinstance(batch_spec, PathBatchSpec):
+            chunk_factory = self._get_chunk_factory(batch_spec=batch_spec)
+            if chunk_factory is not None:
+                return self._get_streamed_batch_data(
+                    chunk_factory=chunk_factory, batch_markers=batch_markers
+                )
+
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             path = batch_spec.path
@@ -373,6 +635,95 @@ not {batch_spec.__class__.__name__}"""
 
         return typed_batch_data, batch_markers
 
+    def _get_streamed_batch_data(
+        self,
+        chunk_factory: Callable[[], Iterator[pd.DataFrame]],
+        batch_markers: BatchMarkers,
+    ) -> Tuple[ChunkedPandasBatchData, BatchMarkers]:
+        self._has_streamed_batch_data = True
+        # Streamed Batch data is not fingerprinted, because that would require reading it in its entirety.
+        return (
+            ChunkedPandasBatchData(execution_engine=self, chunk_factory=chunk_factory),
+            batch_markers,
+        )
+
+    def _get_chunk_factory(
+        self,
+        batch_spec: PathBatchSpec,
+        reader_options: Optional[dict] = None,
+        open_remote_file: Optional[Callable[[], IO[bytes]]] = None,
+    ) -> Optional[Callable[[], Iterator[pd.DataFrame]]]:
+        """Returns callable, producing iterator over chunks of data at path of "batch_spec", if streaming applies.
+
+        Streaming is used only if chunk size is configured, no partitioning or sampling is requested, and reader method
+        supports reading in chunks; otherwise, None is returned (and data is read into single DataFrame).  Chunk size is
+        "chunksize" reader option of text reader methods (e.g., set on Fluent CSV or JSON asset), or else "chunk_size"
+        of this PandasExecutionEngine.
+
+        Data at remote path (S3, GCS, or Azure object) is read from binary file object, which "open_remote_file" opens
+        anew for every pass over chunks; Parquet data is streamed only from local files (reading it in chunks requires
+        seekable file).
+        """
+        if batch_spec.get("partitioner_method") or batch_spec.get("sampling_method"):
+            return None
+
+        path: str = batch_spec.path
+        reader_method: Optional[str] = batch_spec.reader_method
+        reader_options = dict(
+            batch_spec.reader_options if reader_options is None else reader_options
+        )
+        if reader_method is None:
+            path_guess: dict = self.guess_reader_method_from_path(path)
+            reader_method = path_guess["reader_method"]
+            reader_options = {**path_guess.get("reader_options", {}), **reader_options}
+
+        if "iterator" in reader_options:
+            return None
+
+        chunk_size: Optional[int] = self._chunk_size
+        if reader_method in CHUNKED_TEXT_READER_METHODS or (
+            reader_method == "read_json" and reader_options.get("lines")
+        ):
+            chunk_size = reader_options.pop("chunksize", None) or chunk_size
+            if chunk_size is None:
+                return None
+
+            reader_fn: DataFrameFactoryFn = getattr(pd, reader_method)
+
+            def _read_text_chunks() -> Iterator[pd.DataFrame]:
+                with contextlib.ExitStack() as stack:
+                    source: Union[str, IO[bytes]] = (
+                        path
+                        if open_remote_file is None
+                        else stack.enter_context(contextlib.closing(open_remote_file()))
+                    )
+                    with reader_fn(
+                        source, chunksize=chunk_size, **reader_options
+                    ) as reader:
+                        yield from reader
+
+            return _read_text_chunks
+
+        if (
+            chunk_size is not None
+            and reader_method == "read_parquet"
+            and parquet
+            and open_remote_file is None
+            and set(reader_options.keys()) <= {"columns"}
+            and pathlib.Path(path).is_file()
+        ):
+
+            def _read_parquet_chunks() -> Iterator[pd.DataFrame]:
+                parquet_file = parquet.ParquetFile(path)
+                for record_batch in parquet_file.iter_batches(
+                    batch_size=chunk_size, columns=reader_options.get("columns")
+                ):
+                    yield record_batch.to_pandas()
+
+            return _read_parquet_chunks
+
+        return None
+
     def _apply_partitioning_and_sampling_methods(
         self,
         batch_spec: BatchSpec | PandasBatchSpecProtocol,
@@ -503,6 +854,277 @@ not {batch_spec.__class__.__name__}"""
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
+    @override
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves metrics; those pertaining to streamed (chunked) Batch data are computed chunk by chunk.
+
+        See "great_expectations.execution_engine.pandas_chunked_metrics" for details.
+        """
+        if not (self._has_streamed_batch_data and metrics_to_resolve):
+            return super().resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        metrics_by_chunked_batch_id: Dict[str, List[MetricConfiguration]] = {}
+        other_metrics: List[MetricConfiguration] = []
+
+        batch_id: Optional[str]
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metrics_to_resolve:
+            batch_id = (
+                metric_configuration.metric_domain_kwargs.get("batch_id")
+                or self.batch_manager.active_batch_data_id
+            )
+            if batch_id is not None and self._is_streamed_batch(batch_id=batch_id):
+                metrics_by_chunked_batch_id.setdefault(batch_id, []).append(
+                    metric_configuration
+                )
+            else:
+                other_metrics.append(metric_configuration)
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if other_metrics:
+            resolved_metrics.update(
+                super().resolve_metrics(
+                    metrics_to_resolve=other_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        metric_configurations: List[MetricConfiguration]
+        for batch_id, metric_configurations in metrics_by_chunked_batch_id.items():
+            resolved_metrics.update(
+                self._resolve_streamed_batch_metrics(
+                    batch_id=batch_id,
+                    metrics_to_resolve=metric_configurations,
+                    metrics=metrics or {},
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        if self._caching:
+            self._metric_cache.update(resolved_metrics)
+
+        return resolved_metrics
+
+    def _is_streamed_batch(self, batch_id: str) -> bool:
+        batch_data: Optional[PandasBatchData] = self.batch_manager.batch_data_cache.get(batch_id)  # type: ignore[assignment]
+        return isinstance(batch_data, ChunkedPandasBatchData)
+
+    def _resolve_streamed_batch_metrics(  # noqa: C901, PLR0912
+        self,
+        batch_id: str,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves metrics on streamed Batch data in single pass over its chunks, wherever possible.
+
+        Partial function metrics are deferred (evaluated per chunk, when needed), mergeable metrics are computed per chunk
+        and merged, and chunk-invariant metrics are computed on first chunk; remaining metrics (as well as those, whose
+        chunk values turn out to be not mergeable) are computed on whole Batch data, materialized in memory.  Once Batch
+        data has been materialized, all metrics, other than deferred ones, are computed on it directly.
+        """
+        batch_data = cast(
+            ChunkedPandasBatchData, self.batch_manager.batch_data_cache[batch_id]
+        )
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        merge_fns: Dict[Tuple[str, str, str], ChunkedMetricMergeFn] = {}
+        mergeable_metrics: List[MetricConfiguration] = []
+        invariant_metrics: List[MetricConfiguration] = []
+        materialized_metrics: List[MetricConfiguration] = []
+
+        merge_fn: Optional[ChunkedMetricMergeFn]
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metrics_to_resolve:
+            if is_deferred_chunked_metric(metric_name=metric_configuration.metric_name):
+                resolved_metrics[
+                    metric_configuration.id
+                ] = DEFERRED_CHUNKED_METRIC_VALUE
+                continue
+
+            if batch_data.is_materialized:
+                materialized_metrics.append(metric_configuration)
+                continue
+
+            merge_fn = get_chunked_metric_merge_fn(
+                metric_name=metric_configuration.metric_name
+            )
+            if merge_fn is not None and self._depends_on_deferred_metrics_only(
+                metric_configuration=metric_configuration, metrics=metrics
+            ):
+                merge_fns[metric_configuration.id] = merge_fn
+                mergeable_metrics.append(metric_configuration)
+            elif metric_configuration.metric_name in CHUNK_INVARIANT_METRIC_NAMES:
+                invariant_metrics.append(metric_configuration)
+            else:
+                materialized_metrics.append(metric_configuration)
+
+        if mergeable_metrics or invariant_metrics:
+            merged_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+            is_first_chunk: bool = True
+
+            chunk: pd.DataFrame
+            chunk_metrics: Dict[Tuple[str, str, str], MetricValue]
+            for chunk in batch_data.iter_chunks():
+                chunk_metrics = self._resolve_metrics_on_streamed_records(
+                    batch_id=batch_id,
+                    records=chunk,
+                    metrics_to_resolve=mergeable_metrics + invariant_metrics
+                    if is_first_chunk
+                    else mergeable_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+                for metric_configuration in mergeable_metrics:
+                    if metric_configuration.id not in merge_fns:
+                        continue  # value of this metric has already proven not mergeable
+
+                    if is_first_chunk:
+                        merged_metrics[metric_configuration.id] = chunk_metrics[
+                            metric_configuration.id
+                        ]
+                        continue
+
+                    try:
+                        merged_metrics[metric_configuration.id] = merge_fns[
+                            metric_configuration.id
+                        ](
+                            merged_metrics[metric_configuration.id],
+                            chunk_metrics[metric_configuration.id],
+                            metric_configuration,
+                        )
+                    except ChunkedMetricMergeError as e:
+                        logger.debug(str(e))
+                        del merge_fns[metric_configuration.id]
+                        del merged_metrics[metric_configuration.id]
+                        materialized_metrics.append(metric_configuration)
+
+                if is_first_chunk:
+                    for metric_configuration in invariant_metrics:
+                        merged_metrics[metric_configuration.id] = chunk_metrics[
+                            metric_configuration.id
+                        ]
+
+                is_first_chunk = False
+
+            if is_first_chunk:
+                # Streamed Batch data has no chunks; all metrics are computed on (empty) materialized Batch data.
+                materialized_metrics.extend(mergeable_metrics + invariant_metrics)
+            else:
+                resolved_metrics.update(merged_metrics)
+
+        if materialized_metrics:
+            resolved_metrics.update(
+                self._resolve_metrics_on_streamed_records(
+                    batch_id=batch_id,
+                    records=batch_data.dataframe,
+                    metrics_to_resolve=materialized_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
+    @staticmethod
+    def _depends_on_deferred_metrics_only(
+        metric_configuration: MetricConfiguration,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> bool:
+        """Returns False if any partial function metric, on which metric depends, holds value for whole Batch data."""
+        dependency: MetricConfiguration
+        for dependency in metric_configuration.metric_dependencies.values():
+            if not is_partial_function_metric(metric_name=dependency.metric_name):
+                continue
+
+            if metrics.get(
+                dependency.id
+            ) is not DEFERRED_CHUNKED_METRIC_VALUE or not PandasExecutionEngine._depends_on_deferred_metrics_only(
+                metric_configuration=dependency, metrics=metrics
+            ):
+                return False
+
+        return True
+
+    def _resolve_metrics_on_streamed_records(  # noqa: PLR0913
+        self,
+        batch_id: str,
+        records: pd.DataFrame,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes metrics (and their deferred dependencies) on given records (chunk or whole) of streamed Batch data."""
+        ordered_metrics: List[MetricConfiguration] = []
+        visited_metric_ids: set = set()
+
+        def _add_with_deferred_dependencies(
+            metric_configuration: MetricConfiguration,
+        ) -> None:
+            visited_metric_ids.add(metric_configuration.id)
+            dependency: MetricConfiguration
+            for dependency in metric_configuration.metric_dependencies.values():
+                if (
+                    dependency.id not in visited_metric_ids
+                    and metrics.get(dependency.id) is DEFERRED_CHUNKED_METRIC_VALUE
+                ):
+                    _add_with_deferred_dependencies(metric_configuration=dependency)
+
+            ordered_metrics.append(metric_configuration)
+
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metrics_to_resolve:
+            if metric_configuration.id not in visited_metric_ids:
+                _add_with_deferred_dependencies(
+                    metric_configuration=metric_configuration
+                )
+
+        records_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        available_metrics: ChainMap = ChainMap(records_metrics, metrics)
+
+        self._streamed_records[batch_id] = records
+        try:
+            metric_computation_configuration: MetricComputationConfiguration
+            for metric_configuration in ordered_metrics:
+                for (
+                    metric_computation_configuration
+                ) in self._build_direct_and_bundled_metric_computation_configurations(
+                    metrics_to_resolve=(metric_configuration,),
+                    metrics=available_metrics,  # type: ignore[arg-type] # ChainMap is read-only Mapping here
+                    runtime_configuration=runtime_configuration,
+                )[
+                    0
+                ]:
+                    try:
+                        records_metrics[
+                            metric_configuration.id
+                        ] = metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
+                            **metric_computation_configuration.metric_provider_kwargs
+                        )
+                    except Exception as e:
+                        raise gx_exceptions.MetricResolutionError(
+                            message=str(e),
+                            failed_metrics=(metric_configuration,),
+                        ) from e
+        finally:
+            del self._streamed_records[batch_id]
+
+        return {
+            metric_configuration.id: records_metrics[metric_configuration.id]
+            for metric_configuration in metrics_to_resolve
+        }
+
     @override
     def resolve_metric_bundle(
         self, metric_fn_bundle
@@ -514,12 +1136,15 @@ not {batch_spec.__class__.__name__}"""
 
     @public_api
     @override
-    def get_domain_records(  # noqa: C901, PLR0912
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> pd.DataFrame:
         """Uses the given Domain kwargs (which include row_condition, condition_parser, and ignore_row_if directives) to obtain and/or query a Batch of data.
 
+        Filtered records are kept in bounded LRU cache (see "domain_records_cache_max_bytes"), so that metrics sharing
+        the same row_condition and ignore_row_if directives do not re-filter the same Batch of data.
+
         Args:
             domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
 
@@ -533,6 +1158,15 @@ not {batch_spec.__class__.__name__}"""
             )
 
         batch_id = domain_kwargs.get("batch_id")
+
+        streamed_records: Optional[pd.DataFrame] = self._streamed_records.get(
+            batch_id or self.batch_manager.active_batch_data_id  # type: ignore[arg-type]
+        )
+        if streamed_records is not None:
+            return self._filter_domain_records(
+                data=streamed_records, domain_kwargs=domain_kwargs
+            )
+
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data_id is not None:
@@ -553,6 +1187,167 @@ not {batch_spec.__class__.__name__}"""
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
+        domain_records_cache_key: Optional[tuple] = (
+            self._get_domain_records_cache_key(
+                batch_id=batch_id or self.batch_manager.active_batch_data_id,
+                domain_kwargs=domain_kwargs,
+            )
+            if self._caching
+            else None
+        )
+        if domain_records_cache_key is None:
+            return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        domain_records: Optional[pd.DataFrame] = self._domain_records_cache.get(
+            key=domain_records_cache_key, source_data=data
+        )
+        if domain_records is None:
+            domain_records = self._filter_domain_records(
+                data=data, domain_kwargs=domain_kwargs
+            )
+            self._domain_records_cache.put(
+                key=domain_records_cache_key,
+                source_data=data,
+                domain_records=domain_records,
+            )
+
+        return domain_records
+
+    def get_column_notnull_mask(
+        self,
+        domain_records: pd.DataFrame,
+        domain_kwargs: dict,
+        column_name: str,
+    ) -> pd.Series:
+        """Returns boolean mask of non-null values of column of domain records.
+
+        The mask is computed once per Batch, "row_condition", and column (and kept alongside filtered domain records; see
+        "domain_records_cache_max_bytes"), so that all map metrics of the same column share one null scan.
+
+        Args:
+            domain_records: DataFrame, returned by "get_domain_records()" for "domain_kwargs".
+            domain_kwargs: Domain kwargs, from which "domain_records" were obtained.
+            column_name: Name of column in "domain_records".
+
+        Returns:
+            Boolean Series, aligned with "domain_records", that is True where column value is not null.
+        """
+        return self._get_domain_column_entry(
+            domain_records=domain_records,
+            domain_kwargs=domain_kwargs,
+            column_name=column_name,
+            entry_type="notnull_mask",
+            compute_fn=lambda: domain_records[column_name].notnull(),
+        )
+
+    def get_domain_column(
+        self,
+        domain_records: pd.DataFrame,
+        domain_kwargs: dict,
+        column_name: str,
+        filter_column_isnull: bool,
+    ) -> pd.Series:
+        """Returns column of domain records, optionally without null values, for evaluating map metric conditions.
+
+        Non-null values are selected once per Batch, "row_condition", and column, so that condition partials and
+        unexpected values metrics of all map metrics of the same column do not repeat the same null filtering.
+
+        Args:
+            domain_records: DataFrame, returned by "get_domain_records()" for "domain_kwargs".
+            domain_kwargs: Domain kwargs, from which "domain_records" were obtained.
+            column_name: Name of column in "domain_records".
+            filter_column_isnull: If True, null values (and their rows) are excluded.
+
+        Returns:
+            Column of domain records (index labels of retained rows are preserved).
+        """
+        if not filter_column_isnull:
+            return domain_records[column_name]
+
+        return self._get_domain_column_entry(
+            domain_records=domain_records,
+            domain_kwargs=domain_kwargs,
+            column_name=column_name,
+            entry_type="notnull_values",
+            compute_fn=lambda: domain_records[column_name][
+                self.get_column_notnull_mask(
+                    domain_records=domain_records,
+                    domain_kwargs=domain_kwargs,
+                    column_name=column_name,
+                )
+            ],
+        )
+
+    def _get_domain_column_entry(  # noqa: PLR0913
+        self,
+        domain_records: pd.DataFrame,
+        domain_kwargs: dict,
+        column_name: str,
+        entry_type: str,
+        compute_fn: Callable[[], pd.Series],
+    ) -> pd.Series:
+        if not self._caching:
+            return compute_fn()
+
+        row_condition: Optional[str] = domain_kwargs.get("row_condition") or None
+        key: tuple = (
+            "column",
+            entry_type,
+            domain_kwargs.get("batch_id") or self.batch_manager.active_batch_data_id,
+            row_condition,
+            domain_kwargs.get("condition_parser") if row_condition else None,
+            column_name,
+        )
+
+        column: Optional[pd.Series] = self._domain_records_cache.get(  # type: ignore[assignment]
+            key=key, source_data=domain_records
+        )
+        if column is None:
+            column = compute_fn()
+            self._domain_records_cache.put(
+                key=key, source_data=domain_records, domain_records=column
+            )
+
+        return column
+
+    @staticmethod
+    def _get_domain_records_cache_key(
+        batch_id: Optional[str], domain_kwargs: dict
+    ) -> Optional[tuple]:
+        """Builds key of filtered domain records in cache; returns None if Domain kwargs imply no filtering."""
+        row_condition: Optional[str] = domain_kwargs.get("row_condition") or None
+        condition_parser: Optional[str] = (
+            domain_kwargs.get("condition_parser") if row_condition else None
+        )
+
+        ignore_row_if: Optional[str] = None
+        columns: tuple = ()
+        if "column" not in domain_kwargs:
+            if (
+                "column_A" in domain_kwargs
+                and "column_B" in domain_kwargs
+                and "ignore_row_if" in domain_kwargs
+            ):
+                ignore_row_if = domain_kwargs["ignore_row_if"]
+                columns = (domain_kwargs["column_A"], domain_kwargs["column_B"])
+            elif "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
+                ignore_row_if = domain_kwargs["ignore_row_if"]
+                columns = tuple(domain_kwargs["column_list"])
+
+        if ignore_row_if in {"neither", "never"}:
+            ignore_row_if = None
+            columns = ()
+
+        if row_condition is None and ignore_row_if is None:
+            return None
+
+        return batch_id, row_condition, condition_parser, ignore_row_if, columns
+
+    @staticmethod
+    def _filter_domain_records(  # noqa: PLR0912
+        data: pd.DataFrame, domain_kwargs: dict
+    ) -> pd.DataFrame:
+        """Applies row_condition and ignore_row_if directives of Domain kwargs to Batch data."""
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from typing import List, Union
+from typing import List, Optional, Union
 
 from great_expectations.compatibility import pyspark
 from great_expectations.compatibility.pyspark import functions as F
@@ -11,6 +11,9 @@ from great_expectations.execution_engine.partition_and_sample.data_partitioner i
     DataPartitioner,
     DatePart,
 )
+from great_expectations.execution_engine.partition_and_sample.sparkdf_hashing import (
+    get_native_hex_digest_suffix,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -299,14 +302,25 @@ class SparkDataPartitioner(DataPartitioner):
                 )
             )
 
-        def _encrypt_value(to_encode):
-            hash_func = getattr(hashlib, hash_function_name)
-            hashed_value = hash_func(to_encode.encode()).hexdigest()[-1 * hash_digits :]
-            return hashed_value
+        hashed_column: Optional[pyspark.Column] = get_native_hex_digest_suffix(
+            column=F.col(column_name).cast(pyspark.types.StringType()),
+            hash_function_name=hash_function_name,
+            hash_digits=hash_digits,
+        )
+        if hashed_column is None:
+
+            def _encrypt_value(to_encode):
+                hash_func = getattr(hashlib, hash_function_name)
+                hashed_value = hash_func(to_encode.encode()).hexdigest()[
+                    -1 * hash_digits :
+                ]
+                return hashed_value
+
+            encrypt_udf = F.udf(_encrypt_value, pyspark.types.StringType())
+            hashed_column = encrypt_udf(column_name)
 
-        encrypt_udf = F.udf(_encrypt_value, pyspark.types.StringType())
         res = (
-            df.withColumn("encrypted_value", encrypt_udf(column_name))
+            df.withColumn("encrypted_value", hashed_column)
             .filter(F.col("encrypted_value") == batch_identifiers["hash_value"])
             .drop("encrypted_value")
         )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import pyspark
@@ -10,6 +10,9 @@ from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.execution_engine.partition_and_sample.data_sampler import (
     DataSampler,
 )
+from great_expectations.execution_engine.partition_and_sample.sparkdf_hashing import (
+    get_native_hex_digest_suffix,
+)
 
 if TYPE_CHECKING:
     from great_expectations.core.id_dict import BatchSpec
@@ -180,18 +183,39 @@ class SparkDataSampler(DataSampler):
                 )
             )
 
-        def _encrypt_value(to_encode):
-            to_encode_str = str(to_encode)
-            hash_func = getattr(hashlib, hash_function_name)
-            hashed_value = hash_func(to_encode_str.encode()).hexdigest()[
-                -1 * hash_digits :
-            ]
-            return hashed_value
+        hashed_column: Optional[pyspark.Column] = None
+        if self._is_string_column(df=df, column_name=column_name):
+            # Missing values are hashed by their Python string representation ("None"), as in Python UDF below.
+            hashed_column = get_native_hex_digest_suffix(
+                column=F.coalesce(F.col(column_name), F.lit(str(None))),
+                hash_function_name=hash_function_name,
+                hash_digits=hash_digits,
+            )
+
+        if hashed_column is None:
+
+            def _encrypt_value(to_encode):
+                to_encode_str = str(to_encode)
+                hash_func = getattr(hashlib, hash_function_name)
+                hashed_value = hash_func(to_encode_str.encode()).hexdigest()[
+                    -1 * hash_digits :
+                ]
+                return hashed_value
+
+            encrypt_udf = F.udf(_encrypt_value, pyspark.types.StringType())
+            hashed_column = encrypt_udf(column_name)
 
-        encrypt_udf = F.udf(_encrypt_value, pyspark.types.StringType())
         res = (
-            df.withColumn("encrypted_value", encrypt_udf(column_name))
+            df.withColumn("encrypted_value", hashed_column)
             .filter(F.col("encrypted_value") == hash_value)
             .drop("encrypted_value")
         )
         return res
+
+    @staticmethod
+    def _is_string_column(df: pyspark.DataFrame, column_name: str) -> bool:
+        """Native hashing of non-string values would differ from hashing their Python string representations."""
+        try:
+            return isinstance(df.schema[column_name].dataType, pyspark.types.StringType)
+        except KeyError:
+            return False
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Final, Optional
+
+from great_expectations.compatibility.pyspark import functions as F
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import pyspark
+
+# Bit lengths of "hashlib" SHA-2 functions, computed by Spark SQL "sha2" function.
+_SHA2_BIT_LENGTH_BY_HASH_FUNCTION_NAME: Final[Dict[str, int]] = {
+    "sha224": 224,
+    "sha256": 256,
+    "sha384": 384,
+    "sha512": 512,
+}
+
+
+def get_native_hex_digest_suffix(
+    column: pyspark.Column,
+    hash_function_name: str,
+    hash_digits: int,
+) -> Optional[pyspark.Column]:
+    """Compute last "hash_digits" characters of hexadecimal digest of string-valued column with Spark SQL functions.
+
+    Result is the same as that of "getattr(hashlib, hash_function_name)(value.encode()).hexdigest()[-hash_digits:]",
+    but it is computed by Spark itself, without moving every value across JVM/Python boundary (as Python UDF does).
+
+    Args:
+        column: String-valued Spark column to hash.
+        hash_function_name: Name of "hashlib" hash function.
+        hash_digits: Number of trailing hexadecimal digits of digest to keep.
+
+    Returns:
+        Spark column with digest suffix, or None if hash function has no Spark SQL equivalent.
+    """
+    if not (isinstance(hash_digits, int) and hash_digits > 0):
+        return None
+
+    hex_digest: pyspark.Column
+    if hash_function_name == "md5":
+        hex_digest = F.md5(column)
+    elif hash_function_name == "sha1":
+        hex_digest = F.sha1(column)
+    elif hash_function_name in _SHA2_BIT_LENGTH_BY_HASH_FUNCTION_NAME:
+        hex_digest = F.sha2(
+            column, _SHA2_BIT_LENGTH_BY_HASH_FUNCTION_NAME[hash_function_name]
+        )
+    else:
+        return None
+
+    # Negative position counts from the end of string (longer suffix than digest yields whole digest, as in Python).
+    return F.substring(hex_digest, -hash_digits, hash_digits)
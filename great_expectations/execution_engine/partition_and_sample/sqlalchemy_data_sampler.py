@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Union
+import logging
+from typing import TYPE_CHECKING, Dict, Final, List, NamedTuple, Optional, Union
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.sqlalchemy import (
@@ -16,10 +17,87 @@ if TYPE_CHECKING:
     from great_expectations.compatibility import sqlalchemy
     from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 
+logger = logging.getLogger(__name__)
+
+
+class _NativeRandomSampling(NamedTuple):
+    """Dialect-specific sampling clause, appended to table name in FROM clause.
+
+    Attributes:
+        sampling_clause_template: Template formatted with sampling percentage (0 to 100).
+        seed_clause_template: Template formatted with seed (None if dialect does not support repeatable sampling).
+        sampling_method: Name of sampling method, recorded in batch markers.
+    """
+
+    sampling_clause_template: str
+    seed_clause_template: Optional[str]
+    sampling_method: str
+
+
+_NATIVE_RANDOM_SAMPLING_BY_DIALECT: Final[Dict[GXSqlDialect, _NativeRandomSampling]] = {
+    GXSqlDialect.POSTGRESQL: _NativeRandomSampling(
+        sampling_clause_template="TABLESAMPLE BERNOULLI ({percentage})",
+        seed_clause_template="REPEATABLE ({seed})",
+        sampling_method="tablesample_bernoulli",
+    ),
+    GXSqlDialect.TRINO: _NativeRandomSampling(
+        sampling_clause_template="TABLESAMPLE BERNOULLI ({percentage})",
+        seed_clause_template=None,
+        sampling_method="tablesample_bernoulli",
+    ),
+    GXSqlDialect.MSSQL: _NativeRandomSampling(
+        sampling_clause_template="TABLESAMPLE SYSTEM ({percentage} PERCENT)",
+        seed_clause_template="REPEATABLE ({seed})",
+        sampling_method="tablesample_system",
+    ),
+    GXSqlDialect.SNOWFLAKE: _NativeRandomSampling(
+        sampling_clause_template="SAMPLE BERNOULLI ({percentage})",
+        seed_clause_template="SEED ({seed})",
+        sampling_method="sample_bernoulli",
+    ),
+    GXSqlDialect.BIGQUERY: _NativeRandomSampling(
+        sampling_clause_template="TABLESAMPLE SYSTEM ({percentage} PERCENT)",
+        seed_clause_template=None,
+        sampling_method="tablesample_system",
+    ),
+    GXSqlDialect.DATABRICKS: _NativeRandomSampling(
+        sampling_clause_template="TABLESAMPLE ({percentage} PERCENT)",
+        seed_clause_template="REPEATABLE ({seed})",
+        sampling_method="tablesample_percent",
+    ),
+}
+
 
 class SqlAlchemyDataSampler(DataSampler):
     """Sampling methods for data stores with SQL interfaces."""
 
+    def get_applied_sampling_method(
+        self,
+        execution_engine: SqlAlchemyExecutionEngine,
+        batch_spec: BatchSpec,
+    ) -> str:
+        """Get name of sampling method, which is actually used for the batch_spec on dialect of execution engine.
+
+        Args:
+            execution_engine: Engine used to connect to the database.
+            batch_spec: Batch specification, containing "sampling_method".
+
+        Returns:
+            Name of dialect-native sampling method (e.g., "tablesample_bernoulli") for "sample_using_random" on
+            dialects supporting it; otherwise, name of sampler method (without preceding underscore).
+        """
+        sampler_method_name: str = self._get_sampler_method_name(
+            batch_spec["sampling_method"]
+        )
+        if sampler_method_name == "sample_using_random":
+            native_random_sampling: Optional[
+                _NativeRandomSampling
+            ] = _NATIVE_RANDOM_SAMPLING_BY_DIALECT.get(execution_engine.dialect_name)
+            if native_random_sampling is not None:
+                return native_random_sampling.sampling_method
+
+        return sampler_method_name
+
     def sample_using_limit(
         self,
         execution_engine: SqlAlchemyExecutionEngine,
@@ -133,6 +211,11 @@ class SqlAlchemyDataSampler(DataSampler):
     ) -> sqlalchemy.Selectable:
         """Sample using random data with configuration provided via the batch_spec.
 
+        On dialects supporting it (PostgreSQL, Trino, MSSQL, Snowflake, BigQuery, and Databricks), rows are sampled
+        by the database itself (e.g., "TABLESAMPLE BERNOULLI"), returning approximately fraction "p" of rows; optional
+        "seed" in "sampling_kwargs" makes the sample repeatable where the dialect allows it.  Elsewhere, exactly
+        fraction "p" of rows (counted first) is returned in random order.
+
         Note: where_clause needs to be included at this stage since we use the where clause
         to determine the total number of rows to use in determining the rows returned in the
         sample fraction.
@@ -160,24 +243,80 @@ class SqlAlchemyDataSampler(DataSampler):
                 "the 'sampling_kwargs' configuration."
             ) from e
 
-        num_rows: int = execution_engine.execute_query(
-            sa.select(sa.func.count())
-            .select_from(
-                sa.table(table_name, schema=batch_spec.get("schema_name", None))
+        seed: Optional[int] = batch_spec["sampling_kwargs"].get("seed")
+        if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+            raise ValueError(
+                "The parameter 'seed' in the 'sampling_kwargs' configuration of sample_using_random "
+                "must be an integer."
             )
-            .where(where_clause)
+
+        table: sqlalchemy.TableClause = sa.table(
+            table_name, schema=batch_spec.get("schema_name", None)
+        )
+
+        native_random_sampling: Optional[
+            _NativeRandomSampling
+        ] = _NATIVE_RANDOM_SAMPLING_BY_DIALECT.get(execution_engine.dialect_name)
+        if seed is not None and (
+            native_random_sampling is None
+            or native_random_sampling.seed_clause_template is None
+        ):
+            logger.warning(
+                f'Dialect "{execution_engine.dialect_name}" does not support repeatable sampling; the parameter '
+                "'seed' of sample_using_random is ignored."
+            )
+            seed = None
+
+        if native_random_sampling is not None:
+            return (
+                sa.select("*")
+                .select_from(
+                    SqlAlchemyDataSampler._get_natively_sampled_table(
+                        execution_engine=execution_engine,
+                        table=table,
+                        native_random_sampling=native_random_sampling,
+                        p=p,
+                        seed=seed,
+                    )
+                )
+                .where(where_clause)
+            )
+
+        num_rows: int = execution_engine.execute_query(
+            sa.select(sa.func.count()).select_from(table).where(where_clause)
         ).scalar()
         sample_size: int = round(p * num_rows)
         return (
             sa.select("*")
-            .select_from(
-                sa.table(table_name, schema=batch_spec.get("schema_name", None))
-            )
+            .select_from(table)
             .where(where_clause)
             .order_by(sa.func.random())
             .limit(sample_size)
         )
 
+    @staticmethod
+    def _get_natively_sampled_table(
+        execution_engine: SqlAlchemyExecutionEngine,
+        table: sqlalchemy.TableClause,
+        native_random_sampling: _NativeRandomSampling,
+        p: float,
+        seed: Optional[int],
+    ) -> sqlalchemy.TextClause:
+        """Render table name, followed by dialect-native sampling clause, for use in FROM clause."""
+        sampling_clauses: List[str] = [
+            execution_engine.dialect.identifier_preparer.format_table(table),
+            native_random_sampling.sampling_clause_template.format(
+                percentage=f"{100 * float(p):.10g}"
+            ),
+        ]
+        if seed is not None and native_random_sampling.seed_clause_template:
+            sampling_clauses.append(
+                native_random_sampling.seed_clause_template.format(seed=seed)
+            )
+
+        sampled_table: str = " ".join(sampling_clauses)
+        return sa.text(sampled_table)
+
     def sample_using_mod(
         self,
         batch_spec: BatchSpec,
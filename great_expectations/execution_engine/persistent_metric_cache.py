@@ -0,0 +1,284 @@
+"""Persistent (cross-run) cache of resolved metrics, keyed by fingerprint of underlying Batch data.
+
+In-process metric cache of ExecutionEngine lives only as long as ExecutionEngine itself.  When the same immutable data
+(e.g., yesterday's partition of Parquet files) is validated repeatedly by separate runs (e.g., by several Checkpoints),
+all metrics have to be recomputed every time.  PersistentMetricCache stores resolved metric values, so that a later run
+against data having the same fingerprint (e.g., "pandas_data_fingerprint" Batch marker, modification time and size
+of source file, or ETag of source object in cloud storage) can reuse them instead of scheduling their computation.
+
+Since the key includes fingerprint of data (rather than just its identity), qualified by ExecutionEngine class and Great
+Expectations version, entries are never stale with respect to data or to metric implementations; LRU ("max_entries")
+and TTL ("ttl_seconds") eviction exist in order to bound size of cache.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import pathlib
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Final, Iterable, Iterator, Optional, Tuple
+
+import great_expectations.exceptions as gx_exceptions
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRY_SIZE_BYTES: Final[int] = 1024 * 1024  # 1 MiB
+
+
+class PersistentMetricCache(ABC):
+    """Interface of cross-run store of resolved metric values, keyed by (batch fingerprint, metric ID) pairs.
+
+    Args:
+        max_entry_size_bytes: serialized metric values larger than this are not stored (large intermediate results,
+            such as unexpected row lists, are cheaper to recompute than to persist).
+    """
+
+    def __init__(
+        self, max_entry_size_bytes: int = DEFAULT_MAX_ENTRY_SIZE_BYTES
+    ) -> None:
+        self._max_entry_size_bytes = max_entry_size_bytes
+
+    @property
+    def max_entry_size_bytes(self) -> int:
+        return self._max_entry_size_bytes
+
+    @abstractmethod
+    def get_metrics(
+        self, batch_fingerprint: str, metric_ids: Iterable[Tuple[str, str, str]]
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Returns previously stored values for those of "metric_ids" that are present (and not expired) in cache."""
+        pass
+
+    @abstractmethod
+    def set_metrics(
+        self, batch_fingerprint: str, metrics: Dict[Tuple[str, str, str], Any]
+    ) -> None:
+        """Stores resolved metric values, computed against data having "batch_fingerprint"."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries from cache."""
+        pass
+
+    def _serialize(self, metric_value: Any) -> Optional[bytes]:
+        try:
+            serialized_value: bytes = pickle.dumps(
+                metric_value, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        except Exception as e:
+            logger.debug(f"Metric value of type {type(metric_value)} not cached: {e}")
+            return None
+
+        if len(serialized_value) > self._max_entry_size_bytes:
+            return None
+
+        return serialized_value
+
+
+class SqlitePersistentMetricCache(PersistentMetricCache):
+    """PersistentMetricCache implementation, backed by local SQLite database file.
+
+    Connections are short-lived, so that the same cache file can be shared by concurrently running processes.
+
+    Args:
+        cache_file_path: path of SQLite database file (a good location is "uncommitted/" directory of Data Context).
+        max_entries: upper bound on number of stored entries; least recently used entries are evicted first.
+        ttl_seconds: entries stored longer ago than this are treated as missing and purged.
+        max_entry_size_bytes: serialized metric values larger than this are not stored.
+    """
+
+    def __init__(
+        self,
+        cache_file_path: str,
+        max_entries: Optional[int] = 100000,
+        ttl_seconds: Optional[float] = None,
+        max_entry_size_bytes: int = DEFAULT_MAX_ENTRY_SIZE_BYTES,
+    ) -> None:
+        super().__init__(max_entry_size_bytes=max_entry_size_bytes)
+
+        if max_entries is not None and max_entries < 1:
+            raise gx_exceptions.InvalidConfigError(
+                f'"max_entries" must be positive integer (or None); got {max_entries}.'
+            )
+
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise gx_exceptions.InvalidConfigError(
+                f'"ttl_seconds" must be positive number (or None); got {ttl_seconds}.'
+            )
+
+        self._cache_file_path = cache_file_path
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+
+        pathlib.Path(cache_file_path).resolve().parent.mkdir(
+            parents=True, exist_ok=True
+        )
+
+        with self._connection() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS metric_cache (
+                    batch_fingerprint TEXT NOT NULL,
+                    metric_id TEXT NOT NULL,
+                    metric_value BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed_at REAL NOT NULL,
+                    PRIMARY KEY (batch_fingerprint, metric_id)
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS metric_cache_last_accessed_at ON metric_cache (last_accessed_at)"
+            )
+
+    @property
+    def cache_file_path(self) -> str:
+        return self._cache_file_path
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    def get_metrics(
+        self, batch_fingerprint: str, metric_ids: Iterable[Tuple[str, str, str]]
+    ) -> Dict[Tuple[str, str, str], Any]:
+        metric_ids_by_key: Dict[str, Tuple[str, str, str]] = {
+            _metric_id_to_key(metric_id=metric_id): metric_id
+            for metric_id in metric_ids
+        }
+        if not metric_ids_by_key:
+            return {}
+
+        now: float = time.time()
+
+        metrics: Dict[Tuple[str, str, str], Any] = {}
+
+        with self._lock, self._connection() as connection:
+            self._purge_expired_entries(connection=connection, now=now)
+
+            metric_key: str
+            metric_value: bytes
+            for metric_key, metric_value in _select_entries(
+                connection=connection,
+                batch_fingerprint=batch_fingerprint,
+                metric_keys=list(metric_ids_by_key.keys()),
+            ):
+                try:
+                    metrics[metric_ids_by_key[metric_key]] = pickle.loads(metric_value)
+                except Exception as e:
+                    logger.debug(f'Cached metric "{metric_key}" is not readable: {e}')
+
+            if metrics:
+                connection.executemany(
+                    "UPDATE metric_cache SET last_accessed_at = ? WHERE batch_fingerprint = ? AND metric_id = ?",
+                    [
+                        (now, batch_fingerprint, _metric_id_to_key(metric_id=metric_id))
+                        for metric_id in metrics
+                    ],
+                )
+
+        return metrics
+
+    def set_metrics(
+        self, batch_fingerprint: str, metrics: Dict[Tuple[str, str, str], Any]
+    ) -> None:
+        now: float = time.time()
+
+        rows = []
+        metric_id: Tuple[str, str, str]
+        metric_value: Any
+        serialized_value: Optional[bytes]
+        for metric_id, metric_value in metrics.items():
+            serialized_value = self._serialize(metric_value=metric_value)
+            if serialized_value is not None:
+                rows.append(
+                    (
+                        batch_fingerprint,
+                        _metric_id_to_key(metric_id=metric_id),
+                        sqlite3.Binary(serialized_value),
+                        now,
+                        now,
+                    )
+                )
+
+        if not rows:
+            return
+
+        with self._lock, self._connection() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO metric_cache VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._evict_least_recently_used_entries(connection=connection)
+
+    def clear(self) -> None:
+        with self._lock, self._connection() as connection:
+            connection.execute("DELETE FROM metric_cache")
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        connection: sqlite3.Connection = sqlite3.connect(
+            self._cache_file_path, timeout=30
+        )
+        try:
+            with connection:  # commits on success, rolls back on error
+                yield connection
+        finally:
+            connection.close()
+
+    def _purge_expired_entries(
+        self, connection: sqlite3.Connection, now: float
+    ) -> None:
+        if self._ttl_seconds is None:
+            return
+
+        connection.execute(
+            "DELETE FROM metric_cache WHERE created_at < ?", (now - self._ttl_seconds,)
+        )
+
+    def _evict_least_recently_used_entries(
+        self, connection: sqlite3.Connection
+    ) -> None:
+        if self._max_entries is None:
+            return
+
+        connection.execute(
+            """
+            DELETE FROM metric_cache WHERE rowid IN (
+                SELECT rowid FROM metric_cache ORDER BY last_accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self._max_entries,),
+        )
+
+
+# SQLite limits number of host parameters per statement (999 in older versions).
+_MAX_SELECT_PARAMETERS: Final[int] = 900
+
+
+def _select_entries(
+    connection: sqlite3.Connection, batch_fingerprint: str, metric_keys: list
+) -> Iterator[Tuple[str, bytes]]:
+    idx: int
+    for idx in range(0, len(metric_keys), _MAX_SELECT_PARAMETERS):
+        chunk: list = metric_keys[idx : idx + _MAX_SELECT_PARAMETERS]
+        placeholders: str = ", ".join("?" * len(chunk))
+        yield from connection.execute(
+            f"SELECT metric_id, metric_value FROM metric_cache WHERE batch_fingerprint = ? AND metric_id IN ({placeholders})",
+            [batch_fingerprint, *chunk],
+        )
+
+
+def _metric_id_to_key(metric_id: Tuple[str, str, str]) -> str:
+    return repr(tuple(metric_id))
@@ -20,6 +20,8 @@ from typing import (
     overload,
 )
 
+import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 
 from great_expectations._docs_decorators import deprecated_argument, public_api
@@ -82,10 +84,54 @@ logger = logging.getLogger(__name__)
 def apply_dateutil_parse(column):
     assert len(column.columns) == 1, "Expected DataFrame with 1 column"
     col_name = column.columns[0]
-    _udf = F.udf(parse, pyspark.types.TimestampType())
+    _udf = get_vectorized_udf(fn=parse, return_type=pyspark.types.TimestampType())
     return column.withColumn(col_name, _udf(col_name))
 
 
+def get_vectorized_udf(
+    fn: Callable[[Any], Any], return_type: pyspark.types.DataType
+) -> Callable[..., pyspark.Column]:
+    """Wraps Python function of single value into Spark UDF, which applies it to Arrow batches of column values.
+
+    Unlike row-at-a-time "udf", "pandas_udf" does not pickle every value across JVM/Python boundary; moreover, within
+    each batch, "fn" is evaluated only once for every distinct value.  If PyArrow is not available, "udf" is used.
+
+    Args:
+        fn: Function of single value (returning value of "return_type"); it must be picklable.
+        return_type: Spark data type of values, returned by "fn".
+
+    Returns:
+        Spark UDF, applicable to column (or column name).
+    """
+
+    # Function is self-contained (rather than delegating to module-level helpers), so that it is pickled by value and
+    # Spark workers need not have Great Expectations installed.
+    def map_values(values: pd.Series) -> pd.Series:
+        try:
+            codes, unique_values = pd.factorize(values)
+        except TypeError:
+            return values.map(fn)
+
+        unique_results: list = [fn(value) for value in unique_values]
+        unique_results.append(None)  # Placeholder for code -1 (missing value).
+        results = pd.Series(
+            np.asarray(unique_results, dtype=object)[codes], index=values.index
+        )
+        missing_values = codes == -1
+        if missing_values.any():
+            results[missing_values] = values[missing_values].map(fn)
+
+        return results.infer_objects()
+
+    try:
+        return F.pandas_udf(map_values, return_type)
+    except ImportError:
+        logger.debug(
+            "PyArrow is not available; falling back to row-at-a-time Spark UDF."
+        )
+        return F.udf(fn, return_type)
+
+
 @deprecated_argument(
     argument_name="force_reuse_spark_context",
     version="1.0",
@@ -232,6 +278,15 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "the spark_config, the context will be stopped and restarted with the new spark_config.",
                 category=DeprecationWarning,
             )
+
+        # Batch data filtered by "row_condition" (and "filter_conditions"), keyed by Batch and then by conditions, so
+        # that all metrics of the same Domain (e.g., map metrics of the same column) share one (lazily evaluated)
+        # DataFrame.  Entries are held only until next Batch data is loaded (and becomes active); those of Batch, whose
+        # data is unloaded (e.g., evicted from BatchData cache), are released immediately.
+        self._filtered_domain_data: Dict[
+            Optional[str], Dict[tuple, Tuple[pyspark.DataFrame, pyspark.DataFrame]]
+        ] = {}
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -422,8 +477,19 @@ class SparkDFExecutionEngine(ExecutionEngine):
         if self._persist:
             batch_data.dataframe.persist()
 
+        self._filtered_domain_data.clear()
+
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @override
+    def unload_batch_data(  # type: ignore[override]
+        self, batch_id: str, batch_data: SparkDFBatchData
+    ) -> None:
+        self._filtered_domain_data.pop(batch_id, None)
+
+        if self._persist:
+            batch_data.dataframe.unpersist()
+
     @override
     def get_batch_data_and_markers(  # noqa: PLR0912, PLR0915
         self, batch_spec: BatchSpec
@@ -691,27 +757,36 @@ illegal.  Please check your config."""
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
-        # Filtering by row condition.
-        row_condition = domain_kwargs.get("row_condition", None)
-        if row_condition:
-            condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
-            else:
-                raise GreatExpectationsError(
-                    f"unrecognized condition_parser {condition_parser!s} for Spark execution engine"
+        filtered_domain_data_key: Optional[tuple] = (
+            self._get_filtered_domain_data_key(domain_kwargs=domain_kwargs)
+            if self._caching
+            else None
+        )
+        if filtered_domain_data_key is None:
+            data = self._filter_by_row_conditions(
+                data=data, domain_kwargs=domain_kwargs
+            )
+        else:
+            filtered_domain_data_of_batch: Dict[
+                tuple, Tuple[pyspark.DataFrame, pyspark.DataFrame]
+            ] = self._filtered_domain_data.setdefault(
+                batch_id or self.batch_manager.active_batch_data_id, {}
+            )
+            filtered_domain_data: Optional[
+                Tuple[pyspark.DataFrame, pyspark.DataFrame]
+            ] = filtered_domain_data_of_batch.get(filtered_domain_data_key)
+            if filtered_domain_data is None or filtered_domain_data[0] is not data:
+                filtered_domain_data = (
+                    data,
+                    self._filter_by_row_conditions(
+                        data=data, domain_kwargs=domain_kwargs
+                    ),
                 )
+                filtered_domain_data_of_batch[
+                    filtered_domain_data_key
+                ] = filtered_domain_data
 
-        # Filtering by filter_conditions
-        filter_conditions: List[RowCondition] = domain_kwargs.get(
-            "filter_conditions", []
-        )
-        if len(filter_conditions) > 0:
-            filter_condition = self._combine_row_conditions(filter_conditions)
-            data = data.filter(filter_condition.condition)
+            data = filtered_domain_data[1]
 
         if "column" in domain_kwargs:
             return data
@@ -771,6 +846,53 @@ illegal.  Please check your config."""
 
         return data
 
+    @staticmethod
+    def _get_filtered_domain_data_key(domain_kwargs: dict) -> Optional[tuple]:
+        """Builds key of Batch data filtered by row conditions; returns None if Domain kwargs imply no filtering."""
+        row_condition: Optional[str] = domain_kwargs.get("row_condition") or None
+        filter_conditions: List[RowCondition] = domain_kwargs.get(
+            "filter_conditions", []
+        )
+        if row_condition is None and not filter_conditions:
+            return None
+
+        return (
+            row_condition,
+            domain_kwargs.get("condition_parser") if row_condition else None,
+            tuple(
+                (filter_condition.condition, filter_condition.condition_type)
+                for filter_condition in filter_conditions
+            ),
+        )
+
+    def _filter_by_row_conditions(
+        self, data: pyspark.DataFrame, domain_kwargs: dict
+    ) -> pyspark.DataFrame:
+        """Applies "row_condition" and "filter_conditions" directives of Domain kwargs to Batch data."""
+        # Filtering by row condition.
+        row_condition = domain_kwargs.get("row_condition", None)
+        if row_condition:
+            condition_parser = domain_kwargs.get("condition_parser", None)
+            if condition_parser == "spark":
+                data = data.filter(row_condition)
+            elif condition_parser == "great_expectations__experimental__":
+                parsed_condition = parse_condition_to_spark(row_condition)
+                data = data.filter(parsed_condition)
+            else:
+                raise GreatExpectationsError(
+                    f"unrecognized condition_parser {condition_parser!s} for Spark execution engine"
+                )
+
+        # Filtering by filter_conditions
+        filter_conditions: List[RowCondition] = domain_kwargs.get(
+            "filter_conditions", []
+        )
+        if len(filter_conditions) > 0:
+            filter_condition = self._combine_row_conditions(filter_conditions)
+            data = data.filter(filter_condition.condition)
+
+        return data
+
     @staticmethod
     def _combine_row_conditions(row_conditions: List[RowCondition]) -> RowCondition:
         """Combine row conditions using AND if condition_type is SPARK_SQL
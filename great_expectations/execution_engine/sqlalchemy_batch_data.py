@@ -143,6 +143,8 @@ class SqlAlchemyBatchData(BatchData):
         self._use_quoted_name = use_quoted_name
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
+        # Set if selectable is temporary table, created for this Batch (visible only to connection that created it).
+        self._is_temp_table = False
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError(
@@ -205,6 +207,11 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def is_temp_table(self) -> bool:
+        """Whether or not selectable is temporary table, created from query or selectable of this Batch."""
+        return self._is_temp_table
+
     def _create_temporary_table(  # noqa: C901, PLR0912, PLR0915
         self,
         dialect: GXSqlDialect,
@@ -388,6 +395,7 @@ class SqlAlchemyBatchData(BatchData):
             query=query,
             temp_table_schema_name=temp_table_schema_name,
         )
+        self._is_temp_table = True
 
         return sa.Table(
             temp_table_name,
@@ -434,6 +442,7 @@ class SqlAlchemyBatchData(BatchData):
             query=query,
             temp_table_schema_name=temp_table_schema_name,
         )
+        self._is_temp_table = True
 
         return sa.Table(
             temp_table_name,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import concurrent.futures
 import copy
 import datetime
 import hashlib
@@ -21,6 +22,7 @@ from typing import (
     List,
     MutableMapping,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -43,6 +45,7 @@ from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine.execution_engine import (
     MetricComputationConfiguration,
@@ -78,6 +81,19 @@ from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_query_fusion import (
+    apply_row_condition_to_metric_fn,
+    dialect_supports_aggregate_filter_clause,
+    is_fusable_metric_fn,
+)
+from great_expectations.execution_engine.sqlalchemy_sample_query_fusion import (
+    FusableSampleQuery,
+    build_fused_sample_query,
+    get_fusable_sample_query,
+    get_selected_column_names,
+    split_fused_sample_query_rows,
+)
+from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -148,6 +164,10 @@ except ImportError:
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine as SaEngine  # noqa: TID251
 
+    from great_expectations.execution_engine.persistent_metric_cache import (
+        PersistentMetricCache,
+    )
+
 
 def _get_dialect_type_module(dialect):
     """Given a dialect, returns the dialect type, which is defines the engine/system that is used to communicates
@@ -214,6 +234,10 @@ _PERSISTED_CONNECTION_DIALECTS = (
     GXSqlDialect.BIGQUERY,
 )
 
+# Domain, which can be materialized into temporary table, is identified by "batch_id", "row_condition", and
+# "condition_parser" (other directives, such as "filter_conditions", are applied to materialized table).
+_MaterializedDomainKey = Tuple[str, Optional[str], Optional[str]]
+
 
 def _dialect_requires_persisted_connection(
     connection_string: str | None = None,
@@ -284,6 +308,32 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
+        max_query_concurrency (int): Maximum number of bundled metric queries (one per compute domain) that may be \
+            executed concurrently, each on its own connection drawn from the SQLAlchemy engine's connection pool. \
+            Queries reading temporary tables (of Batches or of materialized domains) are always executed on the \
+            (persisted) connection that created them.  Defaults to 1 (sequential execution).  Dialects requiring a \
+            persisted connection (e.g., sqlite, mssql) always execute bundled queries sequentially.
+        fuse_row_condition_queries (bool): If True, bundled aggregate metrics, whose compute domains differ only by \
+            "row_condition", are computed in a single query over their common base selectable, with each domain's \
+            row condition applied to its aggregates using "FILTER (WHERE ...)" clause (where dialect supports it) or \
+            "CASE WHEN ... THEN ... END" expressions (domains materialized into temporary tables are not fused).  \
+            Defaults to False.
+        fuse_unexpected_values_queries (bool): If True, queries sampling "unexpected_values" and \
+            "unexpected_index_list" of map metrics, which select the same columns of the same Batch, are executed as \
+            one "UNION ALL" query (each branch retaining its own "LIMIT"), rather than one query per Expectation. \
+            Defaults to False.
+        temp_table_materialization_threshold (int or None): If set, domains (a Batch, together with its \
+            "row_condition"), which re-execute SQL on every query (because the Batch is not a table or because the \
+            domain is filtered by "row_condition"), and which are estimated to be queried at least this many times by \
+            the metrics of a validation, are materialized into temporary tables on first access (dropped by \
+            "close()").  Defaults to None (disabled).
+        caching (bool): If True (default), then resolved (computed) metrics are added to local in-memory cache.
+        persistent_metric_cache (PersistentMetricCache or dict): PersistentMetricCache object (or its configuration \
+            dictionary) for storing resolved metrics across runs, keyed by fingerprint of Batch data (used only if \
+            "caching" is True).
+        use_approximate_metrics (bool): If True, metrics supporting approximation (e.g., "column.quantile_values") are \
+            estimated in database by dialect-native approximate functions, where dialect has them (and are computed \
+            exactly in database otherwise).  Defaults to False.
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -302,17 +352,56 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         connection_string: Optional[str] = None,
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
+        caching: bool = True,
+        persistent_metric_cache: Optional[Union[PersistentMetricCache, dict]] = None,
         create_temp_table: bool = True,
+        max_query_concurrency: int = 1,
+        fuse_row_condition_queries: bool = False,
+        fuse_unexpected_values_queries: bool = False,
+        temp_table_materialization_threshold: Optional[int] = None,
+        use_approximate_metrics: bool = False,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
         **kwargs,
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            caching=caching,
+            batch_data_dict=batch_data_dict,
+            persistent_metric_cache=persistent_metric_cache,
+            use_approximate_metrics=use_approximate_metrics,
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+
+        if max_query_concurrency < 1:
+            raise InvalidConfigError(
+                f'"max_query_concurrency" must be a positive integer ({max_query_concurrency} was provided).'
+            )
+
+        self._max_query_concurrency = max_query_concurrency
+        self._fuse_row_condition_queries = fuse_row_condition_queries
+        self._fuse_unexpected_values_queries = fuse_unexpected_values_queries
+
+        if (
+            temp_table_materialization_threshold is not None
+            and temp_table_materialization_threshold < 1
+        ):
+            raise InvalidConfigError(
+                f'"temp_table_materialization_threshold" must be a positive integer ({temp_table_materialization_threshold} was provided).'
+            )
+
+        self._temp_table_materialization_threshold = (
+            temp_table_materialization_threshold
+        )
+        # Domains, planned by "plan_metric_resolution()" to be materialized, and temporary tables created for them.
+        self._planned_materialized_domains: Set[_MaterializedDomainKey] = set()
+        self._materialized_domain_tables: Dict[
+            _MaterializedDomainKey, sqlalchemy.Table
+        ] = {}
         os.environ["SF_PARTNER"] = "great_expectations_oss"  # noqa: TID251
 
         # sqlite/mssql temp tables only persist within a connection, so we need to keep the connection alive by
@@ -327,6 +416,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         # built-in caching.
         self._inspector = None
 
+        # Optional parameters of SQLAlchemy engine (needed to create SQLAlchemy engine for copy of this object).
+        self._engine_kwargs = kwargs
+        # Set on copies, created by "copy_for_concurrent_use()", which use SQLAlchemy engine of their original.
+        self._shares_engine = False
+
         if engine is not None:
             if credentials is not None:
                 logger.warning(
@@ -349,6 +443,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             GXSqlDialect.CLICKHOUSE,
         ]:
             self._create_temp_table = False
+            self._temp_table_materialization_threshold = None
 
         # Get the dialect **for purposes of identifying types**
         if self.dialect_name in [
@@ -447,6 +542,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "caching": caching,
+            "persistent_metric_cache": persistent_metric_cache
+            if isinstance(persistent_metric_cache, dict)
+            else None,
+            "use_approximate_metrics": use_approximate_metrics,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -518,6 +618,26 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def dialect(self) -> sqlalchemy.Dialect:
         return self.engine.dialect
 
+    @property
+    def max_query_concurrency(self) -> int:
+        """Maximum number of bundled metric queries executed concurrently by "resolve_metric_bundle()"."""
+        return self._max_query_concurrency
+
+    @property
+    def fuse_row_condition_queries(self) -> bool:
+        """Whether or not bundled metrics on domains, differing only by "row_condition", are computed in one query."""
+        return self._fuse_row_condition_queries
+
+    @property
+    def fuse_unexpected_values_queries(self) -> bool:
+        """Whether or not queries sampling unexpected values of map metrics are combined into "UNION ALL" queries."""
+        return self._fuse_unexpected_values_queries
+
+    @property
+    def temp_table_materialization_threshold(self) -> Optional[int]:
+        """Minimum estimated number of queries re-executing domain, for which it is materialized into temporary table."""
+        return self._temp_table_materialization_threshold
+
     @property
     def dialect_name(self) -> str:
         """Retrieve the string name of the engine dialect in lowercase e.g. "postgresql".
@@ -615,6 +735,178 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             create_engine_kwargs,
         )
 
+    @override
+    def plan_metric_resolution(
+        self, metrics_to_resolve: Iterable[MetricConfiguration]
+    ) -> None:
+        """Plans materialization of domains, which are re-executed by many queries, into temporary tables.
+
+        Number of queries hitting every domain is estimated from metrics to resolve: each directly-computed metric
+        executes its own query, whereas aggregate metrics are bundled into one query per domain for every level of
+        metric dependency graph, at which they become computable (partial metric functions execute no queries).
+
+        Args:
+            metrics_to_resolve: all unresolved metrics of "ValidationGraph"
+        """
+        if self._temp_table_materialization_threshold is None:
+            return
+
+        metrics_by_id: Dict[Tuple[str, str, str], MetricConfiguration] = {
+            metric.id: metric for metric in metrics_to_resolve
+        }
+        dependency_levels: Dict[Tuple[str, str, str], int] = {}
+
+        def _get_dependency_level(metric: MetricConfiguration) -> int:
+            if metric.id not in dependency_levels:
+                dependency_levels[metric.id] = 1 + max(
+                    (
+                        _get_dependency_level(metrics_by_id[dependency.id])
+                        for dependency in metric.metric_dependencies.values()
+                        if dependency.id in metrics_by_id
+                    ),
+                    default=0,
+                )
+
+            return dependency_levels[metric.id]
+
+        direct_query_counts: Dict[_MaterializedDomainKey, int] = {}
+        aggregate_query_levels: Dict[_MaterializedDomainKey, Set[int]] = {}
+
+        metric: MetricConfiguration
+        materialized_domain_key: Optional[_MaterializedDomainKey]
+        for metric in metrics_by_id.values():
+            materialized_domain_key = self._get_materialized_domain_key(
+                domain_kwargs=metric.metric_domain_kwargs
+            )
+            if materialized_domain_key is None:
+                continue
+
+            _, metric_fn = get_metric_provider(
+                metric_name=metric.metric_name, execution_engine=self
+            )
+            if metric_fn is None:
+                aggregate_query_levels.setdefault(materialized_domain_key, set()).add(
+                    _get_dependency_level(metric)
+                )
+            elif not isinstance(
+                getattr(metric_fn, "metric_fn_type", None), MetricPartialFunctionTypes
+            ):
+                direct_query_counts[materialized_domain_key] = (
+                    direct_query_counts.get(materialized_domain_key, 0) + 1
+                )
+
+        estimated_query_count: int
+        for materialized_domain_key in set(direct_query_counts) | set(
+            aggregate_query_levels
+        ):
+            estimated_query_count = direct_query_counts.get(
+                materialized_domain_key, 0
+            ) + len(aggregate_query_levels.get(materialized_domain_key, set()))
+            if estimated_query_count >= self._temp_table_materialization_threshold:
+                logger.debug(
+                    f"""SqlAlchemyExecutionEngine planned materialization of domain {materialized_domain_key} \
+(estimated to be queried {estimated_query_count} times) into temporary table"""
+                )
+                self._planned_materialized_domains.add(materialized_domain_key)
+
+    def _get_materialized_domain_key(
+        self, domain_kwargs: dict
+    ) -> Optional[_MaterializedDomainKey]:
+        """Returns key of domain, if its materialization can save re-execution of SQL; otherwise, returns None."""
+        if domain_kwargs.get("table") is not None:
+            return None
+
+        batch_id: Optional[str] = (
+            domain_kwargs.get("batch_id") or self.batch_manager.active_batch_data_id
+        )
+        if batch_id is None:
+            return None
+
+        data_object: Optional[SqlAlchemyBatchData] = cast(
+            Optional[SqlAlchemyBatchData],
+            self.batch_manager.batch_data_cache.get(batch_id),
+        )
+        if data_object is None:
+            return None
+
+        row_condition: Optional[str] = domain_kwargs.get("row_condition")
+        # Plain tables (including temporary tables of Batches) are only scanned, unless filtered by "row_condition".
+        if row_condition is None and isinstance(data_object.selectable, sa.Table):
+            return None
+
+        return batch_id, row_condition, domain_kwargs.get("condition_parser")
+
+    def _is_planned_materialized_domain(self, domain_kwargs: dict) -> bool:
+        """Whether or not domain is planned by "plan_metric_resolution()" to be materialized into temporary table."""
+        if not self._planned_materialized_domains:
+            return False
+
+        return (
+            self._get_materialized_domain_key(domain_kwargs=domain_kwargs)
+            in self._planned_materialized_domains
+        )
+
+    def _get_materialized_domain_table(
+        self,
+        materialized_domain_key: _MaterializedDomainKey,
+        data_object: SqlAlchemyBatchData,
+        selectable: sqlalchemy.Selectable,
+    ) -> Optional[sqlalchemy.Table]:
+        """Returns temporary table, holding records of domain (materialized from "selectable" on first access).
+
+        If temporary table cannot be created, domain is no longer planned for materialization and None is returned.
+        """
+        if materialized_domain_key in self._materialized_domain_tables:
+            return self._materialized_domain_tables[materialized_domain_key]
+
+        if not isinstance(selectable, sqlalchemy.Select):
+            selectable = sa.select(sa.text("*")).select_from(selectable)
+
+        query: str = str(
+            selectable.compile(
+                dialect=self.engine.dialect, compile_kwargs={"literal_binds": True}
+            )
+        )
+        try:
+            # noinspection PyProtectedMember
+            _, temp_table_name = data_object._create_temporary_table(
+                dialect=data_object.dialect, query=query
+            )
+        except sqlalchemy.SQLAlchemyError as e:
+            logger.warning(
+                f"""SqlAlchemyExecutionEngine could not materialize domain {materialized_domain_key} into temporary \
+table ({e!s}); domain will be queried directly."""
+            )
+            self._planned_materialized_domains.discard(materialized_domain_key)
+            return None
+
+        materialized_domain_table = sa.Table(temp_table_name, sa.MetaData())
+        self._materialized_domain_tables[
+            materialized_domain_key
+        ] = materialized_domain_table
+        return materialized_domain_table
+
+    def _drop_materialized_domain_tables(self) -> None:
+        """Drops temporary tables, into which domains were materialized (failures are logged, but not raised)."""
+        table: sqlalchemy.Table
+        for table in self._materialized_domain_tables.values():
+            if self.dialect_name == GXSqlDialect.DATABRICKS:
+                stmt = f"DROP VIEW IF EXISTS `{table.name}`"
+            elif self.dialect_name == GXSqlDialect.DREMIO:
+                stmt = f"DROP VDS {table.name}"
+            else:
+                stmt = f"DROP TABLE {table.name}"
+
+            try:
+                self.execute_query_in_transaction(sa.text(stmt))
+            except sqlalchemy.SQLAlchemyError as e:
+                logger.warning(
+                    f'Failed to drop temporary table "{table.name}" of materialized domain: {e!s}'
+                )
+
+        self._materialized_domain_tables = {}
+        self._planned_materialized_domains = set()
+
     @public_api
     @override
     def get_domain_records(  # noqa: C901, PLR0912, PLR0915
@@ -700,6 +992,26 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     "SqlAlchemyExecutionEngine only supports the great_expectations condition_parser."
                 )
 
+        # Domains, planned to be materialized by "plan_metric_resolution()", are queried from their temporary tables.
+        materialized_domain_key: Optional[_MaterializedDomainKey]
+        if self._planned_materialized_domains:
+            materialized_domain_key = self._get_materialized_domain_key(
+                domain_kwargs=domain_kwargs
+            )
+            if (
+                materialized_domain_key is not None
+                and materialized_domain_key in self._planned_materialized_domains
+            ):
+                materialized_domain_table: Optional[
+                    sqlalchemy.Table
+                ] = self._get_materialized_domain_table(
+                    materialized_domain_key=materialized_domain_key,
+                    data_object=data_object,
+                    selectable=selectable,
+                )
+                if materialized_domain_table is not None:
+                    selectable = materialized_domain_table
+
         # Filtering by filter_conditions
         filter_conditions: List[RowCondition] = domain_kwargs.get(
             "filter_conditions", []
@@ -1074,6 +1386,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
+        if self._fuse_row_condition_queries:
+            queries = self._fuse_queries_differing_by_row_condition(queries=queries)
+
+        query_objects: List[Tuple[sqlalchemy.Select, dict]] = []
         for query in queries.values():
             domain_kwargs: dict = query["domain_kwargs"]
             selectable: sqlalchemy.Selectable = self.get_domain_records(
@@ -1082,46 +1398,32 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             assert len(query["select"]) == len(query["metric_ids"])
 
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if sqlalchemy.TextClause and isinstance(
-                    selectable, sqlalchemy.TextClause
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.columns().subquery()
-                    )
-                elif (
-                    sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)
-                ) or (
-                    sqlalchemy.TextualSelect
-                    and isinstance(selectable, sqlalchemy.TextualSelect)
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.subquery()
-                    )
-                else:
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable
-                    )
+            """
+            If a custom query is passed, selectable will be TextClause and not formatted
+            as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+            to TextualSelect using sa.columns() before it can be converted to type Subquery
+            """
+            if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):
+                sa_query_object = sa.select(*query["select"]).select_from(
+                    selectable.columns().subquery()
+                )
+            elif (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
+                sqlalchemy.TextualSelect
+                and isinstance(selectable, sqlalchemy.TextualSelect)
+            ):
+                sa_query_object = sa.select(*query["select"]).select_from(
+                    selectable.subquery()
+                )
+            else:
+                sa_query_object = sa.select(*query["select"]).select_from(selectable)
 
-                logger.debug(f"Attempting query {sa_query_object!s}")
-                res = self.execute_query(sa_query_object).fetchall()
+            query_objects.append((sa_query_object, query))
 
-                logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
-{IDDict(domain_kwargs).to_id()}"""
-                )
-            except sqlalchemy.OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
-                logger.error(exception_message)
-                raise ExecutionEngineError(message=exception_message)
+        results: List[List[sqlalchemy.Row]] = self._execute_bundled_queries(
+            query_objects=query_objects
+        )
 
+        for res, (_, query) in zip(results, query_objects):
             assert (
                 len(res) == 1
             ), "all bundle-computed metrics must be single-value statistics"
@@ -1140,6 +1442,310 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    @override
+    def _resolve_fused_direct_metrics(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes unexpected values samples of map metrics, which select the same columns, in one query per group.
+
+        Metric functions, registered as fusable (see "sqlalchemy_sample_query_fusion" module), are split into their
+        query-building and row-processing halves; queries of the same Batch, selecting the same columns, are combined
+        with "UNION ALL", and every result row is processed by the metric whose query produced it.  Metrics, which are
+        alone in their group, whose queries cannot be built, or whose fused query fails, are left to be computed
+        individually (so that an error is reported only for metric that actually causes it).
+        """
+        if not self._fuse_unexpected_values_queries:
+            return {}
+
+        groups: Dict[tuple, List[Tuple[MetricComputationConfiguration, Any]]] = {}
+
+        metric_computation_configuration: MetricComputationConfiguration
+        for metric_computation_configuration in metric_fn_direct_configurations:
+            fusable_sample_query: Optional[
+                FusableSampleQuery
+            ] = get_fusable_sample_query(
+                metric_fn=metric_computation_configuration.metric_fn
+            )
+            if fusable_sample_query is None:
+                continue
+
+            try:
+                query: Optional[
+                    sqlalchemy.Select
+                ] = fusable_sample_query.build_query_fn(
+                    **metric_computation_configuration.metric_provider_kwargs
+                )
+            except Exception as e:
+                # Metric is computed individually, whereupon the same error is reported for it in the usual manner.
+                logger.debug(
+                    f"""Unable to build fusable query for metric "{metric_computation_configuration.metric_configuration.metric_name}" ({e!s}); it will be computed individually."""
+                )
+                continue
+
+            if query is None:
+                continue
+
+            selected_column_names: Optional[
+                Tuple[str, ...]
+            ] = get_selected_column_names(query=query)
+            if selected_column_names is None:
+                continue
+
+            batch_id: Optional[str] = (
+                metric_computation_configuration.metric_configuration.metric_domain_kwargs.get(
+                    "batch_id"
+                )
+                or self.batch_manager.active_batch_data_id
+            )
+            groups.setdefault(
+                (batch_id, fusable_sample_query, selected_column_names), []
+            ).append((metric_computation_configuration, query))
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        group_key: tuple
+        group: List[Tuple[MetricComputationConfiguration, Any]]
+        for group_key, group in groups.items():
+            if len(group) < 2:  # noqa: PLR2004
+                continue
+
+            fusable_sample_query = group_key[1]
+            resolved_group_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+            try:
+                rows: List[sqlalchemy.Row] = self.execute_query(
+                    build_fused_sample_query(queries=[query for _, query in group])
+                ).fetchall()
+                rows_by_branch: List[
+                    List[sqlalchemy.Row]
+                ] = split_fused_sample_query_rows(rows=rows, num_branches=len(group))
+                for (metric_computation_configuration, _), branch_rows in zip(
+                    group, rows_by_branch
+                ):
+                    resolved_group_metrics[
+                        metric_computation_configuration.metric_configuration.id
+                    ] = fusable_sample_query.process_rows_fn(
+                        rows=branch_rows,
+                        **metric_computation_configuration.metric_provider_kwargs,
+                    )
+            except Exception as e:
+                # Metrics of group are computed individually, so that failure of one does not fail all the others.
+                logger.debug(
+                    f"""Unable to compute fused unexpected values query, selecting columns {group_key[2]} ({e!s}); its \
+{len(group)} metrics will be computed individually."""
+                )
+                continue
+
+            resolved_metrics.update(resolved_group_metrics)
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine fused {len(group)} unexpected values queries, selecting columns \
+{group_key[2]}, into single query"""
+            )
+
+        return resolved_metrics
+
+    def _fuse_queries_differing_by_row_condition(
+        self, queries: Dict[Tuple[str, str, str], dict]
+    ) -> Dict[Tuple[str, str, str], dict]:
+        """Merges bundled queries, whose compute domains differ only by "row_condition", into one query per base domain.
+
+        Metric functions of every merged domain that has a row condition are rewritten so as to apply that condition to
+        each of their aggregates (see "sqlalchemy_query_fusion" module); queries that cannot be rewritten are retained.
+        """
+        use_filter_clause: bool = dialect_supports_aggregate_filter_clause(
+            dialect=self.dialect
+        )
+
+        fused_queries: Dict[Tuple[str, str, str], dict] = {}
+        base_domain_kwargs_by_id: Dict[Tuple[str, str, str], IDDict] = {}
+        base_domain_groups: Dict[Tuple[str, str, str], List[Tuple[dict, Any]]] = {}
+
+        domain_id: Tuple[str, str, str]
+        query: dict
+        for domain_id, query in queries.items():
+            domain_kwargs: IDDict = query["domain_kwargs"]
+            row_condition: Optional[str] = domain_kwargs.get("row_condition")
+            # Domains planned for materialization are queried from their temporary tables (rather than re-filtered).
+            if row_condition is not None and (
+                domain_kwargs.get("condition_parser")
+                != "great_expectations__experimental__"
+                or not all(
+                    is_fusable_metric_fn(metric_fn=metric_fn)
+                    for metric_fn in query["select"]
+                )
+                or self._is_planned_materialized_domain(domain_kwargs=domain_kwargs)
+            ):
+                fused_queries[domain_id] = query
+                continue
+
+            base_domain_kwargs = IDDict(
+                {
+                    key: value
+                    for key, value in domain_kwargs.items()
+                    if key not in ("row_condition", "condition_parser")
+                }
+            )
+            base_domain_id: Tuple[str, str, str] = base_domain_kwargs.to_id()
+            base_domain_kwargs_by_id[base_domain_id] = base_domain_kwargs
+            base_domain_groups.setdefault(base_domain_id, []).append(
+                (
+                    query,
+                    None
+                    if row_condition is None
+                    else parse_condition_to_sqlalchemy(row_condition),
+                )
+            )
+
+        group: List[Tuple[dict, Any]]
+        for base_domain_id, group in base_domain_groups.items():
+            if len(group) == 1:
+                query = group[0][0]
+                fused_queries[query["domain_kwargs"].to_id()] = query
+                continue
+
+            fused_query: dict = {
+                "select": [],
+                "metric_ids": [],
+                "domain_kwargs": base_domain_kwargs_by_id[base_domain_id],
+            }
+            for query, parsed_condition in group:
+                if parsed_condition is None:
+                    fused_query["select"].extend(query["select"])
+                else:
+                    fused_query["select"].extend(
+                        apply_row_condition_to_metric_fn(
+                            metric_fn=metric_fn,
+                            row_condition=parsed_condition,
+                            use_filter_clause=use_filter_clause,
+                        )
+                        for metric_fn in query["select"]
+                    )
+
+                fused_query["metric_ids"].extend(query["metric_ids"])
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine fused {len(group)} row_condition domains into single query on domain_id \
+{base_domain_id}"""
+            )
+            fused_queries[base_domain_id] = fused_query
+
+        return fused_queries
+
+    def _execute_bundled_queries(
+        self, query_objects: List[Tuple[sqlalchemy.Select, dict]]
+    ) -> List[List[sqlalchemy.Row]]:
+        """Executes bundled metrics queries (one per compute domain), concurrently if "max_query_concurrency" allows."""
+        # Bundles reading temporary tables (of Batches or of materialized domains) must be executed on connection, which
+        # created those tables; only the remaining bundles may be executed on other connections of engine's pool.
+        concurrent_query_indices: List[int] = []
+        if (
+            self._max_query_concurrency > 1
+            and self.dialect_name not in _PERSISTED_CONNECTION_DIALECTS
+        ):
+            concurrent_query_indices = [
+                idx
+                for idx, (_, query) in enumerate(query_objects)
+                if not self._domain_uses_temp_table(
+                    domain_kwargs=query["domain_kwargs"]
+                )
+            ]
+
+        results: List[List[sqlalchemy.Row]] = [[] for _ in query_objects]
+        max_workers: int = min(
+            self._max_query_concurrency, len(concurrent_query_indices)
+        )
+        if max_workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="gx-sqlalchemy-bundle",
+            ) as executor:
+                futures: Dict[int, concurrent.futures.Future] = {
+                    idx: executor.submit(
+                        self._execute_bundled_query,
+                        sa_query_object=query_objects[idx][0],
+                        domain_kwargs=query_objects[idx][1]["domain_kwargs"],
+                        use_pooled_connection=True,
+                    )
+                    for idx in concurrent_query_indices
+                }
+                for idx, (sa_query_object, query) in enumerate(query_objects):
+                    if idx not in futures:
+                        results[idx] = self._execute_bundled_query(
+                            sa_query_object=sa_query_object,
+                            domain_kwargs=query["domain_kwargs"],
+                        )
+
+                for idx, future in futures.items():
+                    results[idx] = future.result()
+        else:
+            results = [
+                self._execute_bundled_query(
+                    sa_query_object=sa_query_object,
+                    domain_kwargs=query["domain_kwargs"],
+                )
+                for sa_query_object, query in query_objects
+            ]
+
+        return results
+
+    def _domain_uses_temp_table(self, domain_kwargs: dict) -> bool:
+        """Whether or not records of domain are read from temporary table (of its Batch or of materialized domain)."""
+        if (
+            self._get_materialized_domain_key(domain_kwargs=domain_kwargs)
+            in self._materialized_domain_tables
+        ):
+            return True
+
+        batch_id: Optional[str] = (
+            domain_kwargs.get("batch_id") or self.batch_manager.active_batch_data_id
+        )
+        if batch_id is None:
+            return False
+
+        data_object: Optional[SqlAlchemyBatchData] = cast(
+            Optional[SqlAlchemyBatchData],
+            self.batch_manager.batch_data_cache.get(batch_id),
+        )
+        return data_object is not None and data_object.is_temp_table
+
+    def _execute_bundled_query(
+        self,
+        sa_query_object: sqlalchemy.Select,
+        domain_kwargs: dict,
+        use_pooled_connection: bool = False,
+    ) -> List[sqlalchemy.Row]:
+        """Executes single bundled metrics query (for one compute domain) and fetches its (single-row) result.
+
+        Unless "use_pooled_connection" is set (for queries executed by worker threads, which cannot share connection),
+        query is executed by "execute_query()".
+        """
+        try:
+            logger.debug(f"Attempting query {sa_query_object!s}")
+            res: List[sqlalchemy.Row]
+            if use_pooled_connection:
+                # Rows are fetched before connection is returned to pool, since released connection may immediately
+                # be checked out by another worker thread.
+                with self.engine.connect() as connection:
+                    res = connection.execute(sa_query_object).fetchall()
+            else:
+                res = self.execute_query(sa_query_object).fetchall()
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
+{IDDict(domain_kwargs).to_id()}"""
+            )
+        except sqlalchemy.OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += (
+                f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)
+            raise ExecutionEngineError(message=exception_message)
+
+        return res
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1158,13 +1764,71 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """
+        self._drop_materialized_domain_tables()
+
+        # SQLAlchemy engine, shared with other SqlAlchemyExecutionEngine objects, is disposed by its original owner.
+        if self._shares_engine:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+            return
+
         if self._engine_backup:
             if self._connection:
                 self._connection.close()
             self._engine_backup.dispose()
         else:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
             self.engine.dispose()
 
+    def copy_for_concurrent_use(self) -> Optional[SqlAlchemyExecutionEngine]:
+        """Returns new SqlAlchemyExecutionEngine, configured as this one, which can query database concurrently with it.
+
+        The copy has its own Batch data, metric caches, and connections (e.g., to validate other Batches in separate
+        thread).  It shares connection pool of SQLAlchemy engine of this object, unless dialect requires persisted
+        connection (held by single-connection pool); in that case, new SQLAlchemy engine is created from connection
+        parameters.  Calling "close()" on the copy never disposes SQLAlchemy engine, which it shares.
+
+        Returns:
+            Copy of this SqlAlchemyExecutionEngine or None, if its connection cannot be used concurrently (i.e., it
+            requires persisted connection, but SQLAlchemy engine was supplied directly or database is in memory).
+        """
+        execution_engine_kwargs: dict = {
+            "name": self._name,
+            "data_context": self._config.get("data_context"),
+            "caching": self._caching,
+            "persistent_metric_cache": self._persistent_metric_cache,
+            "create_temp_table": self._create_temp_table,
+            "max_query_concurrency": self._max_query_concurrency,
+            "fuse_row_condition_queries": self._fuse_row_condition_queries,
+            "fuse_unexpected_values_queries": self._fuse_unexpected_values_queries,
+            "temp_table_materialization_threshold": self._temp_table_materialization_threshold,
+            "use_approximate_metrics": self._use_approximate_metrics,
+        }
+
+        if self.dialect_name not in _PERSISTED_CONNECTION_DIALECTS:
+            execution_engine = self.__class__(
+                engine=self.engine, **execution_engine_kwargs
+            )
+            execution_engine._shares_engine = True
+            return execution_engine
+
+        if not (self._credentials or self._connection_string or self._url) or (
+            self.dialect_name == GXSqlDialect.SQLITE
+            and self.engine.url.database in (None, "", ":memory:")
+        ):
+            return None
+
+        return self.__class__(
+            credentials=self._credentials,
+            connection_string=self._connection_string,
+            url=self._url,
+            **execution_engine_kwargs,
+            **self._engine_kwargs,
+        )
+
     def _get_partitioner_method(self, partitioner_method_name: str) -> Callable:
         """Get the appropriate partitioner method from the method name.
 
@@ -1347,6 +2011,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         selectable: sqlalchemy.Selectable = self._build_selectable_from_batch_spec(
             batch_spec=batch_spec
         )
+        if batch_spec.get("sampling_method") is not None:
+            batch_markers[
+                "sampling_method"
+            ] = self._data_sampler.get_applied_sampling_method(
+                execution_engine=self, batch_spec=batch_spec
+            )
+
         # NOTE: what's being checked here is the presence of a `query` attribute, we could check this directly
         # instead of doing an instance check
         if isinstance(batch_spec, RuntimeQueryBatchSpec):
@@ -1399,7 +2070,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         Returns:
             Sqlalchemy connection
         """
-        if self.dialect_name in _PERSISTED_CONNECTION_DIALECTS:
+        if self._uses_persisted_connection():
             try:
                 if not self._connection:
                     self._connection = self.engine.connect()
@@ -1412,6 +2083,20 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             with self.engine.connect() as connection:
                 yield connection
 
+    def _uses_persisted_connection(self) -> bool:
+        """Whether or not "get_connection()" yields the same connection to every caller.
+
+        Besides dialects requiring it, persisted connection is used whenever connections of engine's pool may be checked
+        out concurrently (by worker threads of "resolve_metric_bundle()" or by other SqlAlchemyExecutionEngine objects,
+        sharing the same engine); otherwise, temporary tables (visible only to connection that created them) would be
+        created and queried on different connections.
+        """
+        return (
+            self.dialect_name in _PERSISTED_CONNECTION_DIALECTS
+            or self._max_query_concurrency > 1
+            or self._shares_engine
+        )
+
     @public_api
     @new_method_or_class(version="0.16.14")
     def execute_query(
@@ -0,0 +1,169 @@
+"""Fusion of bundled aggregate metric queries that differ only in their row conditions.
+
+Every distinct set of compute domain kwargs results in its own bundled query, so that a suite of conditional
+Expectations on the same table incurs one full scan of that table per distinct "row_condition".  Since bundled metric
+functions are aggregates, a domain's row condition can instead be applied to each aggregate individually -- using
+"<aggregate>(...) FILTER (WHERE <condition>)" where the dialect supports it, or by rewriting every aggregate argument
+into "CASE WHEN <condition> THEN <argument> END" otherwise -- and all such domains computed in a single scan of their
+common base selectable.
+
+Rewriting is only sound for aggregates, which ignore NULL values; hence, a metric function is only considered fusable
+if every column it references is an argument of one of the recognized aggregate functions below.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Final, FrozenSet, Optional
+
+from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.sqlalchemy import (
+    sqlalchemy as sa,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+
+NULL_IGNORING_AGGREGATE_FUNCTION_NAMES: Final[FrozenSet[str]] = frozenset(
+    {
+        "avg",
+        "count",
+        "max",
+        "min",
+        "stddev",
+        "stddev_pop",
+        "stddev_samp",
+        "stdev",
+        "sum",
+        "var_pop",
+        "var_samp",
+        "variance",
+    }
+)
+
+# SQLite supports "FILTER" clause on aggregate functions starting with version 3.30.0.
+_SQLITE_AGGREGATE_FILTER_CLAUSE_MIN_VERSION: Final[tuple] = (3, 30, 0)
+
+
+def dialect_supports_aggregate_filter_clause(dialect: sqlalchemy.Dialect) -> bool:
+    """Returns True if "<aggregate>(...) FILTER (WHERE <condition>)" syntax can be used with dialect supplied."""
+    dialect_name: str = dialect.name.lower()
+    if dialect_name == GXSqlDialect.POSTGRESQL:
+        return True
+
+    if dialect_name == GXSqlDialect.SQLITE:
+        server_version_info: Optional[tuple] = getattr(
+            dialect, "server_version_info", None
+        )
+        return (
+            server_version_info is not None
+            and tuple(server_version_info)
+            >= _SQLITE_AGGREGATE_FILTER_CLAUSE_MIN_VERSION
+        )
+
+    return False
+
+
+def is_fusable_metric_fn(metric_fn: Any) -> bool:
+    """Determines whether or not row condition can be applied to each aggregate of "metric_fn" individually.
+
+    Args:
+        metric_fn: SQLAlchemy expression, computing (bundled) aggregate metric.
+
+    Returns:
+        True if every column, referenced by "metric_fn", is inside of recognized NULL-ignoring aggregate function.
+    """
+    if not isinstance(metric_fn, sqlalchemy.ColumnElement):
+        return False
+
+    return _is_fusable_element(element=metric_fn)
+
+
+def apply_row_condition_to_metric_fn(
+    metric_fn: Any,
+    row_condition: sqlalchemy.ColumnElement,
+    use_filter_clause: bool,
+) -> sqlalchemy.ColumnElement:
+    """Restricts every aggregate function of "metric_fn" to rows, satisfying "row_condition".
+
+    Args:
+        metric_fn: SQLAlchemy expression, computing (bundled) aggregate metric (must be fusable).
+        row_condition: Parsed row condition of compute domain, to which "metric_fn" pertains.
+        use_filter_clause: If True, "FILTER (WHERE ...)" clause is used; otherwise, aggregate arguments are wrapped
+            into "CASE WHEN ... THEN ... END" expressions.
+
+    Returns:
+        Rewritten copy of "metric_fn" (original expression is not modified).
+    """
+
+    def _replace(element: Any) -> Optional[Any]:
+        if not _is_recognized_aggregate(element=element):
+            return None
+
+        if use_filter_clause:
+            return element.filter(row_condition)
+
+        return _wrap_aggregate_arguments_into_case(
+            aggregate=element, row_condition=row_condition
+        )
+
+    return sqlalchemy.visitors.replacement_traverse(metric_fn, {}, _replace)
+
+
+def _is_recognized_aggregate(element: Any) -> bool:
+    return (
+        isinstance(element, sqlalchemy.FunctionElement)
+        and getattr(element, "name", "").lower()
+        in NULL_IGNORING_AGGREGATE_FUNCTION_NAMES
+    )
+
+
+def _is_fusable_element(element: Any) -> bool:
+    if _is_recognized_aggregate(element=element):
+        return True
+
+    # Window functions, ordered-set aggregates, already filtered aggregates, raw SQL text, and subqueries cannot be
+    # restricted to row condition by rewriting their arguments.
+    if isinstance(
+        element,
+        (
+            sqlalchemy.Over,
+            sqlalchemy.WithinGroup,
+            sqlalchemy.FunctionFilter,
+            sqlalchemy.TextClause,
+        ),
+    ) or (
+        # SQL functions are "FromClause" objects as well; non-aggregate functions are examined by their arguments.
+        isinstance(element, sqlalchemy.Selectable)
+        and not isinstance(element, sqlalchemy.FunctionElement)
+    ):
+        return False
+
+    # Column referenced outside of any recognized aggregate (e.g., as argument of unrecognized aggregate function).
+    if isinstance(element, sqlalchemy.ColumnClause):
+        return False
+
+    return all(_is_fusable_element(element=child) for child in element.get_children())
+
+
+def _wrap_aggregate_arguments_into_case(
+    aggregate: sqlalchemy.FunctionElement,
+    row_condition: sqlalchemy.ColumnElement,
+) -> sqlalchemy.FunctionElement:
+    arguments: list = []
+    argument: Any
+    for argument in aggregate.clauses:
+        if (
+            isinstance(argument, sqlalchemy.ColumnClause)
+            and argument.is_literal
+            and argument.name == "*"
+        ):
+            # "COUNT(*)" becomes "COUNT(CASE WHEN <condition> THEN 1 END)".
+            arguments.append(sa.case((row_condition, sa.literal(1))))
+        elif (
+            isinstance(argument, sqlalchemy.UnaryExpression)
+            and argument.operator is sqlalchemy.operators.distinct_op
+        ):
+            # "COUNT(DISTINCT x)" becomes "COUNT(DISTINCT CASE WHEN <condition> THEN x END)".
+            arguments.append(sa.distinct(sa.case((row_condition, argument.element))))
+        else:
+            arguments.append(sa.case((row_condition, argument)))
+
+    return getattr(sa.func, aggregate.name)(*arguments)
@@ -0,0 +1,118 @@
+"""Fusion of per-Expectation queries, which sample unexpected values (or their index columns) of map metrics.
+
+Unlike aggregates (which are bundled into one query per compute domain), "unexpected_values" and
+"unexpected_index_list" metrics of map Expectations each execute their own filtered, "LIMIT"-ed SELECT statement;
+hence, validating many map Expectations in "SUMMARY" result format costs one round trip per Expectation per metric.
+
+Metric functions, registered here along with their query-building and row-processing halves, can instead be computed
+together: queries selecting the same columns of the same Batch are combined with "UNION ALL" (every branch wrapped
+into a subquery, so that its "LIMIT" is preserved), each branch tagged by a literal branch index column, and rows of
+the single result are dispatched back to the metrics they belong to.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Final,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from great_expectations.compatibility.sqlalchemy import (
+    sqlalchemy as sa,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import sqlalchemy
+
+# Name of literal column, appended (as last column, so that positional access to other columns is not affected) to
+# every branch of fused query in order to identify metric, to which each row of its result belongs.
+FUSED_QUERY_BRANCH_INDEX_COLUMN_NAME: Final[str] = "gx_fused_query_branch_index"
+
+
+class FusableSampleQuery(NamedTuple):
+    """Query-building and row-processing halves of metric function, which executes one SELECT statement.
+
+    Both functions are called with the same keyword arguments as the metric function itself (provider kwargs);
+    "process_rows_fn" additionally receives "rows" (result of executing query, returned by "build_query_fn").
+    """
+
+    build_query_fn: Callable[..., Optional[sqlalchemy.Select]]
+    process_rows_fn: Callable[..., Any]
+
+
+_registered_fusable_sample_queries: Dict[Callable, FusableSampleQuery] = {}
+
+
+def register_fusable_sample_query(
+    metric_fn: Callable,
+    build_query_fn: Callable[..., Optional[sqlalchemy.Select]],
+    process_rows_fn: Callable[..., Any],
+) -> None:
+    """Declares that metric function is equivalent to processing rows of query, returned by "build_query_fn"."""
+    _registered_fusable_sample_queries[metric_fn] = FusableSampleQuery(
+        build_query_fn=build_query_fn, process_rows_fn=process_rows_fn
+    )
+
+
+def get_fusable_sample_query(metric_fn: Callable) -> Optional[FusableSampleQuery]:
+    return _registered_fusable_sample_queries.get(metric_fn)
+
+
+def get_selected_column_names(query: sqlalchemy.Select) -> Optional[Tuple[str, ...]]:
+    """Returns names of columns selected by query; None if names are not unique (query cannot be made subquery)."""
+    column_names: Tuple[str, ...] = tuple(
+        str(column.key) for column in query.selected_columns
+    )
+    if len(set(column_names)) != len(column_names):
+        return None
+
+    return column_names
+
+
+def build_fused_sample_query(
+    queries: Sequence[sqlalchemy.Select],
+) -> sqlalchemy.Selectable:
+    """Combines queries, selecting the same columns, into one "UNION ALL" query with branch index as last column.
+
+    Args:
+        queries: SELECT statements (e.g., with their own "WHERE" and "LIMIT" clauses) selecting the same columns.
+
+    Returns:
+        Compound SELECT statement, whose rows carry (in "FUSED_QUERY_BRANCH_INDEX_COLUMN_NAME" column) position of
+        query (in "queries") that produced them.
+    """
+    branches: List[sqlalchemy.Select] = []
+    branch_index: int
+    query: sqlalchemy.Select
+    for branch_index, query in enumerate(queries):
+        subquery = query.subquery(f"gx_fused_query_branch_{branch_index}")
+        branches.append(
+            sa.select(
+                *subquery.c,
+                sa.literal_column(str(branch_index)).label(
+                    FUSED_QUERY_BRANCH_INDEX_COLUMN_NAME
+                ),
+            )
+        )
+
+    return sa.union_all(*branches)
+
+
+def split_fused_sample_query_rows(
+    rows: Sequence[sqlalchemy.Row], num_branches: int
+) -> List[List[sqlalchemy.Row]]:
+    """Distributes rows of fused query among its branches (ordered as "queries" of "build_fused_sample_query()")."""
+    rows_by_branch: List[List[sqlalchemy.Row]] = [[] for _ in range(num_branches)]
+    row: sqlalchemy.Row
+    for row in rows:
+        rows_by_branch[int(row[-1])].append(row)
+
+    return rows_by_branch
@@ -1 +1,10 @@
-from great_expectations.expectations.core import *
+from __future__ import annotations
+
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    # Core Expectations are imported upon first use (see "registry_manifest.json"), which keeps "import great_expectations" fast.
+    from great_expectations.expectations.registry import get_lazy_package_attribute
+
+    return get_lazy_package_attribute(package_name=__name__, attribute_name=name)
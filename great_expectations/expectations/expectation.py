@@ -311,6 +311,19 @@ class Expectation(pydantic.BaseModel, metaclass=MetaExpectation):
         Callable[[Expectation], Expectation], None
     ] = pydantic.PrivateAttr(default=None)
 
+    # Incremented whenever domain or success kwarg of this Expectation is reassigned (lets ExpectationSuite detect
+    # in-place modifications of Expectations, whose computed lookup keys consequently become stale); class-level count
+    # of such reassignments (of any Expectation) lets ExpectationSuite skip checking its Expectations, if it is unchanged.
+    _kwargs_version: int = pydantic.PrivateAttr(default=0)
+    _kwargs_assignment_count: ClassVar[int] = 0
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.domain_keys or name in self.success_keys:
+            self._kwargs_version += 1
+            Expectation._kwargs_assignment_count += 1
+
     @pydantic.validator("result_format")
     def _validate_result_format(
         cls, result_format: ResultFormat | dict
@@ -1,3 +1,5 @@
+from typing import Any
+
 from .meta_metric_provider import (  # isort:skip
     MetaMetricProvider,
     DeprecatedMetaMetricProvider,
@@ -8,15 +10,16 @@ from .column_aggregate_metric_provider import (
     column_aggregate_partial,
     column_aggregate_value,
 )
-from .column_aggregate_metrics import *
-from .column_map_metrics import *
-from .column_pair_map_metrics import *
 from .map_metric_provider import (
     ColumnMapMetricProvider,
     MapMetricProvider,
     column_condition_partial,
     column_function_partial,
 )
-from .multicolumn_map_metrics import *
-from .query_metrics import *
-from .table_metrics import *
+
+
+def __getattr__(name: str) -> Any:
+    # Core Metrics are imported upon first use (see "registry_manifest.json"), which keeps "import great_expectations" fast.
+    from great_expectations.expectations.registry import get_lazy_package_attribute
+
+    return get_lazy_package_attribute(package_name=__name__, attribute_name=name)
@@ -5,7 +5,7 @@ import itertools
 import logging
 import traceback
 from collections.abc import Iterable
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 
@@ -13,8 +13,10 @@ from great_expectations.compatibility import sqlalchemy, trino
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
@@ -26,10 +28,25 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import DEFAULT_KLL_K
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
 
 logger = logging.getLogger(__name__)
 
+_SQLITE_MIN_WINDOW_FUNCTIONS_VERSION: tuple[int, int, int] = (3, 25, 0)
+
+# Dialects, estimating quantiles with "APPROX_PERCENTILE(column, quantile)" aggregate function.
+_APPROX_PERCENTILE_DIALECTS: tuple[GXSqlDialect, ...] = (
+    GXSqlDialect.DATABRICKS,
+    GXSqlDialect.SNOWFLAKE,
+)
+
 
 class ColumnQuantileValues(ColumnAggregateMetricProvider):
     metric_name = "column.quantile_values"
@@ -38,6 +55,10 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
         """Quantile Function"""
+        kll_sketch = kwargs["_metrics"].get("column.kll_sketch")
+        if kll_sketch is not None:
+            return kll_sketch.get_quantiles(quantiles)
+
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
         if not allow_relative_error:
@@ -52,7 +73,7 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         return column.quantile(quantiles, interpolation=allow_relative_error).tolist()
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
-    def _sqlalchemy(  # noqa: PLR0911, PLR0913
+    def _sqlalchemy(  # noqa: PLR0913
         cls,
         execution_engine: SqlAlchemyExecutionEngine,
         metric_domain_kwargs: dict,
@@ -60,93 +81,14 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         metrics: dict[str, Any],
         runtime_configuration: dict,
     ):
-        (
-            selectable,
-            _compute_domain_kwargs,
-            accessor_domain_kwargs,
-        ) = execution_engine.get_compute_domain(
-            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        return _get_column_quantiles_sqlalchemy(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            quantiles=metric_value_kwargs["quantiles"],
+            allow_relative_error=metric_value_kwargs.get("allow_relative_error", False),
+            table_row_count=metrics.get("table.row_count"),
+            approximate=execution_engine.use_approximate_metrics,
         )
-        column_name = accessor_domain_kwargs["column"]
-        column = sa.column(column_name)
-        dialect_name = execution_engine.dialect_name
-        quantiles = metric_value_kwargs["quantiles"]
-        allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
-        table_row_count = metrics.get("table.row_count")
-        if dialect_name == GXSqlDialect.MSSQL:
-            return _get_column_quantiles_mssql(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                execution_engine=execution_engine,
-            )
-        elif dialect_name == GXSqlDialect.BIGQUERY:
-            return _get_column_quantiles_bigquery(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                execution_engine=execution_engine,
-            )
-        elif dialect_name == GXSqlDialect.MYSQL:
-            return _get_column_quantiles_mysql(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                execution_engine=execution_engine,
-            )
-        elif dialect_name.lower() == GXSqlDialect.CLICKHOUSE:
-            return _get_column_quantiles_clickhouse(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                execution_engine=execution_engine,
-            )
-        elif dialect_name == GXSqlDialect.TRINO:
-            return _get_column_quantiles_trino(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                execution_engine=execution_engine,
-            )
-        elif dialect_name == GXSqlDialect.SNOWFLAKE:
-            # NOTE: 20201216 - JPC - snowflake has a representation/precision limitation
-            # in its percentile_disc implementation that causes an error when we do
-            # not round. It is unclear to me *how* the call to round affects the behavior --
-            # the binary representation should be identical before and after, and I do
-            # not observe a type difference. However, the issue is replicable in the
-            # snowflake console and directly observable in side-by-side comparisons with
-            # and without the call to round()
-            quantiles = [round(x, 10) for x in quantiles]
-            return _get_column_quantiles_generic_sqlalchemy(
-                column=column,
-                quantiles=quantiles,
-                allow_relative_error=allow_relative_error,
-                selectable=selectable,
-                execution_engine=execution_engine,
-            )
-        elif dialect_name == GXSqlDialect.SQLITE:
-            return _get_column_quantiles_sqlite(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                execution_engine=execution_engine,
-                table_row_count=table_row_count,
-            )
-        elif dialect_name == GXSqlDialect.AWSATHENA:
-            return _get_column_quantiles_athena(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                execution_engine=execution_engine,
-            )
-        else:
-            return _get_column_quantiles_generic_sqlalchemy(
-                column=column,
-                quantiles=quantiles,
-                allow_relative_error=allow_relative_error,
-                selectable=selectable,
-                execution_engine=execution_engine,
-            )
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(  # noqa: PLR0913
@@ -157,6 +99,10 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         metrics: dict[str, Any],
         runtime_configuration: dict,
     ):
+        kll_sketch = metrics.get("column.kll_sketch")
+        if kll_sketch is not None:
+            return kll_sketch.get_quantiles(metric_value_kwargs["quantiles"])
+
         (
             df,
             _compute_domain_kwargs,
@@ -182,6 +128,181 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
 
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        """Quantiles are estimated from mergeable KLL sketch if ExecutionEngine uses approximate metrics.
+
+        SqlAlchemyExecutionEngine instead estimates quantiles in database, where dialect has native approximate function
+        (otherwise, quantiles are computed exactly in database); hence, column values are never streamed to client.
+        """
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        if (
+            execution_engine is not None
+            and execution_engine.use_approximate_metrics
+            and not isinstance(execution_engine, SqlAlchemyExecutionEngine)
+        ):
+            dependencies["column.kll_sketch"] = MetricConfiguration(
+                metric_name="column.kll_sketch",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={"k": DEFAULT_KLL_K},
+            )
+
+        return dependencies
+
+
+def _get_column_quantiles_sqlalchemy(  # noqa: PLR0911, PLR0913
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    quantiles: Iterable,
+    allow_relative_error: bool,
+    table_row_count: Optional[int],
+    approximate: bool = False,
+    exclude_nulls: bool = False,
+) -> list:
+    """Computes quantiles in database (estimated by dialect-native approximate function, if "approximate" is True and
+    dialect has one; exactly otherwise).
+
+    If "exclude_nulls" is True, quantiles are computed over non-null values only (and "table_row_count" must be number
+    of non-null values); otherwise, some dialects (e.g., SQLite) treat nulls as smallest values.
+    """
+    (
+        selectable,
+        _compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = execution_engine.get_compute_domain(
+        metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+    )
+    column_name = accessor_domain_kwargs["column"]
+    column = sa.column(column_name)
+    dialect_name = execution_engine.dialect_name
+    if exclude_nulls:
+        selectable = (
+            sa.select(column)
+            .where(column.is_not(None))
+            .select_from(selectable)
+            .subquery()
+        )
+
+    if approximate:
+        if dialect_name in _APPROX_PERCENTILE_DIALECTS:
+            return _get_column_quantiles_approx_percentile(
+                column=column,
+                quantiles=quantiles,
+                selectable=selectable,
+                execution_engine=execution_engine,
+            )
+
+        # Redshift estimates quantiles with "approximate percentile_disc", once relative error is allowed.
+        allow_relative_error = True
+
+    if dialect_name == GXSqlDialect.MSSQL:
+        return _get_column_quantiles_mssql(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+    elif dialect_name == GXSqlDialect.BIGQUERY:
+        return _get_column_quantiles_bigquery(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+    elif dialect_name == GXSqlDialect.MYSQL:
+        return _get_column_quantiles_mysql(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+    elif dialect_name.lower() == GXSqlDialect.CLICKHOUSE:
+        return _get_column_quantiles_clickhouse(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+    elif dialect_name == GXSqlDialect.TRINO:
+        return _get_column_quantiles_trino(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+    elif dialect_name == GXSqlDialect.SNOWFLAKE:
+        # NOTE: 20201216 - JPC - snowflake has a representation/precision limitation
+        # in its percentile_disc implementation that causes an error when we do
+        # not round. It is unclear to me *how* the call to round affects the behavior --
+        # the binary representation should be identical before and after, and I do
+        # not observe a type difference. However, the issue is replicable in the
+        # snowflake console and directly observable in side-by-side comparisons with
+        # and without the call to round()
+        quantiles = [round(x, 10) for x in quantiles]
+        return _get_column_quantiles_generic_sqlalchemy(
+            column=column,
+            quantiles=quantiles,
+            allow_relative_error=allow_relative_error,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+    elif dialect_name == GXSqlDialect.SQLITE:
+        return _get_column_quantiles_sqlite(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+            table_row_count=table_row_count,
+        )
+    elif dialect_name == GXSqlDialect.AWSATHENA:
+        return _get_column_quantiles_athena(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+    else:
+        return _get_column_quantiles_generic_sqlalchemy(
+            column=column,
+            quantiles=quantiles,
+            allow_relative_error=allow_relative_error,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+
+
+def _get_column_quantiles_approx_percentile(
+    column, quantiles: Iterable, selectable, execution_engine: SqlAlchemyExecutionEngine
+) -> list:
+    selects: list[sqlalchemy.ColumnElement] = [
+        sa.func.approx_percentile(column, quantile) for quantile in quantiles
+    ]
+    quantiles_query: sqlalchemy.Select = sa.select(*selects).select_from(selectable)
+
+    try:
+        quantiles_results = execution_engine.execute_query(quantiles_query).fetchone()
+        return list(quantiles_results)
+    except sqlalchemy.ProgrammingError as pe:
+        exception_message: str = "An SQL syntax Exception occurred."
+        exception_traceback: str = traceback.format_exc()
+        exception_message += (
+            f'{type(pe).__name__}: "{pe!s}".  Traceback: "{exception_traceback}".'
+        )
+        logger.error(exception_message)
+        raise pe
+
 
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, execution_engine: SqlAlchemyExecutionEngine
@@ -339,12 +460,63 @@ def _get_column_quantiles_sqlite(
     table_row_count,
 ) -> list:
     """
-    The present implementation is somewhat inefficient, because it requires as many calls to
-    "execution_engine.execute_query()" as the number of partitions in the "quantiles" parameter (albeit, typically,
-    only a few).  However, this is the only mechanism available for SQLite at the present time (11/17/2021), because
-    the analytical processing is not a very strongly represented capability of the SQLite database management system.
+    SQLite lacks "percentile_disc()"; hence, the value at "quantile * table_row_count - 1" offset into sorted column
+    is returned for every quantile.  All offsets are obtained in one sorted scan, by numbering sorted rows with the
+    "ROW_NUMBER()" window function (available since SQLite 3.25.0) and keeping only the rows at the requested offsets.
+    Older versions of SQLite fall back to one "ORDER BY ... LIMIT 1 OFFSET ..." query per quantile.
     """
-    offsets: list[int] = [quantile * table_row_count - 1 for quantile in quantiles]
+    # Offsets are truncated to integers (and negative offsets are clamped to zero), as SQLite does for "OFFSET" clause.
+    offsets: list[int] = [
+        max(int(quantile * table_row_count - 1), 0) for quantile in quantiles
+    ]
+
+    server_version_info: Optional[
+        tuple
+    ] = execution_engine.engine.dialect.server_version_info
+    if (
+        server_version_info is not None
+        and server_version_info < _SQLITE_MIN_WINDOW_FUNCTIONS_VERSION
+    ):
+        return _get_column_quantiles_sqlite_by_offset_queries(
+            column=column,
+            offsets=offsets,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+
+    ranked_rows: sqlalchemy.Subquery = (
+        sa.select(
+            column.label("quantile_value"),
+            (sa.func.row_number().over(order_by=column.asc()) - 1).label("row_offset"),
+        )
+        .select_from(selectable)
+        .subquery()
+    )
+    quantiles_query: sqlalchemy.Select = sa.select(
+        ranked_rows.c.row_offset, ranked_rows.c.quantile_value
+    ).where(ranked_rows.c.row_offset.in_(sorted(set(offsets))))
+
+    try:
+        value_by_offset: dict[int, Any] = dict(
+            execution_engine.execute_query(quantiles_query).fetchall()
+        )
+        return [value_by_offset.get(offset) for offset in offsets]
+    except sqlalchemy.ProgrammingError as pe:
+        exception_message: str = "An SQL syntax Exception occurred."
+        exception_traceback: str = traceback.format_exc()
+        exception_message += (
+            f'{type(pe).__name__}: "{pe!s}".  Traceback: "{exception_traceback}".'
+        )
+        logger.error(exception_message)
+        raise pe
+
+
+def _get_column_quantiles_sqlite_by_offset_queries(
+    column,
+    offsets: list[int],
+    selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> list:
     quantile_queries: list[sqlalchemy.Select] = [
         sa.select(column)
         .order_by(column.asc())
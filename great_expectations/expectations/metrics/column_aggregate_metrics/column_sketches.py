@@ -0,0 +1,751 @@
+from __future__ import annotations
+
+import functools
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import pandas as pd
+
+from great_expectations.compatibility.pyspark import functions as F
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine import (
+    ExecutionEngine,
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+)
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (
+    _get_column_quantiles_sqlalchemy,
+)
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import (
+    DEFAULT_COUNT_MIN_DEPTH,
+    DEFAULT_COUNT_MIN_WIDTH,
+    DEFAULT_HEAVY_HITTERS_CAPACITY,
+    DEFAULT_HLL_PRECISION,
+    DEFAULT_KLL_K,
+    CountMinSketch,
+    HyperLogLogSketch,
+    KllSketch,
+)
+from great_expectations.expectations.metrics.util import (
+    get_dbms_compatible_metric_domain_kwargs,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import pyspark, sqlalchemy
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+
+# Number of values added to sketch at a time (bounds memory used while streaming rows from database or Spark partition).
+SKETCH_UPDATE_BLOCK_SIZE: Final[int] = 10000
+
+# Dialects, estimating number of distinct values with "APPROX_COUNT_DISTINCT(column)" aggregate function.
+_APPROX_COUNT_DISTINCT_DIALECTS: Tuple[GXSqlDialect, ...] = (
+    GXSqlDialect.BIGQUERY,
+    GXSqlDialect.DATABRICKS,
+    GXSqlDialect.SNOWFLAKE,
+)
+
+# Dialects, estimating number of distinct values with "APPROX_DISTINCT(column)" aggregate function.
+_APPROX_DISTINCT_DIALECTS: Tuple[GXSqlDialect, ...] = (
+    GXSqlDialect.AWSATHENA,
+    GXSqlDialect.TRINO,
+)
+
+SketchType = TypeVar("SketchType", HyperLogLogSketch, KllSketch, CountMinSketch)
+
+
+class ColumnHyperLogLogSketch(ColumnAggregateMetricProvider):
+    """HyperLogLog sketch of non-null column values (mergeable across chunks, partitions, and Batches)."""
+
+    metric_name = "column.hll_sketch"
+    value_keys = ("precision",)
+    default_kwarg_values = {"precision": DEFAULT_HLL_PRECISION}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(  # noqa: PLR0913
+        cls,
+        execution_engine: PandasExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> HyperLogLogSketch:
+        return _build_sketch_pandas(
+            sketch_factory=cls._get_sketch_factory(
+                metric_value_kwargs=metric_value_kwargs
+            ),
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        )
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(  # noqa: PLR0913
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> HyperLogLogSketch:
+        return _build_sketch_sqlalchemy(
+            sketch_factory=cls._get_sketch_factory(
+                metric_value_kwargs=metric_value_kwargs
+            ),
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(  # noqa: PLR0913
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> HyperLogLogSketch:
+        return _build_sketch_spark(
+            sketch_factory=cls._get_sketch_factory(
+                metric_value_kwargs=metric_value_kwargs
+            ),
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        )
+
+    @classmethod
+    def _get_sketch_factory(
+        cls, metric_value_kwargs: dict
+    ) -> Callable[[], HyperLogLogSketch]:
+        return functools.partial(
+            HyperLogLogSketch,
+            precision=_get_value_kwarg(
+                metric_provider=cls,
+                metric_value_kwargs=metric_value_kwargs,
+                key="precision",
+            ),
+        )
+
+
+class ColumnKllSketch(ColumnAggregateMetricProvider):
+    """KLL quantiles sketch of non-null numeric column values (mergeable across chunks, partitions, and Batches)."""
+
+    metric_name = "column.kll_sketch"
+    value_keys = ("k",)
+    default_kwarg_values = {"k": DEFAULT_KLL_K}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(  # noqa: PLR0913
+        cls,
+        execution_engine: PandasExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> KllSketch:
+        return _build_sketch_pandas(
+            sketch_factory=cls._get_sketch_factory(
+                metric_value_kwargs=metric_value_kwargs
+            ),
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        )
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(  # noqa: PLR0913
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> KllSketch:
+        return _build_sketch_sqlalchemy(
+            sketch_factory=cls._get_sketch_factory(
+                metric_value_kwargs=metric_value_kwargs
+            ),
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(  # noqa: PLR0913
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> KllSketch:
+        return _build_sketch_spark(
+            sketch_factory=cls._get_sketch_factory(
+                metric_value_kwargs=metric_value_kwargs
+            ),
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        )
+
+    @classmethod
+    def _get_sketch_factory(cls, metric_value_kwargs: dict) -> Callable[[], KllSketch]:
+        return functools.partial(
+            KllSketch,
+            k=_get_value_kwarg(
+                metric_provider=cls, metric_value_kwargs=metric_value_kwargs, key="k"
+            ),
+        )
+
+
+class ColumnCountMinSketch(ColumnAggregateMetricProvider):
+    """Count-min sketch (with heavy hitters) of non-null column values (mergeable across chunks, partitions, and Batches)."""
+
+    metric_name = "column.count_min_sketch"
+    value_keys = ("width", "depth", "heavy_hitters_capacity")
+    default_kwarg_values = {
+        "width": DEFAULT_COUNT_MIN_WIDTH,
+        "depth": DEFAULT_COUNT_MIN_DEPTH,
+        "heavy_hitters_capacity": DEFAULT_HEAVY_HITTERS_CAPACITY,
+    }
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(  # noqa: PLR0913
+        cls,
+        execution_engine: PandasExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> CountMinSketch:
+        return _build_sketch_pandas(
+            sketch_factory=cls._get_sketch_factory(
+                metric_value_kwargs=metric_value_kwargs
+            ),
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        )
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(  # noqa: PLR0913
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> CountMinSketch:
+        return _build_sketch_sqlalchemy(
+            sketch_factory=cls._get_sketch_factory(
+                metric_value_kwargs=metric_value_kwargs
+            ),
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(  # noqa: PLR0913
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> CountMinSketch:
+        return _build_sketch_spark(
+            sketch_factory=cls._get_sketch_factory(
+                metric_value_kwargs=metric_value_kwargs
+            ),
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        )
+
+    @classmethod
+    def _get_sketch_factory(
+        cls, metric_value_kwargs: dict
+    ) -> Callable[[], CountMinSketch]:
+        return functools.partial(
+            CountMinSketch,
+            **{
+                key: _get_value_kwarg(
+                    metric_provider=cls,
+                    metric_value_kwargs=metric_value_kwargs,
+                    key=key,
+                )
+                for key in cls.value_keys
+            },
+        )
+
+
+class ColumnApproxDistinctValuesCount(ColumnAggregateMetricProvider):
+    """Number of distinct non-null column values, estimated by HyperLogLog sketch.
+
+    SqlAlchemyExecutionEngine estimates it in database, using dialect-native function (counts distinct values exactly,
+    if dialect has none), rather than streaming column values into sketch.
+    """
+
+    metric_name = "column.approx_distinct_values.count"
+    value_keys = ("precision",)
+    default_kwarg_values = {"precision": DEFAULT_HLL_PRECISION}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(cls, metrics: Dict[str, Any], **kwargs) -> int:
+        return metrics["column.hll_sketch"].estimate()
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(  # noqa: PLR0913
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> int:
+        return _get_approx_distinct_values_count_sqlalchemy(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(cls, metrics: Dict[str, Any], **kwargs) -> int:
+        return metrics["column.hll_sketch"].estimate()
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+            return dependencies
+
+        dependencies["column.hll_sketch"] = MetricConfiguration(
+            metric_name="column.hll_sketch",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                "precision": _get_value_kwarg(
+                    metric_provider=cls,
+                    metric_value_kwargs=metric.metric_value_kwargs,
+                    key="precision",
+                ),
+            },
+        )
+        return dependencies
+
+
+class ColumnApproxQuantileValues(ColumnAggregateMetricProvider):
+    """Quantiles of non-null numeric column values, estimated by KLL sketch.
+
+    SqlAlchemyExecutionEngine estimates them in database, using dialect-native function (computes them exactly, if
+    dialect has none), rather than streaming column values into sketch.
+    """
+
+    metric_name = "column.approx_quantile_values"
+    value_keys = ("quantiles", "k")
+    default_kwarg_values = {"k": DEFAULT_KLL_K}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls, metric_value_kwargs: dict, metrics: Dict[str, Any], **kwargs
+    ) -> list:
+        return metrics["column.kll_sketch"].get_quantiles(
+            metric_value_kwargs["quantiles"]
+        )
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(  # noqa: PLR0913
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> list:
+        return _get_column_quantiles_sqlalchemy(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            quantiles=metric_value_kwargs["quantiles"],
+            allow_relative_error=True,
+            table_row_count=metrics.get("column_values.nonnull.count"),
+            approximate=True,
+            exclude_nulls=True,
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls, metric_value_kwargs: dict, metrics: Dict[str, Any], **kwargs
+    ) -> list:
+        return metrics["column.kll_sketch"].get_quantiles(
+            metric_value_kwargs["quantiles"]
+        )
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+            dependencies["column_values.nonnull.count"] = MetricConfiguration(
+                metric_name="column_values.nonnull.count",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+            )
+            return dependencies
+
+        dependencies["column.kll_sketch"] = MetricConfiguration(
+            metric_name="column.kll_sketch",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                "k": _get_value_kwarg(
+                    metric_provider=cls,
+                    metric_value_kwargs=metric.metric_value_kwargs,
+                    key="k",
+                ),
+            },
+        )
+        return dependencies
+
+
+class ColumnApproxValueCounts(ColumnAggregateMetricProvider):
+    """Estimated counts of (at most "top_k") most frequent non-null column values, tracked by count-min sketch.
+
+    SqlAlchemyExecutionEngine counts most frequent values exactly in database (single "GROUP BY" query), rather than
+    streaming column values into sketch.
+    """
+
+    metric_name = "column.approx_value_counts"
+    value_keys = ("top_k", "width", "depth")
+    default_kwarg_values = {
+        "top_k": 10,
+        "width": DEFAULT_COUNT_MIN_WIDTH,
+        "depth": DEFAULT_COUNT_MIN_DEPTH,
+    }
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls, metric_value_kwargs: dict, metrics: Dict[str, Any], **kwargs
+    ) -> pd.Series:
+        return _get_approx_value_counts(
+            count_min_sketch=metrics["column.count_min_sketch"],
+            top_k=_get_value_kwarg(
+                metric_provider=cls,
+                metric_value_kwargs=metric_value_kwargs,
+                key="top_k",
+            ),
+        )
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(  # noqa: PLR0913
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> pd.Series:
+        return _get_top_value_counts_sqlalchemy(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+            top_k=_get_value_kwarg(
+                metric_provider=cls,
+                metric_value_kwargs=metric_value_kwargs,
+                key="top_k",
+            ),
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls, metric_value_kwargs: dict, metrics: Dict[str, Any], **kwargs
+    ) -> pd.Series:
+        return _get_approx_value_counts(
+            count_min_sketch=metrics["column.count_min_sketch"],
+            top_k=_get_value_kwarg(
+                metric_provider=cls,
+                metric_value_kwargs=metric_value_kwargs,
+                key="top_k",
+            ),
+        )
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+            return dependencies
+
+        top_k: int = _get_value_kwarg(
+            metric_provider=cls,
+            metric_value_kwargs=metric.metric_value_kwargs,
+            key="top_k",
+        )
+        dependencies["column.count_min_sketch"] = MetricConfiguration(
+            metric_name="column.count_min_sketch",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                "width": _get_value_kwarg(
+                    metric_provider=cls,
+                    metric_value_kwargs=metric.metric_value_kwargs,
+                    key="width",
+                ),
+                "depth": _get_value_kwarg(
+                    metric_provider=cls,
+                    metric_value_kwargs=metric.metric_value_kwargs,
+                    key="depth",
+                ),
+                "heavy_hitters_capacity": max(top_k, DEFAULT_HEAVY_HITTERS_CAPACITY),
+            },
+        )
+        return dependencies
+
+
+def _get_value_kwarg(
+    metric_provider: type[ColumnAggregateMetricProvider],
+    metric_value_kwargs: Optional[dict],
+    key: str,
+) -> Any:
+    value: Any = (metric_value_kwargs or {}).get(key)
+    if value is None:
+        return metric_provider.default_kwarg_values[key]
+
+    return value
+
+
+def _get_approx_value_counts(count_min_sketch: CountMinSketch, top_k: int) -> pd.Series:
+    return _build_value_counts(
+        value_counts=count_min_sketch.get_heavy_hitters(top_k=top_k)
+    )
+
+
+def _build_value_counts(value_counts: List[Tuple[Any, int]]) -> pd.Series:
+    counts = pd.Series(
+        [count for _, count in value_counts],
+        index=[value for value, _ in value_counts],
+        dtype="int64",
+    )
+    counts.name = "count"
+    counts.index.name = "value"
+    return counts
+
+
+def _get_column_domain_sqlalchemy(
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    metrics: Dict[str, Any],
+) -> Tuple[sqlalchemy.Selectable, sqlalchemy.ColumnClause]:
+    metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=metric_domain_kwargs,
+        batch_columns_list=metrics["table.columns"],
+    )
+    selectable: sqlalchemy.Selectable
+    accessor_domain_kwargs: dict
+    selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        metric_domain_kwargs, MetricDomainTypes.COLUMN
+    )
+    return selectable, sa.column(accessor_domain_kwargs["column"])
+
+
+def _get_approx_distinct_values_count_sqlalchemy(
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    metrics: Dict[str, Any],
+) -> int:
+    selectable: sqlalchemy.Selectable
+    column: sqlalchemy.ColumnClause
+    selectable, column = _get_column_domain_sqlalchemy(
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metrics=metrics,
+    )
+    dialect_name: str = execution_engine.dialect_name
+    distinct_count: sqlalchemy.ColumnElement
+    if dialect_name in _APPROX_COUNT_DISTINCT_DIALECTS:
+        distinct_count = sa.func.approx_count_distinct(column)
+    elif dialect_name in _APPROX_DISTINCT_DIALECTS:
+        distinct_count = sa.func.approx_distinct(column)
+    else:
+        distinct_count = sa.func.count(sa.distinct(column))
+
+    query: sqlalchemy.Select = sa.select(distinct_count).select_from(selectable)
+    return int(execution_engine.execute_query(query).scalar() or 0)
+
+
+def _get_top_value_counts_sqlalchemy(
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    metrics: Dict[str, Any],
+    top_k: int,
+) -> pd.Series:
+    selectable: sqlalchemy.Selectable
+    column: sqlalchemy.ColumnClause
+    selectable, column = _get_column_domain_sqlalchemy(
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metrics=metrics,
+    )
+    count: sqlalchemy.Label = sa.func.count().label("count")
+    query: sqlalchemy.Select = (
+        sa.select(column, count)
+        .where(column.is_not(None))
+        .select_from(selectable)
+        .group_by(column)
+        .order_by(count.desc())
+        .limit(top_k)
+    )
+    return _build_value_counts(
+        value_counts=[
+            (row[0], row[1]) for row in execution_engine.execute_query(query).fetchall()
+        ]
+    )
+
+
+def _update_sketch(sketch: SketchType, values: Iterable) -> SketchType:
+    values_iterator: Iterator = iter(values)
+    while True:
+        block: list = list(itertools.islice(values_iterator, SKETCH_UPDATE_BLOCK_SIZE))
+        if not block:
+            return sketch
+
+        sketch.update(block)
+
+
+def _build_sketch_pandas(
+    sketch_factory: Callable[[], SketchType],
+    execution_engine: PandasExecutionEngine,
+    metric_domain_kwargs: dict,
+    metrics: Dict[str, Any],
+) -> SketchType:
+    metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=metric_domain_kwargs,
+        batch_columns_list=metrics["table.columns"],
+    )
+    df: pd.DataFrame
+    accessor_domain_kwargs: dict
+    df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        metric_domain_kwargs, MetricDomainTypes.COLUMN
+    )
+    column: pd.Series = df[accessor_domain_kwargs["column"]]
+
+    sketch: SketchType = sketch_factory()
+    sketch.update(column[column.notnull()])
+    return sketch
+
+
+def _build_sketch_sqlalchemy(
+    sketch_factory: Callable[[], SketchType],
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    metrics: Dict[str, Any],
+) -> SketchType:
+    """Streams non-null column values from database (single pass, using server-side cursor where supported).
+
+    Only sketch metrics themselves (e.g., requested for merging across Batches) are built this way; approximate metrics
+    derived from sketches are computed in database by SqlAlchemyExecutionEngine.
+    """
+    selectable: sqlalchemy.Selectable
+    column: sqlalchemy.ColumnClause
+    selectable, column = _get_column_domain_sqlalchemy(
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metrics=metrics,
+    )
+    query: sqlalchemy.Select = (
+        sa.select(column).where(column.is_not(None)).select_from(selectable)
+    )
+
+    sketch: SketchType = sketch_factory()
+    with execution_engine.get_connection() as connection:
+        result: Union[
+            sqlalchemy.CursorResult, sqlalchemy.LegacyCursorResult
+        ] = connection.execution_options(stream_results=True).execute(query)
+        try:
+            return _update_sketch(sketch=sketch, values=(row[0] for row in result))
+        finally:
+            result.close()
+
+
+def _build_sketch_spark(
+    sketch_factory: Callable[[], SketchType],
+    execution_engine: SparkDFExecutionEngine,
+    metric_domain_kwargs: dict,
+    metrics: Dict[str, Any],
+) -> SketchType:
+    """Builds sketch for every partition on executors; partition sketches are merged into one."""
+    metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=metric_domain_kwargs,
+        batch_columns_list=metrics["table.columns"],
+    )
+    df: pyspark.DataFrame
+    accessor_domain_kwargs: dict
+    df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        metric_domain_kwargs, MetricDomainTypes.COLUMN
+    )
+    column_name: str = accessor_domain_kwargs["column"]
+
+    def _build_partition_sketch(rows: Iterable[pyspark.Row]) -> Iterator[SketchType]:
+        yield _update_sketch(sketch=sketch_factory(), values=(row[0] for row in rows))
+
+    return (
+        df.select(F.col(column_name))
+        .where(F.col(column_name).isNotNull())
+        .rdd.mapPartitions(_build_partition_sketch)
+        .fold(sketch_factory(), lambda left, right: left.merge(right))
+    )
@@ -7,6 +7,9 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    map_pandas_column_values_by_unique_value,
+)
 
 
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
@@ -27,4 +30,4 @@ class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
             except (ValueError, OverflowError):
                 return False
 
-        return column.map(is_parseable)
+        return map_pandas_column_values_by_unique_value(column=column, fn=is_parseable)
@@ -3,15 +3,20 @@ from __future__ import annotations
 import json
 
 from great_expectations.compatibility import pyspark
-from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    get_vectorized_udf,
+)
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    map_pandas_column_values_by_unique_value,
+)
 
 
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
@@ -26,7 +31,7 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
             except Exception:
                 return False
 
-        return column.map(is_json)
+        return map_pandas_column_values_by_unique_value(column=column, fn=is_json)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, **kwargs):
@@ -37,6 +42,8 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
             except Exception:
                 return False
 
-        is_json_udf = F.udf(is_json, pyspark.types.BooleanType())
+        is_json_udf = get_vectorized_udf(
+            fn=is_json, return_type=pyspark.types.BooleanType()
+        )
 
         return is_json_udf(column)
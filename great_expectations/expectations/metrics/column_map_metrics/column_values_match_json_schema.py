@@ -5,16 +5,21 @@ import json
 import jsonschema
 
 from great_expectations.compatibility import pyspark
-from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    get_vectorized_udf,
+)
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    map_pandas_column_values_by_unique_value,
+)
 
 
 class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
@@ -23,21 +28,18 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, json_schema, **kwargs):
+        # Schema is checked (raising jsonschema.SchemaError if invalid) and compiled into validator only once.
+        validator_class = jsonschema.validators.validator_for(json_schema)
+        validator_class.check_schema(json_schema)
+        validator = validator_class(json_schema)
+
         def matches_json_schema(val):
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
+            val_json = json.loads(val)
+            return validator.is_valid(val_json)
 
-        return column.map(matches_json_schema)
+        return map_pandas_column_values_by_unique_value(
+            column=column, fn=matches_json_schema
+        )
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, json_schema, **kwargs):
@@ -60,8 +62,8 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
             except:
                 raise
 
-        matches_json_schema_udf = F.udf(
-            lambda val: matches_json_schema(val=val), pyspark.types.BooleanType()
+        matches_json_schema_udf = get_vectorized_udf(
+            fn=matches_json_schema, return_type=pyspark.types.BooleanType()
         )
 
         return matches_json_schema_udf(column)
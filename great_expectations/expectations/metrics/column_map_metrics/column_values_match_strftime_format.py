@@ -3,15 +3,20 @@ from __future__ import annotations
 from datetime import datetime
 
 from great_expectations.compatibility import pyspark
-from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    get_vectorized_udf,
+)
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    map_pandas_column_values_by_unique_value,
+)
 
 
 class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
@@ -31,7 +36,9 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
             except ValueError:
                 return False
 
-        return column.map(is_parseable_by_format)
+        return map_pandas_column_values_by_unique_value(
+            column=column, fn=is_parseable_by_format
+        )
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, strftime_format, **kwargs):
@@ -58,5 +65,7 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
             except ValueError:
                 return False
 
-        success_udf = F.udf(is_parseable_by_format, pyspark.types.BooleanType())
+        success_udf = get_vectorized_udf(
+            fn=is_parseable_by_format, return_type=pyspark.types.BooleanType()
+        )
         return success_udf(column)
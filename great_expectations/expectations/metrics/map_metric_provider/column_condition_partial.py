@@ -113,12 +113,17 @@ def column_condition_partial(  # noqa: C901, PLR0915
                 filter_column_isnull = kwargs.get(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
                 )
-                if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                # Null mask and non-null column values are shared by all map metrics of the same Domain.
+                column = execution_engine.get_domain_column(
+                    domain_records=df,
+                    domain_kwargs=compute_domain_kwargs,
+                    column_name=column_name,
+                    filter_column_isnull=filter_column_isnull,
+                )
 
                 meets_expectation_series = metric_fn(
                     cls,
-                    df[column_name],
+                    column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -103,12 +103,16 @@ def column_function_partial(  # noqa: C901, PLR0915
                 filter_column_isnull = kwargs.get(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
                 )
-                if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                column = execution_engine.get_domain_column(
+                    domain_records=df,
+                    domain_kwargs=compute_domain_kwargs,
+                    column_name=column_name,
+                    filter_column_isnull=filter_column_isnull,
+                )
 
                 values = metric_fn(
                     cls,
-                    df[column_name],
+                    column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -5,6 +5,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    List,
     Tuple,
     Union,
 )
@@ -24,6 +25,9 @@ if TYPE_CHECKING:
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_sample_query_fusion import (
+    register_fusable_sample_query,
+)
 from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (
     _is_sqlalchemy_metric_selectable,
 )
@@ -74,10 +78,12 @@ def _pandas_column_map_condition_values(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
-    domain_values = df[column_name]
+    domain_values = execution_engine.get_domain_column(
+        domain_records=df,
+        domain_kwargs=compute_domain_kwargs,
+        column_name=column_name,
+        filter_column_isnull=filter_column_isnull,
+    )
 
     domain_values = domain_values[
         boolean_mapped_unexpected_values == True  # noqa: E712
@@ -142,10 +148,12 @@ def _pandas_column_map_series_and_domain_values(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
-    domain_values = df[column_name]
+    domain_values = execution_engine.get_domain_column(
+        domain_records=df,
+        domain_kwargs=compute_domain_kwargs,
+        column_name=column_name,
+        filter_column_isnull=filter_column_isnull,
+    )
 
     domain_values = domain_values[
         boolean_mapped_unexpected_values == True  # noqa: E712
@@ -205,10 +213,12 @@ def _pandas_column_map_condition_value_counts(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
-    domain_values = df[column_name]
+    domain_values = execution_engine.get_domain_column(
+        domain_records=df,
+        domain_kwargs=compute_domain_kwargs,
+        column_name=column_name,
+        filter_column_isnull=filter_column_isnull,
+    )
 
     result_format = metric_value_kwargs["result_format"]
     value_counts = None
@@ -245,6 +255,28 @@ def _sqlalchemy_column_map_condition_values(
     Particularly for the purpose of finding unexpected values, returns all the metric values which do not meet an
     expected Expectation condition for ColumnMapExpectation Expectations.
     """
+    query = _sqlalchemy_column_map_condition_values_query(
+        cls=cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
+    )
+    return _sqlalchemy_column_map_condition_values_from_rows(
+        rows=execution_engine.execute_query(query).fetchall()
+    )
+
+
+def _sqlalchemy_column_map_condition_values_query(
+    cls,
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Tuple],
+    **kwargs,
+) -> sqlalchemy.Select:
+    """Builds query of "_sqlalchemy_column_map_condition_values()" (unexpected values in "unexpected_values" column)."""
     unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics[
         "unexpected_condition"
     ]
@@ -290,10 +322,20 @@ def _sqlalchemy_column_map_condition_values(
         )
         query = query.limit(10000)  # BigQuery upper bound on query parameters
 
-    return [
-        val.unexpected_values
-        for val in execution_engine.execute_query(query).fetchall()
-    ]
+    return query
+
+
+def _sqlalchemy_column_map_condition_values_from_rows(
+    rows: List[sqlalchemy.Row], **kwargs
+) -> list:
+    return [val.unexpected_values for val in rows]
+
+
+register_fusable_sample_query(
+    metric_fn=_sqlalchemy_column_map_condition_values,
+    build_query_fn=_sqlalchemy_column_map_condition_values_query,
+    process_rows_fn=_sqlalchemy_column_map_condition_values_from_rows,
+)
 
 
 def _sqlalchemy_column_map_condition_value_counts(
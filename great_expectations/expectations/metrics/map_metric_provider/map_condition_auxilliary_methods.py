@@ -24,6 +24,9 @@ from great_expectations.core.metric_function_types import (
 )
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_sample_query_fusion import (
+    register_fusable_sample_query,
+)
 from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (
     _is_sqlalchemy_metric_selectable,
 )
@@ -107,7 +110,11 @@ def _pandas_map_condition_index(
         )
         if filter_column_isnull:
             domain_records_df = domain_records_df[
-                domain_records_df[column_name].notnull()
+                execution_engine.get_column_notnull_mask(
+                    domain_records=domain_records_df,
+                    domain_kwargs=domain_kwargs,
+                    column_name=column_name,
+                )
             ]
 
         domain_column_name_list.append(column_name)
@@ -127,6 +134,15 @@ def _pandas_map_condition_index(
     result_format = metric_value_kwargs["result_format"]
     domain_records_df = domain_records_df[boolean_mapped_unexpected_values]
 
+    # Every unexpected row contributes one element (unless unexpected values are excluded, in which case all index
+    # values are collected into single element); hence, rows beyond "partial_unexpected_count" need not be processed.
+    if result_format["result_format"] != "COMPLETE" and not result_format.get(
+        "exclude_unexpected_values", False
+    ):
+        domain_records_df = domain_records_df.iloc[
+            : result_format["partial_unexpected_count"]
+        ]
+
     unexpected_index_list: Union[
         List[int], List[Dict[str, Any]]
     ] = compute_unexpected_pandas_indices(
@@ -195,7 +211,11 @@ def _pandas_map_condition_query(
         )
         if filter_column_isnull:
             domain_records_df = domain_records_df[
-                domain_records_df[column_name].notnull()
+                execution_engine.get_column_notnull_mask(
+                    domain_records=domain_records_df,
+                    domain_kwargs=domain_kwargs,
+                    column_name=column_name,
+                )
             ]
 
     domain_values_df_filtered = domain_records_df[boolean_mapped_unexpected_values]
@@ -244,7 +264,13 @@ def _pandas_map_condition_rows(
             "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
         )
         if filter_column_isnull:
-            df = df[df[column_name].notnull()]
+            df = df[
+                execution_engine.get_column_notnull_mask(
+                    domain_records=df,
+                    domain_kwargs=domain_kwargs,
+                    column_name=column_name,
+                )
+            ]
 
     result_format = metric_value_kwargs["result_format"]
 
@@ -519,6 +545,37 @@ def _sqlalchemy_map_condition_index(
     Requires `unexpected_index_column_names` to be part of `result_format` dict to specify primary_key columns
     to return.
     """
+    final_query: Optional[sa.select] = _sqlalchemy_map_condition_index_query(
+        cls=cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
+    )
+    if final_query is None:
+        return None
+
+    query_result: List[sqlalchemy.Row] = execution_engine.execute_query(
+        final_query
+    ).fetchall()
+
+    return _sqlalchemy_map_condition_index_from_rows(
+        rows=query_result,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+    )
+
+
+def _sqlalchemy_map_condition_index_query(
+    cls,
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> Optional[sa.select]:
+    """Builds query of "_sqlalchemy_map_condition_index()"; None if no "unexpected_index_column_names" are given."""
     (
         unexpected_condition,
         compute_domain_kwargs,
@@ -529,25 +586,11 @@ def _sqlalchemy_map_condition_index(
     if "unexpected_index_column_names" not in result_format:
         return None
 
-    domain_column_name_list: List[str] = list()
-    # column map expectations
-    if "column" in accessor_domain_kwargs:
-        column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs[
-            "column"
-        ]
-        domain_column_name_list.append(column_name)
-    # multi-column map expectations
-    elif "column_list" in accessor_domain_kwargs:
-        column_list: List[Union[str, sqlalchemy.quoted_name]] = accessor_domain_kwargs[
-            "column_list"
-        ]
-        domain_column_name_list = column_list
-    # column-map expectations
-    elif "column_A" in accessor_domain_kwargs and "column_B" in accessor_domain_kwargs:
-        column_list = list()
-        column_list.append(accessor_domain_kwargs["column_A"])
-        column_list.append(accessor_domain_kwargs["column_B"])
-        domain_column_name_list = column_list
+    domain_column_name_list: List[
+        Union[str, sqlalchemy.quoted_name]
+    ] = _get_sqlalchemy_domain_column_name_list(
+        accessor_domain_kwargs=accessor_domain_kwargs
+    )
 
     domain_kwargs: dict = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
     all_table_columns: List[str] = metrics.get("table.columns", [])
@@ -582,14 +625,19 @@ def _sqlalchemy_map_condition_index(
         )
 
     # since SQL tables can be **very** large, truncate query_result values at 20, or at `partial_unexpected_count`
-    final_query: sa.select = (
-        unexpected_condition_query_with_selected_columns.select_from(
-            domain_records_as_selectable
-        ).limit(result_format["partial_unexpected_count"])
-    )
-    query_result: List[sqlalchemy.Row] = execution_engine.execute_query(
-        final_query
-    ).fetchall()
+    return unexpected_condition_query_with_selected_columns.select_from(
+        domain_records_as_selectable
+    ).limit(result_format["partial_unexpected_count"])
+
+
+def _sqlalchemy_map_condition_index_from_rows(
+    rows: List[sqlalchemy.Row],
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> list[dict[str, Any]] | None:
+    accessor_domain_kwargs: dict = metrics["unexpected_condition"][2]
+    result_format = metric_value_kwargs["result_format"]
 
     exclude_unexpected_values: bool = result_format.get(
         "exclude_unexpected_values", False
@@ -597,12 +645,49 @@ def _sqlalchemy_map_condition_index(
 
     return _get_sqlalchemy_customized_unexpected_index_list(
         exclude_unexpected_values=exclude_unexpected_values,
-        unexpected_index_column_names=unexpected_index_column_names,
-        query_result=query_result,
-        domain_column_name_list=domain_column_name_list,
+        unexpected_index_column_names=result_format.get(
+            "unexpected_index_column_names", []
+        ),
+        query_result=rows,
+        domain_column_name_list=_get_sqlalchemy_domain_column_name_list(
+            accessor_domain_kwargs=accessor_domain_kwargs
+        ),
     )
 
 
+def _get_sqlalchemy_domain_column_name_list(
+    accessor_domain_kwargs: dict,
+) -> List[Union[str, sqlalchemy.quoted_name]]:
+    domain_column_name_list: List[Union[str, sqlalchemy.quoted_name]] = list()
+    # column map expectations
+    if "column" in accessor_domain_kwargs:
+        column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs[
+            "column"
+        ]
+        domain_column_name_list.append(column_name)
+    # multi-column map expectations
+    elif "column_list" in accessor_domain_kwargs:
+        column_list: List[Union[str, sqlalchemy.quoted_name]] = accessor_domain_kwargs[
+            "column_list"
+        ]
+        domain_column_name_list = column_list
+    # column-map expectations
+    elif "column_A" in accessor_domain_kwargs and "column_B" in accessor_domain_kwargs:
+        column_list = list()
+        column_list.append(accessor_domain_kwargs["column_A"])
+        column_list.append(accessor_domain_kwargs["column_B"])
+        domain_column_name_list = column_list
+
+    return domain_column_name_list
+
+
+register_fusable_sample_query(
+    metric_fn=_sqlalchemy_map_condition_index,
+    build_query_fn=_sqlalchemy_map_condition_index_query,
+    process_rows_fn=_sqlalchemy_map_condition_index_from_rows,
+)
+
+
 def _spark_map_condition_unexpected_count_aggregate_fn(
     cls,
     execution_engine: SparkDFExecutionEngine,
@@ -0,0 +1,430 @@
+"""Mergeable streaming sketches, backing approximate column metrics.
+
+Every sketch summarizes arbitrarily many values in bounded memory, is updated in a single pass (one block of values at a
+time), and can be merged with another sketch of the same configuration (e.g., built over another chunk, partition, or
+Batch), yielding the same summary as if all values had been added to one sketch.
+
+- HyperLogLogSketch estimates number of distinct values (relative standard error is about "1.04 / sqrt(2 ** precision)").
+- KllSketch estimates quantiles (normalized rank error is about "1.7 / k").
+- CountMinSketch estimates frequencies of values and tracks most frequent values ("heavy hitters").
+
+Values are hashed with "pandas.util.hash_pandas_object()", which is stable across processes (unlike built-in "hash()");
+hence, sketches built by Spark executors or by separate runs can be merged, provided that values have the same types.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Final, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_HLL_PRECISION: Final[int] = 14
+DEFAULT_KLL_K: Final[int] = 200
+DEFAULT_COUNT_MIN_WIDTH: Final[int] = 2048
+DEFAULT_COUNT_MIN_DEPTH: Final[int] = 5
+DEFAULT_HEAVY_HITTERS_CAPACITY: Final[int] = 100
+
+_MIN_HLL_PRECISION: Final[int] = 4
+_MAX_HLL_PRECISION: Final[int] = 18
+# Below this many times number of registers, linear counting of empty registers estimates small cardinalities better.
+_HLL_LINEAR_COUNTING_THRESHOLD: Final[float] = 2.5
+_MIN_KLL_K: Final[int] = 8
+_KLL_CAPACITY_DECAY: Final[float] = 2.0 / 3.0
+
+_UINT64_32: Final[np.uint64] = np.uint64(32)
+_UINT64_LOW_32_BITS_MASK: Final[np.uint64] = np.uint64(0xFFFFFFFF)
+
+
+def hash_values(values: Iterable) -> np.ndarray:
+    """Returns array of deterministic 64-bit hashes of values."""
+    if not isinstance(values, (pd.Series, pd.Index, np.ndarray, list)):
+        values = list(values)
+
+    return pd.util.hash_pandas_object(pd.Series(values), index=False).to_numpy(
+        dtype=np.uint64
+    )
+
+
+class HyperLogLogSketch:
+    """Estimates number of distinct values (HyperLogLog, with linear counting for small cardinalities).
+
+    Args:
+        precision: number of hash bits, addressing registers (memory footprint is "2 ** precision" bytes).
+    """
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION) -> None:
+        if not _MIN_HLL_PRECISION <= precision <= _MAX_HLL_PRECISION:
+            raise ValueError(
+                f'"precision" must be between {_MIN_HLL_PRECISION} and {_MAX_HLL_PRECISION} ({precision} was provided).'
+            )
+
+        self._precision = precision
+        self._registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    def update(self, values: Iterable) -> None:
+        hashes: np.ndarray = hash_values(values=values)
+        if hashes.size == 0:
+            return
+
+        precision = np.uint64(self._precision)
+        indices: np.ndarray = (hashes >> (np.uint64(64) - precision)).astype(np.intp)
+        # Sentinel bit bounds position of leftmost 1-bit among remaining (64 - precision) hash bits.
+        remainders: np.ndarray = (hashes << precision) | (
+            np.uint64(1) << (precision - np.uint64(1))
+        )
+        ranks: np.ndarray = (_count_leading_zeros(values=remainders) + 1).astype(
+            np.uint8
+        )
+        np.maximum.at(self._registers, indices, ranks)
+
+    def merge(self, other: HyperLogLogSketch) -> HyperLogLogSketch:
+        """Returns new sketch, summarizing values of this and other sketch."""
+        if (
+            not isinstance(other, HyperLogLogSketch)
+            or other.precision != self._precision
+        ):
+            raise ValueError(
+                f"Only HyperLogLogSketch objects having precision {self._precision} can be merged with this sketch."
+            )
+
+        merged = HyperLogLogSketch(precision=self._precision)
+        merged._registers = np.maximum(self._registers, other._registers)
+        return merged
+
+    def estimate(self) -> int:
+        """Returns estimated number of distinct values."""
+        num_registers: int = self._registers.size
+        alpha: float = 0.7213 / (1.0 + 1.079 / num_registers)
+        raw_estimate: float = (
+            alpha
+            * num_registers
+            * num_registers
+            / float(np.sum(np.exp2(-self._registers.astype(np.float64))))
+        )
+
+        num_empty_registers: int = int(np.count_nonzero(self._registers == 0))
+        if (
+            raw_estimate <= _HLL_LINEAR_COUNTING_THRESHOLD * num_registers
+            and num_empty_registers > 0
+        ):
+            return int(
+                round(num_registers * math.log(num_registers / num_empty_registers))
+            )
+
+        return int(round(raw_estimate))
+
+
+class KllSketch:
+    """Estimates quantiles of numeric values (KLL sketch; Karnin, Lang, and Liberty, 2016).
+
+    Args:
+        k: size of top level compactor (memory footprint is about "3 * k" values); larger k means smaller error.
+        seed: seed of random choices, made by compactions (fixed by default, so that results are reproducible).
+    """
+
+    def __init__(self, k: int = DEFAULT_KLL_K, seed: Optional[int] = 0) -> None:
+        if k < _MIN_KLL_K:
+            raise ValueError(f'"k" must be at least {_MIN_KLL_K} ({k} was provided).')
+
+        self._k = k
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._rng = np.random.default_rng(self._seed_sequence)
+        self._compactors: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._count = 0
+        self._min = math.nan
+        self._max = math.nan
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def update(self, values: Iterable) -> None:
+        if not isinstance(values, (pd.Series, pd.Index, np.ndarray, list)):
+            values = list(values)
+
+        array: np.ndarray = np.asarray(values, dtype=np.float64).ravel()
+        array = array[~np.isnan(array)]
+        if array.size == 0:
+            return
+
+        self._count += array.size
+        self._min = float(np.fmin(self._min, array.min()))
+        self._max = float(np.fmax(self._max, array.max()))
+        self._compactors[0] = np.concatenate((self._compactors[0], array))
+        self._compress()
+
+    def merge(self, other: KllSketch) -> KllSketch:
+        """Returns new sketch, summarizing values of this and other sketch."""
+        if not isinstance(other, KllSketch) or other.k != self._k:
+            raise ValueError(
+                f"Only KllSketch objects having k {self._k} can be merged with this sketch."
+            )
+
+        merged = KllSketch(k=self._k)
+        # Merged sketch gets its own random generator (derived from sizes of merged sketches, so that successive merges
+        # make independent, yet reproducible, random choices), leaving generators of merged sketches intact.
+        merged._seed_sequence = np.random.SeedSequence(
+            entropy=self._seed_sequence.entropy,
+            spawn_key=(self._count, other._count),
+        )
+        merged._rng = np.random.default_rng(merged._seed_sequence)
+        num_levels: int = max(len(self._compactors), len(other._compactors))
+        merged._compactors = [
+            np.concatenate(
+                (
+                    _get_level(compactors=self._compactors, level=level),
+                    _get_level(compactors=other._compactors, level=level),
+                )
+            )
+            for level in range(num_levels)
+        ]
+        merged._count = self._count + other._count
+        merged._min = float(np.fmin(self._min, other._min))
+        merged._max = float(np.fmax(self._max, other._max))
+        merged._compress()
+        return merged
+
+    def get_quantiles(self, quantiles: Sequence[float]) -> List[float]:
+        """Returns estimated quantiles (actual values seen by sketch; NaN if sketch is empty)."""
+        quantile: float
+        for quantile in quantiles:
+            if not 0.0 <= quantile <= 1.0:
+                raise ValueError(
+                    f"Quantiles must be between 0 and 1 ({quantile} was provided)."
+                )
+
+        if self._count == 0:
+            return [math.nan] * len(quantiles)
+
+        items: np.ndarray = np.concatenate(self._compactors)
+        weights: np.ndarray = np.concatenate(
+            [
+                np.full(compactor.size, 2**level, dtype=np.int64)
+                for level, compactor in enumerate(self._compactors)
+            ]
+        )
+        order: np.ndarray = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative_weights: np.ndarray = np.cumsum(weights[order])
+
+        result: List[float] = []
+        idx: int
+        for quantile in quantiles:
+            if quantile == 0.0:
+                result.append(self._min)
+            elif quantile == 1.0:
+                result.append(self._max)
+            else:
+                idx = int(
+                    np.searchsorted(
+                        cumulative_weights,
+                        quantile * cumulative_weights[-1],
+                        side="left",
+                    )
+                )
+                result.append(float(items[min(idx, items.size - 1)]))
+
+        return result
+
+    def _capacity(self, level: int) -> int:
+        depth: int = len(self._compactors) - level - 1
+        return max(int(math.ceil(self._k * _KLL_CAPACITY_DECAY**depth)), 2)
+
+    def _compress(self) -> None:
+        level: int
+        compactor: np.ndarray
+        while sum(compactor.size for compactor in self._compactors) > sum(
+            self._capacity(level=level) for level in range(len(self._compactors))
+        ):
+            for level, compactor in enumerate(self._compactors):
+                if compactor.size < self._capacity(level=level):
+                    continue
+
+                if level + 1 == len(self._compactors):
+                    self._compactors.append(np.empty(0, dtype=np.float64))
+
+                sorted_items: np.ndarray = np.sort(compactor)
+                if sorted_items.size % 2 == 1:
+                    self._compactors[level] = sorted_items[-1:]
+                    sorted_items = sorted_items[:-1]
+                else:
+                    self._compactors[level] = np.empty(0, dtype=np.float64)
+
+                # Every other item (starting from random offset) is promoted, representing twice its previous weight.
+                offset: int = int(self._rng.integers(0, 2))
+                self._compactors[level + 1] = np.concatenate(
+                    (self._compactors[level + 1], sorted_items[offset::2])
+                )
+                break
+
+
+class CountMinSketch:
+    """Estimates frequencies of values, and tracks (approximately) most frequent values, in bounded memory.
+
+    Estimated frequency of value is never less than its true frequency; with probability of at least "1 - exp(-depth)",
+    it exceeds true frequency by no more than "e / width" times total number of values.
+
+    Args:
+        width: number of counters per hash function.
+        depth: number of hash functions.
+        heavy_hitters_capacity: number of candidate most frequent values tracked alongside counters.
+    """
+
+    def __init__(
+        self,
+        width: int = DEFAULT_COUNT_MIN_WIDTH,
+        depth: int = DEFAULT_COUNT_MIN_DEPTH,
+        heavy_hitters_capacity: int = DEFAULT_HEAVY_HITTERS_CAPACITY,
+    ) -> None:
+        if width < 1 or depth < 1 or heavy_hitters_capacity < 1:
+            raise ValueError(
+                f'"width", "depth", and "heavy_hitters_capacity" must be positive integers ({width}, {depth}, and {heavy_hitters_capacity} were provided).'
+            )
+
+        self._width = width
+        self._depth = depth
+        self._heavy_hitters_capacity = heavy_hitters_capacity
+        self._counters = np.zeros((depth, width), dtype=np.int64)
+        self._count = 0
+        # Maps candidate most frequent values to their hashes.
+        self._heavy_hitters: Dict[Any, np.uint64] = {}
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def heavy_hitters_capacity(self) -> int:
+        return self._heavy_hitters_capacity
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def update(self, values: Iterable) -> None:
+        if not isinstance(values, (pd.Series, pd.Index, np.ndarray, list)):
+            values = list(values)
+
+        value_counts: pd.Series = pd.Series(values).value_counts(dropna=True)
+        if value_counts.empty:
+            return
+
+        hashes: np.ndarray = hash_values(values=value_counts.index)
+        counts: np.ndarray = value_counts.to_numpy(dtype=np.int64)
+        positions: np.ndarray = self._get_positions(hashes=hashes)
+
+        row: int
+        for row in range(self._depth):
+            np.add.at(self._counters[row], positions[row], counts)
+
+        self._count += int(counts.sum())
+
+        # Most frequent values of this block compete with current candidates for places among heavy hitters.
+        self._update_heavy_hitters(
+            candidates=dict(
+                zip(
+                    value_counts.index[: self._heavy_hitters_capacity],
+                    hashes[: self._heavy_hitters_capacity],
+                )
+            )
+        )
+
+    def merge(self, other: CountMinSketch) -> CountMinSketch:
+        """Returns new sketch, summarizing values of this and other sketch."""
+        if (
+            not isinstance(other, CountMinSketch)
+            or other.width != self._width
+            or other.depth != self._depth
+        ):
+            raise ValueError(
+                f"Only CountMinSketch objects having width {self._width} and depth {self._depth} can be merged with this sketch."
+            )
+
+        merged = CountMinSketch(
+            width=self._width,
+            depth=self._depth,
+            heavy_hitters_capacity=max(
+                self._heavy_hitters_capacity, other.heavy_hitters_capacity
+            ),
+        )
+        merged._counters = self._counters + other._counters
+        merged._count = self._count + other._count
+        merged._update_heavy_hitters(
+            candidates={**self._heavy_hitters, **other._heavy_hitters}
+        )
+        return merged
+
+    def estimate_count(self, value: Any) -> int:
+        """Returns estimated number of occurrences of value."""
+        return int(self._estimate_counts(hashes=hash_values(values=[value]))[0])
+
+    def get_heavy_hitters(self, top_k: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """Returns (value, estimated count) pairs for most frequent values, ordered by decreasing estimated count."""
+        values: List[Any] = list(self._heavy_hitters.keys())
+        if not values:
+            return []
+
+        estimated_counts: np.ndarray = self._estimate_counts(
+            hashes=np.fromiter(self._heavy_hitters.values(), dtype=np.uint64)
+        )
+        order: np.ndarray = np.argsort(-estimated_counts, kind="stable")[:top_k]
+        return [(values[idx], int(estimated_counts[idx])) for idx in order]
+
+    def _get_positions(self, hashes: np.ndarray) -> np.ndarray:
+        # Double hashing derives "depth" independent-enough hash functions from one 64-bit hash.
+        low_bits: np.ndarray = hashes & _UINT64_LOW_32_BITS_MASK
+        high_bits: np.ndarray = (hashes >> _UINT64_32) | np.uint64(1)
+        rows: np.ndarray = np.arange(self._depth, dtype=np.uint64)[:, np.newaxis]
+        return ((low_bits + rows * high_bits) % np.uint64(self._width)).astype(np.intp)
+
+    def _estimate_counts(self, hashes: np.ndarray) -> np.ndarray:
+        positions: np.ndarray = self._get_positions(hashes=hashes)
+        return self._counters[np.arange(self._depth)[:, np.newaxis], positions].min(
+            axis=0
+        )
+
+    def _update_heavy_hitters(self, candidates: Dict[Any, np.uint64]) -> None:
+        candidates = {**self._heavy_hitters, **candidates}
+        values: List[Any] = list(candidates.keys())
+        hashes: np.ndarray = np.fromiter(candidates.values(), dtype=np.uint64)
+        estimated_counts: np.ndarray = self._estimate_counts(hashes=hashes)
+        top_indices: np.ndarray = np.argsort(-estimated_counts, kind="stable")[
+            : self._heavy_hitters_capacity
+        ]
+        self._heavy_hitters = {values[idx]: hashes[idx] for idx in top_indices}
+
+
+def _count_leading_zeros(values: np.ndarray) -> np.ndarray:
+    """Counts leading zero bits of non-zero unsigned 64-bit integers."""
+    counts: np.ndarray = np.zeros(values.shape, dtype=np.int64)
+    values = values.copy()
+
+    shift: int
+    has_leading_zeros: np.ndarray
+    for shift in (32, 16, 8, 4, 2, 1):
+        has_leading_zeros = values < (np.uint64(1) << np.uint64(64 - shift))
+        counts[has_leading_zeros] += shift
+        values[has_leading_zeros] <<= np.uint64(shift)
+
+    return counts
+
+
+def _get_level(compactors: List[np.ndarray], level: int) -> np.ndarray:
+    if level < len(compactors):
+        return compactors[level]
+
+    return np.empty(0, dtype=np.float64)
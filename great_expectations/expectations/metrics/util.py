@@ -4,8 +4,8 @@ import logging
 import re
 from collections import UserDict
 from typing import (
-    TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     List,
     Mapping,
@@ -16,6 +16,7 @@ from typing import (
 )
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 from packaging import version
 
@@ -68,9 +69,6 @@ _BIGQUERY_MODULE_NAME = "sqlalchemy_bigquery"
 from great_expectations.compatibility import bigquery as sqla_bigquery
 from great_expectations.compatibility.bigquery import bigquery_types_tuple
 
-if TYPE_CHECKING:
-    import pandas as pd
-
 try:
     import teradatasqlalchemy.dialect
     import teradatasqlalchemy.types as teradatatypes
@@ -1277,7 +1275,6 @@ def get_unexpected_indices_for_multiple_pandas_named_indices(
         )
 
     domain_records_df_index_names: List[str] = domain_records_df.index.names
-    unexpected_indices: List[tuple[int | str, ...]] = list(domain_records_df.index)
 
     tuple_index: Dict[str, int] = dict()
     for column_name in unexpected_index_column_names:
@@ -1292,30 +1289,29 @@ def get_unexpected_indices_for_multiple_pandas_named_indices(
                 column_name, 0
             )
 
-    unexpected_index_list: List[Dict[str, Any]] = list()
+    index_values_by_column_name: Dict[str, List[Any]] = {
+        column_name: domain_records_df.index.get_level_values(
+            tuple_index[column_name]
+        ).tolist()
+        for column_name in unexpected_index_column_names
+    }
 
-    if exclude_unexpected_values and len(unexpected_indices) != 0:
-        primary_key_dict_list: dict[str, List[Any]] = {
-            idx_col: [] for idx_col in unexpected_index_column_names
-        }
-        for index in unexpected_indices:
-            for column_name in unexpected_index_column_names:
-                primary_key_dict_list[column_name].append(
-                    index[tuple_index[column_name]]
-                )
+    unexpected_index_list: List[Dict[str, Any]] = list()
 
-        unexpected_index_list.append(primary_key_dict_list)
+    if exclude_unexpected_values and len(domain_records_df.index) != 0:
+        unexpected_index_list.append(index_values_by_column_name)
 
     else:
-        for index in unexpected_indices:
-            primary_key_dict: Dict[str, Any] = dict()
-            for domain_column_name in expectation_domain_column_list:
-                primary_key_dict[domain_column_name] = domain_records_df.at[
-                    index, domain_column_name
-                ]
-                for column_name in unexpected_index_column_names:
-                    primary_key_dict[column_name] = index[tuple_index[column_name]]
-            unexpected_index_list.append(primary_key_dict)
+        values_by_key: Dict[str, List[Any]] = dict()
+        for domain_column_name in expectation_domain_column_list:
+            values_by_key[domain_column_name] = domain_records_df[
+                domain_column_name
+            ].tolist()
+            for column_name in unexpected_index_column_names:
+                values_by_key[column_name] = index_values_by_column_name[column_name]
+        unexpected_index_list = _build_unexpected_index_records(
+            values_by_key=values_by_key
+        )
 
     return unexpected_index_list
 
@@ -1340,9 +1336,6 @@ def get_unexpected_indices_for_single_pandas_named_index(
     """
     if not expectation_domain_column_list:
         return []
-    unexpected_index_values_by_named_index: List[int | str] = list(
-        domain_records_df.index
-    )
     unexpected_index_list: List[Dict[str, Any]] = list()
     if not (
         len(unexpected_index_column_names) == 1
@@ -1353,28 +1346,74 @@ def get_unexpected_indices_for_single_pandas_named_index(
             failed_metrics=["unexpected_index_list"],
         )
 
+    column_name: str = unexpected_index_column_names[0]
+    unexpected_index_values_by_named_index: List[
+        int | str
+    ] = domain_records_df.index.tolist()
+
     if exclude_unexpected_values and len(unexpected_index_values_by_named_index) != 0:
-        primary_key_dict_list: dict[str, List[Any]] = {
-            unexpected_index_column_names[0]: []
-        }
-        for index in unexpected_index_values_by_named_index:
-            primary_key_dict_list[unexpected_index_column_names[0]].append(index)
-        unexpected_index_list.append(primary_key_dict_list)
+        unexpected_index_list.append(
+            {column_name: unexpected_index_values_by_named_index}
+        )
 
     else:
-        for index in unexpected_index_values_by_named_index:
-            primary_key_dict: Dict[str, Any] = dict()
-            for domain_column in expectation_domain_column_list:
-                primary_key_dict[domain_column] = domain_records_df.at[
-                    index, domain_column
-                ]
-            column_name: str = unexpected_index_column_names[0]
-            primary_key_dict[column_name] = index
-            unexpected_index_list.append(primary_key_dict)
+        values_by_key: Dict[str, List[Any]] = {
+            domain_column: domain_records_df[domain_column].tolist()
+            for domain_column in expectation_domain_column_list
+        }
+        values_by_key[column_name] = unexpected_index_values_by_named_index
+        unexpected_index_list = _build_unexpected_index_records(
+            values_by_key=values_by_key
+        )
 
     return unexpected_index_list
 
 
+def _build_unexpected_index_records(
+    values_by_key: Dict[str, List[Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Transposes column-wise lists of values (all of the same length) into list of row-wise dictionaries, whose keys
+    appear in order of "values_by_key".
+    """
+    keys: List[str] = list(values_by_key.keys())
+    return [dict(zip(keys, row)) for row in zip(*values_by_key.values())]
+
+
+def map_pandas_column_values_by_unique_value(
+    column: pd.Series, fn: Callable[[Any], Any]
+) -> pd.Series:
+    """
+    Equivalent of "column.map(fn)", which evaluates "fn" only once for every distinct value of "column".
+
+    Python-level predicates (e.g., parsing every string) dominate the cost of condition metrics; with column factorized
+    first, this cost is proportional to the number of distinct values, rather than to the number of rows.  Missing
+    values are passed to "fn" individually; columns containing unhashable values are mapped row by row.
+
+    Args:
+        column: Pandas Series, whose values are passed to "fn".
+        fn: Function of single value (it is called on distinct values in order of their first appearance).
+
+    Returns:
+        Pandas Series, holding the value of "fn" for every row of "column" (with index and name of "column").
+    """
+    try:
+        codes, unique_values = column.factorize()
+    except TypeError:
+        return column.map(fn)
+
+    # Trailing placeholder is picked by code -1 (missing value), which is then overwritten below.
+    unique_results: list = [fn(value) for value in unique_values]
+    unique_results.append(None)
+    results: np.ndarray = np.asarray(unique_results, dtype=object)[codes]
+
+    missing_values: np.ndarray = codes == -1
+    if missing_values.any():
+        results[missing_values] = column[missing_values].map(fn).to_numpy()
+
+    return pd.Series(results, index=column.index, name=column.name).infer_objects()
+
+
 def compute_unexpected_pandas_indices(
     domain_records_df: pd.DataFrame,
     expectation_domain_column_list: List[str],
@@ -1430,50 +1469,41 @@ def compute_unexpected_pandas_indices(
     elif result_format.get("unexpected_index_column_names"):
         unexpected_index_column_names = result_format["unexpected_index_column_names"]
         unexpected_index_list = []
-        unexpected_indices: List[int | str] = list(domain_records_df.index)
 
-        if (
-            exclude_unexpected_values
-            and len(unexpected_indices) != 0
-            and len(unexpected_index_column_names) != 0
-        ):
-            primary_key_dict_list: dict[str, List[Any]] = {
-                idx_col: [] for idx_col in unexpected_index_column_names
-            }
-            for index in unexpected_indices:
-                for column_name in unexpected_index_column_names:
-                    column_name = get_dbms_compatible_column_names(  # noqa: PLW2901
-                        column_names=column_name,
-                        batch_columns_list=metrics["table.columns"],
-                        error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',
-                    )
-                    primary_key_dict_list[column_name].append(
-                        domain_records_df.at[index, column_name]
-                    )
-            unexpected_index_list.append(primary_key_dict_list)
+        if len(domain_records_df.index) == 0:
+            return unexpected_index_list
+
+        unexpected_index_column_names = get_dbms_compatible_column_names(
+            column_names=list(unexpected_index_column_names),
+            batch_columns_list=metrics["table.columns"],
+            error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',
+        )
+        index_values_by_column_name: Dict[str, List[Any]] = {
+            column_name: domain_records_df[column_name].tolist()
+            for column_name in unexpected_index_column_names
+        }
+
+        if exclude_unexpected_values:
+            unexpected_index_list.append(index_values_by_column_name)
 
         else:
-            for index in unexpected_indices:
-                primary_key_dict: Dict[str, Any] = dict()
-                assert (
-                    expectation_domain_column_list
-                ), "`expectation_domain_column_list` was not provided"
-                for domain_column_name in expectation_domain_column_list:
-                    primary_key_dict[domain_column_name] = domain_records_df.at[
-                        index, domain_column_name
+            assert (
+                expectation_domain_column_list
+            ), "`expectation_domain_column_list` was not provided"
+            values_by_key: Dict[str, List[Any]] = dict()
+            for domain_column_name in expectation_domain_column_list:
+                values_by_key[domain_column_name] = domain_records_df[
+                    domain_column_name
+                ].tolist()
+                for column_name in unexpected_index_column_names:
+                    values_by_key[column_name] = index_values_by_column_name[
+                        column_name
                     ]
-                    for column_name in unexpected_index_column_names:
-                        column_name = get_dbms_compatible_column_names(  # noqa: PLW2901
-                            column_names=column_name,
-                            batch_columns_list=metrics["table.columns"],
-                            error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',
-                        )
-                        primary_key_dict[column_name] = domain_records_df.at[
-                            index, column_name
-                        ]
-                unexpected_index_list.append(primary_key_dict)
+            unexpected_index_list = _build_unexpected_index_records(
+                values_by_key=values_by_key
+            )
 
     else:
-        unexpected_index_list = list(domain_records_df.index)
+        unexpected_index_list = domain_records_df.index.tolist()
 
     return unexpected_index_list
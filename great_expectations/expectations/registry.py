@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import functools
+import importlib
+import inspect
+import json
 import logging
+import pathlib
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Dict,
+    Final,
     List,
     NamedTuple,
     Optional,
@@ -43,6 +50,23 @@ _registered_expectations: dict = {}
 _registered_metrics: dict = {}
 _registered_renderers: dict = {}
 
+# Packages, whose modules define (and, upon being imported, register) core Expectations and core Metrics.
+_CORE_EXPECTATIONS_PACKAGE: Final[str] = "great_expectations.expectations.core"
+_CORE_METRICS_PACKAGES: Final[Tuple[str, ...]] = (
+    "great_expectations.expectations.metrics.column_aggregate_metrics",
+    "great_expectations.expectations.metrics.column_map_metrics",
+    "great_expectations.expectations.metrics.column_pair_map_metrics",
+    "great_expectations.expectations.metrics.multicolumn_map_metrics",
+    "great_expectations.expectations.metrics.query_metrics",
+    "great_expectations.expectations.metrics.table_metrics",
+)
+
+# Prebuilt mapping of core Expectation types and Metric names to modules, which define them (generated by
+# "build_registry_manifest()"; run "invoke registry-manifest --sync" to regenerate it after adding core components).
+REGISTRY_MANIFEST_FILE_PATH: Final[pathlib.Path] = (
+    pathlib.Path(__file__).parent / "registry_manifest.json"
+)
+
 """
 {
   "metric_name"
@@ -109,6 +133,7 @@ def get_renderer_names(expectation_or_metric_type: str) -> List[str]:
     Returns:
         A list of renderer names for the Expectation or Metric.
     """
+    _load_renderers(object_name=expectation_or_metric_type)
     return list(_registered_renderers.get(expectation_or_metric_type, {}).keys())
 
 
@@ -137,10 +162,12 @@ def get_renderer_names_with_renderer_types(
 
 
 def get_renderer_impls(object_name: str) -> List[str]:
+    _load_renderers(object_name=object_name)
     return list(_registered_renderers.get(object_name, {}).values())
 
 
 def get_renderer_impl(object_name: str, renderer_type: str) -> Optional[RendererImpl]:
+    _load_renderers(object_name=object_name)
     renderer_tuple: Optional[tuple] = _registered_renderers.get(object_name, {}).get(
         renderer_type
     )
@@ -183,9 +210,10 @@ def register_core_metrics() -> None:
     """
     before_count = len(_registered_metrics)
 
-    # Implicitly calls MetaMetricProvider.__new__ as Metrics are loaded from metrics.__init__.py
+    # Implicitly calls MetaMetricProvider.__new__ as Metrics are loaded from the __init__.py of every core Metrics package
     # As __new__ calls upon register_metric this import builds our core registry
-    from great_expectations.expectations import metrics  # noqa: F401
+    for package_name in _CORE_METRICS_PACKAGES:
+        importlib.import_module(package_name)
 
     after_count = len(_registered_metrics)
 
@@ -211,7 +239,7 @@ def register_core_expectations() -> None:
 
     # Implicitly calls MetaExpectation.__new__ as Expectations are loaded from core.__init__.py
     # As __new__ calls upon register_expectation, this import builds our core registry
-    from great_expectations.expectations import core  # noqa: F401
+    importlib.import_module(_CORE_EXPECTATIONS_PACKAGE)
 
     after_count = len(_registered_expectations)
 
@@ -328,6 +356,7 @@ def register_metric(  # noqa: PLR0913
 def get_metric_provider(
     metric_name: str, execution_engine: ExecutionEngine
 ) -> Tuple[MetricProvider, Callable]:
+    _load_metric(metric_name=metric_name, execution_engine=execution_engine)
     try:
         metric_definition = _registered_metrics[metric_name]
         return metric_definition["providers"][type(execution_engine).__name__]
@@ -340,6 +369,7 @@ def get_metric_provider(
 def get_metric_function_type(
     metric_name: str, execution_engine: ExecutionEngine
 ) -> Optional[Union[MetricPartialFunctionTypes, MetricFunctionTypes]]:
+    _load_metric(metric_name=metric_name, execution_engine=execution_engine)
     try:
         metric_definition = _registered_metrics[metric_name]
         provider_fn, _provider_class = metric_definition["providers"][
@@ -357,6 +387,7 @@ def get_metric_kwargs(
     configuration: Optional[ExpectationConfiguration] = None,
     runtime_configuration: Optional[dict] = None,
 ) -> dict:
+    _load_metric(metric_name=metric_name)
     try:
         metric_definition = _registered_metrics.get(metric_name)
         if metric_definition is None:
@@ -413,6 +444,7 @@ def get_domain_metrics_dict_by_name(
 
 
 def get_expectation_impl(expectation_name: str) -> Type[Expectation]:
+    _load_expectation(expectation_type=expectation_name)
     expectation: Type[Expectation] | None = _registered_expectations.get(
         expectation_name
     )
@@ -425,6 +457,7 @@ def get_expectation_impl(expectation_name: str) -> Type[Expectation]:
 def list_registered_expectation_implementations(
     expectation_root: Optional[Type[Expectation]] = None,
 ) -> List[str]:
+    register_core_expectations()
     registered_expectation_implementations = []
     for (
         expectation_name,
@@ -438,3 +471,175 @@ def list_registered_expectation_implementations(
             registered_expectation_implementations.append(expectation_name)
 
     return registered_expectation_implementations
+
+
+def build_registry_manifest() -> dict:
+    """Builds manifest of core Expectations and core Metrics, which lets registry import them only upon first use.
+
+    All core components are registered first; components, registered from outside of core packages, are not included.
+
+    Returns:
+        Dictionary with "expectations" (Expectation type to "module:class"), "metrics" (Metric name to "module:class"
+        of every ExecutionEngine, implementing it), and "package_attributes" (public attribute of lazily loaded package
+        to module, defining it) entries.
+    """
+    register_core_metrics()
+    register_core_expectations()
+
+    core_package_names: Tuple[str, ...] = (
+        _CORE_EXPECTATIONS_PACKAGE,
+        *_CORE_METRICS_PACKAGES,
+    )
+
+    expectations: Dict[str, str] = {
+        expectation_type: _get_object_path(expectation)
+        for expectation_type, expectation in sorted(_registered_expectations.items())
+        if _is_defined_in_packages(expectation, core_package_names)
+    }
+
+    metrics: Dict[str, Dict[str, str]] = {}
+    for metric_name, metric_definition in sorted(_registered_metrics.items()):
+        providers: Dict[str, str] = {
+            execution_engine_name: _get_object_path(metric_class)
+            for execution_engine_name, (metric_class, _metric_provider) in sorted(
+                metric_definition["providers"].items()
+            )
+            if _is_defined_in_packages(metric_class, core_package_names)
+        }
+        if providers:
+            metrics[metric_name] = providers
+
+    package_attributes: Dict[str, Dict[str, str]] = {
+        "great_expectations.expectations": _get_package_attribute_modules(
+            package_names=(_CORE_EXPECTATIONS_PACKAGE,)
+        ),
+        "great_expectations.expectations.metrics": _get_package_attribute_modules(
+            package_names=_CORE_METRICS_PACKAGES
+        ),
+    }
+
+    return {
+        "expectations": expectations,
+        "metrics": metrics,
+        "package_attributes": package_attributes,
+    }
+
+
+def get_lazy_package_attribute(package_name: str, attribute_name: str) -> Any:
+    """Imports attribute of package, whose "__init__.py" does not import it eagerly (module "__getattr__" hook).
+
+    Args:
+        package_name: Name of package, listed under "package_attributes" in registry manifest.
+        attribute_name: Name of public attribute (e.g., Expectation class name) of package.
+
+    Returns:
+        Attribute, imported from module, which defines it.
+
+    Raises:
+        AttributeError: If attribute is not listed in registry manifest for given package.
+    """
+    module_name: Optional[str] = (
+        _get_registry_manifest()["package_attributes"]
+        .get(package_name, {})
+        .get(attribute_name)
+    )
+    if module_name is None:
+        raise AttributeError(
+            f"module '{package_name}' has no attribute '{attribute_name}'"
+        )
+
+    return getattr(importlib.import_module(module_name), attribute_name)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_registry_manifest() -> dict:
+    try:
+        with open(REGISTRY_MANIFEST_FILE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(
+            f"""Unable to load registry manifest "{REGISTRY_MANIFEST_FILE_PATH}" ({e}); core Expectations and Metrics \
+will be registered all at once upon first lookup.
+"""
+        )
+        return {"expectations": {}, "metrics": {}, "package_attributes": {}}
+
+
+def _load_expectation(expectation_type: str) -> None:
+    """Imports module of core Expectation, unless it is registered (all core Expectations are registered as fallback)."""
+    if expectation_type in _registered_expectations:
+        return
+
+    object_path: Optional[str] = _get_registry_manifest()["expectations"].get(
+        expectation_type
+    )
+    if object_path is None:
+        register_core_expectations()
+    else:
+        _import_object_module(object_path=object_path)
+
+
+def _load_metric(
+    metric_name: str, execution_engine: Optional[ExecutionEngine] = None
+) -> None:
+    """Imports module(s) of core Metric, unless it is registered (all core Metrics are registered as fallback)."""
+    metric_definition: Optional[dict] = _registered_metrics.get(metric_name)
+    if metric_definition is not None and (
+        execution_engine is None
+        or type(execution_engine).__name__ in metric_definition["providers"]
+    ):
+        return
+
+    providers: Optional[Dict[str, str]] = _get_registry_manifest()["metrics"].get(
+        metric_name
+    )
+    if providers is None:
+        register_core_metrics()
+        return
+
+    for object_path in providers.values():
+        _import_object_module(object_path=object_path)
+
+
+def _load_renderers(object_name: str) -> None:
+    """Imports module of core Expectation or core Metric, whose renderers are requested, unless they are registered."""
+    if object_name in _registered_renderers:
+        return
+
+    registry_manifest: dict = _get_registry_manifest()
+    if object_name in registry_manifest["expectations"]:
+        _load_expectation(expectation_type=object_name)
+    elif object_name in registry_manifest["metrics"]:
+        _load_metric(metric_name=object_name)
+
+
+def _import_object_module(object_path: str) -> None:
+    module_name: str = object_path.split(":")[0]
+    logger.debug(f"Importing {module_name} upon first use of {object_path}")
+    importlib.import_module(module_name)
+
+
+def _get_object_path(obj: type) -> str:
+    return f"{obj.__module__}:{obj.__qualname__}"
+
+
+def _is_defined_in_packages(obj: type, package_names: Tuple[str, ...]) -> bool:
+    return any(
+        obj.__module__ == package_name or obj.__module__.startswith(f"{package_name}.")
+        for package_name in package_names
+    )
+
+
+def _get_package_attribute_modules(package_names: Tuple[str, ...]) -> Dict[str, str]:
+    package_attribute_modules: Dict[str, str] = {}
+    for package_name in package_names:
+        package = importlib.import_module(package_name)
+        for attribute_name, attribute in sorted(vars(package).items()):
+            if attribute_name.startswith("_") or inspect.ismodule(attribute):
+                continue
+
+            package_attribute_modules[attribute_name] = getattr(
+                attribute, "__module__", package_name
+            )
+
+    return dict(sorted(package_attribute_modules.items()))
@@ -13,6 +13,7 @@ from great_expectations.expectations.expectation_configuration import (
 from great_expectations.expectations.registry import (
     _registered_renderers,
     get_renderer_impl,
+    register_core_expectations,
 )
 from great_expectations.render import (
     CollapseContent,
@@ -433,6 +434,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
 
     @classmethod
     def list_available_expectations(cls):
+        register_core_expectations()
         expectations = [
             object_name
             for object_name in _registered_renderers
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import logging
 import os
 import pathlib
+import threading
 import traceback
 import urllib
 from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
@@ -363,11 +366,21 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        max_workers=None,
         **kwargs,
     ) -> None:
+        if max_workers is not None and (
+            not isinstance(max_workers, int) or max_workers < 1
+        ):
+            raise exceptions.InvalidConfigError(
+                f'max_workers should be a positive integer; "{max_workers}" was provided.'
+            )
+
         self.name = name
         self.data_context = data_context
         self.source_store = data_context.stores[source_store_name]
+        # Maximum number of pages rendered (and written to target store) concurrently; if None or 1, one at a time.
+        self.max_workers = max_workers
         self.target_store = target_store
         self.run_name_filter = run_name_filter
         self.validation_results_limit = validation_results_limit
@@ -382,50 +395,67 @@ class DefaultSiteSectionBuilder:
                 "SiteSectionBuilder requires a renderer configuration "
                 "with a class_name key."
             )
+        self._renderer_config = renderer
+        if view is None:
+            view = {
+                "module_name": "great_expectations.render.view",
+                "class_name": "DefaultJinjaPageView",
+            }
+        self._view_config = view
+        self._custom_styles_directory = custom_styles_directory
+        self._custom_views_directory = custom_views_directory
+
+        self.renderer_class = self._instantiate_renderer()
+        self.view_class = self._instantiate_view()
+
+    def _instantiate_renderer(self):
         module_name = (
-            renderer.get("module_name") or "great_expectations.render.renderer"
+            self._renderer_config.get("module_name")
+            or "great_expectations.render.renderer"
         )
-        self.renderer_class = instantiate_class_from_config(
-            config=renderer,
-            runtime_environment={"data_context": data_context},
+        renderer = instantiate_class_from_config(
+            config=self._renderer_config,
+            runtime_environment={"data_context": self.data_context},
             config_defaults={"module_name": module_name},
         )
-        if not self.renderer_class:
+        if not renderer:
             raise exceptions.ClassInstantiationError(
                 module_name=module_name,
                 package_name=None,
-                class_name=renderer["class_name"],
+                class_name=self._renderer_config["class_name"],
             )
 
-        module_name = "great_expectations.render.view"
-        if view is None:
-            view = {
-                "module_name": module_name,
-                "class_name": "DefaultJinjaPageView",
-            }
-        module_name = view.get("module_name") or module_name
-        self.view_class = instantiate_class_from_config(
-            config=view,
+        return renderer
+
+    def _instantiate_view(self):
+        module_name = (
+            self._view_config.get("module_name") or "great_expectations.render.view"
+        )
+        view = instantiate_class_from_config(
+            config=self._view_config,
             runtime_environment={
-                "custom_styles_directory": custom_styles_directory,
-                "custom_views_directory": custom_views_directory,
+                "custom_styles_directory": self._custom_styles_directory,
+                "custom_views_directory": self._custom_views_directory,
             },
             config_defaults={"module_name": module_name},
         )
-        if not self.view_class:
+        if not view:
             raise exceptions.ClassInstantiationError(
-                module_name=view["module_name"],
+                module_name=self._view_config["module_name"],
                 package_name=None,
-                class_name=view["class_name"],
+                class_name=self._view_config["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:  # noqa: PLR0912
+        return view
+
+    def build(self, resource_identifiers=None) -> None:
         source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        resource_keys = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -440,75 +470,114 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(**resource)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
+
+            resource_keys.append(resource_key)
+
+        max_workers = min(self.max_workers or 1, len(resource_keys))
+        if max_workers > 1:
+            # Pages are independent of one another; hence, they can be rendered and written in any order.  Renderer and
+            # view objects are not thread-safe; hence, every worker thread renders pages with its own renderer and view.
+            worker_state = threading.local()
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="gx-site-section-builder",
+            ) as executor:
+                list(
+                    executor.map(
+                        functools.partial(self._build_page_in_worker, worker_state),
+                        resource_keys,
+                    )
+                )
+        else:
+            for resource_key in resource_keys:
+                self._build_page(
+                    resource_key=resource_key,
+                    renderer=self.renderer_class,
+                    view=self.view_class,
                 )
-                continue
 
+    def _build_page_in_worker(
+        self, worker_state: threading.local, resource_key
+    ) -> None:
+        if not hasattr(worker_state, "renderer"):
+            worker_state.renderer = self._instantiate_renderer()
+            worker_state.view = self._instantiate_view()
+
+        self._build_page(
+            resource_key=resource_key,
+            renderer=worker_state.renderer,
+            view=worker_state.view,
+        )
+
+    def _build_page(self, resource_key, renderer, view) -> None:
+        try:
+            resource = self.source_store.get(resource_key)
             if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.expectation_suite_name
+                resource = ExpectationSuite(**resource)
+        except exceptions.InvalidKeyError:
+            logger.warning(
+                f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
+            )
+            return
+
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.expectation_suite_name
+            logger.debug(
+                f"        Rendering expectation suite {expectation_suite_name}"
+            )
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = (
+                resource_key.expectation_suite_identifier.expectation_suite_name
+            )
+            if self.name == "profiling":
                 logger.debug(
-                    f"        Rendering expectation suite {expectation_suite_name}"
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
                 )
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = (
-                    resource_key.expectation_suite_identifier.expectation_suite_name
+            else:
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
                 )
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
-                    )
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
-
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(
-                            resource_type=GXCloudRESTResource.RENDERED_DATA_DOC
-                        ),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
-                    )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
-                    )
-            except Exception as e:
-                exception_message = """\
+        try:
+            rendered_content = renderer.render(resource)
+
+            if self.cloud_mode:
+                self.target_store.set(
+                    GXCloudIdentifier(
+                        resource_type=GXCloudRESTResource.RENDERED_DATA_DOC
+                    ),
+                    rendered_content,
+                    source_type=resource_key.resource_type,
+                    source_id=resource_key.id,
+                )
+            else:
+                viewable_content = view.render(
+                    rendered_content,
+                    data_context_id=self.data_context_id,
+                    show_how_to_buttons=self.show_how_to_buttons,
+                )
+                # Verify type
+                self.target_store.set(
+                    SiteSectionIdentifier(
+                        site_section_name=self.name,
+                        resource_identifier=resource_key,
+                    ),
+                    viewable_content,
+                )
+        except Exception as e:
+            exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{e!s}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)
+            exception_traceback = traceback.format_exc()
+            exception_message += (
+                f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)
 
 
 class DefaultSiteIndexBuilder:
@@ -759,11 +828,21 @@ class DefaultSiteIndexBuilder:
                 skip_and_clean_missing
             )
         )
+
+        # Summaries of validation (and profiling) results, needed for index page, are kept in compact manifest, so
+        # that only results, which have not been indexed before, are loaded from source store.
+        index_manifest: Dict[Tuple[str, tuple], dict] = self._read_index_manifest()
+        index_manifest_size: int = len(index_manifest)
         self._add_profiling_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, index_manifest
         )
         self._add_validations_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, index_manifest
+        )
+        self._write_index_manifest(
+            index_manifest=index_manifest,
+            index_manifest_size=index_manifest_size,
+            validation_and_profiling_result_site_keys=validation_and_profiling_result_site_keys,
         )
 
         viewable_content = ""
@@ -867,10 +946,62 @@ diagnose and repair the underlying issue.  Detailed information follows:
 
         return validation_and_profiling_result_site_keys
 
+    def _read_index_manifest(self) -> Dict[Tuple[str, tuple], dict]:
+        return {
+            (entry["section_name"], tuple(entry["key"])): entry
+            for entry in self.target_store.read_index_manifest()
+        }
+
+    def _write_index_manifest(
+        self,
+        index_manifest: Dict[Tuple[str, tuple], dict],
+        index_manifest_size: int,
+        validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+    ) -> None:
+        """Drops entries of results, no longer in site, and persists manifest, if it has changed."""
+        site_keys: Set[tuple] = {
+            validation_result_key.to_fixed_length_tuple()
+            for validation_result_key in validation_and_profiling_result_site_keys
+        }
+        entries: List[dict] = [
+            entry for (_, key), entry in index_manifest.items() if key in site_keys
+        ]
+        if len(entries) == len(index_manifest) == index_manifest_size:
+            return
+
+        self.target_store.write_index_manifest(entries)
+
+    def _get_validation_result_index_entry(
+        self,
+        section_name: str,
+        validation_result_key: ValidationResultIdentifier,
+        index_manifest: Dict[Tuple[str, tuple], dict],
+    ) -> dict:
+        key: tuple = validation_result_key.to_fixed_length_tuple()
+        entry: Optional[dict] = index_manifest.get((section_name, key))
+        if entry is None:
+            validation = self.data_context.get_validation_result(
+                batch_identifier=validation_result_key.batch_identifier,
+                expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+                run_id=validation_result_key.run_id,
+                validations_store_name=self.source_stores.get(section_name),
+            )
+            entry = {
+                "section_name": section_name,
+                "key": list(key),
+                "validation_success": validation.success,
+                "batch_kwargs": validation.meta.get("batch_kwargs", {}),
+                "batch_spec": validation.meta.get("batch_spec", {}),
+            }
+            index_manifest[(section_name, key)] = entry
+
+        return entry
+
     def _add_profiling_to_index_links(
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        index_manifest: Dict[Tuple[str, tuple], dict],
     ) -> None:
         profiling = self.site_section_builders_config.get("profiling", "None")
         if profiling and profiling not in FALSEY_YAML_STRINGS:
@@ -886,15 +1017,14 @@ diagnose and repair the underlying issue.  Detailed information follows:
             ]
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
+                    index_entry = self._get_validation_result_index_entry(
+                        section_name="profiling",
+                        validation_result_key=profiling_result_key,
+                        index_manifest=index_manifest,
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = index_entry["batch_kwargs"]
+                    batch_spec = index_entry["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -917,6 +1047,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        index_manifest: Dict[Tuple[str, tuple], dict],
     ) -> None:
         validations = self.site_section_builders_config.get("validations", "None")
         if validations and validations not in FALSEY_YAML_STRINGS:
@@ -941,16 +1072,15 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 ]
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
+                    index_entry = self._get_validation_result_index_entry(
+                        section_name="validations",
+                        validation_result_key=validation_result_key,
+                        index_manifest=index_manifest,
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = index_entry["validation_success"]
+                    batch_kwargs = index_entry["batch_kwargs"]
+                    batch_spec = index_entry["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
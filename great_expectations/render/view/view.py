@@ -2,16 +2,29 @@ from __future__ import annotations
 
 import datetime
 import json
+import logging
 import re
+import threading
 from collections import OrderedDict
 from string import Template as pTemplate
-from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Mapping
+from types import CodeType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+)
 from uuid import uuid4
 
 import mistune
 from jinja2 import (
+    BytecodeCache,
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     PackageLoader,
     select_autoescape,
@@ -34,6 +47,75 @@ from great_expectations.render import (
 if TYPE_CHECKING:
     from jinja2 import BaseLoader
     from jinja2 import Template as jTemplate
+    from jinja2.bccache import Bucket
+
+logger = logging.getLogger(__name__)
+
+
+class _BytecodeCache(BytecodeCache):
+    """Cache of compiled templates, shared by Jinja Environments of all views in process (and by processes).
+
+    Compiled templates are held in memory (up to "MAX_TEMPLATES" of them, least recently used are discarded first) and,
+    if possible, in temporary directory; failure to use the latter (e.g., read-only directory) is not fatal.
+    """
+
+    MAX_TEMPLATES: ClassVar[int] = 256
+
+    def __init__(self) -> None:
+        self._templates: OrderedDict[str, Tuple[str, CodeType]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._file_system_bytecode_cache: Optional[FileSystemBytecodeCache]
+        try:
+            self._file_system_bytecode_cache = FileSystemBytecodeCache()
+        except (OSError, RuntimeError) as e:
+            logger.debug(
+                f"Unable to use directory cache of compiled Jinja templates: {e!r}"
+            )
+            self._file_system_bytecode_cache = None
+
+    @override
+    def load_bytecode(self, bucket: Bucket) -> None:
+        with self._lock:
+            entry: Optional[Tuple[str, CodeType]] = self._templates.get(bucket.key)
+            if entry is not None and entry[0] == bucket.checksum:
+                self._templates.move_to_end(bucket.key)
+                bucket.code = entry[1]
+                return
+
+        if self._file_system_bytecode_cache is not None:
+            self._file_system_bytecode_cache.load_bytecode(bucket)
+            if bucket.code is not None:
+                self._remember(bucket=bucket)
+
+    @override
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        self._remember(bucket=bucket)
+        if self._file_system_bytecode_cache is not None:
+            try:
+                self._file_system_bytecode_cache.dump_bytecode(bucket)
+            except OSError as e:
+                logger.debug(f"Unable to write compiled Jinja template to cache: {e!r}")
+
+    def _remember(self, bucket: Bucket) -> None:
+        with self._lock:
+            self._templates[bucket.key] = (bucket.checksum, bucket.code)
+            self._templates.move_to_end(bucket.key)
+            while len(self._templates) > self.MAX_TEMPLATES:
+                self._templates.popitem(last=False)
+
+
+_bytecode_cache: Optional[_BytecodeCache] = None
+_bytecode_cache_lock = threading.Lock()
+
+
+def _get_bytecode_cache() -> _BytecodeCache:
+    """Process-wide cache of compiled templates (created upon first use)."""
+    global _bytecode_cache  # noqa: PLW0603
+    with _bytecode_cache_lock:
+        if _bytecode_cache is None:
+            _bytecode_cache = _BytecodeCache()
+
+        return _bytecode_cache
 
 
 class PrettyPrintTemplate:
@@ -67,6 +149,10 @@ class DefaultJinjaView:
         self.custom_styles_directory = custom_styles_directory
         self.custom_views_directory = custom_views_directory
 
+        self.env = self._build_environment()
+
+    def _build_environment(self) -> Environment:
+        """Builds Jinja Environment of this view (its templates are compiled once per process; see "_BytecodeCache")."""
         templates_loader = PackageLoader("great_expectations", "render/view/templates")
         styles_loader = PackageLoader("great_expectations", "render/view/static/styles")
 
@@ -76,31 +162,32 @@ class DefaultJinjaView:
         if self.custom_views_directory:
             loaders.append(FileSystemLoader(self.custom_views_directory))
 
-        self.env = Environment(
+        env = Environment(
             loader=ChoiceLoader(loaders),
             autoescape=select_autoescape(["html", "xml"]),
             extensions=["jinja2.ext.do"],
+            bytecode_cache=_get_bytecode_cache(),
         )
 
-        self.env.filters["render_string_template"] = self.render_string_template
-        self.env.filters[
+        env.filters["render_string_template"] = self.render_string_template
+        env.filters[
             "render_styling_from_string_template"
         ] = self.render_styling_from_string_template
-        self.env.filters["render_styling"] = self.render_styling
-        self.env.filters["render_content_block"] = self.render_content_block
-        self.env.filters["render_markdown"] = self.render_markdown
-        self.env.filters[
+        env.filters["render_styling"] = self.render_styling
+        env.filters["render_content_block"] = self.render_content_block
+        env.filters["render_markdown"] = self.render_markdown
+        env.filters[
             "get_html_escaped_json_string_from_dict"
         ] = self.get_html_escaped_json_string_from_dict
-        self.env.filters["generate_html_element_uuid"] = self.generate_html_element_uuid
-        self.env.filters[
+        env.filters["generate_html_element_uuid"] = self.generate_html_element_uuid
+        env.filters[
             "attributes_dict_to_html_string"
         ] = self.attributes_dict_to_html_string
-        self.env.filters[
-            "render_bootstrap_table_data"
-        ] = self.render_bootstrap_table_data
-        self.env.globals["ge_version"] = ge_version
-        self.env.filters["add_data_context_id_to_url"] = self.add_data_context_id_to_url
+        env.filters["render_bootstrap_table_data"] = self.render_bootstrap_table_data
+        env.globals["ge_version"] = ge_version
+        env.filters["add_data_context_id_to_url"] = self.add_data_context_id_to_url
+
+        return env
 
     def render(self, document, template=None, **kwargs):
         self._validate_document(document)
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.rule_based_profiler.estimators.numeric_range_estimator import (
     NumericRangeEstimator,
 )
 from great_expectations.rule_based_profiler.helpers.util import (
     compute_bootstrap_quantiles_point_estimate,
+    compute_bootstrap_quantiles_point_estimates,
     get_false_positive_rate_from_rule_state,
     get_parameter_value_and_validate_return_type,
     get_quantile_statistic_interpolation_method_from_rule_state,
@@ -52,6 +54,7 @@ class BootstrapNumericRangeEstimator(NumericRangeEstimator):
             configuration=configuration,
         )
 
+    @override
     def _get_numeric_range_estimate(
         self,
         metric_values: np.ndarray,
@@ -59,6 +62,42 @@ class BootstrapNumericRangeEstimator(NumericRangeEstimator):
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
     ) -> NumericRangeEstimationResult:
+        self._validate_metric_values_dtype(metric_values=metric_values)
+
+        return compute_bootstrap_quantiles_point_estimate(
+            metric_values=metric_values,
+            **self._get_bootstrap_estimation_kwargs(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            ),
+        )
+
+    @override
+    def _get_numeric_range_estimates(
+        self,
+        metric_values: np.ndarray,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[NumericRangeEstimationResult]:
+        column_idx: int
+        for column_idx in range(metric_values.shape[1]):
+            self._validate_metric_values_dtype(
+                metric_values=metric_values[:, column_idx]
+            )
+
+        # All columns are resampled together (see "compute_bootstrap_quantiles_point_estimates()" for details).
+        return compute_bootstrap_quantiles_point_estimates(
+            metric_values=metric_values,
+            **self._get_bootstrap_estimation_kwargs(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            ),
+        )
+
+    def _validate_metric_values_dtype(self, metric_values: np.ndarray) -> None:
         if is_ndarray_datetime_dtype(
             data=metric_values,
             parse_strings_as_datetimes=True,
@@ -68,6 +107,12 @@ class BootstrapNumericRangeEstimator(NumericRangeEstimator):
                 message=f'Estimator "{self.__class__.__name__}" does not support DateTime/TimeStamp data types.'
             )
 
+    def _get_bootstrap_estimation_kwargs(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Dict[str, Any]:
         false_positive_rate: np.float64 = get_false_positive_rate_from_rule_state(
             false_positive_rate=self.configuration.false_positive_rate,
             domain=domain,
@@ -135,12 +180,11 @@ class BootstrapNumericRangeEstimator(NumericRangeEstimator):
                 DEFAULT_BOOTSTRAP_QUANTILE_BIAS_STD_ERROR_RATIO_THRESHOLD
             )
 
-        return compute_bootstrap_quantiles_point_estimate(
-            metric_values=metric_values,
-            false_positive_rate=false_positive_rate,
-            n_resamples=n_resamples,
-            random_seed=random_seed,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
-            quantile_bias_correction=quantile_bias_correction,
-            quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
-        )
+        return {
+            "false_positive_rate": false_positive_rate,
+            "n_resamples": n_resamples,
+            "random_seed": random_seed,
+            "quantile_statistic_interpolation_method": quantile_statistic_interpolation_method,
+            "quantile_bias_correction": quantile_bias_correction,
+            "quantile_bias_std_error_ratio_threshold": quantile_bias_std_error_ratio_threshold,
+        }
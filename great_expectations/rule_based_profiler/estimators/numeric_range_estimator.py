@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.util import convert_to_json_serializable
@@ -82,6 +82,32 @@ class NumericRangeEstimator(ABC, SerializableDictDot):
             parameters=parameters,
         )
 
+    def get_numeric_range_estimates(
+        self,
+        metric_values: np.ndarray,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[NumericRangeEstimationResult]:
+        """
+        Vectorized counterpart of "get_numeric_range_estimate()" for many elements of multi-dimensional metric at once.
+        Args:
+            metric_values: 2-dimensional "numpy.ndarray" ("N x M"), whose "M" columns are vectors of "N" samples (one
+            per "Batch" of data) of "M" elements of multi-dimensional metric, which are estimated independently.
+            domain: "Domain" object that is context for execution of this "NumericRangeEstimator" object.
+            variables: attribute name/value pairs
+            parameters: Dictionary of "ParameterContainer" objects corresponding to all "Domain" objects in memory.
+
+        Returns:
+            List of "NumericRangeEstimationResult" objects, one for every column of "metric_values" (in column order).
+        """
+        return self._get_numeric_range_estimates(
+            metric_values=metric_values,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
     @abstractmethod
     def _get_numeric_range_estimate(
         self,
@@ -95,6 +121,27 @@ class NumericRangeEstimator(ABC, SerializableDictDot):
         """
         pass
 
+    def _get_numeric_range_estimates(
+        self,
+        metric_values: np.ndarray,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[NumericRangeEstimationResult]:
+        """
+        Estimates every column separately (subclasses, whose algorithms vectorize, override this method).
+        """
+        column_idx: int
+        return [
+            self._get_numeric_range_estimate(
+                metric_values=metric_values[:, column_idx],
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+            for column_idx in range(metric_values.shape[1])
+        ]
+
     @override
     def to_dict(self) -> dict:
         """
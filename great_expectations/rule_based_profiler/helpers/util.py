@@ -96,6 +96,9 @@ RECOGNIZED_QUANTILE_STATISTIC_INTERPOLATION_METHODS: set = {
 
 NP_RANDOM_GENERATOR: Final = np.random.default_rng()
 
+# Upper limit on number of elements in array of bootstrap samples ("n_resamples x N x M"), which is materialized at once.
+BOOTSTRAP_SAMPLES_MAX_ARRAY_SIZE: Final[int] = 2**24
+
 
 def get_validator(  # noqa: PLR0913
     purpose: str,
@@ -850,6 +853,103 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
     )
 
 
+def compute_bootstrap_quantiles_point_estimates(  # noqa: PLR0913
+    metric_values: np.ndarray,
+    false_positive_rate: np.float64,
+    n_resamples: int,
+    quantile_statistic_interpolation_method: str,
+    quantile_bias_correction: bool,
+    quantile_bias_std_error_ratio_threshold: float,
+    random_seed: Optional[int] = None,
+) -> List[NumericRangeEstimationResult]:
+    """
+    Vectorized counterpart of "compute_bootstrap_quantiles_point_estimate()" for "N x M" array "metric_values", whose
+    "M" columns are vectors of "N" samples of independently estimated elements of multi-dimensional metric.
+
+    Resampling indices are drawn once (exactly as "np.random.Generator.choice()" draws them for one vector of "N"
+    samples) and are applied to all columns, yielding "n_resamples x N x M" array of bootstrap samples, whose quantiles
+    are computed along samples axis.  Hence, if "random_seed" is specified, then estimate for every column is identical
+    to that, which "compute_bootstrap_quantiles_point_estimate()" returns for this column alone.  Columns are processed
+    in chunks, sized so that array of bootstrap samples does not exceed "BOOTSTRAP_SAMPLES_MAX_ARRAY_SIZE" elements.
+    """
+    lower_quantile_pct: float = false_positive_rate / 2.0
+    upper_quantile_pct: float = 1.0 - false_positive_rate / 2.0
+
+    num_samples: int = metric_values.shape[0]
+    num_columns: int = metric_values.shape[1]
+
+    sample_lower_quantiles: np.ndarray = numpy.numpy_quantile(
+        a=metric_values,
+        q=lower_quantile_pct,
+        axis=0,
+        method=quantile_statistic_interpolation_method,
+    )
+    sample_upper_quantiles: np.ndarray = numpy.numpy_quantile(
+        a=metric_values,
+        q=upper_quantile_pct,
+        axis=0,
+        method=quantile_statistic_interpolation_method,
+    )
+
+    bootstrap_indices: np.ndarray
+    if random_seed:
+        random_state: np.random.Generator = np.random.Generator(
+            np.random.PCG64(random_seed)
+        )
+        bootstrap_indices = random_state.choice(
+            num_samples, size=(n_resamples, num_samples)
+        )
+    else:
+        bootstrap_indices = NP_RANDOM_GENERATOR.choice(
+            num_samples, size=(n_resamples, num_samples)
+        )
+
+    lower_quantile_point_estimates: np.ndarray = np.empty(shape=(num_columns,))
+    upper_quantile_point_estimates: np.ndarray = np.empty(shape=(num_columns,))
+
+    chunk_size: int = max(
+        1, BOOTSTRAP_SAMPLES_MAX_ARRAY_SIZE // (n_resamples * num_samples)
+    )
+
+    chunk_start: int
+    chunk: slice
+    bootstraps: np.ndarray
+    for chunk_start in range(0, num_columns, chunk_size):
+        chunk = slice(chunk_start, chunk_start + chunk_size)
+        # Indexing samples axis with "n_resamples x N" array of indices yields "n_resamples x N x chunk_size" array.
+        bootstraps = metric_values[:, chunk][bootstrap_indices]
+        lower_quantile_point_estimates[
+            chunk
+        ] = _determine_quantile_bias_corrected_point_estimates(
+            bootstraps=bootstraps,
+            quantile_pct=lower_quantile_pct,
+            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+            quantile_bias_correction=quantile_bias_correction,
+            quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
+            sample_quantiles=sample_lower_quantiles[chunk],
+        )
+        upper_quantile_point_estimates[
+            chunk
+        ] = _determine_quantile_bias_corrected_point_estimates(
+            bootstraps=bootstraps,
+            quantile_pct=upper_quantile_pct,
+            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+            quantile_bias_correction=quantile_bias_correction,
+            quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
+            sample_quantiles=sample_upper_quantiles[chunk],
+        )
+
+    column_idx: int
+    return [
+        build_numeric_range_estimation_result(
+            metric_values=metric_values[:, column_idx],
+            min_value=lower_quantile_point_estimates[column_idx],
+            max_value=upper_quantile_point_estimates[column_idx],
+        )
+        for column_idx in range(num_columns)
+    ]
+
+
 def build_numeric_range_estimation_result(
     metric_values: np.ndarray,
     min_value: Number,
@@ -938,6 +1038,51 @@ def _determine_quantile_bias_corrected_point_estimate(  # noqa: PLR0913
     return quantile_bias_corrected_point_estimate
 
 
+def _determine_quantile_bias_corrected_point_estimates(  # noqa: PLR0913
+    bootstraps: np.ndarray,
+    quantile_pct: float,
+    quantile_statistic_interpolation_method: str,
+    quantile_bias_correction: bool,
+    quantile_bias_std_error_ratio_threshold: float,
+    sample_quantiles: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized counterpart of "_determine_quantile_bias_corrected_point_estimate()" for "n_resamples x N x M" array.
+    """
+    # Statistics are reduced along contiguous last axis, which makes them equal to their 1-dimensional counterparts.
+    bootstrap_quantiles: np.ndarray = np.ascontiguousarray(
+        numpy.numpy_quantile(
+            bootstraps,
+            q=quantile_pct,
+            axis=1,
+            method=quantile_statistic_interpolation_method,
+        ).T
+    )
+    bootstrap_quantile_point_estimates: np.ndarray = np.mean(
+        bootstrap_quantiles, axis=1
+    )
+    bootstrap_quantile_standard_errors: np.ndarray = np.std(bootstrap_quantiles, axis=1)
+    bootstrap_quantile_biases: np.ndarray = (
+        bootstrap_quantile_point_estimates - sample_quantiles
+    )
+
+    # Same rule of thumb as in "_determine_quantile_bias_corrected_point_estimate()" decides bias correction.
+    positive_standard_errors: np.ndarray = bootstrap_quantile_standard_errors > 0.0
+    bias_to_standard_error_ratios: np.ndarray = np.divide(
+        bootstrap_quantile_biases,
+        bootstrap_quantile_standard_errors,
+        out=np.full_like(bootstrap_quantile_biases, np.inf),
+        where=positive_standard_errors,
+    )
+    return np.where(
+        (not quantile_bias_correction)
+        & positive_standard_errors
+        & (bias_to_standard_error_ratios <= quantile_bias_std_error_ratio_threshold),
+        bootstrap_quantile_point_estimates,
+        bootstrap_quantile_point_estimates - bootstrap_quantile_biases,
+    )
+
+
 def convert_metric_values_to_float_dtype_best_effort(
     metric_values: np.ndarray,
 ) -> Tuple[bool, np.ndarray]:
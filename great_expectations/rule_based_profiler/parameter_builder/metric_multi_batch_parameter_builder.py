@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 import numpy as np
 
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.domain import Domain  # noqa: TCH001
 from great_expectations.rule_based_profiler.config import (
     ParameterBuilderConfig,  # noqa: TCH001
@@ -21,6 +22,7 @@ from great_expectations.rule_based_profiler.parameter_container import (
     FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY,
     FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY,
     ParameterContainer,
+    is_parameter_reference_in_literal,
 )
 from great_expectations.types.attributes import Attributes
 
@@ -28,6 +30,9 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.validator.metric_configuration import (
+        MetricConfiguration,
+    )
 
 
 class MetricMultiBatchParameterBuilder(ParameterBuilder):
@@ -131,6 +136,53 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
     def reduce_scalar_metric(self) -> Union[str, bool]:
         return self._reduce_scalar_metric
 
+    @override
+    def _get_metric_configurations_to_prefetch(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        if any(
+            is_parameter_reference_in_literal(parameter_reference=parameter_reference)
+            for parameter_reference in (
+                self.metric_domain_kwargs,
+                self.metric_value_kwargs,
+                self.single_batch_mode,
+            )
+        ):
+            return []
+
+        # Obtain single_batch_mode from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+        single_batch_mode: bool = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.single_batch_mode,
+            expected_return_type=bool,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        batch_ids: Optional[List[str]] = self.get_batch_ids(
+            limit=1 if single_batch_mode else None,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        if not (self.metric_name and batch_ids):
+            return []
+
+        metrics_to_resolve: List[MetricConfiguration]
+        _, _, metrics_to_resolve = self._build_metric_configurations(
+            metric_name=self.metric_name,
+            metric_domain_kwargs=self.metric_domain_kwargs,
+            metric_value_kwargs=self.metric_value_kwargs,
+            batch_ids=batch_ids,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        return metrics_to_resolve
+
     def _build_parameters(
         self,
         domain: Domain,
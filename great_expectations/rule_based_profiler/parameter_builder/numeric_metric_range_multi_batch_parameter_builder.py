@@ -610,34 +610,65 @@ detected.
             metric_value_range = np.zeros(shape=metric_value_range_shape)
             estimation_histogram = np.empty(shape=estimation_histogram_shape)
 
-        # Traverse indices of sample vectors corresponding to every element of multi-dimensional metric.
+        # Computation is unnecessary for elements of multi-dimensional metric, whose distributions are degenerate.
         metric_value_vector: np.ndarray
+        metric_value_vector_idx: int
+        estimated_metric_value_vector_positions: List[int] = [
+            metric_value_vector_idx
+            for metric_value_vector_idx, metric_value_idx in enumerate(
+                metric_value_vector_indices
+            )
+            if datetime_detected
+            or not np.all(
+                np.isclose(
+                    metric_values[metric_value_idx], metric_values[metric_value_idx][0]
+                )
+            )
+        ]
+
+        # Compute low and high estimates for vectors of samples of all other elements of multi-dimensional metric at once
+        # ("N x M" array of these vectors enables estimators to vectorize computations across all "M" elements).
+        numeric_range_estimation_results: Dict[int, NumericRangeEstimationResult] = {}
+        if estimated_metric_value_vector_positions:
+            numeric_range_estimation_results = dict(
+                zip(
+                    estimated_metric_value_vector_positions,
+                    numeric_range_estimator.get_numeric_range_estimates(
+                        metric_values=np.column_stack(
+                            [
+                                metric_values[
+                                    metric_value_vector_indices[metric_value_vector_idx]
+                                ]
+                                for metric_value_vector_idx in estimated_metric_value_vector_positions
+                            ]
+                        ),
+                        domain=domain,
+                        variables=variables,
+                        parameters=parameters,
+                    ),
+                )
+            )
+
+        # Traverse indices of sample vectors corresponding to every element of multi-dimensional metric.
         metric_value_range_min_idx: tuple
         metric_value_range_max_idx: tuple
         metric_value_estimation_histogram_idx: tuple
         numeric_range_estimation_result: NumericRangeEstimationResult
-        for metric_value_idx in metric_value_vector_indices:
-            # Obtain "N"-element-long vector of samples for each element of multi-dimensional metric.
-            metric_value_vector = metric_values[metric_value_idx]
-            if not datetime_detected and np.all(
-                np.isclose(metric_value_vector, metric_value_vector[0])
-            ):
-                # Computation is unnecessary if distribution is degenerate.
+        for metric_value_vector_idx, metric_value_idx in enumerate(
+            metric_value_vector_indices
+        ):
+            if metric_value_vector_idx in numeric_range_estimation_results:
+                numeric_range_estimation_result = numeric_range_estimation_results[
+                    metric_value_vector_idx
+                ]
+            else:
+                # Obtain "N"-element-long vector of samples of element with degenerate distribution.
+                metric_value_vector = metric_values[metric_value_idx]
                 numeric_range_estimation_result = build_numeric_range_estimation_result(
                     metric_values=metric_value_vector,
                     min_value=metric_value_vector[0],
                     max_value=metric_value_vector[0],
                 )
-            else:
-                # Compute low and high estimates for vector of samples for given element of multi-dimensional metric.
-                numeric_range_estimation_result = (
-                    numeric_range_estimator.get_numeric_range_estimate(
-                        metric_values=metric_value_vector,
-                        domain=domain,
-                        variables=variables,
-                        parameters=parameters,
-                    )
-                )
 
             min_value = numeric_range_estimation_result.value_range[0]
             if lower_bound is not None:
@@ -95,6 +95,7 @@ class ParameterBuilder(ABC, Builder):
 
     exclude_field_names: ClassVar[Set[str]] = Builder.exclude_field_names | {
         "evaluation_parameter_builders",
+        "prefetched_metrics",
     }
 
     def __init__(
@@ -130,6 +131,10 @@ class ParameterBuilder(ABC, Builder):
             data_context=self._data_context,
         )
 
+        self._prefetched_metrics: Optional[
+            Dict[Tuple[str, str, str], MetricValue]
+        ] = None
+
     def build_parameters(  # noqa: PLR0913
         self,
         domain: Domain,
@@ -260,6 +265,70 @@ class ParameterBuilder(ABC, Builder):
                     runtime_configuration=runtime_configuration,
                 )
 
+    def get_metric_configurations_to_prefetch(  # noqa: PLR0913
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Declares (without computing them) "MetricConfiguration" objects, which "build_parameters()" of this
+        "ParameterBuilder" object and of its evaluation dependencies will resolve for specified "Domain" object, so that
+        "RuleBasedProfiler" can resolve them, together with metrics of all other "Rule" and "Domain" objects, in one
+        "ValidationGraph" ahead of time (see "prefetched_metrics" property).
+
+        Metrics, which cannot be known before evaluation dependencies are computed (e.g., those referencing other
+        parameters), are not declared; these "ParameterBuilder" objects compute their metrics in "build_parameters()".
+        """
+        self.set_batch_list_if_null_batch_request(
+            batch_list=batch_list,
+            batch_request=batch_request,
+        )
+
+        metric_configurations: List[MetricConfiguration] = []
+
+        evaluation_parameter_builder: ParameterBuilder
+        for evaluation_parameter_builder in self.evaluation_parameter_builders or []:
+            metric_configurations.extend(
+                evaluation_parameter_builder.get_metric_configurations_to_prefetch(
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                    batch_list=self.batch_list,
+                    batch_request=self.batch_request,
+                )
+            )
+
+        try:
+            metric_configurations.extend(
+                self._get_metric_configurations_to_prefetch(
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+            )
+        except Exception as e:
+            logger.debug(
+                f"""{self.__class__.__name__} "{self.name}" did not declare its metrics for Domain "{domain.id}" \
+ahead of time (they will be computed by "build_parameters()"): {e}"""
+            )
+
+        return metric_configurations
+
+    def _get_metric_configurations_to_prefetch(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        "ParameterBuilder" implementations, whose metrics are fully determined by their configuration, "Domain" object,
+        and variables, override this method to declare them (see "get_metric_configurations_to_prefetch()").
+        """
+        return []
+
     @abstractmethod
     def _build_parameters(
         self,
@@ -292,6 +361,24 @@ class ParameterBuilder(ABC, Builder):
     ) -> Optional[List[ParameterBuilderConfig]]:
         return self._evaluation_parameter_builder_configs
 
+    @property
+    def prefetched_metrics(self) -> Optional[Dict[Tuple[str, str, str], MetricValue]]:
+        """
+        Metrics, resolved by "RuleBasedProfiler" ahead of time; "get_metrics()" uses them instead of building its own
+        "ValidationGraph", if all requested metrics are available.
+        """
+        return self._prefetched_metrics
+
+    @prefetched_metrics.setter
+    def prefetched_metrics(
+        self, value: Optional[Dict[Tuple[str, str, str], MetricValue]]
+    ) -> None:
+        self._prefetched_metrics = value
+
+        evaluation_parameter_builder: ParameterBuilder
+        for evaluation_parameter_builder in self.evaluation_parameter_builders or []:
+            evaluation_parameter_builder.prefetched_metrics = value
+
     @property
     def raw_fully_qualified_parameter_name(self) -> str:
         """
@@ -403,99 +490,65 @@ specified (empty "metric_name" value detected)."""
         Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
         """
 
-        # Step-1: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
-
-        domain_kwargs: dict = build_metric_domain_kwargs(
-            batch_id=None,
+        domain_kwargs: dict
+        metrics_to_resolve: List[MetricConfiguration]
+        (
+            domain_kwargs,
+            metric_value_kwargs,
+            metrics_to_resolve,
+        ) = self._build_metric_configurations(
+            metric_name=metric_name,
             metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            batch_ids=batch_ids,
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
 
-        batch_id: str
+        # Step-4: Resolve all metrics in one operation simultaneously (unless all were resolved ahead of time).
 
-        metric_domain_kwargs = [
-            copy.deepcopy(
-                build_metric_domain_kwargs(
-                    batch_id=batch_id,
-                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
-                    domain=domain,
-                    variables=variables,
-                    parameters=parameters,
-                )
-            )
-            for batch_id in batch_ids
-        ]
-
-        # Step-2: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).
-
-        if not isinstance(metric_value_kwargs, list):
-            metric_value_kwargs = [metric_value_kwargs]
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
 
-        value_kwargs_cursor: dict
-        metric_value_kwargs = [
-            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
-            get_parameter_value_and_validate_return_type(
+        prefetched_metrics: Dict[Tuple[str, str, str], MetricValue] = (
+            self.prefetched_metrics or {}
+        )
+        metric_configuration: MetricConfiguration
+        if prefetched_metrics and all(
+            metric_configuration.id in prefetched_metrics
+            for metric_configuration in metrics_to_resolve
+        ):
+            resolved_metrics = {
+                metric_configuration.id: prefetched_metrics[metric_configuration.id]
+                for metric_configuration in metrics_to_resolve
+            }
+        else:
+            # The Validator object used for metric calculation purposes.
+            validator: Validator = self.get_validator(
                 domain=domain,
-                parameter_reference=value_kwargs_cursor,
-                expected_return_type=None,
                 variables=variables,
                 parameters=parameters,
             )
-            for value_kwargs_cursor in metric_value_kwargs
-        ]
-
-        # Step-3: Generate "MetricConfiguration" directives for all "metric_domain_kwargs"/"metric_value_kwargs" pairs.
-
-        domain_kwargs_cursor: dict
-        kwargs_combinations: List[List[dict]] = [
-            [domain_kwargs_cursor, value_kwargs_cursor]
-            for value_kwargs_cursor in metric_value_kwargs
-            for domain_kwargs_cursor in metric_domain_kwargs
-        ]
-
-        metrics_to_resolve: List[MetricConfiguration]
 
-        kwargs_pair_cursor: List[dict, dict]
-        metrics_to_resolve = [
-            MetricConfiguration(
-                metric_name=metric_name,
-                metric_domain_kwargs=kwargs_pair_cursor[0],
-                metric_value_kwargs=kwargs_pair_cursor[1],
+            graph: ValidationGraph = (
+                validator.metrics_calculator.build_metric_dependency_graph(
+                    metric_configurations=metrics_to_resolve,
+                    runtime_configuration=runtime_configuration,
+                )
             )
-            for kwargs_pair_cursor in kwargs_combinations
-        ]
-
-        # Step-4: Resolve all metrics in one operation simultaneously.
 
-        # The Validator object used for metric calculation purposes.
-        validator: Validator = self.get_validator(
-            domain=domain,
-            variables=variables,
-            parameters=parameters,
-        )
-
-        graph: ValidationGraph = (
-            validator.metrics_calculator.build_metric_dependency_graph(
-                metric_configurations=metrics_to_resolve,
+            aborted_metrics_info: Dict[
+                Tuple[str, str, str],
+                Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+            ]
+            (
+                resolved_metrics,
+                _aborted_metrics_info,
+            ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
+                graph=graph,
                 runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=0,
             )
-        )
-
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
-        aborted_metrics_info: Dict[
-            Tuple[str, str, str],
-            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
-        ]
-        (
-            resolved_metrics,
-            _aborted_metrics_info,
-        ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
-            graph=graph,
-            runtime_configuration=runtime_configuration,
-            min_graph_edges_pbar_enable=0,
-        )
 
         # Step-5: Map resolved metrics to their attributes for identification and recovery by receiver.
 
@@ -503,7 +556,6 @@ specified (empty "metric_name" value detected)."""
 
         resolved_metric_value: MetricValue
         attributed_resolved_metrics: AttributedResolvedMetrics
-        metric_configuration: MetricConfiguration
         for metric_configuration in metrics_to_resolve:
             attributed_resolved_metrics = attributed_resolved_metrics_map.get(
                 metric_configuration.metric_value_kwargs_id
@@ -588,6 +640,92 @@ specified (empty "metric_name" value detected)."""
             details=details,
         )
 
+    def _build_metric_configurations(  # noqa: PLR0913
+        self,
+        metric_name: str,
+        batch_ids: List[str],
+        metric_domain_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        metric_value_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Tuple[dict, List[dict], List[MetricConfiguration]]:
+        """
+        Generates "MetricConfiguration" directives, resolved by "get_metrics()" (see its Steps 1 through 3).
+
+        :return: Tuple of "domain_kwargs" (without "batch_id"), list of resolved "metric_value_kwargs", and list of
+        "MetricConfiguration" objects (one for each "batch_id" and "metric_value_kwargs" combination).
+        """
+        # Step-1: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
+
+        domain_kwargs: dict = build_metric_domain_kwargs(
+            batch_id=None,
+            metric_domain_kwargs=metric_domain_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        batch_id: str
+
+        metric_domain_kwargs = [
+            copy.deepcopy(
+                build_metric_domain_kwargs(
+                    batch_id=batch_id,
+                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+            )
+            for batch_id in batch_ids
+        ]
+
+        # Step-2: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).
+
+        if not isinstance(metric_value_kwargs, list):
+            metric_value_kwargs = [metric_value_kwargs]
+
+        value_kwargs_cursor: dict
+        metric_value_kwargs = [
+            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+            get_parameter_value_and_validate_return_type(
+                domain=domain,
+                parameter_reference=value_kwargs_cursor,
+                expected_return_type=None,
+                variables=variables,
+                parameters=parameters,
+            )
+            for value_kwargs_cursor in metric_value_kwargs
+        ]
+
+        # Step-3: Generate "MetricConfiguration" directives for all "metric_domain_kwargs"/"metric_value_kwargs" pairs.
+
+        domain_kwargs_cursor: dict
+        kwargs_combinations: List[List[dict]] = [
+            [domain_kwargs_cursor, value_kwargs_cursor]
+            for value_kwargs_cursor in metric_value_kwargs
+            for domain_kwargs_cursor in metric_domain_kwargs
+        ]
+
+        metrics_to_resolve: List[MetricConfiguration]
+
+        kwargs_pair_cursor: List[dict, dict]
+        metrics_to_resolve = [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=kwargs_pair_cursor[0],
+                metric_value_kwargs=kwargs_pair_cursor[1],
+            )
+            for kwargs_pair_cursor in kwargs_combinations
+        ]
+
+        return domain_kwargs, metric_value_kwargs, metrics_to_resolve
+
     @staticmethod
     def _sanitize_metric_computation(  # noqa: PLR0913
         parameter_builder: ParameterBuilder,
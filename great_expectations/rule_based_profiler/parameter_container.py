@@ -146,6 +146,29 @@ def is_fully_qualified_parameter_name_prefix_in_literal(
     )
 
 
+def is_parameter_reference_in_literal(parameter_reference: Any) -> bool:
+    """
+    Determines whether or not "parameter_reference" (possibly nested in dictionaries and lists) references any "$parameter"
+    value (i.e., value, which becomes available only after corresponding "ParameterBuilder" has been executed).
+    """
+    if isinstance(parameter_reference, str):
+        return parameter_reference.startswith(f"{PARAMETER_PREFIX}")
+
+    if isinstance(parameter_reference, dict):
+        return any(
+            is_parameter_reference_in_literal(parameter_reference=value)
+            for value in parameter_reference.values()
+        )
+
+    if isinstance(parameter_reference, (list, tuple)):
+        return any(
+            is_parameter_reference_in_literal(parameter_reference=value)
+            for value in parameter_reference
+        )
+
+    return False
+
+
 class ParameterNode(SerializableDotDict):
     """
     ParameterNode is a node of a tree structure.
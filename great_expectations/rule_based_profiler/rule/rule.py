@@ -45,6 +45,9 @@ if TYPE_CHECKING:
     from great_expectations.rule_based_profiler.parameter_builder import (
         ParameterBuilder,
     )
+    from great_expectations.validator.metric_configuration import (
+        MetricConfiguration,
+    )
 
 
 class Rule(SerializableDictDot):
@@ -117,27 +120,26 @@ class Rule(SerializableDictDot):
         Returns:
             RuleState representing effect of executing Rule
         """
-        if not reconciliation_directives:
-            reconciliation_directives = DEFAULT_RECONCILATION_DIRECTIVES
-
-        variables = build_parameter_container_for_variables(
-            variables_configs=reconcile_rule_variables(
-                variables=self.variables,
-                variables_config=convert_variables_to_dict(variables=variables),
-                reconciliation_strategy=reconciliation_directives.variables,
-            )
+        variables = self._get_effective_variables(
+            variables=variables,
+            reconciliation_directives=reconciliation_directives,
         )
 
         if rule_state is None:
             rule_state = RuleState()
 
-        domains: List[Domain] = self._get_rule_domains(
-            variables=variables,
-            batch_list=batch_list,
-            batch_request=batch_request,
-            rule_state=rule_state,
-            runtime_configuration=runtime_configuration,
-        )
+        domains: List[Domain]
+        if rule_state.rule is self:
+            # Domains have already been obtained by "get_metric_configurations_to_prefetch()" for this "RuleState".
+            domains = rule_state.domains
+        else:
+            domains = self._get_rule_domains(
+                variables=variables,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                rule_state=rule_state,
+                runtime_configuration=runtime_configuration,
+            )
 
         rule_state.rule = self
         rule_state.variables = variables
@@ -188,6 +190,71 @@ class Rule(SerializableDictDot):
 
         return rule_state
 
+    def get_metric_configurations_to_prefetch(  # noqa: PLR0913
+        self,
+        variables: Optional[ParameterContainer] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+        reconciliation_directives: Optional[ReconciliationDirectives] = None,
+        rule_state: Optional[RuleState] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Declares "MetricConfiguration" objects, which "ParameterBuilder" objects of this Rule will resolve for all of its
+        "Domain" objects, without computing them (see "ParameterBuilder.get_metric_configurations_to_prefetch()").
+
+        Args:
+            variables: Attribute name/value pairs, commonly-used in Builder objects
+            batch_list: Explicit list of Batch objects to supply data at runtime
+            batch_request: Explicit batch_request used to supply data at runtime
+            runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+            reconciliation_directives: directives for how each rule component should be overwritten
+            rule_state: receives "Domain" objects of Rule, so that subsequent "Rule.run()" with it does not rebuild them
+
+        Returns:
+            List of MetricConfiguration objects (possibly with repetitions)
+        """
+        variables = self._get_effective_variables(
+            variables=variables,
+            reconciliation_directives=reconciliation_directives,
+        )
+
+        if rule_state is None:
+            rule_state = RuleState()
+
+        domains: List[Domain] = self._get_rule_domains(
+            variables=variables,
+            batch_list=batch_list,
+            batch_request=batch_request,
+            rule_state=rule_state,
+            runtime_configuration=runtime_configuration,
+        )
+
+        rule_state.rule = self
+        rule_state.variables = variables
+        rule_state.domains = domains
+
+        metric_configurations: List[MetricConfiguration] = []
+
+        domain: Domain
+        for domain in domains:
+            rule_state.initialize_parameter_container_for_domain(domain=domain)
+
+            parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
+            parameter_builder: ParameterBuilder
+            for parameter_builder in parameter_builders:
+                metric_configurations.extend(
+                    parameter_builder.get_metric_configurations_to_prefetch(
+                        domain=domain,
+                        variables=variables,
+                        parameters=rule_state.parameters,
+                        batch_list=batch_list,
+                        batch_request=batch_request,
+                    )
+                )
+
+        return metric_configurations
+
     @property
     def name(self) -> str:
         return self._name
@@ -326,6 +393,22 @@ class Rule(SerializableDictDot):
             for expectation_configuration_builder in expectation_configuration_builders
         }
 
+    def _get_effective_variables(
+        self,
+        variables: Optional[ParameterContainer] = None,
+        reconciliation_directives: Optional[ReconciliationDirectives] = None,
+    ) -> ParameterContainer:
+        if not reconciliation_directives:
+            reconciliation_directives = DEFAULT_RECONCILATION_DIRECTIVES
+
+        return build_parameter_container_for_variables(
+            variables_configs=reconcile_rule_variables(
+                variables=self.variables,
+                variables_config=convert_variables_to_dict(variables=variables),
+                reconciliation_strategy=reconciliation_directives.variables,
+            )
+        )
+
     # noinspection PyUnusedLocal
     @measure_execution_time(
         execution_time_holder_object_reference_name="rule_state",
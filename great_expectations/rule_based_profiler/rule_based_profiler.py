@@ -6,7 +6,17 @@ import json
 import logging
 import sys
 import traceback
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.batch import (
@@ -51,6 +61,9 @@ from great_expectations.rule_based_profiler.helpers.configuration_reconciliation
 from great_expectations.rule_based_profiler.helpers.util import (
     convert_variables_to_dict,
 )
+from great_expectations.rule_based_profiler.helpers.util import (
+    get_validator as get_validator_using_batch_list_or_batch_request,
+)
 from great_expectations.rule_based_profiler.parameter_builder import (
     ParameterBuilder,
     init_rule_parameter_builders,
@@ -79,6 +92,12 @@ if TYPE_CHECKING:
         RuntimeEnvironmentDomainTypeDirectives,
         RuntimeEnvironmentVariablesDirectives,
     )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import (
+        MetricConfiguration,
+    )
+    from great_expectations.validator.validation_graph import ValidationGraph
+    from great_expectations.validator.validator import Validator
 
 
 logger = logging.getLogger(__name__)
@@ -302,6 +321,17 @@ class BaseRuleBasedProfiler(ConfigPeer):
             rule.name: rule.to_json_dict() for rule in effective_rules
         }
 
+        # Metrics, needed by all Rules for all their Domains, are resolved together first (Phase 1); then Rules are run
+        # (Phase 2), while their ParameterBuilders use these prefetched metrics in lieu of building own ValidationGraphs.
+        planned_rule_states: Dict[str, RuleState] = self._prefetch_metrics(
+            rules=effective_rules,
+            variables=effective_variables,
+            batch_list=batch_list,
+            batch_request=batch_request,
+            runtime_configuration=runtime_configuration,
+            reconciliation_directives=reconciliation_directives,
+        )
+
         sys.stdout.write("\n")
         sys.stdout.flush()
 
@@ -309,37 +339,40 @@ class BaseRuleBasedProfiler(ConfigPeer):
 
         rule_state: RuleState
         rule: Rule
-        for rule in pbar_method(
-            effective_rules,
-            desc="Generating Expectations:",
-            disable=disable,
-            position=0,
-            leave=True,
-            bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
-        ):
-            try:
-                rule_state = rule.run(
-                    variables=effective_variables,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    runtime_configuration=runtime_configuration,
-                    reconciliation_directives=reconciliation_directives,
-                    rule_state=RuleState(),
-                )
-                self.rule_states.append(rule_state)
-            except Exception as err:
-                if self._catch_exceptions:
-                    rule_state = RuleState(rule=rule, catch_exceptions=True)
-                    exception_traceback: str = traceback.format_exc()
-                    exception_message: str = str(err)
-                    exception_info = ExceptionInfo(
-                        exception_traceback=exception_traceback,
-                        exception_message=exception_message,
+        try:
+            for rule in pbar_method(
+                effective_rules,
+                desc="Generating Expectations:",
+                disable=disable,
+                position=0,
+                leave=True,
+                bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
+            ):
+                try:
+                    rule_state = rule.run(
+                        variables=effective_variables,
+                        batch_list=batch_list,
+                        batch_request=batch_request,
+                        runtime_configuration=runtime_configuration,
+                        reconciliation_directives=reconciliation_directives,
+                        rule_state=planned_rule_states.get(rule.name, RuleState()),
                     )
-                    rule_state.exception_traceback = exception_info
                     self.rule_states.append(rule_state)
-                else:
-                    raise err
+                except Exception as err:
+                    if self._catch_exceptions:
+                        rule_state = RuleState(rule=rule, catch_exceptions=True)
+                        exception_traceback: str = traceback.format_exc()
+                        exception_message: str = str(err)
+                        exception_info = ExceptionInfo(
+                            exception_traceback=exception_traceback,
+                            exception_message=exception_message,
+                        )
+                        rule_state.exception_traceback = exception_info
+                        self.rule_states.append(rule_state)
+                    else:
+                        raise err
+        finally:
+            self._set_prefetched_metrics(rules=effective_rules, resolved_metrics=None)
 
         return RuleBasedProfilerResult(
             fully_qualified_parameter_names_by_domain=self.get_fully_qualified_parameter_names_by_domain(),
@@ -376,6 +409,116 @@ class BaseRuleBasedProfiler(ConfigPeer):
             },
         )
 
+    def _prefetch_metrics(  # noqa: PLR0913
+        self,
+        rules: List[Rule],
+        variables: Optional[ParameterContainer] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+        reconciliation_directives: ReconciliationDirectives = DEFAULT_RECONCILATION_DIRECTIVES,
+    ) -> Dict[str, RuleState]:
+        """
+        Resolves metrics, which "ParameterBuilder" objects of all Rules declare for all their Domains, in one suite-wide
+        "ValidationGraph" (so that metric bundling and caching of "ExecutionEngine" apply across the entire profile) and
+        makes them available to these "ParameterBuilder" objects (see "ParameterBuilder.prefetched_metrics" property).
+
+        Rules, whose metrics could not be declared, as well as metrics, which could not be resolved, are not prefetched;
+        these are computed by "ParameterBuilder" objects while running their Rules (same as without this phase).
+
+        Returns:
+            Dictionary of "RuleState" objects (holding already obtained Domains) to run each planned Rule with.
+        """
+        planned_rule_states: Dict[str, RuleState] = {}
+
+        # Only metrics of "Batch" data, supplied at runtime, can be resolved by one "Validator" object.
+        if batch_list is None and batch_request is None:
+            return planned_rule_states
+
+        metric_configurations: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+
+        rule_state: RuleState
+        rule: Rule
+        metric_configuration: MetricConfiguration
+        for rule in rules:
+            rule_state = RuleState()
+            try:
+                for metric_configuration in rule.get_metric_configurations_to_prefetch(
+                    variables=variables,
+                    batch_list=batch_list,
+                    batch_request=batch_request,
+                    runtime_configuration=runtime_configuration,
+                    reconciliation_directives=reconciliation_directives,
+                    rule_state=rule_state,
+                ):
+                    metric_configurations[
+                        metric_configuration.id
+                    ] = metric_configuration
+            except Exception as e:
+                # Errors (if any) are reported by running the Rule, subject to "catch_exceptions" directive.
+                logger.debug(f'Metrics of Rule "{rule.name}" were not prefetched: {e}')
+                continue
+
+            planned_rule_states[rule.name] = rule_state
+
+        if not metric_configurations:
+            return planned_rule_states
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
+        try:
+            validator: Optional[
+                Validator
+            ] = get_validator_using_batch_list_or_batch_request(
+                purpose="rule_based_profiler",
+                data_context=self._data_context,
+                batch_list=batch_list,
+                batch_request=batch_request,
+            )
+            if validator is None:
+                return planned_rule_states
+
+            loaded_batch_ids: Set[str] = set(validator.loaded_batch_ids)
+            metrics_to_resolve: List[MetricConfiguration] = [
+                metric_configuration
+                for metric_configuration in metric_configurations.values()
+                if metric_configuration.metric_domain_kwargs.get("batch_id")
+                in loaded_batch_ids
+            ]
+            graph: ValidationGraph = (
+                validator.metrics_calculator.build_metric_dependency_graph(
+                    metric_configurations=metrics_to_resolve,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+            (
+                resolved_metrics,
+                _,
+            ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
+                graph=graph,
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=0,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Prefetching metrics of {len(metric_configurations)} MetricConfiguration objects failed (they will be computed by each Rule): {e}"
+            )
+            return planned_rule_states
+
+        self._set_prefetched_metrics(rules=rules, resolved_metrics=resolved_metrics)
+
+        return planned_rule_states
+
+    @staticmethod
+    def _set_prefetched_metrics(
+        rules: List[Rule],
+        resolved_metrics: Optional[Dict[Tuple[str, str, str], MetricValue]],
+    ) -> None:
+        rule: Rule
+        parameter_builder: ParameterBuilder
+        for rule in rules:
+            for parameter_builder in rule.parameter_builders or []:
+                parameter_builder.prefetched_metrics = resolved_metrics
+
     def get_expectation_configurations(self) -> List[ExpectationConfiguration]:
         """
         Returns:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import logging
 import warnings
 from collections import OrderedDict
@@ -22,6 +23,8 @@ from great_expectations.validation_operators.types.validation_operator_result im
 )
 
 if TYPE_CHECKING:
+    import threading
+
     from great_expectations.core.batch import Batch
     from great_expectations.data_asset import DataAsset
 
@@ -190,16 +193,19 @@ class ActionListValidationOperator(ValidationOperator):
         }
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         data_context,
         action_list,
         name,
         result_format={"result_format": "SUMMARY"},  # noqa: B006 # mutable default
+        actions_lock: Optional[threading.Lock] = None,
     ) -> None:
         super().__init__()
         self.data_context = data_context
         self.name = name
+        # Operators, validating concurrently, share lock so that their actions (e.g., updating Data Docs) never overlap.
+        self._actions_lock = actions_lock
 
         result_format = parse_result_format(result_format)
         assert result_format["result_format"] in [
@@ -388,15 +394,16 @@ class ActionListValidationOperator(ValidationOperator):
                 checkpoint_identifier.id if checkpoint_identifier else None
             )
 
-            batch_actions_results = self._run_actions(
-                batch=batch,
-                expectation_suite_identifier=expectation_suite_identifier,
-                expectation_suite=batch._expectation_suite,
-                batch_validation_result=validation_result,
-                run_id=run_id,
-                validation_result_id=validation_result_id,
-                checkpoint_identifier=checkpoint_identifier,
-            )
+            with self._actions_lock or contextlib.nullcontext():
+                batch_actions_results = self._run_actions(
+                    batch=batch,
+                    expectation_suite_identifier=expectation_suite_identifier,
+                    expectation_suite=batch._expectation_suite,
+                    batch_validation_result=validation_result,
+                    run_id=run_id,
+                    validation_result_id=validation_result_id,
+                    checkpoint_identifier=checkpoint_identifier,
+                )
 
             run_result_obj = {
                 "validation_result": validation_result,
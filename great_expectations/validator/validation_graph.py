@@ -6,6 +6,7 @@ from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -229,6 +230,8 @@ class ValidationGraph:
         failed_metric_info: _AbortedMetricsInfoDict = {}
         aborted_metrics_info: _AbortedMetricsInfoDict = {}
 
+        scheduler = _MetricDependencyScheduler(edges=self.edges, metrics=metrics)
+
         ready_metrics: Set[MetricConfiguration]
         needed_metrics: Set[MetricConfiguration]
 
@@ -236,9 +239,17 @@ class ValidationGraph:
 
         progress_bar: Optional[tqdm] = None
 
+        # Let ExecutionEngine plan computation of all unresolved metrics of graph (e.g., materialize shared domains).
+        plan_metric_resolution: Optional[
+            Callable[[Iterable[MetricConfiguration]], None]
+        ] = getattr(self._execution_engine, "plan_metric_resolution", None)
+        if plan_metric_resolution is not None:
+            plan_metric_resolution(scheduler.ready_metrics | scheduler.needed_metrics)
+
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics = scheduler.ready_metrics
+            needed_metrics = scheduler.needed_metrics
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -265,13 +276,16 @@ class ValidationGraph:
 
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        runtime_configuration=runtime_configuration,
-                    )
+                resolved_metrics: Dict[
+                    _MetricKey, MetricValue
+                ] = self._execution_engine.resolve_metrics(
+                    metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    runtime_configuration=runtime_configuration,
                 )
+                metrics.update(resolved_metrics)
+                # Release dependents of newly resolved metrics (without rescanning all "MetricEdge" objects of graph).
+                scheduler.mark_resolved(metric_ids=resolved_metrics.keys())
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
@@ -324,23 +338,8 @@ class ValidationGraph:
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:  # noqa: PLR5501
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+        scheduler = _MetricDependencyScheduler(edges=self.edges, metrics=metrics)
+        return scheduler.ready_metrics, scheduler.needed_metrics
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
@@ -362,6 +361,96 @@ class ValidationGraph:
         return ", ".join([edge.__repr__() for edge in self._edges])
 
 
+class _MetricDependencyScheduler:
+    """Incremental topological scheduler over "MetricEdge" objects of "ValidationGraph".
+
+    Graph edges are indexed once (keyed by "MetricConfiguration.id"); thereafter, every metric keeps count of its
+    unresolved dependencies, and resolving metric releases only its direct dependents (using reverse adjacency lists),
+    rather than requiring rescan of all graph edges after every round of metric computations.
+    """
+
+    def __init__(
+        self,
+        edges: List[MetricEdge],
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> None:
+        self._metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+        self._dependents: Dict[_MetricKey, Set[_MetricKey]] = {}
+        self._unmet_dependency_counts: Dict[_MetricKey, int] = {}
+
+        dependencies: Dict[_MetricKey, Set[_MetricKey]] = {}
+
+        edge: MetricEdge
+        left_id: _MetricKey
+        right_id: _MetricKey
+        for edge in edges:
+            left_id = edge.left.id
+            if left_id not in dependencies:
+                dependencies[left_id] = set()
+                self._metric_configurations[left_id] = edge.left
+
+            if edge.right is not None:
+                right_id = edge.right.id
+                dependencies[left_id].add(right_id)
+                self._dependents.setdefault(right_id, set()).add(left_id)
+
+        self._resolved_ids: Set[_MetricKey] = {
+            metric_id
+            for metric_id in set(dependencies.keys()) | set(self._dependents.keys())
+            if metric_id in metrics
+        }
+
+        self._ready_ids: Set[_MetricKey] = set()
+        self._needed_ids: Set[_MetricKey] = set()
+
+        dependency_ids: Set[_MetricKey]
+        unmet_dependency_count: int
+        for left_id, dependency_ids in dependencies.items():
+            if left_id in self._resolved_ids:
+                continue
+
+            unmet_dependency_count = len(dependency_ids - self._resolved_ids)
+            self._unmet_dependency_counts[left_id] = unmet_dependency_count
+            if unmet_dependency_count == 0:
+                self._ready_ids.add(left_id)
+            else:
+                self._needed_ids.add(left_id)
+
+    @property
+    def ready_metrics(self) -> Set[MetricConfiguration]:
+        """Returns unresolved metrics, all of whose dependencies have been resolved."""
+        return {self._metric_configurations[metric_id] for metric_id in self._ready_ids}
+
+    @property
+    def needed_metrics(self) -> Set[MetricConfiguration]:
+        """Returns unresolved metrics, which still have at least one unresolved dependency."""
+        return {
+            self._metric_configurations[metric_id] for metric_id in self._needed_ids
+        }
+
+    def mark_resolved(self, metric_ids: Iterable[_MetricKey]) -> None:
+        """Records supplied metrics as resolved and releases their dependents, whose dependencies are now all met."""
+        metric_id: _MetricKey
+        dependent_id: _MetricKey
+        for metric_id in metric_ids:
+            if metric_id in self._resolved_ids:
+                continue
+
+            self._resolved_ids.add(metric_id)
+            self._ready_ids.discard(metric_id)
+            self._needed_ids.discard(metric_id)
+            self._unmet_dependency_counts.pop(metric_id, None)
+
+            for dependent_id in self._dependents.get(metric_id, set()):
+                if dependent_id not in self._unmet_dependency_counts:
+                    continue
+
+                self._unmet_dependency_counts[dependent_id] -= 1
+                if self._unmet_dependency_counts[dependent_id] == 0:
+                    self._needed_ids.discard(dependent_id)
+                    self._ready_ids.add(dependent_id)
+
+
 class ExpectationValidationGraph:
     def __init__(
         self,
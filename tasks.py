@@ -564,6 +564,50 @@ def type_schema(
     raise invoke.Exit(code=0)
 
 
+@invoke.task(
+    aliases=("manifest",),
+    help={
+        "sync": "Update the registry manifest at `great_expectations/expectations/registry_manifest.json`",
+        "indent": "Indent size for nested json objects. Default: 2",
+    },
+)
+def registry_manifest(
+    ctx: Context,
+    sync: bool = False,
+    indent: int = 2,
+):
+    """
+    Check that the registry manifest of core Expectations & Metrics is up to date
+
+    Regenerate the manifest with `--sync` (required after adding, removing, or moving core Expectations or Metrics).
+    """
+    import json
+
+    from great_expectations.expectations.registry import (
+        REGISTRY_MANIFEST_FILE_PATH,
+        build_registry_manifest,
+    )
+
+    json_str: str = json.dumps(build_registry_manifest(), indent=indent) + "\n"
+
+    if (
+        REGISTRY_MANIFEST_FILE_PATH.exists()
+        and json_str == REGISTRY_MANIFEST_FILE_PATH.read_text()
+    ):
+        print(f"✅  {REGISTRY_MANIFEST_FILE_PATH.name} unchanged")
+        raise invoke.Exit(code=0)
+
+    if not sync:
+        raise invoke.Exit(
+            f"❌  {REGISTRY_MANIFEST_FILE_PATH.name} is out of date; run `invoke registry-manifest --sync`",
+            code=1,
+        )
+
+    REGISTRY_MANIFEST_FILE_PATH.write_text(json_str)
+    print(f"🔃  {REGISTRY_MANIFEST_FILE_PATH.name} updated")
+    raise invoke.Exit(code=0)
+
+
 def _exit_with_error_if_not_in_repo_root(task_name: str):
     """Exit if the command was not run from the repository root."""
     filedir = os.path.realpath(
@@ -32,7 +32,13 @@ from great_expectations.data_context.types.resource_identifiers import (
     ConfigurationIdentifier,
     ValidationResultIdentifier,
 )
-from great_expectations.execution_engine import SparkDFExecutionEngine
+from great_expectations.execution_engine import (
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
 from great_expectations.render import RenderedAtomicContent
 from great_expectations.util import deep_filter_properties_iterable
 from great_expectations.validator.validator import Validator
@@ -1431,6 +1437,158 @@ def test_newstyle_checkpoint_instantiates_and_produces_a_validation_result_when_
     assert result["success"]
 
 
+@pytest.mark.filesystem
+def test_newstyle_checkpoint_runs_validations_concurrently_with_max_workers(
+    data_context_with_datasource_pandas_engine,
+    common_action_list,
+):
+    context: FileDataContext = data_context_with_datasource_pandas_engine
+
+    suite = ExpectationSuite("my_expectation_suite")
+    suite.add_expectation_configuration(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": "col1", "min_value": 0, "max_value": 5},
+        )
+    )
+    context.suites.add(suite)
+
+    # Validations of Batches from the same Datasource take turns; different Datasources are validated concurrently.
+    context.add_datasource(
+        "my_other_datasource",
+        class_name="Datasource",
+        execution_engine={"class_name": "PandasExecutionEngine"},
+        data_connectors={
+            "default_runtime_data_connector_name": {
+                "class_name": "RuntimeDataConnector",
+                "batch_identifiers": ["default_identifier_name"],
+            }
+        },
+    )
+
+    validations: list[dict] = [
+        {
+            "batch_request": RuntimeBatchRequest(
+                datasource_name=("my_datasource", "my_other_datasource")[idx % 2],
+                data_connector_name="default_runtime_data_connector_name",
+                data_asset_name="default_data_asset_name",
+                batch_identifiers={"default_identifier_name": f"identifier_{idx}"},
+                runtime_parameters={
+                    "batch_data": pd.DataFrame(data={"col1": [idx, idx + 1]})
+                },
+            )
+        }
+        for idx in range(8)
+    ]
+
+    context.add_checkpoint(
+        name="my_checkpoint",
+        expectation_suite_name="my_expectation_suite",
+        action_list=common_action_list,
+    )
+    my_checkpoint: Checkpoint = context.checkpoints.get("my_checkpoint")
+
+    def _summarize(result: CheckpointResult) -> list:
+        return [
+            (
+                validation_result_identifier.batch_identifier,
+                run_result["validation_result"].success,
+                list(run_result["actions_results"]),
+            )
+            for validation_result_identifier, run_result in result.run_results.items()
+        ]
+
+    sequential_result: CheckpointResult = my_checkpoint.run(
+        validations=validations, run_name="sequential"
+    )
+    concurrent_result: CheckpointResult = my_checkpoint.run(
+        validations=validations, run_name="concurrent", max_workers=4
+    )
+
+    assert _summarize(concurrent_result) == _summarize(sequential_result)
+    assert [success for _, success, _ in _summarize(concurrent_result)] == [
+        True
+    ] * 5 + [False] * 3
+    assert len(context.validations_store.list_keys()) == 2 * len(validations)
+
+    with pytest.raises(gx_exceptions.InvalidCheckpointConfigError):
+        my_checkpoint.run(validations=validations, max_workers=0)
+
+
+@pytest.mark.filesystem
+def test_newstyle_checkpoint_runs_sql_validations_concurrently_with_own_execution_engines(
+    data_context_with_datasource_sqlalchemy_engine,
+    common_action_list,
+    sa,
+):
+    context: FileDataContext = data_context_with_datasource_sqlalchemy_engine
+
+    suite = ExpectationSuite("my_expectation_suite")
+    suite.add_expectation_configuration(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": "id", "min_value": 0, "max_value": 30},
+        )
+    )
+    context.suites.add(suite)
+
+    validations: list[dict] = [
+        {
+            "batch_request": RuntimeBatchRequest(
+                datasource_name="my_datasource",
+                data_connector_name="default_runtime_data_connector_name",
+                data_asset_name="default_data_asset_name",
+                batch_identifiers={"default_identifier_name": f"identifier_{idx}"},
+                runtime_parameters={
+                    "query": f"SELECT * FROM table_partitioned_by_date_column__A WHERE id < {10 * (idx + 1)}"
+                },
+            )
+        }
+        for idx in range(6)
+    ]
+
+    context.add_checkpoint(
+        name="my_checkpoint",
+        expectation_suite_name="my_expectation_suite",
+        action_list=common_action_list,
+        max_workers=3,
+    )
+    my_checkpoint: Checkpoint = context.checkpoints.get("my_checkpoint")
+    assert my_checkpoint.config.max_workers == 3
+
+    def _summarize(result: CheckpointResult) -> list:
+        return [
+            (
+                validation_result_identifier.batch_identifier,
+                run_result["validation_result"].success,
+                run_result["validation_result"].results[0].result["element_count"],
+            )
+            for validation_result_identifier, run_result in result.run_results.items()
+        ]
+
+    sequential_result: CheckpointResult = my_checkpoint.run(
+        validations=validations, run_name="sequential", max_workers=1
+    )
+
+    # SQL Batches of each validation are re-materialized and validated by its own SqlAlchemyExecutionEngine.
+    with mock.patch.object(
+        SqlAlchemyExecutionEngine,
+        "copy_for_concurrent_use",
+        autospec=True,
+        side_effect=SqlAlchemyExecutionEngine.copy_for_concurrent_use,
+    ) as mock_copy_for_concurrent_use:
+        concurrent_result: CheckpointResult = my_checkpoint.run(
+            validations=validations, run_name="concurrent"
+        )
+
+    assert mock_copy_for_concurrent_use.call_count == len(validations)
+    assert _summarize(concurrent_result) == _summarize(sequential_result)
+    assert [
+        (success, element_count)
+        for _, success, element_count in _summarize(concurrent_result)
+    ] == [(True, 10), (True, 20), (True, 30), (False, 40), (False, 50), (False, 60)]
+
+
 @pytest.mark.filesystem
 def test_newstyle_checkpoint_instantiates_and_produces_a_validation_result_when_run_runtime_validations_query_in_context_run_checkpoint(
     data_context_with_datasource_sqlalchemy_engine,
@@ -96,6 +96,34 @@ def test_iddict_is_hashable():
         assert False, "IDDict.__hash__() failed."
 
 
+@pytest.mark.unit
+def test_iddict_id_is_cached_until_iddict_is_modified():
+    id_dict = IDDict({"column": "a", "batch_id": "my_batch_id"})
+    original_id: str = id_dict.to_id()
+    assert id_dict.to_id() is original_id
+    assert id_dict.to_id(id_ignore_keys={"batch_id"}) == "column=a"
+
+    modifications = [
+        lambda d: d.__setitem__("row_condition", "b > 1"),
+        lambda d: d.update(condition_parser="pandas"),
+        lambda d: d.setdefault("filter_conditions", []),
+        lambda d: d.pop("row_condition"),
+        lambda d: d.__delitem__("condition_parser"),
+        lambda d: d.popitem(),
+    ]
+    for modify in modifications:
+        id_before_modification: str = id_dict.to_id()
+        modify(id_dict)
+        assert id_dict.to_id() != id_before_modification
+        assert id_dict.to_id() == IDDict(dict(id_dict)).to_id()
+        assert hash(id_dict) == hash(IDDict(dict(id_dict)))
+
+    assert id_dict.to_id() == original_id
+
+    id_dict.clear()
+    assert id_dict.to_id() == tuple()
+
+
 @pytest.mark.unit
 def test_batch_definition_id():
     # noinspection PyUnusedLocal,PyPep8Naming
@@ -1,8 +1,12 @@
 from copy import deepcopy
+from unittest import mock
 
 import pytest
 
-from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.expectation_suite import (
+    ExpectationSuite,
+    _ExpectationIndex,
+)
 from great_expectations.exceptions import (
     DataContextError,
     InvalidExpectationConfigurationError,
@@ -276,6 +280,107 @@ def test_find_expectation_indexes(
         )
 
 
+@pytest.mark.filesystem
+def test_find_expectation_indexes_stays_in_sync_with_suite_changes(
+    exp1, exp2, exp4, exp6, in_memory_runtime_context
+):
+    empty_suite = ExpectationSuite(expectation_suite_name="warning")
+    empty_suite.add_expectation_configurations(
+        expectation_configurations=[exp1, exp2], match_type="domain"
+    )
+    assert empty_suite.find_expectation_indexes(exp4, "domain") == [1]
+    assert empty_suite.find_expectation_indexes(exp4, "success") == []
+
+    # Replaced (upserted) Expectation is indexed anew.
+    empty_suite.add_expectation_configuration(exp4, match_type="domain")
+    assert empty_suite.find_expectation_indexes(exp4, "success") == [1]
+
+    # Changes made directly to "expectations" list are picked up.
+    empty_suite.expectations.append(exp6.to_domain_obj())
+    assert empty_suite.find_expectation_indexes(exp4, "domain") == [1, 2]
+    empty_suite.expectations = empty_suite.expectations[1:]
+    assert empty_suite.find_expectation_indexes(exp4, "domain") == [0, 1]
+    assert empty_suite.find_expectation_indexes(exp1, "domain") == []
+
+    empty_suite.remove_expectation(exp4, match_type="success")
+    assert empty_suite.find_expectation_indexes(exp6, "success") == [0]
+    assert empty_suite.find_expectation_indexes(exp4, "runtime") == []
+
+
+@pytest.mark.filesystem
+def test_find_expectation_indexes_after_expectation_is_modified_in_place(
+    exp1, exp2, in_memory_runtime_context
+):
+    suite = ExpectationSuite(expectation_suite_name="warning")
+    suite.add_expectation_configurations(
+        expectation_configurations=[exp1], match_type="domain"
+    )
+    assert suite.find_expectation_indexes(exp1, "domain") == [0]
+
+    # Reassigning column (domain kwarg) in place moves Expectation into domain of "exp2".
+    suite.expectations[0].column = "b"
+    assert suite.find_expectation_indexes(exp1, "domain") == []
+    assert suite.find_expectation_indexes(exp2, "domain") == [0]
+
+    suite.add_expectation_configuration(exp2, match_type="domain")
+    assert len(suite.expectations) == 1
+    assert suite.expectations[0].configuration.isEquivalentTo(
+        other=exp2, match_type="success"
+    )
+
+
+@pytest.mark.filesystem
+def test_find_expectation_indexes_recomputes_keys_only_of_reassigned_expectation(
+    exp1, exp2, exp4, in_memory_runtime_context
+):
+    suite = ExpectationSuite(expectation_suite_name="warning")
+    suite.add_expectation_configurations(
+        expectation_configurations=[exp1, exp2], match_type="domain"
+    )
+    other_suite = ExpectationSuite(expectation_suite_name="other")
+    other_suite.add_expectation_configurations(
+        expectation_configurations=[exp1, exp2], match_type="domain"
+    )
+    assert suite.find_expectation_indexes(exp4, "domain") == [1]
+    assert other_suite.find_expectation_indexes(exp4, "domain") == [1]
+
+    suite.expectations[0].column = "b"
+
+    with mock.patch.object(
+        _ExpectationIndex, "get_key", wraps=_ExpectationIndex.get_key
+    ) as mock_get_key:
+        assert other_suite.find_expectation_indexes(exp4, "domain") == [1]
+        # Only key of looked up ExpectationConfiguration is computed.
+        assert mock_get_key.call_count == 1
+
+        assert suite.find_expectation_indexes(exp4, "domain") == [0, 1]
+        # Keys (for both match types) are recomputed only for reassigned Expectation.
+        assert mock_get_key.call_count == 4
+
+
+@pytest.mark.filesystem
+def test_find_expectation_indexes_after_kwarg_value_is_mutated_in_place(
+    exp1, in_memory_runtime_context
+):
+    suite = ExpectationSuite(expectation_suite_name="warning")
+    suite.add_expectation_configurations(
+        expectation_configurations=[exp1], match_type="domain"
+    )
+    assert suite.find_expectation_indexes(exp1, "success") == [0]
+    exp1_original = deepcopy(exp1)
+    exp1_mutated = deepcopy(exp1)
+    exp1_mutated.kwargs["value_set"] = [1, 2, 3, 4]
+
+    # Mutating value of success kwarg in place is not detected (documented limitation) until Expectation is saved.
+    suite.expectations[0].value_set.append(4)
+    assert suite.find_expectation_indexes(exp1_mutated, "success") == []
+
+    # Saving Expectation discards its index keys (see "ExpectationSuite._save_expectation()").
+    suite._expectation_index.discard(expectation=suite.expectations[0])
+    assert suite.find_expectation_indexes(exp1_mutated, "success") == [0]
+    assert suite.find_expectation_indexes(exp1_original, "success") == []
+
+
 @pytest.mark.cloud
 def test_find_expectation_indexes_with_ge_cloud_suite(ge_cloud_suite, ge_cloud_id):
     # All expectations in `ge_cloud_suite` have our desired id
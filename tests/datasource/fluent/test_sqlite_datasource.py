@@ -6,8 +6,11 @@ from typing import TYPE_CHECKING, Any, Callable, Generator, Optional
 
 import pytest
 
+import great_expectations as gx
 from great_expectations.compatibility.pydantic import ValidationError
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.core.partitioners import (
+    PartitionerColumnValue,
     PartitionerConvertedDatetime,
 )
 from great_expectations.datasource.fluent import SqliteDatasource
@@ -192,3 +195,67 @@ def test_create_temp_table(empty_data_context, create_sqlite_source):
         asset = source.add_query_asset(name="query_asset", query="SELECT * from table")
         _ = asset.get_batch_list_from_batch_request(asset.build_batch_request())
         assert source._execution_engine._create_temp_table is False
+
+
+@pytest.fixture
+def sqlite_datasource_with_ids_table(
+    tmp_path: pathlib.Path,
+) -> Generator[tuple[SqliteDatasource, Callable[[int], None]], None, None]:
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'ids.db'}")
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE ids (id INTEGER)"))
+        connection.execute(sa.text("INSERT INTO ids (id) VALUES (1), (2)"))
+
+    def insert_id(id_: int) -> None:
+        with engine.begin() as connection:
+            connection.execute(
+                sa.text("INSERT INTO ids (id) VALUES (:id)"), {"id": id_}
+            )
+
+    context = gx.get_context(mode="ephemeral")
+    yield context.sources.add_sqlite(
+        name="sqlite_datasource",
+        connection_string=f"sqlite:///{tmp_path / 'ids.db'}",
+    ), insert_id
+    engine.dispose()
+
+
+@pytest.mark.sqlite
+def test_partition_discovery_cache_ttl(sqlite_datasource_with_ids_table):
+    source, insert_id = sqlite_datasource_with_ids_table
+    asset = source.add_table_asset(name="ids", table_name="ids")
+    asset.partition_discovery_cache_ttl = 3600
+    batch_request = asset.build_batch_request(
+        partitioner=PartitionerColumnValue(column_name="id")
+    )
+
+    assert len(asset.get_batch_list_from_batch_request(batch_request)) == 2
+
+    insert_id(3)
+    assert len(asset.get_batch_list_from_batch_request(batch_request)) == 2
+
+    asset.invalidate_partition_discovery_cache()
+    assert len(asset.get_batch_list_from_batch_request(batch_request)) == 3
+
+
+@pytest.mark.sqlite
+def test_incremental_partition_discovery(sqlite_datasource_with_ids_table):
+    source, insert_id = sqlite_datasource_with_ids_table
+    asset = source.add_table_asset(name="ids", table_name="ids")
+    asset.incremental_partition_discovery = True
+    batch_request = asset.build_batch_request(
+        partitioner=PartitionerColumnValue(column_name="id")
+    )
+
+    assert len(asset.get_batch_list_from_batch_request(batch_request)) == 2
+
+    insert_id(3)
+    batches = asset.get_batch_list_from_batch_request(batch_request)
+    assert [batch.metadata["id"] for batch in batches] == [1, 2, 3]
+
+    # Only rows above the last seen maximum are queried for new partitions.
+    insert_id(0)
+    assert len(asset.get_batch_list_from_batch_request(batch_request)) == 3
+
+    asset.invalidate_partition_discovery_cache()
+    assert len(asset.get_batch_list_from_batch_request(batch_request)) == 4
@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 
 import pytest
 
@@ -141,3 +142,40 @@ def test_sample_using_md5(test_sparkdf, basic_spark_df_execution_engine):
     collected = sampled_df.collect()
     for val in collected:
         assert val.date in [datetime.date(2020, 1, 15), datetime.date(2020, 1, 29)]
+
+
+@pytest.mark.parametrize(
+    "hash_function_name",
+    ["md5", "sha1", "sha256", "sha512", "blake2b"],
+)
+def test_sample_using_hash_of_string_column_matches_hashlib(
+    hash_function_name, spark_session, basic_spark_df_execution_engine
+):
+    """Native Spark SQL hash functions (or Python UDF, for "blake2b") must sample the same rows as hashlib does."""
+    values = [f"value_{idx}" for idx in range(100)] + [None]
+    df = spark_session.createDataFrame(
+        [(value,) for value in values], schema="name string"
+    )
+
+    sampled_df = basic_spark_df_execution_engine.get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=df,
+            sampling_method="_sample_using_hash",
+            sampling_kwargs={
+                "column_name": "name",
+                "hash_digits": 1,
+                "hash_value": "a",
+                "hash_function_name": hash_function_name,
+            },
+        )
+    ).dataframe
+
+    hash_func = getattr(hashlib, hash_function_name)
+    expected_values = [
+        value
+        for value in values
+        if hash_func(str(value).encode()).hexdigest()[-1:] == "a"
+    ]
+    assert sorted((row.name for row in sampled_df.collect()), key=str) == sorted(
+        expected_values, key=str
+    )
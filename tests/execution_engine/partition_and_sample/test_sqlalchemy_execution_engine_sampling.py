@@ -430,3 +430,128 @@ def test_sample_using_random_batch_spec_test_sampling_kwargs_p_required(
             execution_engine=fake_execution_engine, batch_spec=batch_spec
         )
         assert "sample_using_random" in str(e.value)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dialect_module_name,dialect_name,sampling_kwargs,expected_from_clause,expected_sampling_method",
+    [
+        pytest.param(
+            "sqlalchemy.dialects.postgresql",
+            GXSqlDialect.POSTGRESQL,
+            {"p": 0.1, "seed": 42},
+            "my_schema.my_table TABLESAMPLE BERNOULLI (10) REPEATABLE (42)",
+            "tablesample_bernoulli",
+            id="postgresql",
+        ),
+        pytest.param(
+            "sqlalchemy.dialects.postgresql",
+            GXSqlDialect.TRINO,
+            {"p": 0.25, "seed": 42},
+            "my_schema.my_table TABLESAMPLE BERNOULLI (25)",
+            "tablesample_bernoulli",
+            id="trino_ignores_seed",
+        ),
+        pytest.param(
+            "sqlalchemy.dialects.mssql",
+            GXSqlDialect.MSSQL,
+            {"p": 0.5},
+            "my_schema.my_table TABLESAMPLE SYSTEM (50 PERCENT)",
+            "tablesample_system",
+            id="mssql",
+        ),
+        pytest.param(
+            "sqlalchemy.dialects.postgresql",
+            GXSqlDialect.SNOWFLAKE,
+            {"p": 0.005, "seed": 7},
+            "my_schema.my_table SAMPLE BERNOULLI (0.5) SEED (7)",
+            "sample_bernoulli",
+            id="snowflake",
+        ),
+    ],
+)
+def test_sample_using_random_uses_dialect_native_sampling(
+    mocker,
+    dialect_module_name: str,
+    dialect_name: GXSqlDialect,
+    sampling_kwargs: dict,
+    expected_from_clause: str,
+    expected_sampling_method: str,
+):
+    dialect = import_library_module(dialect_module_name).dialect()
+    execution_engine = mocker.Mock(
+        spec=SqlAlchemyExecutionEngine,
+        dialect=dialect,
+        dialect_name=dialect_name.value,
+    )
+    batch_spec = SqlAlchemyDatasourceBatchSpec(
+        table_name="my_table",
+        schema_name="my_schema",
+        sampling_method="_sample_using_random",
+        sampling_kwargs=sampling_kwargs,
+    )
+    data_sampler = SqlAlchemyDataSampler()
+
+    selectable = data_sampler.sample_using_random(
+        execution_engine=execution_engine,
+        batch_spec=batch_spec,
+        where_clause=sqlalchemy.column("a") == 1,
+    )
+
+    # No row count (or any other query) is needed to sample natively.
+    execution_engine.execute_query.assert_not_called()
+    query: str = str(
+        selectable.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    )
+    assert clean_query_for_comparison(query) == clean_query_for_comparison(
+        f"SELECT * FROM {expected_from_clause} WHERE a = 1"
+    )
+    assert (
+        data_sampler.get_applied_sampling_method(
+            execution_engine=execution_engine, batch_spec=batch_spec
+        )
+        == expected_sampling_method
+    )
+
+
+@pytest.mark.sqlite
+def test_sample_using_random_records_sampling_method_in_batch_markers(
+    sqlite_view_engine, test_df
+):
+    my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
+        engine=sqlite_view_engine
+    )
+    add_dataframe_to_db(
+        df=test_df, name="test_table_sampled", con=my_execution_engine.engine
+    )
+
+    batch_spec = SqlAlchemyDatasourceBatchSpec(
+        table_name="test_table_sampled",
+        schema_name="main",
+        sampling_method="_sample_using_random",
+        sampling_kwargs={"p": 0.2, "seed": 42},
+    )
+    batch_data, batch_markers = my_execution_engine.get_batch_data_and_markers(
+        batch_spec=batch_spec
+    )
+
+    # SQLite has no native sampling; exact fraction of rows is sampled in random order instead.
+    assert batch_markers["sampling_method"] == "sample_using_random"
+    num_rows: int = batch_data.execution_engine.execute_query(
+        sqlalchemy.select(sqlalchemy.func.count()).select_from(batch_data.selectable)
+    ).scalar()
+    assert num_rows == round(0.2 * test_df.shape[0])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("seed", ["42", 4.2, True])
+def test_sample_using_random_batch_spec_test_sampling_kwargs_seed_must_be_integer(
+    seed,
+):
+    fake_execution_engine = None
+    batch_spec = BatchSpec(table_name="table", sampling_kwargs={"p": 0.1, "seed": seed})
+    with pytest.raises(ValueError) as e:
+        SqlAlchemyDataSampler.sample_using_random(
+            execution_engine=fake_execution_engine, batch_spec=batch_spec
+        )
+    assert "seed" in str(e.value)
@@ -0,0 +1,329 @@
+import io
+from typing import Optional
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility import aws, azure
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import (
+    AzureBatchSpec,
+    PathBatchSpec,
+    S3BatchSpec,
+)
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+)
+from great_expectations.execution_engine.pandas_chunked_metrics import (
+    ChunkedMetricMergeError,
+    get_chunked_metric_merge_fn,
+    is_deferred_chunked_metric,
+)
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+    _BytesChunksReader,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+
+def _build_metric_configuration(
+    metric_name: str, result_format: str = "SUMMARY"
+) -> MetricConfiguration:
+    return MetricConfiguration(
+        metric_name=metric_name,
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "result_format": {
+                "result_format": result_format,
+                "partial_unexpected_count": 3,
+            }
+        },
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_name,expected",
+    [
+        pytest.param("column_values.in_set.condition", True, id="condition"),
+        pytest.param("column_values.value_length.map", True, id="map"),
+        pytest.param("column_values.unique.condition", False, id="non_row_local"),
+        pytest.param(
+            "column_values.increasing.condition", False, id="non_row_local_increasing"
+        ),
+        pytest.param("column_values.in_set.unexpected_count", False, id="summary"),
+        pytest.param("column.max", False, id="aggregate"),
+    ],
+)
+def test_is_deferred_chunked_metric(metric_name, expected):
+    assert is_deferred_chunked_metric(metric_name=metric_name) is expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_name,accumulated_value,chunk_value,expected",
+    [
+        pytest.param("table.row_count", 3, 4, 7, id="row_count"),
+        pytest.param("column.min", np.nan, 2, 2, id="min_of_empty_chunk"),
+        pytest.param("column.max", 5, np.nan, 5, id="max_with_empty_chunk"),
+        pytest.param(
+            "column_values.in_set.unexpected_count", 1, 2, 3, id="unexpected_count"
+        ),
+        pytest.param(
+            "column_values.in_set.unexpected_values",
+            ["x", "y"],
+            ["z", "w"],
+            ["x", "y", "z"],
+            id="partial_unexpected_values",
+        ),
+        pytest.param(
+            "column_values.in_set.unexpected_index_query",
+            "df.filter(items=[1, 2], axis=0)",
+            "df.filter(items=[10], axis=0)",
+            "df.filter(items=[1, 2, 10], axis=0)",
+            id="unexpected_index_query",
+        ),
+    ],
+)
+def test_chunked_metric_merge_fn(metric_name, accumulated_value, chunk_value, expected):
+    merge_fn = get_chunked_metric_merge_fn(metric_name=metric_name)
+    assert merge_fn is not None
+    assert (
+        merge_fn(
+            accumulated_value,
+            chunk_value,
+            _build_metric_configuration(metric_name=metric_name),
+        )
+        == expected
+    )
+
+
+@pytest.mark.unit
+def test_chunked_metric_merge_fn_complete_result_format_and_unmergeable_values():
+    metric_name = "column_values.in_set.unexpected_index_list"
+    merge_fn = get_chunked_metric_merge_fn(metric_name=metric_name)
+    assert merge_fn is not None
+
+    metric_configuration = _build_metric_configuration(
+        metric_name=metric_name, result_format="COMPLETE"
+    )
+    assert merge_fn([1, 2], [3, 4], metric_configuration) == [1, 2, 3, 4]
+
+    with pytest.raises(ChunkedMetricMergeError):
+        merge_fn([1, 2], "3", metric_configuration)
+
+    assert get_chunked_metric_merge_fn(metric_name="column.median") is None
+
+
+@pytest.mark.unit
+def test_chunked_pandas_batch_data_reindexes_and_materializes_chunks():
+    chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})]
+    batch_data = ChunkedPandasBatchData(
+        execution_engine=None, chunk_factory=lambda: iter(chunks)
+    )
+
+    assert [list(chunk.index) for chunk in batch_data.iter_chunks()] == [[0, 1], [2]]
+    assert not batch_data.is_materialized
+    pd.testing.assert_frame_equal(batch_data.dataframe, pd.DataFrame({"a": [1, 2, 3]}))
+    assert batch_data.is_materialized
+
+
+@pytest.mark.unit
+def test_chunk_size_must_be_positive():
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        PandasExecutionEngine(chunk_size=0)
+
+    assert PandasExecutionEngine(chunk_size=10).config["chunk_size"] == 10
+
+
+@pytest.fixture
+def csv_path(tmp_path) -> str:
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame(
+        {
+            "a": rng.integers(0, 100, 50),
+            "b": rng.choice(["x", "y", None, "zz"], 50),
+            "c": rng.normal(size=50),
+        }
+    )
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.mark.filesystem
+def test_get_batch_data_and_markers_streams_csv_in_chunks(csv_path):
+    batch_spec = PathBatchSpec(path=csv_path, reader_method="read_csv")
+
+    batch_data, _ = PandasExecutionEngine(chunk_size=7).get_batch_data_and_markers(
+        batch_spec=batch_spec
+    )
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    assert [len(chunk) for chunk in batch_data.iter_chunks()] == [7] * 7 + [1]
+
+    batch_data, _ = PandasExecutionEngine().get_batch_data_and_markers(
+        batch_spec=batch_spec
+    )
+    assert type(batch_data) is PandasBatchData
+
+    batch_spec = PathBatchSpec(
+        path=csv_path, reader_method="read_csv", reader_options={"nrows": 10}
+    )
+    batch_data, _ = PandasExecutionEngine(chunk_size=7).get_batch_data_and_markers(
+        batch_spec=batch_spec
+    )
+    assert [len(chunk) for chunk in batch_data.iter_chunks()] == [7, 3]
+
+    # "chunksize" reader option (e.g., of Fluent CSV asset) streams Batch data in chunks of that many rows.
+    batch_spec = PathBatchSpec(
+        path=csv_path, reader_method="read_csv", reader_options={"chunksize": 20}
+    )
+    batch_data, _ = PandasExecutionEngine(chunk_size=7).get_batch_data_and_markers(
+        batch_spec=batch_spec
+    )
+    assert [len(chunk) for chunk in batch_data.iter_chunks()] == [20, 20, 10]
+
+
+@pytest.mark.skipif(
+    not aws.boto3,
+    reason="Unable to load AWS connection object. Please install boto3 and botocore.",
+)
+@pytest.mark.big
+def test_get_batch_data_and_markers_streams_s3_object_in_chunks(
+    s3_bucket, csv_path, monkeypatch
+):
+    # Object is uploaded as is (newer botocore would otherwise send it with checksum trailer, which moto 2 stores).
+    monkeypatch.setenv("AWS_REQUEST_CHECKSUM_CALCULATION", "when_required")
+    with open(csv_path, "rb") as f:
+        aws.boto3.client("s3", region_name="us-east-1").put_object(
+            Bucket=s3_bucket, Key="data.csv", Body=f.read()
+        )
+
+    batch_spec = S3BatchSpec(
+        path=f"s3a://{s3_bucket}/data.csv", reader_method="read_csv"
+    )
+    batch_data, _ = PandasExecutionEngine(chunk_size=7).get_batch_data_and_markers(
+        batch_spec=batch_spec
+    )
+
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    # Every pass over chunks reads S3 object anew.
+    assert [len(chunk) for chunk in batch_data.iter_chunks()] == [7] * 7 + [1]
+    pd.testing.assert_frame_equal(
+        pd.concat(batch_data.iter_chunks()), pd.read_csv(csv_path)
+    )
+
+
+@pytest.mark.skipif(
+    not (azure.storage and azure.BlobServiceClient),
+    reason='Could not import "azure.storage.blob" from Microsoft Azure cloud',
+)
+@mock.patch(
+    "great_expectations.execution_engine.pandas_execution_engine.azure.BlobServiceClient",
+)
+@pytest.mark.big
+def test_get_batch_data_and_markers_streams_azure_blob_in_chunks(mock_azure_conn):
+    mock_blob_client = mock_azure_conn().get_blob_client()
+    mock_blob_client.download_blob().chunks.side_effect = lambda: iter(
+        [b"colA,colB\n1,2\n3,", b"4\n5,6\n"]
+    )
+
+    batch_data, _ = PandasExecutionEngine(chunk_size=2).get_batch_data_and_markers(
+        batch_spec=AzureBatchSpec(
+            path="mock_account.blob.core.windows.net/test_container/path/A-100.csv",
+            reader_method="read_csv",
+        )
+    )
+
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    assert [len(chunk) for chunk in batch_data.iter_chunks()] == [2, 1]
+    pd.testing.assert_frame_equal(
+        batch_data.dataframe, pd.DataFrame({"colA": [1, 3, 5], "colB": [2, 4, 6]})
+    )
+    mock_blob_client.download_blob().readall.assert_not_called()
+
+
+@pytest.mark.unit
+def test_bytes_chunks_reader():
+    reader = io.BufferedReader(
+        _BytesChunksReader(chunks=iter([b"a,b\n1,", b"", b"x\n2,y\n3", b",z\n"]))
+    )
+
+    with pd.read_csv(reader, chunksize=2) as chunks:
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks), pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        )
+
+
+EXPECTATIONS = [
+    ("expect_column_values_to_be_unique", {"column": "a"}),
+    ("expect_column_values_to_be_increasing", {"column": "a"}),
+    ("expect_column_values_to_not_be_null", {"column": "b"}),
+    (
+        "expect_column_values_to_be_between",
+        {"column": "a", "min_value": 10, "max_value": 90, "result_format": "COMPLETE"},
+    ),
+    (
+        "expect_column_values_to_be_in_set",
+        {"column": "b", "value_set": ["x", "y"], "mostly": 0.5},
+    ),
+    (
+        "expect_column_values_to_be_in_set",
+        {
+            "column": "b",
+            "value_set": ["x", "y"],
+            "row_condition": "a > 50",
+            "condition_parser": "pandas",
+        },
+    ),
+    (
+        "expect_column_max_to_be_between",
+        {"column": "a", "min_value": 0, "max_value": 98},
+    ),
+    ("expect_table_row_count_to_equal", {"value": 50}),
+    (
+        "expect_column_mean_to_be_between",
+        {"column": "c", "min_value": -5, "max_value": 5},
+    ),
+    ("expect_column_values_to_match_regex", {"column": "b", "regex": "^x"}),
+]
+
+
+def _validate(csv_path: str, chunk_size, reader_options: Optional[dict] = None) -> list:
+    engine = PandasExecutionEngine(chunk_size=chunk_size)
+    batch_spec = PathBatchSpec(
+        path=csv_path, reader_method="read_csv", reader_options=reader_options or {}
+    )
+    batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec=batch_spec)
+    validator = Validator(
+        execution_engine=engine,
+        batches=[
+            Batch(data=batch_data, batch_spec=batch_spec, batch_markers=batch_markers)
+        ],
+    )
+
+    results = []
+    for expectation_type, expectation_kwargs in EXPECTATIONS:
+        result = getattr(validator, expectation_type)(**expectation_kwargs)
+        results.append(
+            (result.success, result.result, result.exception_info["raised_exception"])
+        )
+
+    return results
+
+
+@pytest.mark.filesystem
+def test_chunked_validation_results_equal_in_memory_validation_results(
+    in_memory_runtime_context, csv_path
+):
+    in_memory_results: list = _validate(csv_path=csv_path, chunk_size=None)
+    assert _validate(csv_path=csv_path, chunk_size=7) == in_memory_results
+    assert (
+        _validate(csv_path=csv_path, chunk_size=None, reader_options={"chunksize": 7})
+        == in_memory_results
+    )
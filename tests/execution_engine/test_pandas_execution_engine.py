@@ -1,13 +1,20 @@
+import gc
 import os
+import weakref
 from typing import Dict, Tuple
 from unittest import mock
 
 import pandas as pd
 import pytest
 
+import great_expectations as gx
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import aws, azure, google
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
+from great_expectations.core.batch_spec import (
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
 
 # noinspection PyBroadException
 from great_expectations.core.metric_domain_types import MetricDomainTypes
@@ -17,6 +24,7 @@ from great_expectations.execution_engine.pandas_execution_engine import (
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -368,6 +376,268 @@ def test_get_compute_domain_with_unmeetable_row_condition():
     assert accessor_kwargs == {"column": "a"}, "Accessor kwargs have been modified"
 
 
+@pytest.mark.unit
+def test_get_domain_records_reuses_filtered_records():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs: dict = {
+        "row_condition": "b > 2",
+        "condition_parser": "pandas",
+    }
+    with mock.patch.object(
+        pd.DataFrame, "query", autospec=True, side_effect=pd.DataFrame.query
+    ) as mock_query:
+        data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+        assert (
+            engine.get_domain_records(domain_kwargs={**domain_kwargs, "column": "a"})
+            is data
+        )
+        assert (
+            engine.get_domain_records(
+                domain_kwargs={**domain_kwargs, "batch_id": "1234"}
+            )
+            is data
+        )
+        assert mock_query.call_count == 1
+
+        # Different "ignore_row_if" directive and reloaded Batch data are filtered anew.
+        pair_data = engine.get_domain_records(
+            domain_kwargs={
+                **domain_kwargs,
+                "column_A": "a",
+                "column_B": "b",
+                "ignore_row_if": "either_value_is_missing",
+            }
+        )
+        assert pair_data is not data
+
+        engine.load_batch_data(batch_data=df.copy(), batch_id="1234")
+        assert engine.get_domain_records(domain_kwargs=domain_kwargs) is not data
+        assert mock_query.call_count == 3
+
+    # Unfiltered Batch data is not cached.
+    assert (
+        engine.get_domain_records(domain_kwargs={})
+        is engine.batch_manager.active_batch_data.dataframe
+    )
+
+
+@pytest.mark.unit
+def test_get_domain_records_cache_memory_budget():
+    df = pd.DataFrame({"a": list(range(1000)), "b": list(range(1000))})
+    filtered_df_size: int = int(df.query("b > 1").memory_usage(index=True).sum())
+
+    engine = PandasExecutionEngine(domain_records_cache_max_bytes=0)
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs: dict = {"row_condition": "b > 1", "condition_parser": "pandas"}
+    assert engine.get_domain_records(
+        domain_kwargs=domain_kwargs
+    ) is not engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+    # Budget accommodates one filtered DataFrame; least recently used one is evicted.
+    engine = PandasExecutionEngine(
+        domain_records_cache_max_bytes=filtered_df_size + filtered_df_size // 2
+    )
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    assert (
+        engine.config["domain_records_cache_max_bytes"]
+        == filtered_df_size + filtered_df_size // 2
+    )
+
+    first = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs) is first
+    engine.get_domain_records(
+        domain_kwargs={"row_condition": "b > 2", "condition_parser": "pandas"}
+    )
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs) is not first
+
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        PandasExecutionEngine(domain_records_cache_max_bytes=-1)
+
+
+@pytest.mark.unit
+def test_batch_data_cache_evicts_and_rematerializes_batch_data(tmp_path):
+    engine = PandasExecutionEngine(batch_data_cache_max_count=2)
+    assert engine.config["batch_data_cache_max_count"] == 2
+    batch_manager = engine.batch_manager
+
+    # Runtime (in-memory) Batch data cannot be re-materialized; hence, it is never evicted.
+    engine.load_batch_data(
+        batch_id="runtime", batch_data=pd.DataFrame({"a": [-1, -1, -1]})
+    )
+
+    idx: int
+    for idx in range(3):
+        path = tmp_path / f"data_{idx}.csv"
+        pd.DataFrame({"a": [idx, idx, idx]}).to_csv(path, index=False)
+        batch_spec = PathBatchSpec(path=str(path), reader_method="read_csv")
+        batch_manager.register_batch_spec(batch_id=str(idx), batch_spec=batch_spec)
+        engine.load_batch_data(
+            batch_id=str(idx), batch_data=engine.get_batch_data(batch_spec=batch_spec)
+        )
+
+    assert batch_manager.loaded_batch_ids == ["runtime", "0", "1", "2"]
+    assert batch_manager.active_batch_data_id == "2"
+    assert batch_manager.batch_data_cache.is_loaded("runtime")
+    assert not batch_manager.batch_data_cache.is_loaded("0")
+    assert not batch_manager.batch_data_cache.is_loaded("1")
+
+    # Evicted Batch data is re-materialized from its BatchSpec; active Batch data stays loaded and unchanged.
+    with mock.patch.object(
+        engine, "get_batch_data", wraps=engine.get_batch_data
+    ) as mock_get_batch_data:
+        assert batch_manager.batch_data_cache["0"].dataframe["a"].to_list() == [0, 0, 0]
+        assert mock_get_batch_data.call_count == 1
+
+    assert batch_manager.active_batch_data_id == "2"
+    assert batch_manager.batch_data_cache.is_loaded("2")
+    assert batch_manager.batch_data_cache.get("runtime").dataframe["a"].to_list() == [
+        -1,
+        -1,
+        -1,
+    ]
+    assert batch_manager.batch_data_cache.get("unknown") is None
+
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        PandasExecutionEngine(batch_data_cache_max_count=0)
+
+
+@pytest.mark.filesystem
+def test_batch_data_cache_eviction_releases_batch_data(tmp_path):
+    idx: int
+    for idx in range(3):
+        pd.DataFrame({"a": [idx, idx, idx]}).to_csv(
+            tmp_path / f"data_{idx}.csv", index=False
+        )
+
+    context = gx.get_context(mode="ephemeral")
+    asset = context.sources.add_pandas_filesystem(
+        name="my_pandas", base_directory=tmp_path
+    ).add_csv_asset(name="my_csv", batching_regex=r"data_(?P<idx>\d)\.csv")
+    batch_list = asset.get_batch_list_from_batch_request(asset.build_batch_request())
+    assert len(batch_list) == 3
+    batch_ids = [batch.id for batch in batch_list]
+    dataframe_refs = [weakref.ref(batch.data.dataframe) for batch in batch_list]
+
+    engine = PandasExecutionEngine(batch_data_cache_max_count=1)
+    batch_manager = engine.batch_manager
+    batch_manager.load_batch_list(batch_list=batch_list)
+    assert all(batch._data is None for batch in batch_manager.batch_cache.values())
+
+    del batch_list
+    gc.collect()
+
+    # Only BatchData of active Batch is held; other BatchData objects are released (and re-materialized on access).
+    assert [ref() is None for ref in dataframe_refs] == [True, True, False]
+    assert batch_manager.batch_data_cache[batch_ids[0]].dataframe["a"].to_list() == [
+        0,
+        0,
+        0,
+    ]
+    assert batch_manager.batch_data_cache.is_loaded(batch_ids[2])
+
+    batch_manager.batch_data_cache[batch_ids[1]]
+    gc.collect()
+
+    assert not batch_manager.batch_data_cache.is_loaded(batch_ids[0])
+    assert batch_manager.batch_data_cache.is_loaded(batch_ids[2])
+
+    # Batch "data" resolves through BatchData cache (re-materializing evicted BatchData).
+    assert batch_manager.active_batch.data.dataframe["a"].to_list() == [2, 2, 2]
+    assert batch_manager.batch_cache[batch_ids[0]].data.dataframe["a"].to_list() == [
+        0,
+        0,
+        0,
+    ]
+    assert batch_manager.batch_data_cache.is_loaded(batch_ids[0])
+
+
+@pytest.mark.filesystem
+def test_validator_exposes_dataframe_methods_with_batch_data_cache_budget(tmp_path):
+    pd.DataFrame({"a": [1, 2, 3]}).to_csv(tmp_path / "data_0.csv", index=False)
+
+    context = gx.get_context(mode="ephemeral")
+    asset = context.sources.add_pandas_filesystem(
+        name="my_pandas", base_directory=tmp_path
+    ).add_csv_asset(name="my_csv", batching_regex=r"data_(?P<idx>\d)\.csv")
+    batch_list = asset.get_batch_list_from_batch_request(asset.build_batch_request())
+
+    engine = PandasExecutionEngine(batch_data_cache_max_count=1)
+    validator = Validator(execution_engine=engine, batches=batch_list)
+
+    assert validator.active_batch.data is not None
+    assert validator.head()["a"].to_list() == [1, 2, 3]
+
+
+@pytest.mark.unit
+def test_get_domain_column_reuses_null_mask_and_non_null_values():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, None, 3, 4], "b": [2, 3, None, 5]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs: dict = {"row_condition": "a > 1", "condition_parser": "pandas"}
+    domain_records = engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+    column = engine.get_domain_column(
+        domain_records=domain_records,
+        domain_kwargs=domain_kwargs,
+        column_name="b",
+        filter_column_isnull=True,
+    )
+    assert column.to_list() == [5.0]
+    assert column.index.to_list() == [3]
+    assert (
+        engine.get_domain_column(
+            domain_records=domain_records,
+            domain_kwargs={**domain_kwargs, "batch_id": "1234"},
+            column_name="b",
+            filter_column_isnull=True,
+        )
+        is column
+    )
+
+    notnull_mask = engine.get_column_notnull_mask(
+        domain_records=domain_records, domain_kwargs=domain_kwargs, column_name="b"
+    )
+    assert notnull_mask.to_list() == [False, True]
+    assert (
+        engine.get_column_notnull_mask(
+            domain_records=domain_records,
+            domain_kwargs=domain_kwargs,
+            column_name="b",
+        )
+        is notnull_mask
+    )
+
+    # Unfiltered column is not copied; other row conditions and reloaded Batch data are filtered anew.
+    assert engine.get_domain_column(
+        domain_records=domain_records,
+        domain_kwargs=domain_kwargs,
+        column_name="b",
+        filter_column_isnull=False,
+    ).isnull().to_list() == [True, False]
+    assert engine.get_domain_column(
+        domain_records=engine.get_domain_records(domain_kwargs={}),
+        domain_kwargs={},
+        column_name="b",
+        filter_column_isnull=True,
+    ).to_list() == [2.0, 3.0, 5.0]
+
+    engine.load_batch_data(batch_data=df.copy(), batch_id="1234")
+    reloaded_domain_records = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert (
+        engine.get_domain_column(
+            domain_records=reloaded_domain_records,
+            domain_kwargs=domain_kwargs,
+            column_name="b",
+            filter_column_isnull=True,
+        )
+        is not column
+    )
+
+
 # Just checking that the Pandas Execution Engine can perform these in sequence
 @pytest.mark.unit
 def test_resolve_metric_bundle():
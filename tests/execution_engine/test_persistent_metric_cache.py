@@ -0,0 +1,362 @@
+from typing import Dict, Tuple
+
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility import aws
+from great_expectations.compatibility.sqlalchemy_compatibility_wrappers import (
+    add_dataframe_to_db,
+)
+from great_expectations.core.batch import Batch, BatchDefinition, BatchMarkers
+from great_expectations.core.batch_spec import PathBatchSpec, S3BatchSpec
+from great_expectations.core.id_dict import IDDict
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine import (
+    execution_engine as execution_engine_module,
+)
+from great_expectations.execution_engine import (
+    persistent_metric_cache as persistent_metric_cache_module,
+)
+from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.persistent_metric_cache import (
+    SqlitePersistentMetricCache,
+)
+from great_expectations.execution_engine.sqlalchemy_batch_data import (
+    SqlAlchemyBatchData,
+)
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+METRIC_ID_A: Tuple[str, str, str] = ("column.max", "column=a", "()")
+METRIC_ID_B: Tuple[str, str, str] = ("column.min", "column=a", "()")
+METRIC_ID_C: Tuple[str, str, str] = ("column.mean", "column=a", "()")
+
+
+@pytest.fixture
+def cache_file_path(tmp_path) -> str:
+    return str(tmp_path / "uncommitted" / "metric_cache.db")
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_persists_across_instances(cache_file_path):
+    cache = SqlitePersistentMetricCache(cache_file_path=cache_file_path)
+    cache.set_metrics(
+        batch_fingerprint="fingerprint",
+        metrics={METRIC_ID_A: 3, METRIC_ID_B: [1, 2]},
+    )
+
+    cache = SqlitePersistentMetricCache(cache_file_path=cache_file_path)
+    assert cache.get_metrics(
+        batch_fingerprint="fingerprint",
+        metric_ids=[METRIC_ID_A, METRIC_ID_B, METRIC_ID_C],
+    ) == {METRIC_ID_A: 3, METRIC_ID_B: [1, 2]}
+    assert (
+        cache.get_metrics(
+            batch_fingerprint="other_fingerprint", metric_ids=[METRIC_ID_A]
+        )
+        == {}
+    )
+
+    cache.clear()
+    assert (
+        cache.get_metrics(batch_fingerprint="fingerprint", metric_ids=[METRIC_ID_A])
+        == {}
+    )
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_ttl_eviction(cache_file_path, monkeypatch):
+    now: float = 1000.0
+    monkeypatch.setattr(persistent_metric_cache_module.time, "time", lambda: now)
+
+    cache = SqlitePersistentMetricCache(cache_file_path=cache_file_path, ttl_seconds=60)
+    cache.set_metrics(batch_fingerprint="fingerprint", metrics={METRIC_ID_A: 3})
+
+    now = 1059.0
+    assert cache.get_metrics(
+        batch_fingerprint="fingerprint", metric_ids=[METRIC_ID_A]
+    ) == {METRIC_ID_A: 3}
+
+    now = 1061.0
+    assert (
+        cache.get_metrics(batch_fingerprint="fingerprint", metric_ids=[METRIC_ID_A])
+        == {}
+    )
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_lru_eviction(cache_file_path, monkeypatch):
+    now: float = 1000.0
+    monkeypatch.setattr(persistent_metric_cache_module.time, "time", lambda: now)
+
+    cache = SqlitePersistentMetricCache(cache_file_path=cache_file_path, max_entries=2)
+    cache.set_metrics(batch_fingerprint="fingerprint", metrics={METRIC_ID_A: 1})
+    now = 1001.0
+    cache.set_metrics(batch_fingerprint="fingerprint", metrics={METRIC_ID_B: 2})
+
+    # Reading "METRIC_ID_A" makes "METRIC_ID_B" least recently used entry.
+    now = 1002.0
+    assert cache.get_metrics(
+        batch_fingerprint="fingerprint", metric_ids=[METRIC_ID_A]
+    ) == {METRIC_ID_A: 1}
+
+    now = 1003.0
+    cache.set_metrics(batch_fingerprint="fingerprint", metrics={METRIC_ID_C: 3})
+
+    assert cache.get_metrics(
+        batch_fingerprint="fingerprint",
+        metric_ids=[METRIC_ID_A, METRIC_ID_B, METRIC_ID_C],
+    ) == {METRIC_ID_A: 1, METRIC_ID_C: 3}
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_skips_large_and_unserializable_values(
+    cache_file_path,
+):
+    cache = SqlitePersistentMetricCache(
+        cache_file_path=cache_file_path, max_entry_size_bytes=1024
+    )
+    cache.set_metrics(
+        batch_fingerprint="fingerprint",
+        metrics={
+            METRIC_ID_A: list(range(10000)),
+            METRIC_ID_B: lambda x: x,
+            METRIC_ID_C: 3,
+        },
+    )
+
+    assert cache.get_metrics(
+        batch_fingerprint="fingerprint",
+        metric_ids=[METRIC_ID_A, METRIC_ID_B, METRIC_ID_C],
+    ) == {METRIC_ID_C: 3}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "cache_kwargs",
+    [
+        pytest.param({"max_entries": 0}, id="max_entries"),
+        pytest.param({"ttl_seconds": 0}, id="ttl_seconds"),
+    ],
+)
+def test_sqlite_persistent_metric_cache_invalid_config(cache_file_path, cache_kwargs):
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        SqlitePersistentMetricCache(cache_file_path=cache_file_path, **cache_kwargs)
+
+
+def _build_engine_with_batch(
+    cache_file_path: str, df: pd.DataFrame, pandas_data_fingerprint: str
+) -> PandasExecutionEngine:
+    engine = PandasExecutionEngine(
+        persistent_metric_cache={"cache_file_path": cache_file_path}
+    )
+    batch = Batch(
+        data=PandasBatchData(execution_engine=engine, dataframe=df),
+        batch_definition=BatchDefinition(
+            datasource_name="my_datasource",
+            data_connector_name="my_data_connector",
+            data_asset_name="my_asset",
+            batch_identifiers=IDDict({"day": "2024-01-01"}),
+        ),
+        batch_markers=BatchMarkers(
+            {
+                "ge_load_time": "20240102T000000.000000Z",
+                "pandas_data_fingerprint": pandas_data_fingerprint,
+            }
+        ),
+    )
+    engine.batch_manager.load_batch_list(batch_list=[batch])
+    return engine
+
+
+def _resolve_column_max(engine: PandasExecutionEngine) -> MetricValue:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    column_max_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_max_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(column_max_metric,), metrics=metrics
+    )
+    return results[column_max_metric.id]
+
+
+@pytest.mark.unit
+def test_resolve_metrics_uses_persistent_metric_cache_by_batch_fingerprint(
+    cache_file_path,
+):
+    engine = _build_engine_with_batch(
+        cache_file_path=cache_file_path,
+        df=pd.DataFrame({"a": [1, 2, 3]}),
+        pandas_data_fingerprint="fingerprint",
+    )
+    assert isinstance(engine.persistent_metric_cache, SqlitePersistentMetricCache)
+    assert engine.config["persistent_metric_cache"] == {
+        "cache_file_path": cache_file_path
+    }
+    assert _resolve_column_max(engine=engine) == 3
+
+    # Data having the same fingerprint is not recomputed by subsequent run (stored metric value is reused).
+    engine = _build_engine_with_batch(
+        cache_file_path=cache_file_path,
+        df=pd.DataFrame({"a": [4, 5, 6]}),
+        pandas_data_fingerprint="fingerprint",
+    )
+    assert _resolve_column_max(engine=engine) == 3
+
+    # Data having different fingerprint is computed.
+    engine = _build_engine_with_batch(
+        cache_file_path=cache_file_path,
+        df=pd.DataFrame({"a": [4, 5, 6]}),
+        pandas_data_fingerprint="other_fingerprint",
+    )
+    assert _resolve_column_max(engine=engine) == 6
+
+
+@pytest.mark.sqlite
+def test_sqlalchemy_execution_engine_uses_persistent_metric_cache(
+    sa, cache_file_path, monkeypatch
+):
+    # SQL Batch data is not fingerprinted by default.
+    monkeypatch.setattr(
+        SqlAlchemyExecutionEngine,
+        "_get_batch_fingerprint",
+        lambda self, batch_id: "fingerprint",
+    )
+
+    def _build_sa_engine_with_batch(df: pd.DataFrame) -> SqlAlchemyExecutionEngine:
+        sqlalchemy_engine = sa.create_engine("sqlite://")
+        add_dataframe_to_db(df=df, name="test", con=sqlalchemy_engine, index=False)
+        engine = SqlAlchemyExecutionEngine(
+            engine=sqlalchemy_engine,
+            persistent_metric_cache={"cache_file_path": cache_file_path},
+        )
+        engine.load_batch_data(
+            "1234", SqlAlchemyBatchData(execution_engine=engine, table_name="test")
+        )
+        return engine
+
+    engine = _build_sa_engine_with_batch(df=pd.DataFrame({"a": [1, 2, 3]}))
+    assert isinstance(engine.persistent_metric_cache, SqlitePersistentMetricCache)
+    assert engine.config["persistent_metric_cache"] == {
+        "cache_file_path": cache_file_path
+    }
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    assert results[table_columns_metric.id] == ["a"]
+
+    engine = _build_sa_engine_with_batch(df=pd.DataFrame({"b": [4, 5, 6]}))
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    assert results[table_columns_metric.id] == ["a"]
+
+
+@pytest.mark.sqlite
+def test_sqlalchemy_execution_engine_caching_is_not_passed_to_sqlalchemy(
+    cache_file_path,
+):
+    engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://",
+        caching=False,
+        persistent_metric_cache={"cache_file_path": cache_file_path},
+    )
+    assert not engine._caching
+    assert isinstance(engine.persistent_metric_cache, SqlitePersistentMetricCache)
+
+
+@pytest.mark.unit
+def test_get_batch_fingerprint_from_local_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n")
+
+    engine = PandasExecutionEngine()
+    batch = Batch(
+        data=PandasBatchData(
+            execution_engine=engine, dataframe=pd.DataFrame({"a": [1]})
+        ),
+        batch_spec=PathBatchSpec(path=str(path), reader_method="read_csv"),
+    )
+    engine.batch_manager.load_batch_list(batch_list=[batch])
+
+    batch_fingerprint = engine._get_batch_fingerprint(batch_id=batch.id)
+    assert batch_fingerprint is not None
+    assert engine._get_batch_fingerprint(batch_id=None) == batch_fingerprint
+
+    path.write_text("a\n1\n2\n")
+    assert engine._get_batch_fingerprint(batch_id=batch.id) != batch_fingerprint
+
+
+@pytest.mark.skipif(
+    not aws.boto3,
+    reason="Unable to load AWS connection object. Please install boto3 and botocore.",
+)
+@pytest.mark.big
+def test_get_batch_fingerprint_from_s3_object_etag(s3_bucket, monkeypatch):
+    # Object is uploaded as is (newer botocore would otherwise send it with checksum trailer, which moto 2 stores).
+    monkeypatch.setenv("AWS_REQUEST_CHECKSUM_CALCULATION", "when_required")
+    s3 = aws.boto3.client("s3", region_name="us-east-1")
+    s3.put_object(Bucket=s3_bucket, Key="data.csv", Body=b"a\n1\n")
+
+    engine = PandasExecutionEngine()
+    batch = Batch(
+        data=PandasBatchData(
+            execution_engine=engine, dataframe=pd.DataFrame({"a": [1]})
+        ),
+        batch_spec=S3BatchSpec(
+            path=f"s3a://{s3_bucket}/data.csv", reader_method="read_csv"
+        ),
+    )
+    engine.batch_manager.load_batch_list(batch_list=[batch])
+
+    batch_fingerprint = engine._get_batch_fingerprint(batch_id=batch.id)
+    assert batch_fingerprint is not None
+    assert engine._get_batch_fingerprint(batch_id=batch.id) == batch_fingerprint
+
+    s3.put_object(Bucket=s3_bucket, Key="data.csv", Body=b"a\n1\n2\n")
+    assert engine._get_batch_fingerprint(batch_id=batch.id) != batch_fingerprint
+
+
+@pytest.mark.sqlite
+def test_metric_cache_fingerprint_depends_on_execution_engine_and_version(
+    monkeypatch,
+):
+    for execution_engine_class in (PandasExecutionEngine, SqlAlchemyExecutionEngine):
+        monkeypatch.setattr(
+            execution_engine_class,
+            "_get_batch_fingerprint",
+            lambda self, batch_id: "fingerprint",
+        )
+
+    pandas_engine = PandasExecutionEngine()
+    sa_engine = SqlAlchemyExecutionEngine(connection_string="sqlite://")
+
+    metric_cache_fingerprint = pandas_engine._get_metric_cache_fingerprint(
+        batch_id=None
+    )
+    assert metric_cache_fingerprint is not None
+    # The same data is not shared by different ExecutionEngine classes.
+    assert (
+        sa_engine._get_metric_cache_fingerprint(batch_id=None)
+        != metric_cache_fingerprint
+    )
+
+    # Metric values, computed by previous versions of Great Expectations, are not reused.
+    monkeypatch.setattr(execution_engine_module, "ge_version", "0.0.0")
+    assert (
+        pandas_engine._get_metric_cache_fingerprint(batch_id=None)
+        != metric_cache_fingerprint
+    )
@@ -0,0 +1,97 @@
+from unittest import mock
+
+import pytest
+
+from great_expectations.execution_engine import SparkDFExecutionEngine
+from great_expectations.execution_engine.sparkdf_batch_data import SparkDFBatchData
+
+
+@pytest.fixture
+def spark_engine_with_mocked_filtering() -> SparkDFExecutionEngine:
+    execution_engine = SparkDFExecutionEngine(spark=mock.MagicMock(), persist=False)
+    execution_engine._filter_by_row_conditions = mock.MagicMock(  # type: ignore[method-assign]
+        side_effect=lambda data, domain_kwargs: mock.MagicMock()
+    )
+    return execution_engine
+
+
+def _load_batch_data(execution_engine: SparkDFExecutionEngine, batch_id: str) -> None:
+    execution_engine.load_batch_data(
+        batch_id=batch_id,
+        batch_data=SparkDFBatchData(
+            execution_engine=execution_engine, dataframe=mock.MagicMock()
+        ),
+    )
+
+
+@pytest.mark.unit
+def test_filtered_domain_data_is_shared_by_domains_with_same_conditions(
+    spark_engine_with_mocked_filtering,
+):
+    execution_engine = spark_engine_with_mocked_filtering
+    _load_batch_data(execution_engine=execution_engine, batch_id="batch_1")
+
+    domain_kwargs = {"row_condition": 'col("a")>0', "condition_parser": "spark"}
+    domain_records = execution_engine.get_domain_records(
+        domain_kwargs={**domain_kwargs, "column": "a"}
+    )
+
+    assert (
+        execution_engine.get_domain_records(
+            domain_kwargs={**domain_kwargs, "column": "b", "batch_id": "batch_1"}
+        )
+        is domain_records
+    )
+    assert execution_engine._filter_by_row_conditions.call_count == 1
+    assert list(execution_engine._filtered_domain_data) == ["batch_1"]
+    assert list(execution_engine._filtered_domain_data["batch_1"]) == [
+        ('col("a")>0', "spark", ())
+    ]
+
+
+@pytest.mark.unit
+def test_filtered_domain_data_is_released_when_batch_data_is_loaded(
+    spark_engine_with_mocked_filtering,
+):
+    execution_engine = spark_engine_with_mocked_filtering
+    domain_kwargs = {"row_condition": 'col("a")>0', "condition_parser": "spark"}
+
+    _load_batch_data(execution_engine=execution_engine, batch_id="batch_1")
+    execution_engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert list(execution_engine._filtered_domain_data) == ["batch_1"]
+
+    # Reloading data of Batch releases DataFrames filtered from its previous data.
+    _load_batch_data(execution_engine=execution_engine, batch_id="batch_1")
+    assert execution_engine._filtered_domain_data == {}
+    execution_engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+    # Loading data of another Batch (which becomes active) releases DataFrames filtered from all other Batches.
+    _load_batch_data(execution_engine=execution_engine, batch_id="batch_2")
+    assert execution_engine._filtered_domain_data == {}
+    execution_engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+    assert list(execution_engine._filtered_domain_data) == ["batch_2"]
+    assert execution_engine._filter_by_row_conditions.call_count == 3
+
+
+@pytest.mark.unit
+def test_filtered_domain_data_is_released_when_batch_data_is_unloaded(
+    spark_engine_with_mocked_filtering,
+):
+    execution_engine = spark_engine_with_mocked_filtering
+    domain_kwargs = {"row_condition": 'col("a")>0', "condition_parser": "spark"}
+
+    _load_batch_data(execution_engine=execution_engine, batch_id="batch_1")
+    _load_batch_data(execution_engine=execution_engine, batch_id="batch_2")
+    for batch_id in ("batch_1", "batch_2"):
+        execution_engine.get_domain_records(
+            domain_kwargs={**domain_kwargs, "batch_id": batch_id}
+        )
+
+    # Eviction of Batch data from BatchData cache unloads it (see "BatchManager").
+    execution_engine.unload_batch_data(
+        batch_id="batch_1",
+        batch_data=execution_engine.batch_manager.batch_data_cache["batch_1"],
+    )
+
+    assert list(execution_engine._filtered_domain_data) == ["batch_2"]
@@ -1,6 +1,7 @@
+import concurrent.futures
 import logging
 import os
-from typing import Dict, Tuple, cast
+from typing import Dict, List, Set, Tuple, cast
 from unittest import mock
 
 import pandas as pd
@@ -22,6 +23,9 @@ from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -40,6 +44,7 @@ from great_expectations.self_check.util import build_sa_execution_engine
 from great_expectations.util import get_sqlalchemy_domain_data
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
 from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 from tests.test_utils import (
@@ -1141,6 +1146,497 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(sa)
         assert False, str(e)
 
 
+@pytest.mark.sqlite
+@pytest.mark.parametrize("max_query_concurrency", [1, 4])
+def test_resolve_metric_bundle_with_max_query_concurrency(
+    sa, tmp_path, max_query_concurrency
+):
+    """
+    Insures that bundled queries (one per compute domain) produce same results whether executed sequentially or on
+    concurrent connections drawn from the engine's pool.  File-based sqlite with non-static pool stands in for a
+    dialect that does not require persisted connection.
+    """
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 1, 2, 2, 2]}),
+        name="test",
+        con=sqlalchemy_engine,
+        index=False,
+    )
+    batch_data = SqlAlchemyBatchData(
+        execution_engine=SqlAlchemyExecutionEngine(engine=sqlalchemy_engine),
+        table_name="test",
+    )
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        batch_data_dict={"1234": batch_data},
+        max_query_concurrency=max_query_concurrency,
+    )
+    assert execution_engine.max_query_concurrency == max_query_concurrency
+
+    metric_fn_bundle = []
+    expected_results = {}
+    for b_value, expected_max in ((1, 3), (2, 6)):
+        metric_configuration = MetricConfiguration(
+            metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs={
+                "column": "a",
+                "row_condition": f'col("b")=={b_value}',
+                "condition_parser": "great_expectations__experimental__",
+            },
+        )
+        metric_fn_bundle.append(
+            MetricComputationConfiguration(
+                metric_configuration=metric_configuration,
+                metric_fn=sa.func.max(sa.column("a")),
+                metric_provider_kwargs={},
+                compute_domain_kwargs={
+                    "batch_id": "1234",
+                    "row_condition": f'col("b")=={b_value}',
+                    "condition_parser": "great_expectations__experimental__",
+                },
+            )
+        )
+        expected_results[metric_configuration.id] = expected_max
+
+    with mock.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    ), mock.patch(
+        "concurrent.futures.ThreadPoolExecutor",
+        wraps=concurrent.futures.ThreadPoolExecutor,
+    ) as mock_thread_pool_executor:
+        results = execution_engine.resolve_metric_bundle(
+            metric_fn_bundle=metric_fn_bundle
+        )
+
+    assert results == expected_results
+    assert mock_thread_pool_executor.called is (max_query_concurrency > 1)
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_with_max_query_concurrency_reads_temp_tables_on_their_connection(
+    sa, tmp_path
+):
+    """
+    Insures that bundled queries on temporary tables (visible only to connection that created them) are executed on
+    persisted connection of the engine (through "execute_query()"), while only the other bundled queries are executed
+    on concurrent connections.  File-based sqlite (whose temporary tables are connection-local) with non-static pool
+    stands in for a dialect that does not require persisted connection.
+    """
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 1, 2, 2, 2]}),
+        name="test",
+        con=sqlalchemy_engine,
+        index=False,
+    )
+
+    with mock.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    ):
+        execution_engine = SqlAlchemyExecutionEngine(
+            engine=sqlalchemy_engine, max_query_concurrency=4
+        )
+        temp_table_batch_data = SqlAlchemyBatchData(
+            execution_engine=execution_engine,
+            query="SELECT * FROM test",
+            create_temp_table=True,
+        )
+        table_batch_data = SqlAlchemyBatchData(
+            execution_engine=execution_engine, table_name="test"
+        )
+        assert temp_table_batch_data.is_temp_table
+        assert not table_batch_data.is_temp_table
+        execution_engine.load_batch_data("temp_table", temp_table_batch_data)
+        execution_engine.load_batch_data("table", table_batch_data)
+
+        metric_fn_bundle = []
+        expected_results = {}
+        for batch_id in ("temp_table", "table"):
+            for b_value, expected_max in ((1, 3), (2, 6)):
+                domain_kwargs = {
+                    "batch_id": batch_id,
+                    "row_condition": f'col("b")=={b_value}',
+                    "condition_parser": "great_expectations__experimental__",
+                }
+                metric_configuration = MetricConfiguration(
+                    metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+                    metric_domain_kwargs={"column": "a", **domain_kwargs},
+                )
+                metric_fn_bundle.append(
+                    MetricComputationConfiguration(
+                        metric_configuration=metric_configuration,
+                        metric_fn=sa.func.max(sa.column("a")),
+                        metric_provider_kwargs={},
+                        compute_domain_kwargs=domain_kwargs,
+                    )
+                )
+                expected_results[metric_configuration.id] = expected_max
+
+        with mock.patch(
+            "concurrent.futures.ThreadPoolExecutor",
+            wraps=concurrent.futures.ThreadPoolExecutor,
+        ) as mock_thread_pool_executor, mock.patch.object(
+            execution_engine,
+            "execute_query",
+            wraps=execution_engine.execute_query,
+        ) as mock_execute_query:
+            results = execution_engine.resolve_metric_bundle(
+                metric_fn_bundle=metric_fn_bundle
+            )
+
+    assert results == expected_results
+    assert mock_thread_pool_executor.called
+    # Only the two queries on temporary table are executed on persisted connection.
+    assert mock_execute_query.call_count == 2
+
+    execution_engine.close()
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "fuse_row_condition_queries,use_filter_clause",
+    [
+        pytest.param(False, False, id="not_fused"),
+        pytest.param(True, True, id="fused_using_filter_clause"),
+        pytest.param(True, False, id="fused_using_case_expressions"),
+    ],
+)
+def test_resolve_metric_bundle_with_fused_row_condition_queries(
+    caplog, sa, fuse_row_condition_queries, use_filter_clause
+):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame(
+            {"a": [1, 2, 3, 4, 5, 6, None], "b": [1, 1, 1, 2, 2, 2, 2]},
+        ),
+        sa,
+        batch_id="1234",
+    )
+    execution_engine._fuse_row_condition_queries = fuse_row_condition_queries
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(
+        execution_engine=execution_engine
+    )
+    metrics.update(results)
+
+    row_conditions = [None, 'col("b")==1', 'col("b")==2', 'col("b")==3']
+    expected_results = {
+        # (row_condition, metric_name): expected value
+        (None, "column.max"): 6,
+        (None, "column.min"): 1,
+        (None, "table.row_count"): 7,
+        ('col("b")==1', "column.max"): 3,
+        ('col("b")==1', "column.min"): 1,
+        ('col("b")==1', "table.row_count"): 3,
+        ('col("b")==2', "column.max"): 6,
+        ('col("b")==2', "column.min"): 4,
+        ('col("b")==2', "table.row_count"): 4,
+        ('col("b")==3', "column.max"): None,
+        ('col("b")==3', "column.min"): None,
+        ('col("b")==3', "table.row_count"): 0,
+    }
+
+    aggregate_fn_metrics = {}
+    for row_condition in row_conditions:
+        condition_kwargs = (
+            {}
+            if row_condition is None
+            else {
+                "row_condition": row_condition,
+                "condition_parser": "great_expectations__experimental__",
+            }
+        )
+        for metric_name in ("column.max", "column.min", "table.row_count"):
+            domain_kwargs = {"batch_id": "1234", **condition_kwargs}
+            if metric_name != "table.row_count":
+                domain_kwargs["column"] = "a"
+            aggregate_fn_metric = MetricConfiguration(
+                metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+                metric_domain_kwargs=domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            aggregate_fn_metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            aggregate_fn_metrics[(row_condition, metric_name)] = aggregate_fn_metric
+
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=tuple(aggregate_fn_metrics.values()),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
+    desired_metrics = {}
+    for key, aggregate_fn_metric in aggregate_fn_metrics.items():
+        desired_metric = MetricConfiguration(
+            metric_name=key[1],
+            metric_domain_kwargs=aggregate_fn_metric.metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics[key] = desired_metric
+
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    with mock.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine.dialect_supports_aggregate_filter_clause",
+        return_value=use_filter_clause,
+    ):
+        results = execution_engine.resolve_metrics(
+            metrics_to_resolve=tuple(desired_metrics.values()),
+            metrics=metrics,
+        )
+
+    assert {
+        key: results[desired_metric.id]
+        for key, desired_metric in desired_metrics.items()
+    } == expected_results
+
+    executed_queries = [
+        record.message
+        for record in caplog.records
+        if record.message.startswith("SqlAlchemyExecutionEngine computed")
+    ]
+    if fuse_row_condition_queries:
+        assert executed_queries == [
+            "SqlAlchemyExecutionEngine computed 12 metrics on domain_id batch_id=1234"
+        ]
+        assert ("FILTER (WHERE" in caplog.text) is use_filter_clause
+    else:
+        assert len(executed_queries) == len(row_conditions)
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "temp_table_materialization_threshold,materialized",
+    [
+        pytest.param(1, True, id="threshold_reached"),
+        pytest.param(2, False, id="threshold_not_reached"),
+    ],
+)
+def test_plan_metric_resolution_materializes_row_condition_domain(
+    sa, temp_table_materialization_threshold, materialized
+):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame(
+            {"a": [1, 2, 3, 4, 5, 6, None], "b": [1, 1, 1, 2, 2, 2, 2]},
+        ),
+        sa,
+        batch_id="1234",
+    )
+    execution_engine._temp_table_materialization_threshold = (
+        temp_table_materialization_threshold
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(
+        execution_engine=execution_engine
+    )
+    metrics.update(results)
+
+    domain_kwargs = {
+        "batch_id": "1234",
+        "column": "a",
+        "row_condition": 'col("b")==2',
+        "condition_parser": "great_expectations__experimental__",
+    }
+    aggregate_fn_metrics = {}
+    desired_metrics = {}
+    for metric_name in ("column.max", "column.min"):
+        aggregate_fn_metric = MetricConfiguration(
+            metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        aggregate_fn_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        aggregate_fn_metrics[metric_name] = aggregate_fn_metric
+        desired_metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics[metric_name] = desired_metric
+
+    # Both aggregates are bundled into one query; partial metric functions execute no queries.
+    execution_engine.plan_metric_resolution(
+        metrics_to_resolve=[*aggregate_fn_metrics.values(), *desired_metrics.values()]
+    )
+
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=tuple(aggregate_fn_metrics.values()),
+        metrics=metrics,
+    )
+    metrics.update(results)
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=tuple(desired_metrics.values()),
+        metrics=metrics,
+    )
+
+    assert {
+        metric_name: results[desired_metric.id]
+        for metric_name, desired_metric in desired_metrics.items()
+    } == {"column.max": 6, "column.min": 4}
+
+    assert (len(execution_engine._materialized_domain_tables) == 1) is materialized
+    assert (
+        isinstance(
+            execution_engine.get_domain_records(domain_kwargs=domain_kwargs), sa.Table
+        )
+        is materialized
+    )
+    # Tables are only scanned, so domains without "row_condition" are never materialized.
+    assert (
+        execution_engine._get_materialized_domain_key(
+            domain_kwargs={"batch_id": "1234", "column": "a"}
+        )
+        is None
+    )
+
+    execution_engine.close()
+    assert execution_engine._materialized_domain_tables == {}
+
+
+@pytest.mark.sqlite
+def test_materialized_domains_with_max_query_concurrency(sa, tmp_path):
+    """
+    Insures that domains materialized into temporary tables are neither fused into queries over their base domain nor
+    queried on concurrent connections (which cannot see temporary tables), while other domains still are.  File-based
+    sqlite (whose temporary tables are connection-local) with non-static pool stands in for a dialect that does not
+    require persisted connection.
+    """
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 1, 2, 2, 2]}),
+        name="test",
+        con=sqlalchemy_engine,
+        index=False,
+    )
+
+    with mock.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    ):
+        execution_engine = SqlAlchemyExecutionEngine(
+            engine=sqlalchemy_engine,
+            max_query_concurrency=2,
+            fuse_row_condition_queries=True,
+            temp_table_materialization_threshold=1,
+        )
+        execution_engine.load_batch_data(
+            "1234",
+            SqlAlchemyBatchData(execution_engine=execution_engine, table_name="test"),
+        )
+
+        metric_fn_bundle = []
+        desired_metrics = []
+        expected_results = {}
+        for column_name, compute_domain_kwargs, expected_max in (
+            (
+                "a",
+                {
+                    "batch_id": "1234",
+                    "row_condition": 'col("b")==1',
+                    "condition_parser": "great_expectations__experimental__",
+                },
+                3,
+            ),
+            (
+                "a",
+                {
+                    "batch_id": "1234",
+                    "row_condition": 'col("b")==2',
+                    "condition_parser": "great_expectations__experimental__",
+                },
+                6,
+            ),
+            ("a", {"batch_id": "1234"}, 6),
+            ("b", {"batch_id": "1234", "column": "b"}, 2),
+        ):
+            metric_configuration = MetricConfiguration(
+                metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+                metric_domain_kwargs={"column": column_name, **compute_domain_kwargs},
+            )
+            metric_fn_bundle.append(
+                MetricComputationConfiguration(
+                    metric_configuration=metric_configuration,
+                    metric_fn=sa.func.max(sa.column(column_name)),
+                    metric_provider_kwargs={},
+                    compute_domain_kwargs=compute_domain_kwargs,
+                )
+            )
+            expected_results[metric_configuration.id] = expected_max
+            desired_metric = MetricConfiguration(
+                metric_name="column.max",
+                metric_domain_kwargs=metric_configuration.metric_domain_kwargs,
+            )
+            desired_metric.metric_dependencies = {
+                "metric_partial_fn": metric_configuration
+            }
+            desired_metrics.append(desired_metric)
+
+        execution_engine.plan_metric_resolution(
+            metrics_to_resolve=[
+                *(
+                    metric_computation_configuration.metric_configuration
+                    for metric_computation_configuration in metric_fn_bundle
+                ),
+                *desired_metrics,
+            ]
+        )
+
+        with mock.patch(
+            "concurrent.futures.ThreadPoolExecutor",
+            wraps=concurrent.futures.ThreadPoolExecutor,
+        ) as mock_thread_pool_executor:
+            results = execution_engine.resolve_metric_bundle(
+                metric_fn_bundle=metric_fn_bundle
+            )
+
+    assert results == expected_results
+    # Both "row_condition" domains are materialized (rather than fused); the other two domains are queried concurrently.
+    assert len(execution_engine._materialized_domain_tables) == 2
+    assert mock_thread_pool_executor.called
+
+    execution_engine.close()
+    assert execution_engine._materialized_domain_tables == {}
+
+
+@pytest.mark.unit
+def test_temp_table_materialization_threshold_must_be_positive(sa):
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        SqlAlchemyExecutionEngine(
+            connection_string="sqlite://", temp_table_materialization_threshold=0
+        )
+
+
+@pytest.mark.unit
+def test_max_query_concurrency_must_be_positive(sa):
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        SqlAlchemyExecutionEngine(
+            connection_string="sqlite://", max_query_concurrency=0
+        )
+
+
 @pytest.mark.sqlite
 def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
@@ -1407,3 +1903,126 @@ class TestDialectRequiresPersistedConnection:
                 connection_string=connection_string,
                 url=url,
             )
+
+
+@pytest.mark.sqlite
+def test_copy_for_concurrent_use(sa, tmp_path):
+    connection_string = f"sqlite:///{tmp_path / 'copy.db'}"
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=connection_string,
+        create_temp_table=False,
+        temp_table_materialization_threshold=2,
+        connect_args={"timeout": 10},
+    )
+    execution_engine.load_batch_data(
+        batch_id="1234", batch_data=execution_engine.engine
+    )
+
+    # Dialect requiring persisted connection gets new SQLAlchemy engine (and connection), created with same options.
+    execution_engine_copy = execution_engine.copy_for_concurrent_use()
+    assert isinstance(execution_engine_copy, SqlAlchemyExecutionEngine)
+    assert execution_engine_copy.engine is not execution_engine.engine
+    assert str(execution_engine_copy.engine.url) == connection_string
+    assert execution_engine_copy.config == execution_engine.config
+    assert execution_engine_copy._create_temp_table is False
+    assert execution_engine_copy._temp_table_materialization_threshold == 2
+    assert execution_engine_copy.batch_manager.loaded_batch_ids == []
+
+    # Connection of in-memory database cannot be replaced without losing its data.
+    assert (
+        SqlAlchemyExecutionEngine(
+            connection_string="sqlite://"
+        ).copy_for_concurrent_use()
+        is None
+    )
+    assert (
+        SqlAlchemyExecutionEngine(
+            engine=sa.create_engine(connection_string)
+        ).copy_for_concurrent_use()
+        is None
+    )
+
+
+def _compute_unexpected_values_metrics(
+    sa, fuse_unexpected_values_queries: bool, fail_column: bool = False
+) -> Tuple[List[MetricValue], Set[str], int]:
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame(
+            {"a": [1, 2, 3, None], "b_failing": [2, 2, 4, 5], "c": [1, 1, 1, 1]}
+        ),
+        sa,
+    )
+    execution_engine._fuse_unexpected_values_queries = fuse_unexpected_values_queries
+    metric_configurations = [
+        MetricConfiguration(
+            metric_name="column_values.in_set.unexpected_values",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={
+                "value_set": [1, 2],
+                "result_format": {
+                    "result_format": "SUMMARY",
+                    "partial_unexpected_count": 20,
+                },
+            },
+        )
+        for column in ("a", "b_failing", "c")
+    ]
+
+    execute_query = execution_engine.execute_query
+
+    def _execute_query(query):
+        if fail_column and "b_failing" in str(query):
+            raise ValueError('Column "b_failing" cannot be queried.')
+
+        return execute_query(query)
+
+    with mock.patch.object(
+        execution_engine, "execute_query", side_effect=_execute_query
+    ) as mock_execute_query:
+        resolved_metrics, aborted_metrics = MetricsCalculator(
+            execution_engine=execution_engine
+        ).compute_metrics(metric_configurations=metric_configurations)
+
+    return (
+        [
+            resolved_metrics.get(metric_configuration.id)
+            for metric_configuration in metric_configurations
+        ],
+        {
+            aborted_metric_info["metric_configuration"].metric_domain_kwargs["column"]
+            for aborted_metric_info in aborted_metrics.values()
+        },
+        mock_execute_query.call_count,
+    )
+
+
+@pytest.mark.sqlite
+def test_fused_unexpected_values_queries_resolve_same_metrics_as_unfused_queries(sa):
+    (
+        unfused_metrics,
+        unfused_aborted_metrics,
+        unfused_num_queries,
+    ) = _compute_unexpected_values_metrics(sa, fuse_unexpected_values_queries=False)
+    (
+        fused_metrics,
+        fused_aborted_metrics,
+        fused_num_queries,
+    ) = _compute_unexpected_values_metrics(sa, fuse_unexpected_values_queries=True)
+
+    assert unfused_metrics == [[3.0], [4, 5], []]
+    assert fused_metrics == unfused_metrics
+    assert fused_aborted_metrics == unfused_aborted_metrics == set()
+    assert fused_num_queries == unfused_num_queries - 2
+
+
+@pytest.mark.sqlite
+def test_failing_fused_unexpected_values_query_does_not_fail_other_metrics(sa):
+    fused_metrics, fused_aborted_metrics, _ = _compute_unexpected_values_metrics(
+        sa, fuse_unexpected_values_queries=True, fail_column=True
+    )
+    unfused_metrics, unfused_aborted_metrics, _ = _compute_unexpected_values_metrics(
+        sa, fuse_unexpected_values_queries=False, fail_column=True
+    )
+
+    assert fused_metrics == unfused_metrics == [[3.0], None, []]
+    assert fused_aborted_metrics == unfused_aborted_metrics == {"b_failing"}
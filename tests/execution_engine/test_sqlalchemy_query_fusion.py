@@ -0,0 +1,120 @@
+import pytest
+
+from great_expectations.execution_engine.sqlalchemy_query_fusion import (
+    apply_row_condition_to_metric_fn,
+    dialect_supports_aggregate_filter_clause,
+    is_fusable_metric_fn,
+)
+
+sa = pytest.importorskip("sqlalchemy")
+
+
+def _compile(expression) -> str:
+    return str(expression.compile(compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_fn",
+    [
+        pytest.param(sa.func.max(sa.column("a")), id="max"),
+        pytest.param(sa.func.count(), id="count_star"),
+        pytest.param(sa.func.count(sa.distinct(sa.column("a"))), id="count_distinct"),
+        pytest.param(sa.func.max(sa.func.length(sa.column("a"))), id="nested"),
+        pytest.param(
+            sa.func.sum(sa.case((sa.column("a") > 5, 1), else_=0)), id="sum_case"
+        ),
+        pytest.param(
+            sa.func.sqrt(
+                sa.func.sum(sa.column("a") * sa.column("a"))
+                / (sa.func.count(sa.column("a")) - 1)
+            ),
+            id="expression_over_aggregates",
+        ),
+        pytest.param(sa.func.min(sa.column("a")).label("column.min"), id="label"),
+    ],
+)
+def test_is_fusable_metric_fn_recognized_aggregates(metric_fn):
+    assert is_fusable_metric_fn(metric_fn=metric_fn)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_fn",
+    [
+        pytest.param(sa.column("a"), id="bare_column"),
+        pytest.param(sa.func.approx_distinct(sa.column("a")), id="unknown_aggregate"),
+        pytest.param(
+            sa.func.percentile_disc(0.5).within_group(sa.column("a").asc()),
+            id="within_group",
+        ),
+        pytest.param(sa.func.max(sa.column("a")).over(), id="window"),
+        pytest.param(sa.text("max(a)"), id="text"),
+        pytest.param(None, id="not_an_expression"),
+    ],
+)
+def test_is_fusable_metric_fn_rejects_non_rewritable_expressions(metric_fn):
+    assert not is_fusable_metric_fn(metric_fn=metric_fn)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_fn,use_filter_clause,expected",
+    [
+        pytest.param(
+            sa.func.max(sa.column("a")),
+            True,
+            "max(a) FILTER (WHERE b = 1)",
+            id="filter_clause",
+        ),
+        pytest.param(
+            sa.func.max(sa.column("a")),
+            False,
+            "max(CASE WHEN (b = 1) THEN a END)",
+            id="case_expression",
+        ),
+        pytest.param(
+            sa.func.count(),
+            False,
+            "count(CASE WHEN (b = 1) THEN 1 END)",
+            id="count_star",
+        ),
+        pytest.param(
+            sa.func.count(sa.distinct(sa.column("a"))),
+            False,
+            "count(DISTINCT CASE WHEN (b = 1) THEN a END)",
+            id="count_distinct",
+        ),
+        pytest.param(
+            sa.func.max(sa.func.length(sa.column("a"))),
+            False,
+            "max(CASE WHEN (b = 1) THEN length(a) END)",
+            id="nested_function_argument",
+        ),
+    ],
+)
+def test_apply_row_condition_to_metric_fn(metric_fn, use_filter_clause, expected):
+    original_sql: str = _compile(metric_fn)
+
+    rewritten = apply_row_condition_to_metric_fn(
+        metric_fn=metric_fn,
+        row_condition=sa.column("b") == 1,
+        use_filter_clause=use_filter_clause,
+    )
+
+    assert _compile(rewritten) == expected
+    assert _compile(metric_fn) == original_sql
+
+
+@pytest.mark.unit
+def test_dialect_supports_aggregate_filter_clause():
+    from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+    assert dialect_supports_aggregate_filter_clause(dialect=postgresql.dialect())
+    assert not dialect_supports_aggregate_filter_clause(dialect=mysql.dialect())
+
+    sqlite_dialect = sqlite.dialect()
+    sqlite_dialect.server_version_info = (3, 29, 0)
+    assert not dialect_supports_aggregate_filter_clause(dialect=sqlite_dialect)
+    sqlite_dialect.server_version_info = (3, 30, 0)
+    assert dialect_supports_aggregate_filter_clause(dialect=sqlite_dialect)
@@ -0,0 +1,55 @@
+import pytest
+
+from great_expectations.execution_engine.sqlalchemy_sample_query_fusion import (
+    build_fused_sample_query,
+    get_selected_column_names,
+    split_fused_sample_query_rows,
+)
+
+sa = pytest.importorskip("sqlalchemy")
+
+
+@pytest.fixture
+def sqlite_engine_with_table():
+    engine = sa.create_engine("sqlite://")
+    metadata = sa.MetaData()
+    table = sa.Table("t", metadata, sa.Column("a", sa.Integer))
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"a": value} for value in range(1, 6)])
+
+    return engine, table
+
+
+@pytest.mark.unit
+def test_get_selected_column_names():
+    query = sa.select(sa.column("a"), sa.column("b"))
+    assert get_selected_column_names(query) == ("a", "b")
+
+
+@pytest.mark.unit
+def test_get_selected_column_names_rejects_duplicate_names():
+    query = sa.select(sa.column("a"), sa.column("a"))
+    assert get_selected_column_names(query) is None
+
+
+@pytest.mark.sqlite
+def test_fused_sample_query_preserves_per_branch_filters_and_limits(
+    sqlite_engine_with_table,
+):
+    engine, table = sqlite_engine_with_table
+    queries = [
+        sa.select(table.c.a).where(table.c.a > 1).order_by(table.c.a).limit(2),
+        sa.select(table.c.a).where(table.c.a < 3).order_by(table.c.a).limit(5),
+        sa.select(table.c.a).where(table.c.a > 10).limit(5),
+    ]
+
+    with engine.connect() as connection:
+        rows = connection.execute(build_fused_sample_query(queries)).fetchall()
+
+    rows_by_branch = split_fused_sample_query_rows(rows=rows, num_branches=3)
+    assert [sorted(row[0] for row in branch) for branch in rows_by_branch] == [
+        [2, 3],
+        [1, 2],
+        [],
+    ]
@@ -260,6 +260,65 @@ def test_pd_unexpected_index_list_metric_with_id_pk_without_column_values(
         ]
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "exclude_unexpected_values,expected_unexpected_index_list",
+    [
+        pytest.param(
+            False,
+            [
+                {"animals": "giraffe", "pk_1": 3, "pk_2": "three"},
+                {"animals": "lion", "pk_1": 4, "pk_2": "four"},
+            ],
+            id="with_column_values",
+        ),
+        pytest.param(
+            True,
+            [
+                {"pk_1": [3, 4, 5], "pk_2": ["three", "four", "five"]},
+            ],
+            id="without_column_values",
+        ),
+    ],
+)
+def test_pd_unexpected_index_list_metric_with_id_pk_summary(
+    animal_table_df, exclude_unexpected_values, expected_unexpected_index_list
+):
+    df: pd.DataFrame = animal_table_df
+    metric_value_kwargs: dict = {
+        "value_set": ["cat", "fish", "dog"],
+        "parse_strings_as_datetimes": False,
+        "result_format": {
+            "result_format": "SUMMARY",
+            "unexpected_index_column_names": ["pk_1", "pk_2"],
+            "partial_unexpected_count": 2,
+            "include_unexpected_rows": False,
+            "exclude_unexpected_values": exclude_unexpected_values,
+        },
+    }
+
+    engine: PandasExecutionEngine = build_pandas_engine(df=df)
+    (
+        table_columns_metric,
+        unexpected_columns_metric,
+        metrics,
+    ) = _build_table_columns_and_unexpected(engine, metric_value_kwargs)
+
+    unexpected_index_list: MetricConfiguration = MetricConfiguration(
+        metric_name=f"column_values.in_set.{SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value}",
+        metric_domain_kwargs={"column": "animals"},
+        metric_value_kwargs=metric_value_kwargs,
+    )
+    unexpected_index_list.metric_dependencies = {
+        "unexpected_condition": unexpected_columns_metric,
+        "table.columns": table_columns_metric,
+    }
+    results: Dict[Tuple[str, str, str], MetricValue] = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_index_list,), metrics=metrics
+    )
+    assert results[unexpected_index_list.id] == expected_unexpected_index_list
+
+
 @pytest.mark.unit
 def test_sa_unexpected_index_list_metric_with_id_pk(
     sa, animal_table_df, metric_value_kwargs_complete
@@ -2,7 +2,7 @@ import copy
 import datetime
 import logging
 from decimal import Decimal
-from typing import Dict, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -827,6 +827,63 @@ def test_quantiles_metric_sa(sa):
     assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
+@pytest.mark.sqlite
+def test_quantiles_metric_sqlite_single_query(sa, mocker):
+    df = pd.DataFrame(
+        {"a": np.random.default_rng(seed=0).integers(0, 50, 101).astype(float)}
+    )
+    df.loc[[3, 7], "a"] = np.nan
+    engine = build_sa_execution_engine(df, sa)
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    table_row_count_metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    metrics[table_row_count_metric.id] = len(df)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [0.0, 0.01, 0.1, 0.25, 0.3, 0.5, 0.57, 0.7, 0.9, 0.99, 1.0],
+        },
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+        "table.row_count": table_row_count_metric,
+    }
+
+    execute_query_spy = mocker.spy(engine, "execute_query")
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert execute_query_spy.call_count == 1
+
+    # SQLite versions without window functions issue one query per quantile; both must agree.
+    mocker.patch.object(engine.engine.dialect, "server_version_info", (3, 24, 0))
+    execute_query_spy.reset_mock()
+    engine._metric_cache.clear()
+    expected_results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert execute_query_spy.call_count == len(
+        desired_metric.metric_value_kwargs["quantiles"]
+    )
+
+    assert results == expected_results
+    # NULL values sort first in SQLite.
+    assert results[desired_metric.id][:2] == [None, None]
+
+
 @pytest.mark.spark
 def test_quantiles_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -860,6 +917,197 @@ def test_quantiles_metric_spark(spark_session):
     assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
+def _resolve_approximate_metrics(
+    engine: Union[PandasExecutionEngine, SqlAlchemyExecutionEngine]
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    approximate_metrics = [
+        MetricConfiguration(
+            metric_name="column.approx_distinct_values.count",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        ),
+        MetricConfiguration(
+            metric_name="column.approx_quantile_values",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"quantiles": [0.0, 0.5, 1.0]},
+        ),
+        MetricConfiguration(
+            metric_name="column.approx_value_counts",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"top_k": 2},
+        ),
+    ]
+    for approximate_metric in approximate_metrics:
+        approximate_metric.metric_dependencies = {"table.columns": table_columns_metric}
+
+    if isinstance(engine, SqlAlchemyExecutionEngine):
+        # SQL engine computes approximate metrics in database; quantiles need number of non-null values (6 in tests).
+        nonnull_count_metric = MetricConfiguration(
+            metric_name="column_values.nonnull.count",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        )
+        metrics[nonnull_count_metric.id] = 6
+        approximate_metrics[1].metric_dependencies[
+            "column_values.nonnull.count"
+        ] = nonnull_count_metric
+    else:
+        sketch_metrics = _resolve_sketch_metrics(
+            engine=engine, table_columns_metric=table_columns_metric, metrics=metrics
+        )
+        for approximate_metric, sketch_metric in zip(
+            approximate_metrics, sketch_metrics.values()
+        ):
+            approximate_metric.metric_dependencies[
+                sketch_metric.metric_name
+            ] = sketch_metric
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=tuple(approximate_metrics), metrics=metrics
+    )
+    return {
+        approximate_metric.metric_name: results[approximate_metric.id]
+        for approximate_metric in approximate_metrics
+    }
+
+
+def _resolve_sketch_metrics(
+    engine: Union[PandasExecutionEngine, SqlAlchemyExecutionEngine],
+    table_columns_metric: MetricConfiguration,
+    metrics: Dict[Tuple[str, str, str], MetricValue],
+) -> Dict[str, MetricConfiguration]:
+    sketch_metrics = {
+        metric_name: MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=metric_value_kwargs,
+        )
+        for metric_name, metric_value_kwargs in (
+            ("column.hll_sketch", {"precision": 14}),
+            ("column.kll_sketch", {"k": 200}),
+            (
+                "column.count_min_sketch",
+                {"width": 2048, "depth": 5, "heavy_hitters_capacity": 100},
+            ),
+        )
+    }
+    for sketch_metric in sketch_metrics.values():
+        sketch_metric.metric_dependencies = {"table.columns": table_columns_metric}
+
+    metrics.update(
+        engine.resolve_metrics(
+            metrics_to_resolve=tuple(sketch_metrics.values()), metrics=metrics
+        )
+    )
+    return sketch_metrics
+
+
+@pytest.mark.unit
+def test_approximate_metrics_pd():
+    engine = build_pandas_engine(pd.DataFrame({"a": [1, 2, 2, 3, 3, 3, None]}))
+
+    results = _resolve_approximate_metrics(engine=engine)
+
+    assert results["column.approx_distinct_values.count"] == 3
+    assert results["column.approx_quantile_values"] == [1.0, 2.0, 3.0]
+    assert results["column.approx_value_counts"].to_dict() == {3.0: 3, 2.0: 2}
+
+
+@pytest.mark.sqlite
+def test_approximate_metrics_sa(sa):
+    engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 2, 3, 3, 3, None]}), sa
+    )
+
+    results = _resolve_approximate_metrics(engine=engine)
+
+    assert results["column.approx_distinct_values.count"] == 3
+    assert results["column.approx_quantile_values"] == [1.0, 2.0, 3.0]
+    assert results["column.approx_value_counts"].to_dict() == {3.0: 3, 2.0: 2}
+
+
+@pytest.mark.sqlite
+def test_sketch_metrics_sa(sa):
+    engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 2, 3, 3, 3, None]}), sa
+    )
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    sketch_metrics = _resolve_sketch_metrics(
+        engine=engine, table_columns_metric=table_columns_metric, metrics=metrics
+    )
+
+    assert metrics[sketch_metrics["column.hll_sketch"].id].estimate() == 3
+    assert metrics[sketch_metrics["column.kll_sketch"].id].get_quantiles(
+        [0.0, 0.5, 1.0]
+    ) == [1.0, 2.0, 3.0]
+    assert metrics[sketch_metrics["column.count_min_sketch"].id].get_heavy_hitters(
+        top_k=1
+    ) == [(3.0, 3)]
+
+
+@pytest.mark.sqlite
+def test_approximate_metrics_sa_do_not_depend_on_sketches(sa):
+    engine = SqlAlchemyExecutionEngine(
+        engine=sa.create_engine("sqlite://"), use_approximate_metrics=True
+    )
+
+    metric_name: str
+    metric_value_kwargs: Optional[dict]
+    for metric_name, metric_value_kwargs in (
+        ("column.approx_distinct_values.count", None),
+        ("column.approx_quantile_values", {"quantiles": [0.5]}),
+        ("column.approx_value_counts", {"top_k": 2}),
+        ("column.quantile_values", {"quantiles": [0.5]}),
+    ):
+        provider = get_metric_provider(metric_name, engine)[0]
+        dependencies = provider.get_evaluation_dependencies(
+            metric=MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": "a"},
+                metric_value_kwargs=metric_value_kwargs,
+            ),
+            execution_engine=engine,
+        )
+        assert not any(name.endswith("_sketch") for name in dependencies)
+
+
+@pytest.mark.unit
+def test_quantiles_metric_uses_kll_sketch_if_engine_uses_approximate_metrics():
+    metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": [0.5], "allow_relative_error": False},
+    )
+    provider = get_metric_provider("column.quantile_values", PandasExecutionEngine())[0]
+
+    dependencies = provider.get_evaluation_dependencies(
+        metric=metric, execution_engine=PandasExecutionEngine()
+    )
+    assert "column.kll_sketch" not in dependencies
+
+    engine = PandasExecutionEngine(use_approximate_metrics=True)
+    assert engine.config["use_approximate_metrics"] is True
+    dependencies = provider.get_evaluation_dependencies(
+        metric=metric, execution_engine=engine
+    )
+    assert dependencies["column.kll_sketch"].metric_name == "column.kll_sketch"
+
+
 @pytest.mark.unit
 def test_column_histogram_metric_pd():
     engine = build_pandas_engine(
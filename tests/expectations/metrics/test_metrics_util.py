@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING, Final, List, Union
+from typing import Final, List, Union
 
+import numpy as np
+import pandas as pd
 import pytest
 from _pytest import monkeypatch
 
@@ -19,6 +21,7 @@ from great_expectations.expectations.metrics.util import (
     get_dbms_compatible_metric_domain_kwargs,
     get_unexpected_indices_for_multiple_pandas_named_indices,
     get_unexpected_indices_for_single_pandas_named_index,
+    map_pandas_column_values_by_unique_value,
     sql_statement_with_post_compile_to_string,
 )
 from tests.test_utils import (
@@ -32,9 +35,6 @@ from tests.test_utils import (
     get_snowflake_connection_url,
 )
 
-if TYPE_CHECKING:
-    import pandas as pd
-
 # The following class allows for declarative instantiation of base class for SqlAlchemy. Adopted from
 # https://docs.sqlalchemy.org/en/14/faq/sqlexpressions.html#rendering-postcompile-parameters-as-bound-parameters
 
@@ -618,6 +618,45 @@ _CASE_PARAMS: Final[list[str]] = [
 ]
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "column",
+    [
+        pytest.param(
+            pd.Series(["200", "404", None, "200", "500", np.nan, "404"], name="code"),
+            id="strings_with_missing_values",
+        ),
+        pytest.param(
+            pd.Series(
+                [{"a": 1}, {"a": 1}, {"b": 2}], index=[10, 20, 30], name="records"
+            ),
+            id="unhashable_values",
+        ),
+        pytest.param(pd.Series([], dtype=object), id="empty"),
+    ],
+)
+def test_map_pandas_column_values_by_unique_value(column: pd.Series):
+    evaluated_values: list = []
+
+    def is_valid(value) -> bool:
+        evaluated_values.append(value)
+        return isinstance(value, str) and value.startswith("2") or value == {"a": 1}
+
+    expected_result: pd.Series = column.map(is_valid)
+    num_row_evaluations: int = len(evaluated_values)
+    evaluated_values.clear()
+
+    result: pd.Series = map_pandas_column_values_by_unique_value(
+        column=column, fn=is_valid
+    )
+
+    pd.testing.assert_series_equal(result, expected_result)
+    if column.name == "code":
+        # Every distinct value is evaluated once; each missing value is evaluated individually.
+        assert evaluated_values[:3] == ["200", "404", "500"]
+        assert len(evaluated_values) == 5 < num_row_evaluations
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize("input_str", _CASE_PARAMS)
 class TestCaseInsensitiveString:
@@ -0,0 +1,129 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from great_expectations.expectations.metrics.sketches import (
+    CountMinSketch,
+    HyperLogLogSketch,
+    KllSketch,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("num_distinct_values", [0, 1, 100, 10000, 200000])
+def test_hyper_log_log_sketch_estimate(num_distinct_values):
+    sketch = HyperLogLogSketch()
+    sketch.update(np.tile(np.arange(num_distinct_values), 2))
+
+    assert sketch.estimate() == pytest.approx(num_distinct_values, rel=0.03, abs=1)
+
+
+@pytest.mark.unit
+def test_hyper_log_log_sketch_merge():
+    left = HyperLogLogSketch()
+    left.update(range(0, 50000))
+    right = HyperLogLogSketch()
+    right.update(range(25000, 75000))
+
+    merged = left.merge(right)
+    assert merged.estimate() == pytest.approx(75000, rel=0.03)
+    assert left.estimate() == pytest.approx(50000, rel=0.03)
+
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLogSketch(precision=10))
+
+    with pytest.raises(ValueError):
+        HyperLogLogSketch(precision=30)
+
+
+@pytest.mark.unit
+def test_kll_sketch_quantiles_and_merge():
+    values = np.random.default_rng(seed=0).normal(size=200000)
+    quantiles = [0.0, 0.1, 0.5, 0.9, 1.0]
+
+    sketch = KllSketch()
+    for block in np.array_split(values, 20):
+        sketch.update(block)
+
+    left = KllSketch()
+    left.update(values[:100000])
+    right = KllSketch()
+    right.update(values[100000:])
+    merged = left.merge(right)
+
+    sorted_values = np.sort(values)
+    for estimated_quantiles in (
+        sketch.get_quantiles(quantiles),
+        merged.get_quantiles(quantiles),
+    ):
+        assert estimated_quantiles[0] == sorted_values[0]
+        assert estimated_quantiles[-1] == sorted_values[-1]
+        # Normalized rank of every estimate is close to requested quantile.
+        ranks = np.searchsorted(sorted_values, estimated_quantiles) / values.size
+        np.testing.assert_allclose(ranks, quantiles, atol=0.02)
+
+    assert merged.count == values.size
+    assert sum(compactor.size for compactor in merged._compactors) < 1000
+
+
+@pytest.mark.unit
+def test_kll_sketch_merge_leaves_merged_sketches_intact():
+    values = np.random.default_rng(seed=0).normal(size=20000)
+    left = KllSketch(k=50)
+    left.update(values[:10000])
+    right = KllSketch(k=50)
+    right.update(values[10000:])
+
+    first_merged = left.merge(right)
+    second_merged = left.merge(right)
+
+    # Merged sketches have own random generators; hence, repeated merge makes same random choices.
+    assert first_merged._rng is not left._rng
+    for first_compactor, second_compactor in zip(
+        first_merged._compactors, second_merged._compactors
+    ):
+        np.testing.assert_array_equal(first_compactor, second_compactor)
+
+
+@pytest.mark.unit
+def test_kll_sketch_ignores_nan_and_handles_empty_input():
+    sketch = KllSketch()
+    sketch.update([])
+    assert np.isnan(sketch.get_quantiles([0.5])).all()
+
+    sketch.update([1.0, np.nan, 3.0, 2.0])
+    assert sketch.count == 3
+    assert sketch.get_quantiles([0.0, 0.5, 1.0]) == [1.0, 2.0, 3.0]
+
+    with pytest.raises(ValueError):
+        sketch.get_quantiles([1.5])
+
+
+@pytest.mark.unit
+def test_count_min_sketch_heavy_hitters_and_merge():
+    values = np.random.default_rng(seed=0).zipf(a=1.5, size=100000)
+    unique_values, counts = np.unique(values, return_counts=True)
+    expected_top_values = unique_values[np.argsort(-counts)][:5].tolist()
+
+    left = CountMinSketch()
+    left.update(values[:50000])
+    right = CountMinSketch()
+    right.update(values[50000:])
+    merged = pickle.loads(pickle.dumps(left)).merge(right)
+
+    heavy_hitters = merged.get_heavy_hitters(top_k=5)
+    assert [value for value, _ in heavy_hitters] == expected_top_values
+
+    value: int
+    estimated_count: int
+    for value, estimated_count in heavy_hitters:
+        true_count = int(counts[unique_values == value][0])
+        # Count-min sketch never underestimates.
+        assert true_count <= estimated_count <= true_count + 0.01 * values.size
+        assert merged.estimate_count(value) == estimated_count
+
+    assert merged.count == values.size
+
+    with pytest.raises(ValueError):
+        merged.merge(CountMinSketch(width=16))
@@ -1,3 +1,7 @@
+import json
+import subprocess
+import sys
+
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
@@ -5,7 +9,15 @@ import great_expectations.expectations as gxe
 from great_expectations.expectations.expectation_configuration import (
     ExpectationConfiguration,
 )
-from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.expectations.metrics import ColumnMax
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_max import (
+    ColumnMax as ColumnMaxFromDefiningModule,
+)
+from great_expectations.expectations.registry import (
+    REGISTRY_MANIFEST_FILE_PATH,
+    build_registry_manifest,
+    get_expectation_impl,
+)
 
 # module level markers
 pytestmark = pytest.mark.unit
@@ -27,3 +39,33 @@ def test_registry_from_configuration():
 def test_registry_raises_error_when_invalid_expectation_requested():
     with pytest.raises(gx_exceptions.ExpectationNotFoundError):
         get_expectation_impl("expect_something_in_beta")
+
+
+def test_registry_manifest_is_up_to_date():
+    """If this test fails, run "invoke registry-manifest --sync" to regenerate manifest of core components."""
+    assert build_registry_manifest() == json.loads(
+        REGISTRY_MANIFEST_FILE_PATH.read_text()
+    )
+
+
+def test_lazy_package_attributes():
+    assert ColumnMax is ColumnMaxFromDefiningModule
+
+    with pytest.raises(AttributeError):
+        _ = gxe.ExpectSomethingInBeta
+
+
+def test_import_great_expectations_does_not_register_core_expectations_and_metrics():
+    completed_process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import great_expectations; "
+            "from great_expectations.expectations import registry; "
+            "print(len(registry._registered_expectations), len(registry._registered_metrics))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert completed_process.stdout.split() == ["0", "0"]
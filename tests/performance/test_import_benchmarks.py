@@ -0,0 +1,55 @@
+"""
+Test performance of "import great_expectations" (no external dependencies are required).
+"""
+
+import subprocess
+import sys
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+pytestmark = pytest.mark.performance
+
+# Every round imports package in fresh interpreter (modules, imported by pytest itself, would otherwise be cached).
+IMPORT_STATEMENT: str = "import great_expectations"
+
+
+def _import_great_expectations() -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", IMPORT_STATEMENT],
+        capture_output=True,
+        check=True,
+    )
+
+
+def test_import_great_expectations_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+):
+    """Benchmark "import great_expectations" (core Expectations and Metrics must be imported only upon first use).
+
+    Run "python -X importtime -c 'import great_expectations'" in order to find modules, contributing most to import time.
+    """
+    _skip_if_performance_tests_not_enabled(pytestconfig)
+
+    completed_process: subprocess.CompletedProcess = benchmark.pedantic(
+        _import_great_expectations,
+        iterations=1,
+        rounds=5,
+        warmup_rounds=1,
+    )
+
+    assert completed_process.returncode == 0
+
+
+def _skip_if_performance_tests_not_enabled(
+    pytestconfig: _pytest.config.Config,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,115 @@
+"""
+Test performance of computing and looking up metric identifiers (no external dependencies are required).
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+from typing import Dict, List, Tuple
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+pytestmark = pytest.mark.performance
+
+NUMBER_OF_COLUMNS: int = 100
+
+# Metrics, resolved (along with their dependencies) for typical Expectation on every column of large suite.
+METRIC_NAMES: List[str] = [
+    "column_values.in_set.condition",
+    "column_values.in_set.unexpected_count",
+    "column_values.in_set.unexpected_values",
+    "column_values.nonnull.unexpected_count",
+    "column.min",
+    "column.max",
+    "table.row_count",
+]
+
+# Number of times identifiers of every metric are accessed (while building and traversing ValidationGraph, looking up
+# resolved metrics, and filtering aborted metrics).
+NUMBER_OF_ID_LOOKUPS: int = 20
+
+
+def _build_metric_configurations() -> List[MetricConfiguration]:
+    return [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={
+                "column": f"column_{idx}",
+                "batch_id": "my_batch_id",
+                "row_condition": None,
+                "condition_parser": None,
+            },
+            metric_value_kwargs={
+                "value_set": ["a", "b", "c"],
+                "parse_strings_as_datetimes": False,
+                "result_format": {
+                    "result_format": "SUMMARY",
+                    "partial_unexpected_count": 20,
+                },
+            },
+        )
+        for idx in range(NUMBER_OF_COLUMNS)
+        for metric_name in METRIC_NAMES
+    ]
+
+
+def _resolve_metric_ids(
+    metric_configurations: List[MetricConfiguration],
+) -> Dict[Tuple[str, str, str], int]:
+    resolved_metrics: Dict[Tuple[str, str, str], int] = {}
+    for _ in range(NUMBER_OF_ID_LOOKUPS):
+        for idx, metric_configuration in enumerate(metric_configurations):
+            resolved_metrics.setdefault(metric_configuration.id, idx)
+
+    return resolved_metrics
+
+
+def test_metric_configuration_id_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+):
+    """Benchmark computing and looking up identifiers of metrics of large Expectation Suite.
+
+    Set "GE_PROFILE_FILE_PATH" environment variable in order to write profile (instead of running benchmark); the share
+    of time, spent in "IDDict.to_id()", is printed as well.
+    """
+    _skip_if_performance_tests_not_enabled(pytestconfig)
+
+    metric_configurations: List[MetricConfiguration] = _build_metric_configurations()
+
+    if os.environ.get("GE_PROFILE_FILE_PATH"):
+        profile = cProfile.Profile()
+        profile.runctx(
+            "_resolve_metric_ids(metric_configurations)",
+            globals(),
+            locals(),
+        )
+        profile.dump_stats(os.environ["GE_PROFILE_FILE_PATH"])
+        pstats.Stats(profile).sort_stats("cumulative").print_stats("to_id")
+        return
+
+    resolved_metrics: Dict[Tuple[str, str, str], int] = benchmark.pedantic(
+        _resolve_metric_ids,
+        args=(metric_configurations,),
+        iterations=1,
+        rounds=10,
+    )
+
+    assert len(resolved_metrics) == len(metric_configurations)
+
+
+def _skip_if_performance_tests_not_enabled(
+    pytestconfig: _pytest.config.Config,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
@@ -1,18 +1,30 @@
 import os
 import shutil
 from typing import Dict
+from unittest import mock
 
 import pytest
 
+from great_expectations import exceptions
+from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context import get_context
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
 from great_expectations.data_context.store import ExpectationsStore, ValidationsStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
+from great_expectations.render.renderer.site_builder import (
+    DefaultSiteIndexBuilder,
+    DefaultSiteSectionBuilder,
+)
 
 # module level markers
 pytestmark = pytest.mark.filesystem
@@ -131,3 +143,133 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     assert profiling_site_section_builder.run_name_filter == {
         "equals": "custom_profiling_filter"
     }
+
+
+def _add_validation_result(
+    context: FileDataContext, idx: int
+) -> ValidationResultIdentifier:
+    validation_result_identifier = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("my.suite"),
+        run_id=RunIdentifier(
+            run_name=f"run_{idx}", run_time=f"2023-01-0{idx + 1}T00:00:00+00:00"
+        ),
+        batch_identifier=f"batch_{idx}",
+    )
+    context.validations_store.set(
+        validation_result_identifier,
+        ExpectationSuiteValidationResult(
+            success=idx % 2 == 0,
+            results=[],
+            meta={
+                "run_id": validation_result_identifier.run_id,
+                "expectation_suite_name": "my.suite",
+                "active_batch_definition": {},
+                "batch_spec": {"data_asset_name": f"asset_{idx}"},
+            },
+        ),
+    )
+    return validation_result_identifier
+
+
+def test_site_index_builder_loads_only_validation_results_missing_from_index_manifest(
+    tmp_path, mocker
+):
+    context = get_context(mode="file", project_root_dir=tmp_path)
+    validation_result_identifiers = [
+        _add_validation_result(context=context, idx=idx) for idx in range(3)
+    ]
+
+    index_builder_build_spy = mocker.spy(DefaultSiteIndexBuilder, "build")
+    context.build_data_docs()
+
+    index_manifest_path = (
+        tmp_path
+        / "gx"
+        / "uncommitted"
+        / "data_docs"
+        / "local_site"
+        / "index_manifest.jsonl"
+    )
+    assert len(index_manifest_path.read_text().splitlines()) == 3
+    _, index_links_dict = index_builder_build_spy.spy_return
+    assert [
+        (link["batch_identifier"], link["validation_success"], link["asset_name"])
+        for link in index_links_dict["validations_links"]
+    ] == [
+        ("batch_2", True, "asset_2"),
+        ("batch_1", False, "asset_1"),
+        ("batch_0", True, "asset_0"),
+    ]
+
+    get_validation_result_spy = mocker.spy(context, "get_validation_result")
+
+    # Index page is rendered from manifest alone.
+    context.build_data_docs()
+    assert get_validation_result_spy.call_count == 0
+    assert index_builder_build_spy.spy_return[1] == index_links_dict
+
+    # Only the new validation result is loaded.
+    validation_result_identifiers.append(_add_validation_result(context=context, idx=3))
+    context.build_data_docs(resource_identifiers=validation_result_identifiers[-1:])
+    assert get_validation_result_spy.call_count == 1
+    assert len(index_manifest_path.read_text().splitlines()) == 4
+
+    # Entries of results, removed from site, are dropped from manifest.
+    context.validations_store.store_backend.remove_key(
+        validation_result_identifiers[0].to_tuple()
+    )
+    context.build_data_docs()
+    assert get_validation_result_spy.call_count == 1
+    assert len(index_manifest_path.read_text().splitlines()) == 3
+
+    # Index links, obtained from manifest, equal those obtained from validation results.
+    index_links_dict = index_builder_build_spy.spy_return[1]
+    index_manifest_path.unlink()
+    context.build_data_docs()
+    assert get_validation_result_spy.call_count == 4
+    assert index_builder_build_spy.spy_return[1] == index_links_dict
+
+
+def test_site_section_builder_renders_pages_concurrently(tmp_path):
+    context = get_context(mode="file", project_root_dir=tmp_path)
+    for idx in range(4):
+        _add_validation_result(context=context, idx=idx)
+
+    site_builder = context._init_site_builder_for_data_docs_site_creation(
+        site_name="local_site",
+        site_config=context._project_config.data_docs_sites["local_site"],
+    )
+    validations_site_section_builder = site_builder.site_section_builders["validations"]
+    validations_site_section_builder.max_workers = 3
+    with mock.patch.object(
+        validations_site_section_builder,
+        "_build_page",
+        wraps=validations_site_section_builder._build_page,
+    ) as mock_build_page:
+        validations_site_section_builder.build()
+
+    # Every worker thread renders pages with its own renderer and view objects.
+    renderers = {id(call.kwargs["renderer"]) for call in mock_build_page.call_args_list}
+    views = {id(call.kwargs["view"]) for call in mock_build_page.call_args_list}
+    assert 1 <= len(renderers) == len(views) <= 3
+    assert id(validations_site_section_builder.renderer_class) not in renderers
+    assert id(validations_site_section_builder.view_class) not in views
+
+    validations_dir = (
+        tmp_path / "gx" / "uncommitted" / "data_docs" / "local_site" / "validations"
+    )
+    assert sorted(path.stem for path in validations_dir.rglob("*.html")) == [
+        "batch_0",
+        "batch_1",
+        "batch_2",
+        "batch_3",
+    ]
+
+    with pytest.raises(exceptions.InvalidConfigError):
+        DefaultSiteSectionBuilder(
+            name="validations",
+            data_context=context,
+            target_store=validations_site_section_builder.target_store,
+            source_store_name="validations_store",
+            max_workers=0,
+        )
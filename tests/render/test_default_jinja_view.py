@@ -15,12 +15,36 @@ from great_expectations.render import (
     ValueListContent,
 )
 from great_expectations.render.renderer import ProfilingResultsPageRenderer
-from great_expectations.render.view import DefaultJinjaPageView
+from great_expectations.render.view import (
+    DefaultJinjaPageView,
+    DefaultJinjaSectionView,
+)
 
 # module level markers
 pytestmark = pytest.mark.big
 
 
+def test_jinja_environment_filters_are_bound_to_own_view_and_templates_are_compiled_once():
+    page_view = DefaultJinjaPageView()
+    other_page_view = DefaultJinjaPageView()
+
+    assert page_view.env is not other_page_view.env
+    assert page_view.env.filters["render_styling"].__self__ is page_view
+    assert other_page_view.env.filters["render_styling"].__self__ is other_page_view
+
+    # Environments of all views share compiled templates (rather than compiling every template for every view).
+    assert (
+        page_view.env.get_template("page.j2").root_render_func.__code__
+        is other_page_view.env.get_template("page.j2").root_render_func.__code__
+    )
+    assert (
+        DefaultJinjaSectionView()
+        .env.get_template("section.j2")
+        .root_render_func.__code__
+        is page_view.env.get_template("section.j2").root_render_func.__code__
+    )
+
+
 # noinspection PyPep8Naming
 @pytest.mark.filterwarnings(
     "ignore:Cannot get %*::great_expectations.render.renderer.profiling_results_overview_section_renderer"
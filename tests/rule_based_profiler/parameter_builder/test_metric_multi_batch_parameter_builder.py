@@ -270,3 +270,119 @@ def test_metric_multi_batch_parameter_builder_bobby_single_batch_yes(
     parameter_node["attributed_value"] = None
 
     assert parameter_node == expected_parameter_node_as_dict
+
+
+def test_metric_multi_batch_parameter_builder_uses_prefetched_metrics(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context = bobby_columnar_table_multi_batch_deterministic_data_context
+
+    # BatchRequest yielding three batches
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    metric_multi_batch_parameter_builder: ParameterBuilder = (
+        MetricMultiBatchParameterBuilder(
+            name="row_count",
+            metric_name="table.row_count",
+            metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+            metric_value_kwargs=None,
+            enforce_numeric_metric=True,
+            replace_nan_with_zero=True,
+            reduce_scalar_metric=True,
+            evaluation_parameter_builder_configs=None,
+            data_context=data_context,
+        )
+    )
+
+    domain = Domain(
+        domain_type=MetricDomainTypes.TABLE,
+        rule_name="my_rule",
+    )
+    parameter_container = ParameterContainer(parameter_nodes=None)
+    parameters: Dict[str, ParameterContainer | None] = {
+        domain.id: parameter_container,
+    }
+
+    metric_configurations = (
+        metric_multi_batch_parameter_builder.get_metric_configurations_to_prefetch(
+            domain=domain,
+            variables=None,
+            parameters=parameters,
+            batch_request=batch_request,
+        )
+    )
+    assert len(metric_configurations) == 3
+    assert {
+        metric_configuration.metric_name
+        for metric_configuration in metric_configurations
+    } == {"table.row_count"}
+
+    # Values, which differ from actual row counts, demonstrate that no ValidationGraph is resolved by builder itself.
+    metric_multi_batch_parameter_builder.prefetched_metrics = {
+        metric_configuration.id: 1 for metric_configuration in metric_configurations
+    }
+
+    metric_multi_batch_parameter_builder.build_parameters(
+        domain=domain,
+        variables=None,
+        parameters=parameters,
+        batch_request=batch_request,
+        runtime_configuration=None,
+    )
+
+    parameter_node: ParameterNode = (
+        get_parameter_value_by_fully_qualified_parameter_name(
+            fully_qualified_parameter_name="$parameter.row_count",
+            domain=domain,
+            parameters=parameters,
+        )
+    )
+    assert list(parameter_node["value"]) == [1, 1, 1]
+
+
+def test_metric_multi_batch_parameter_builder_referencing_parameters_is_not_prefetched(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context = bobby_columnar_table_multi_batch_deterministic_data_context
+
+    # BatchRequest yielding three batches
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    metric_multi_batch_parameter_builder: ParameterBuilder = (
+        MetricMultiBatchParameterBuilder(
+            name="quantiles",
+            metric_name="column.quantile_values",
+            metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+            metric_value_kwargs={
+                "quantiles": "$parameter.my_quantiles.value",
+            },
+            data_context=data_context,
+        )
+    )
+
+    domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN,
+        domain_kwargs={"column": "fare_amount"},
+        rule_name="my_rule",
+    )
+    parameters: Dict[str, ParameterContainer | None] = {
+        domain.id: ParameterContainer(parameter_nodes=None),
+    }
+
+    assert (
+        metric_multi_batch_parameter_builder.get_metric_configurations_to_prefetch(
+            domain=domain,
+            variables=None,
+            parameters=parameters,
+            batch_request=batch_request,
+        )
+        == []
+    )
@@ -17,6 +17,7 @@ from great_expectations.rule_based_profiler.estimators.numeric_range_estimation_
 )
 from great_expectations.rule_based_profiler.helpers.util import (
     compute_bootstrap_quantiles_point_estimate,
+    compute_bootstrap_quantiles_point_estimates,
     sanitize_parameter_name,
 )
 
@@ -95,6 +96,54 @@ def test_bootstrap_point_estimate_efficacy(
         )
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("quantile_bias_correction", [False, True])
+def test_vectorized_bootstrap_point_estimates_equal_element_wise_estimates(
+    quantile_bias_correction: bool,
+):
+    random_state: np.random.Generator = np.random.Generator(np.random.PCG64(7))
+    # 30 samples (e.g., Batches) of metric with 3 x 4 elements, one of which is degenerate.
+    metric_values: np.ndarray = random_state.normal(size=(30, 3, 4))
+    metric_values[:, 1, 2] = 5.0
+    metric_values = metric_values.reshape(30, -1)
+
+    numeric_range_estimation_results: List[
+        NumericRangeEstimationResult
+    ] = compute_bootstrap_quantiles_point_estimates(
+        metric_values=metric_values,
+        false_positive_rate=np.float64(5.0e-2),
+        n_resamples=999,
+        quantile_statistic_interpolation_method="linear",
+        quantile_bias_correction=quantile_bias_correction,
+        quantile_bias_std_error_ratio_threshold=2.5e-1,
+        random_seed=43792,
+    )
+    assert len(numeric_range_estimation_results) == metric_values.shape[1]
+
+    column_idx: int
+    for column_idx in range(metric_values.shape[1]):
+        numeric_range_estimation_result: NumericRangeEstimationResult = (
+            compute_bootstrap_quantiles_point_estimate(
+                metric_values=metric_values[:, column_idx],
+                false_positive_rate=np.float64(5.0e-2),
+                n_resamples=999,
+                quantile_statistic_interpolation_method="linear",
+                quantile_bias_correction=quantile_bias_correction,
+                quantile_bias_std_error_ratio_threshold=2.5e-1,
+                random_seed=43792,
+            )
+        )
+        np.testing.assert_allclose(
+            actual=numeric_range_estimation_results[column_idx].value_range,
+            desired=numeric_range_estimation_result.value_range,
+            rtol=1.0e-12,
+        )
+        np.testing.assert_array_equal(
+            numeric_range_estimation_results[column_idx].estimation_histogram,
+            numeric_range_estimation_result.estimation_histogram,
+        )
+
+
 @pytest.mark.unit
 def test_sanitize_parameter_name(
     table_row_count_metric_config,
@@ -11,6 +11,7 @@ from great_expectations.rule_based_profiler.parameter_container import (
     build_parameter_container_for_variables,
     get_fully_qualified_parameter_names,
     get_parameter_values_for_fully_qualified_parameter_names,
+    is_parameter_reference_in_literal,
 )
 
 # module level markers
@@ -500,3 +501,25 @@ def test_get_parameter_values_for_fully_qualified_parameter_names(
         parameter_values_for_fully_qualified_parameter_names
         == expected_parameter_values_for_fully_qualified_parameter_names
     )
+
+
+@pytest.mark.parametrize(
+    "parameter_reference,expected",
+    [
+        pytest.param(None, False, id="none"),
+        pytest.param("$variables.false_positive_rate", False, id="variables"),
+        pytest.param("$domain.domain_kwargs", False, id="domain_kwargs"),
+        pytest.param("$parameter.my_quantiles.value", True, id="parameter"),
+        pytest.param(
+            {"column": "$domain.domain_kwargs.column", "bins": "$parameter.bins"},
+            True,
+            id="nested_parameter",
+        ),
+        pytest.param({"quantiles": [0.25, 0.5, 0.75]}, False, id="literal_dict"),
+    ],
+)
+def test_is_parameter_reference_in_literal(parameter_reference, expected: bool):
+    assert (
+        is_parameter_reference_in_literal(parameter_reference=parameter_reference)
+        is expected
+    )
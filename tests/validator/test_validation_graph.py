@@ -19,6 +19,7 @@ from great_expectations.validator.validation_graph import (
     ExpectationValidationGraph,
     MetricEdge,
     ValidationGraph,
+    _MetricDependencyScheduler,
 )
 from great_expectations.validator.validator import ValidationDependencies
 
@@ -328,6 +329,33 @@ def test_parse_validation_graph(
     assert len(ready_metrics) == 2 and len(needed_metrics) == 9
 
 
+@pytest.mark.unit
+def test_metric_dependency_scheduler_releases_dependents_incrementally(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+    scheduler = _MetricDependencyScheduler(edges=graph.edges, metrics={})
+
+    available_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    while scheduler.ready_metrics:
+        ready_metrics, needed_metrics = graph._parse(metrics=available_metrics)
+        assert {metric.id for metric in scheduler.ready_metrics} == {
+            metric.id for metric in ready_metrics
+        }
+        assert {metric.id for metric in scheduler.needed_metrics} == {
+            metric.id for metric in needed_metrics
+        }
+
+        resolved_metric_ids = [metric.id for metric in ready_metrics]
+        available_metrics.update(
+            {metric_id: "my_value" for metric_id in resolved_metric_ids}
+        )
+        scheduler.mark_resolved(metric_ids=resolved_metric_ids)
+
+    assert len(scheduler.needed_metrics) == 0
+    assert {edge.left.id for edge in graph.edges} <= set(available_metrics.keys())
+
+
 @pytest.mark.unit
 def test_populate_dependencies(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
@@ -454,11 +482,7 @@ def test_progress_bar_config(
 
     # ValidationGraph is a complex object that requires len > 3 to not trigger tqdm
     with mock.patch(
-        "great_expectations.validator.validation_graph.ValidationGraph._parse",
-        return_value=(
-            {},
-            {},
-        ),
+        "great_expectations.validator.validation_graph._MetricDependencyScheduler",
     ), mock.patch(
         "great_expectations.validator.validation_graph.ValidationGraph.edges",
         new_callable=mock.PropertyMock,